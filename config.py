@@ -18,6 +18,7 @@ Automation Method Priority (macOS):
 """
 
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -313,12 +314,15 @@ The action plan should be a list of simple, atomic steps. Possible actions are:
 
 For web form filling, identify form fields and create a sequence of 'click' and 'type' actions to fill them appropriately.
 
+When a click lands on an element with a visible label (a button, link, menu item or form field), also give that element as "target" so its exact position can be looked up before clicking.
+
 Return the response in this JSON structure:
 {
     "plan": [
         {
             "action": "click|double_click|type|scroll|speak|finish",
             "coordinates": [x, y],  // for click actions
+            "target": {"role": "AXButton", "label": "Submit"},  // optional, for click actions on a labeled element
             "text": "text to type",  // for type actions
             "direction": "up|down|left|right",  // for scroll actions
             "amount": 100,  // for scroll actions
@@ -401,6 +405,13 @@ INTENT_CLASSIFICATION_RETRIES = 2  # Number of retries for failed intent classif
 INTENT_CACHE_ENABLED = True  # Enable caching of intent classification results
 INTENT_CACHE_TTL = 300  # Intent cache time-to-live in seconds
 
+# Pre-intent fast command router ("type ...", "press ...", "scroll ...", "click <label>" without the LLM)
+FAST_COMMAND_ROUTER_MODE = "shadow"          # "off", "shadow" (compare with LLM labels only), "auto" or "enforce"
+FAST_COMMAND_ROUTER_MIN_CONFIDENCE = 0.9     # Minimum grammar match confidence for routing
+FAST_COMMAND_ROUTER_MIN_PRECISION = 0.95     # Shadow agreement with LLM labels a grammar needs before "auto" enforces it
+FAST_COMMAND_ROUTER_MIN_SAMPLES = 20         # Shadowed commands a grammar needs before "auto" enforces it
+FAST_COMMAND_ROUTER_STATS_FILE = "fast_command_router_stats.json"  # Shadow counts kept across sessions
+
 # Content generation settings
 CODE_GENERATION_MAX_LENGTH = 2000  # Maximum length for generated code
 CODE_GENERATION_TIMEOUT = 120.0    # Timeout for code generation (increased for complex requests)
@@ -422,16 +433,98 @@ AUDIO_SAMPLE_RATE = 16000  # Hz, for speech recognition
 AUDIO_CHUNK_SIZE = 1024    # Buffer size for audio processing
 AUDIO_RECORDING_DURATION = 8.0  # Maximum recording duration in seconds
 AUDIO_SILENCE_THRESHOLD = 0.005  # Threshold for silence detection (0.0 to 1.0) - lower = more sensitive
+AUDIO_HIGHPASS_CUTOFF_HZ = 80.0  # High-pass cutoff applied before transcription (0 disables)
+AUDIO_NORMALIZE_HEADROOM_DB = 0.1  # Peak normalization headroom before transcription
+
+# Debug audio capture (opt-in; utterances kept in memory, written only on demand)
+AUDIO_DEBUG_CAPTURE_ENABLED = False  # Keep recent utterances in a ring buffer
+AUDIO_DEBUG_CAPTURE_SIZE = 5         # Number of utterances kept
+AUDIO_DEBUG_CAPTURE_DIR = "debug_audio"  # Directory used when the ring buffer is dumped
 
 # Silence detection settings
 SILENCE_DETECTION_ENABLED = True  # Enable automatic silence detection
-SILENCE_DETECTION_DURATION = 1.0  # Seconds of silence required to stop recording
+SILENCE_DETECTION_DURATION = 0.7  # Seconds of non-speech after the utterance that end recording (endpoint latency)
 SILENCE_DETECTION_CHUNK_SIZE = 0.1  # Size of audio chunks for real-time analysis (seconds)
 SILENCE_DETECTION_SENSITIVITY = 0.05  # RMS threshold for silence detection (lower = more sensitive)
 MIN_RECORDING_DURATION = 0.5  # Minimum recording duration before silence detection kicks in
+
+# Voice activity detection (end-of-utterance detection while recording)
+VAD_ENGINE = "features"           # "features" (energy + zero-crossing + spectral flatness) or "webrtc" (requires webrtcvad)
+VAD_FRAME_DURATION = 0.02         # Analysis frame length in seconds (webrtc supports 0.01, 0.02 and 0.03)
+VAD_ENERGY_RATIO = 3.0            # Speech frames must exceed the noise floor by this factor
+VAD_MIN_ENERGY = 0.005            # Absolute RMS floor for speech frames
+VAD_SPECTRAL_FLATNESS_MAX = 0.35  # Louder frames flatter than this count as noise unless they look like fricatives
+VAD_MIN_SPEECH_DURATION = 0.1     # Consecutive speech required before an utterance starts (rejects clicks)
+VAD_WEBRTC_AGGRESSIVENESS = 2     # WebRTC non-speech filtering, 0 (least) to 3 (most)
+
+# Speech-to-text engine and worker process
+STT_ENGINE = "whisper"            # "whisper" (openai-whisper) or "faster-whisper" (CTranslate2, int8 on CPU)
+STT_MODEL = "small"               # Model size or path passed to the engine (small is more sensitive to quiet speech)
+STT_COMPUTE_TYPE = "int8"         # faster-whisper compute type ("int8", "int8_float32", "float32")
+STT_CPU_THREADS = 0               # faster-whisper CPU threads (0 = engine default)
+STT_WORKER_ENABLED = True         # Run STT in a long-lived worker process (warm model, no GIL contention)
+STT_WORKER_START_TIMEOUT = 120.0  # Seconds to wait for the worker to load and warm up its model
+STT_WORKER_MAX_AUDIO = 60.0       # Seconds of audio the worker's shared memory buffer holds
+
+# Streaming transcription settings (incremental Whisper passes while the user speaks)
+STREAMING_STT_ENABLED = True    # Transcribe during recording; only the uncommitted tail is transcribed after silence
+STREAMING_STT_STEP = 1.0        # Seconds of new audio between incremental passes
+STREAMING_STT_MIN_AUDIO = 1.0   # Seconds of uncommitted audio required before a pass
+
+# Shared audio capture (one persistent input stream for wake word and recording)
+AUDIO_CAPTURE_SHARED_STREAM = True    # Keep one microphone stream open and read both wake word and commands from it
+AUDIO_CAPTURE_BUFFER_SECONDS = 30.0   # Seconds of audio kept in the capture ring buffer
+AUDIO_CAPTURE_BLOCK_SIZE = 512        # Samples per capture callback (matches Porcupine's frame length)
+AUDIO_CAPTURE_PREROLL = 0.5           # Seconds of audio before recording start included in commands (never before the wake word end)
+
+# Idle power mode (low-CPU wake word listening; background workers suspended until the wake word)
+IDLE_POWER_MODE_ENABLED = True      # Suspend health, permission, dashboard and cache workers while idle
+WAKE_WORD_ENERGY_GATE_ENABLED = True  # Only run Porcupine while the input is louder than the noise floor
+WAKE_WORD_ENERGY_RATIO = 2.0        # Frames louder than noise floor * ratio open the gate
+WAKE_WORD_MIN_ENERGY = 0.003        # Absolute RMS below which frames never open the gate
+WAKE_WORD_GATE_PREROLL = 0.3        # Seconds before the gate opened that Porcupine still hears
+WAKE_WORD_GATE_HANGOVER = 1.0       # Seconds Porcupine keeps running after the last loud frame
+WAKE_WORD_FRAME_BATCH = 4           # Porcupine frames handled per wake-up (higher = less CPU, more latency)
 TTS_SPEED = 1.0           # Text-to-speech speed multiplier
 TTS_VOLUME = 0.8          # Text-to-speech volume (0.0 to 1.0)
 
+# Pre-rendered TTS phrases (fixed feedback played from memory instead of a fresh synthesis)
+TTS_PHRASE_CACHE_ENABLED = True   # Render fixed feedback utterances once and play them through the pygame mixer
+TTS_PHRASE_CACHE_DIR = str(BASE_DIR / ".cache" / "tts_phrases")  # Rendered audio, keyed by (text, voice, rate)
+TTS_PHRASE_CACHE_MAX_CHARS = 120  # Longer utterances are always synthesized live
+TTS_PHRASE_CACHE_PHRASES = [      # Rendered at startup
+    "Yes?",
+    "Session timed out. Say the wake word to reactivate.",
+    "I didn't hear a command. Please try again.",
+    "I can't hear you clearly. Please check your microphone settings and speak louder.",
+    "I can hear you but couldn't understand what you said. Please try speaking more clearly.",
+    "I'm having trouble with the microphone. Please check your audio settings.",
+    "I encountered an error while executing your command.",
+    "I had trouble processing your command. Please try again.",
+    "Previous action cancelled. Starting new deferred action.",
+    "Action timed out. Please try again.",
+]
+TTS_PHRASE_CACHE_TEMPLATES = [    # Regular expressions of templated utterances, rendered on first use
+    r".*(Code|Text|Content) generated successfully\..*",
+    r"(\.\.\. )?((Code|Text|Content) placed successfully|Failed to place content\. Please try again)\.",
+    r"(Attention: )?The deferred action has timed out after \d+ seconds\. The action has been cancelled\.",
+    r"\w+ is ready\. Say '[^']+' to activate\.",
+]
+
+# Sentence-pipelined TTS (long responses start playing after the first sentence is synthesized)
+TTS_PIPELINE_ENABLED = True            # Synthesize the next sentence while the current one plays
+TTS_PIPELINE_LOOKAHEAD = 2             # Sentences synthesized ahead of playback
+TTS_PIPELINE_MAX_SENTENCE_CHARS = 200  # Longer sentences are split at clause boundaries
+
+# Streaming LLM-to-speech (speak responses sentence by sentence while they are generated)
+STREAMING_SPEECH_ENABLED = True              # Conversation, question answering and explain-selection
+STREAMING_SPEECH_FIRST_SENTENCE_TIMEOUT = 3.0  # Seconds to wait for the first sentence before falling back
+
+# Feedback queue (stale items are dropped, duplicates coalesced, sound effects play alongside speech)
+FEEDBACK_SOUND_DEADLINE = 2.0      # Seconds after which a queued sound effect is dropped
+FEEDBACK_SPEECH_DEADLINE = 15.0    # Seconds after which queued LOW/NORMAL speech is dropped (None: never)
+FEEDBACK_PREEMPT_PRIORITY = "HIGH" # Speech at or above this priority interrupts lower-priority speech (None: off)
+
 # Hybrid feedback settings
 HYBRID_FEEDBACK_ENABLED = True  # Enable hybrid-specific audio feedback
 HYBRID_FAST_PATH_FEEDBACK = True  # Play subtle feedback for fast path execution
@@ -445,14 +538,84 @@ HYBRID_FEEDBACK_MESSAGES = True  # Enable spoken messages for hybrid feedback
 SCREENSHOT_QUALITY = 85    # JPEG quality for API transmission (1-100)
 MAX_SCREENSHOT_SIZE = 1920 # Max width/height for screenshots
 
+# Per-analysis-type screenshot encoding profiles (max width/height, JPEG quality, grayscale)
+# "simple" descriptions don't need full fidelity, coordinate-heavy analyses do
+SCREENSHOT_ENCODING_PROFILES = {
+    "simple": {"max_size": 1280, "quality": 60, "grayscale": False},
+    "detailed": {"max_size": MAX_SCREENSHOT_SIZE, "quality": SCREENSHOT_QUALITY, "grayscale": False},
+    "form": {"max_size": MAX_SCREENSHOT_SIZE, "quality": 75, "grayscale": False},
+    "clickable": {"max_size": MAX_SCREENSHOT_SIZE, "quality": SCREENSHOT_QUALITY, "grayscale": False}
+}
+# Analysis types whose results carry click coordinates; never downscaled below MAX_SCREENSHOT_SIZE
+SCREENSHOT_COORDINATE_ANALYSIS_TYPES = ["detailed", "form", "clickable"]
+SCREENSHOT_PROFILE_AUTOTUNE = True                  # Apply calibrated profiles when a calibration file exists
+SCREENSHOT_PROFILE_CALIBRATION_FILE = "screenshot_profile_calibration.json"  # Recorded accuracy/latency pairs
+SCREENSHOT_PROFILE_MIN_ACCURACY = 0.9               # Minimum accuracy (vs. full fidelity) a tuned profile must keep
+
+# Per-command perception context settings
+PERCEPTION_CONTEXT_ENABLED = True   # Share screenshot/vision/accessibility results across handlers within a command
+PERCEPTION_CONTEXT_MAX_AGE = 30.0   # Seconds before a memoized perception result is considered stale
+
+# Speculative perception settings (screen analysis started on wake word, in parallel with speech capture)
+SPECULATIVE_PERCEPTION_ENABLED = True                # Analyze the screen while the user is still speaking
+SPECULATIVE_PERCEPTION_ANALYSIS_TYPES = ["simple"]   # Analysis types precomputed after the wake word
+SPECULATIVE_PERCEPTION_TTL = 20.0                    # Seconds a speculative result stays usable
+SPECULATIVE_PERCEPTION_CHANGE_THRESHOLD = 3.0        # Max mean thumbnail pixel difference (0-255) to count as unchanged
+SPECULATIVE_PERCEPTION_WAIT_TIMEOUT = 10.0           # Seconds describe_screen waits for an in-flight speculative result
+SPECULATIVE_PERCEPTION_INTENTS = ["gui_interaction", "question_answering"]  # Intents that keep speculative results
+
+# Local UI element detector settings (OpenCV fast path tried before vision fallback)
+UI_DETECTOR_ENABLED = True                 # Detect buttons/fields locally before calling the vision model
+UI_DETECTOR_MIN_MATCH_CONFIDENCE = 0.6     # Minimum label/geometry score to click a detected element without vision
+UI_DETECTOR_MAX_CANDIDATES = 40            # Maximum candidates kept per screenshot
+UI_DETECTOR_MAX_HINT_CROPS = 3             # Cropped candidate regions sent to the vision model as hints
+
 # Automation settings
 MOUSE_MOVE_DURATION = 0.25  # Seconds for smooth cursor movement
 TYPE_INTERVAL = 0.05        # Seconds between keystrokes
 SCROLL_AMOUNT = 100         # Default scroll amount in pixels
+AUTOMATION_INPUT_BACKEND = "auto"  # "auto", "quartz" (in-process CGEvents), "cliclick", "recording" or "none"
+
+# Batched action execution (an action plan compiled into one cliclick invocation on macOS)
+AUTOMATION_BATCH_ENABLED = True         # Run compilable action runs as a single cliclick command line
+AUTOMATION_BATCH_ACTION_PAUSE_MS = 20   # Extra cliclick w: wait between actions (replaces per-action Python sleeps)
+AUTOMATION_BATCH_FOCUS_PAUSE_MS = 100   # Wait after a click before typing into the clicked field
+AUTOMATION_BATCH_TIMEOUT = 10.0         # Seconds before a batched cliclick invocation is abandoned
+
+# Automation telemetry (ring buffers; per-action aggregates are kept for the whole session)
+AUTOMATION_TELEMETRY_HISTORY_SIZE = 200  # Most recent performance records kept
+AUTOMATION_ACTION_HISTORY_SIZE = 500     # Most recent action history entries kept
+
+# Shared display geometry (bounds and scale factors of all displays, cached until reconfigured)
+DISPLAY_GEOMETRY_PROVIDER = "auto"  # "auto" (Quartz on macOS), "quartz", "pyautogui", "static" or "none"
+DISPLAY_GEOMETRY_MAX_AGE = 30.0     # Seconds before the layout is re-read without a reconfiguration event (0: never)
+
+# Pipelined action plan execution (step N+1 resolved in the background while step N runs)
+ACTION_PIPELINE_ENABLED = True
+
+# Batched form filling (fields resolved in one accessibility traversal, filled in one input stream)
+FORM_FILL_BATCH_ENABLED = True
+FORM_FILL_TAB_NAVIGATION = True    # Move between adjacent text fields with Tab instead of clicking
+FORM_FILL_TRAVERSAL_DEPTH = 20     # Maximum accessibility tree depth searched for form fields
+
+# Selected-text capture through the pasteboard (changeCount polling instead of fixed sleeps)
+CLIPBOARD_CAPTURE_BACKEND = "auto"     # "auto" (AppKit pasteboard if available), "appkit", "memory" or "none" (pyperclip)
+CLIPBOARD_CAPTURE_TIMEOUT = 0.5        # Seconds to wait for the copy to reach the pasteboard
+CLIPBOARD_CAPTURE_LAZY_RESTORE = True  # Restore the original clipboard in the background after returning the text
+
+# Hedged selected-text capture (clipboard method raced against the accessibility read)
+SELECTION_CAPTURE_HEDGED = True
+SELECTION_CAPTURE_HEDGE_DELAY = 0.15      # Seconds before starting the clipboard method for apps without history
+SELECTION_CAPTURE_HEDGE_MIN_DELAY = 0.02  # Bounds of the delay learned per app from accessibility read latency
+SELECTION_CAPTURE_HEDGE_MAX_DELAY = 0.5
 
 # API timeout settings
 VISION_API_TIMEOUT = 180    # Seconds - Increased for vision models (was 120)
 
+# Vision request scheduler settings
+VISION_MAX_CONCURRENT_REQUESTS = 1   # Concurrent vision requests sent to LM Studio
+VISION_QUEUE_WAIT_TIMEOUT = 600.0    # Seconds a caller waits for a scheduled vision result
+
 # Fallback coordinates for common UI elements when vision fails
 FALLBACK_COORDINATES = {
     "sign in": [(363, 360), (400, 350), (350, 370), (380, 360), (363, 340)],
@@ -857,6 +1020,15 @@ def validate_conversational_config():
     if INTENT_CACHE_TTL < 60 or INTENT_CACHE_TTL > 3600:
         warnings.append(f"INTENT_CACHE_TTL ({INTENT_CACHE_TTL}) should be between 60 and 3600 seconds for optimal performance")
     
+    if FAST_COMMAND_ROUTER_MODE not in ("off", "shadow", "auto", "enforce"):
+        errors.append("FAST_COMMAND_ROUTER_MODE must be 'off', 'shadow', 'auto' or 'enforce'")
+    
+    if not 0.0 <= FAST_COMMAND_ROUTER_MIN_CONFIDENCE <= 1.0 or not 0.0 <= FAST_COMMAND_ROUTER_MIN_PRECISION <= 1.0:
+        errors.append("FAST_COMMAND_ROUTER_MIN_CONFIDENCE and FAST_COMMAND_ROUTER_MIN_PRECISION must be between 0.0 and 1.0")
+    
+    if FAST_COMMAND_ROUTER_MIN_SAMPLES < 1:
+        errors.append("FAST_COMMAND_ROUTER_MIN_SAMPLES must be at least 1")
+    
     # Validate content generation settings
     if CODE_GENERATION_MAX_LENGTH < 100 or CODE_GENERATION_MAX_LENGTH > 10000:
         errors.append(f"CODE_GENERATION_MAX_LENGTH ({CODE_GENERATION_MAX_LENGTH}) must be between 100 and 10000")
@@ -963,9 +1135,63 @@ def validate_config():
     if MAX_SCREENSHOT_SIZE < 100:
         errors.append("MAX_SCREENSHOT_SIZE too small (minimum 100)")
     
+    for analysis_type, profile in SCREENSHOT_ENCODING_PROFILES.items():
+        if not 1 <= profile.get("quality", 0) <= 100:
+            errors.append(f"SCREENSHOT_ENCODING_PROFILES['{analysis_type}'] quality must be between 1 and 100")
+        if profile.get("max_size", 0) < 100:
+            errors.append(f"SCREENSHOT_ENCODING_PROFILES['{analysis_type}'] max_size too small (minimum 100)")
+        if analysis_type in SCREENSHOT_COORDINATE_ANALYSIS_TYPES and profile.get("max_size", 0) < MAX_SCREENSHOT_SIZE:
+            errors.append(f"SCREENSHOT_ENCODING_PROFILES['{analysis_type}'] returns coordinates; "
+                          f"max_size must be at least MAX_SCREENSHOT_SIZE")
+    
+    if not 0.0 <= SCREENSHOT_PROFILE_MIN_ACCURACY <= 1.0:
+        errors.append("SCREENSHOT_PROFILE_MIN_ACCURACY must be between 0.0 and 1.0")
+    
     if VISION_API_TIMEOUT < 1:
         errors.append("VISION_API_TIMEOUT too small (minimum 1 second)")
     
+    if VISION_MAX_CONCURRENT_REQUESTS < 1:
+        errors.append("VISION_MAX_CONCURRENT_REQUESTS must be at least 1")
+    
+    if not 0.0 <= UI_DETECTOR_MIN_MATCH_CONFIDENCE <= 1.0:
+        errors.append("UI_DETECTOR_MIN_MATCH_CONFIDENCE must be between 0.0 and 1.0")
+    
+    if UI_DETECTOR_MAX_CANDIDATES < 1:
+        errors.append("UI_DETECTOR_MAX_CANDIDATES must be at least 1")
+    
+    if AUTOMATION_BATCH_ACTION_PAUSE_MS < 0 or AUTOMATION_BATCH_FOCUS_PAUSE_MS < 0:
+        errors.append("AUTOMATION_BATCH_ACTION_PAUSE_MS and AUTOMATION_BATCH_FOCUS_PAUSE_MS must be non-negative")
+    
+    if AUTOMATION_INPUT_BACKEND not in ("auto", "quartz", "cliclick", "recording", "none"):
+        errors.append("AUTOMATION_INPUT_BACKEND must be 'auto', 'quartz', 'cliclick', 'recording' or 'none'")
+    
+    if AUTOMATION_BATCH_TIMEOUT <= 0:
+        errors.append("AUTOMATION_BATCH_TIMEOUT must be positive")
+    
+    if AUTOMATION_TELEMETRY_HISTORY_SIZE < 1 or AUTOMATION_ACTION_HISTORY_SIZE < 1:
+        errors.append("AUTOMATION_TELEMETRY_HISTORY_SIZE and AUTOMATION_ACTION_HISTORY_SIZE must be at least 1")
+    
+    if DISPLAY_GEOMETRY_PROVIDER not in ("auto", "quartz", "pyautogui", "static", "none"):
+        errors.append("DISPLAY_GEOMETRY_PROVIDER must be 'auto', 'quartz', 'pyautogui', 'static' or 'none'")
+    
+    if DISPLAY_GEOMETRY_MAX_AGE < 0:
+        errors.append("DISPLAY_GEOMETRY_MAX_AGE must be non-negative")
+    
+    if FORM_FILL_TRAVERSAL_DEPTH < 1:
+        errors.append("FORM_FILL_TRAVERSAL_DEPTH must be at least 1")
+    
+    if CLIPBOARD_CAPTURE_BACKEND not in ("auto", "appkit", "memory", "none"):
+        errors.append("CLIPBOARD_CAPTURE_BACKEND must be 'auto', 'appkit', 'memory' or 'none'")
+    
+    if CLIPBOARD_CAPTURE_TIMEOUT <= 0:
+        errors.append("CLIPBOARD_CAPTURE_TIMEOUT must be positive")
+    
+    if not 0 <= SELECTION_CAPTURE_HEDGE_MIN_DELAY <= SELECTION_CAPTURE_HEDGE_MAX_DELAY:
+        errors.append("SELECTION_CAPTURE_HEDGE_MIN_DELAY must be between 0 and SELECTION_CAPTURE_HEDGE_MAX_DELAY")
+    
+    if SELECTION_CAPTURE_HEDGE_DELAY < 0:
+        errors.append("SELECTION_CAPTURE_HEDGE_DELAY must be non-negative")
+    
     if REASONING_API_TIMEOUT < 1:
         errors.append("REASONING_API_TIMEOUT too small (minimum 1 second)")
     
@@ -973,6 +1199,54 @@ def validate_config():
     if AUDIO_SAMPLE_RATE < 8000:
         warnings.append("AUDIO_SAMPLE_RATE very low (may affect quality)")
     
+    if AUDIO_HIGHPASS_CUTOFF_HZ < 0 or AUDIO_HIGHPASS_CUTOFF_HZ >= AUDIO_SAMPLE_RATE / 2:
+        errors.append("AUDIO_HIGHPASS_CUTOFF_HZ must be between 0 and half the sample rate")
+    
+    if AUDIO_DEBUG_CAPTURE_SIZE < 1:
+        errors.append("AUDIO_DEBUG_CAPTURE_SIZE must be at least 1")
+    
+    if STREAMING_STT_STEP <= 0 or STREAMING_STT_MIN_AUDIO <= 0:
+        errors.append("STREAMING_STT_STEP and STREAMING_STT_MIN_AUDIO must be positive")
+    
+    if VAD_ENGINE not in ("features", "webrtc"):
+        errors.append("VAD_ENGINE must be 'features' or 'webrtc'")
+    
+    if VAD_ENGINE == "webrtc" and VAD_FRAME_DURATION not in (0.01, 0.02, 0.03):
+        errors.append("VAD_FRAME_DURATION must be 0.01, 0.02 or 0.03 for the webrtc engine")
+    
+    if VAD_FRAME_DURATION <= 0 or VAD_FRAME_DURATION > SILENCE_DETECTION_CHUNK_SIZE:
+        errors.append("VAD_FRAME_DURATION must be positive and no longer than SILENCE_DETECTION_CHUNK_SIZE")
+    
+    if not 0 <= VAD_WEBRTC_AGGRESSIVENESS <= 3:
+        errors.append("VAD_WEBRTC_AGGRESSIVENESS must be between 0 and 3")
+    
+    if VAD_ENERGY_RATIO <= 1.0:
+        warnings.append("VAD_ENERGY_RATIO should be greater than 1.0")
+    
+    if STT_ENGINE not in ("whisper", "faster-whisper") and ":" not in STT_ENGINE:
+        errors.append("STT_ENGINE must be 'whisper', 'faster-whisper' or a 'package.module:ClassName' path")
+    
+    if STT_WORKER_MAX_AUDIO < AUDIO_RECORDING_DURATION:
+        errors.append("STT_WORKER_MAX_AUDIO must be at least AUDIO_RECORDING_DURATION")
+    
+    if AUDIO_CAPTURE_BLOCK_SIZE < 1:
+        errors.append("AUDIO_CAPTURE_BLOCK_SIZE must be at least 1")
+    
+    if AUDIO_CAPTURE_PREROLL < 0 or AUDIO_CAPTURE_PREROLL >= AUDIO_CAPTURE_BUFFER_SECONDS:
+        errors.append("AUDIO_CAPTURE_PREROLL must be non-negative and shorter than AUDIO_CAPTURE_BUFFER_SECONDS")
+    
+    if WAKE_WORD_ENERGY_RATIO < 1.0:
+        errors.append("WAKE_WORD_ENERGY_RATIO must be at least 1.0")
+    if WAKE_WORD_GATE_PREROLL < 0 or WAKE_WORD_GATE_HANGOVER <= 0:
+        errors.append("WAKE_WORD_GATE_PREROLL must be non-negative and WAKE_WORD_GATE_HANGOVER positive")
+    if WAKE_WORD_FRAME_BATCH < 1:
+        errors.append("WAKE_WORD_FRAME_BATCH must be at least 1")
+    elif WAKE_WORD_FRAME_BATCH > 16:
+        warnings.append("WAKE_WORD_FRAME_BATCH above 16 adds noticeable wake word latency")
+    
+    if AUDIO_CAPTURE_BUFFER_SECONDS < AUDIO_RECORDING_DURATION:
+        warnings.append("AUDIO_CAPTURE_BUFFER_SECONDS should be at least AUDIO_RECORDING_DURATION")
+    
     if AUDIO_RECORDING_DURATION < 2.0 or AUDIO_RECORDING_DURATION > 30.0:
         warnings.append("AUDIO_RECORDING_DURATION should be between 2-30 seconds")
     
@@ -995,6 +1269,29 @@ def validate_config():
     if TTS_VOLUME < 0 or TTS_VOLUME > 1:
         errors.append("TTS_VOLUME must be between 0.0 and 1.0")
     
+    if TTS_PHRASE_CACHE_MAX_CHARS < 1:
+        errors.append("TTS_PHRASE_CACHE_MAX_CHARS must be positive")
+    for pattern in TTS_PHRASE_CACHE_TEMPLATES:
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            errors.append(f"Invalid TTS_PHRASE_CACHE_TEMPLATES pattern '{pattern}': {e}")
+    if any(len(phrase) > TTS_PHRASE_CACHE_MAX_CHARS for phrase in TTS_PHRASE_CACHE_PHRASES):
+        warnings.append("TTS_PHRASE_CACHE_PHRASES longer than TTS_PHRASE_CACHE_MAX_CHARS are never cached")
+    
+    if TTS_PIPELINE_LOOKAHEAD < 1:
+        errors.append("TTS_PIPELINE_LOOKAHEAD must be at least 1")
+    if TTS_PIPELINE_MAX_SENTENCE_CHARS < 20:
+        warnings.append("TTS_PIPELINE_MAX_SENTENCE_CHARS below 20 splits sentences into unnatural fragments")
+    if STREAMING_SPEECH_FIRST_SENTENCE_TIMEOUT <= 0:
+        errors.append("STREAMING_SPEECH_FIRST_SENTENCE_TIMEOUT must be positive")
+    if FEEDBACK_SOUND_DEADLINE <= 0:
+        errors.append("FEEDBACK_SOUND_DEADLINE must be positive")
+    if FEEDBACK_SPEECH_DEADLINE is not None and FEEDBACK_SPEECH_DEADLINE <= 0:
+        errors.append("FEEDBACK_SPEECH_DEADLINE must be positive or None")
+    if FEEDBACK_PREEMPT_PRIORITY not in (None, "LOW", "NORMAL", "HIGH", "CRITICAL"):
+        errors.append("FEEDBACK_PREEMPT_PRIORITY must be LOW, NORMAL, HIGH, CRITICAL or None")
+    
     # Check hybrid feedback settings
     if not 0.0 <= HYBRID_FEEDBACK_VOLUME <= 1.0:
         errors.append("HYBRID_FEEDBACK_VOLUME must be between 0.0 and 1.0")
@@ -1324,8 +1621,23 @@ def get_config_summary():
             'silence_detection_chunk_size': SILENCE_DETECTION_CHUNK_SIZE,
             'silence_detection_sensitivity': SILENCE_DETECTION_SENSITIVITY,
             'min_recording_duration': MIN_RECORDING_DURATION,
+            'vad_engine': VAD_ENGINE,
+            'vad_min_speech_duration': VAD_MIN_SPEECH_DURATION,
+            'highpass_cutoff_hz': AUDIO_HIGHPASS_CUTOFF_HZ,
+            'debug_capture_enabled': AUDIO_DEBUG_CAPTURE_ENABLED,
+            'stt_engine': STT_ENGINE,
+            'stt_model': STT_MODEL,
+            'stt_worker_enabled': STT_WORKER_ENABLED,
+            'streaming_stt_enabled': STREAMING_STT_ENABLED,
+            'shared_capture_stream': AUDIO_CAPTURE_SHARED_STREAM,
             'tts_speed': TTS_SPEED,
             'tts_volume': TTS_VOLUME,
+            'tts_phrase_cache_enabled': TTS_PHRASE_CACHE_ENABLED,
+            'tts_pipeline_enabled': TTS_PIPELINE_ENABLED,
+            'idle_power_mode_enabled': IDLE_POWER_MODE_ENABLED,
+            'wake_word_energy_gate_enabled': WAKE_WORD_ENERGY_GATE_ENABLED,
+            'streaming_speech_enabled': STREAMING_SPEECH_ENABLED,
+            'feedback_preempt_priority': FEEDBACK_PREEMPT_PRIORITY,
             'hybrid_feedback_enabled': HYBRID_FEEDBACK_ENABLED,
             'hybrid_fast_path_feedback': HYBRID_FAST_PATH_FEEDBACK,
             'hybrid_slow_path_feedback': HYBRID_SLOW_PATH_FEEDBACK,
@@ -1336,12 +1648,31 @@ def get_config_summary():
         'vision': {
             'screenshot_quality': SCREENSHOT_QUALITY,
             'max_screenshot_size': MAX_SCREENSHOT_SIZE,
-            'api_timeout': VISION_API_TIMEOUT
+            'screenshot_encoding_profiles': SCREENSHOT_ENCODING_PROFILES,
+            'screenshot_profile_autotune': SCREENSHOT_PROFILE_AUTOTUNE,
+            'api_timeout': VISION_API_TIMEOUT,
+            'perception_context_enabled': PERCEPTION_CONTEXT_ENABLED,
+            'perception_context_max_age': PERCEPTION_CONTEXT_MAX_AGE,
+            'speculative_perception_enabled': SPECULATIVE_PERCEPTION_ENABLED,
+            'speculative_perception_analysis_types': SPECULATIVE_PERCEPTION_ANALYSIS_TYPES,
+            'speculative_perception_ttl': SPECULATIVE_PERCEPTION_TTL,
+            'ui_detector_enabled': UI_DETECTOR_ENABLED,
+            'max_concurrent_requests': VISION_MAX_CONCURRENT_REQUESTS,
+            'queue_wait_timeout': VISION_QUEUE_WAIT_TIMEOUT
         },
         'automation': {
             'mouse_move_duration': MOUSE_MOVE_DURATION,
             'type_interval': TYPE_INTERVAL,
-            'scroll_amount': SCROLL_AMOUNT
+            'scroll_amount': SCROLL_AMOUNT,
+            'input_backend': AUTOMATION_INPUT_BACKEND,
+            'batch_enabled': AUTOMATION_BATCH_ENABLED,
+            'telemetry_history_size': AUTOMATION_TELEMETRY_HISTORY_SIZE,
+            'display_geometry_provider': DISPLAY_GEOMETRY_PROVIDER,
+            'pipeline_enabled': ACTION_PIPELINE_ENABLED,
+            'form_fill_batch_enabled': FORM_FILL_BATCH_ENABLED,
+            'clipboard_capture_backend': CLIPBOARD_CAPTURE_BACKEND,
+            'selection_capture_hedged': SELECTION_CAPTURE_HEDGED,
+            'fast_command_router_mode': FAST_COMMAND_ROUTER_MODE
         },
         'system': {
             'debug_mode': DEBUG_MODE,
@@ -6,11 +6,17 @@ It provides a standardized interface for command processing, error handling, and
 """
 
 import logging
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Iterable, List, Optional
 from dataclasses import dataclass
 
+from config import STREAMING_SPEECH_ENABLED, STREAMING_SPEECH_FIRST_SENTENCE_TIMEOUT
+from modules.perception_context import PerceptionContext
+from modules.speech_stream import SpeechStream
+from modules.vision_scheduler import VisionRequestPriority
+
 
 @dataclass
 class HandlerResult:
@@ -232,6 +238,137 @@ class BaseHandler(ABC):
             self.logger.error(f"Error accessing module '{module_name}': {e}")
             return None
     
+    def _get_perception_context(self, context: Optional[Dict[str, Any]] = None) -> Optional[PerceptionContext]:
+        """
+        Get the per-command perception context shared across handlers.
+        
+        Args:
+            context: Optional handler context passed to handle()
+            
+        Returns:
+            PerceptionContext for the executing command, or None if unavailable
+        """
+        perception = context.get('perception') if isinstance(context, dict) else None
+        if perception is None:
+            getter = getattr(self.orchestrator, '_get_active_perception_context', None)
+            if callable(getter):
+                try:
+                    perception = getter()
+                except Exception as e:
+                    self.logger.debug(f"Could not get active perception context: {e}")
+                    perception = None
+        
+        return perception if isinstance(perception, PerceptionContext) else None
+    
+    def _describe_screen(self, vision_module, analysis_type: str = "simple",
+                         context: Optional[Dict[str, Any]] = None,
+                         priority=VisionRequestPriority.INTERACTIVE,
+                         hints: Optional[List[Dict[str, Any]]] = None,
+                         screenshot_b64: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Describe the screen, reusing this command's perception results when possible.
+        
+        Args:
+            vision_module: Vision module to use when no perception context exists
+            analysis_type: Vision analysis type
+            context: Optional handler context passed to handle()
+            priority: Vision request priority (fallback paths should use FALLBACK)
+            hints: Optional local UI detector candidates for the vision model
+            screenshot_b64: Screenshot the hints were detected in; analyzed
+                instead of a new capture when there is no perception context
+                (the perception context already reuses its memoized capture)
+            
+        Returns:
+            Screen analysis results
+        """
+        hint_kwargs = {'hints': hints} if hints else {}
+        perception = self._get_perception_context(context)
+        if perception is not None and perception.vision_module is vision_module:
+            return perception.describe_screen(analysis_type=analysis_type, priority=priority, **hint_kwargs)
+        if hints and screenshot_b64:
+            hint_kwargs['screenshot_b64'] = screenshot_b64
+        return vision_module.describe_screen(analysis_type=analysis_type, priority=priority, **hint_kwargs)
+    
+    def _stream_llm_to_speech(self, tokens: Iterable[str],
+                              transform: Optional[Callable[[str], str]] = None,
+                              max_chars: Optional[int] = None,
+                              first_sentence_timeout: float = STREAMING_SPEECH_FIRST_SENTENCE_TIMEOUT,
+                              priority=None, audio_module=None) -> Optional[SpeechStream]:
+        """
+        Speak an LLM response sentence by sentence while it is being generated.
+        
+        Speech starts as soon as the first sentence is complete, so the delay
+        before the user hears the answer does not grow with its length.
+        
+        Args:
+            tokens: LLM response deltas (e.g. ReasoningModule.stream_query())
+            transform: Post-processing applied to each sentence before it is spoken
+            max_chars: Spoken length budget
+            first_sentence_timeout: Seconds to wait for the first sentence
+            priority: Feedback priority for the FeedbackModule queue
+            audio_module: Speak through this AudioModule instead of the
+                orchestrator's feedback/audio modules
+            
+        Returns:
+            The SpeechStream once generation has ended, or None if nothing was
+            spoken (streaming disabled or unavailable, the stream failed or no
+            sentence arrived in time) so the caller can use its non-streaming path
+        """
+        if not STREAMING_SPEECH_ENABLED:
+            return None
+        
+        speak = self._get_stream_speaker(priority, audio_module)
+        if speak is None:
+            return None
+        
+        lock = threading.Lock()
+        abandoned = threading.Event()
+        errors = []
+        
+        def start_speaking(stream: SpeechStream) -> None:
+            with lock:
+                if not abandoned.is_set():
+                    speak(stream)
+        
+        stream = SpeechStream(transform=transform, max_chars=max_chars, on_first_sentence=start_speaking)
+        
+        def feed():
+            try:
+                stream.feed(tokens)
+            except Exception as e:
+                errors.append(e)
+        
+        threading.Thread(target=feed, daemon=True, name="LLMSpeechStream").start()
+        
+        stream.wait_for_first_sentence(first_sentence_timeout)
+        with lock:
+            if not stream.sentences:
+                abandoned.set()
+                stream.cancel()
+                reason = errors[0] if errors else f"no sentence within {first_sentence_timeout}s"
+                self.logger.info(f"Streamed response unavailable ({reason}), using non-streaming path")
+                return None
+        
+        stream.wait_until_finished()
+        self.logger.info(f"Streamed {len(stream.sentences)} sentences, first after "
+                         f"{stream.time_to_first_sentence * 1000:.0f}ms")
+        return stream
+    
+    def _get_stream_speaker(self, priority=None, audio_module=None) -> Optional[Callable[[SpeechStream], None]]:
+        """Get a callable that starts speaking a SpeechStream without blocking."""
+        if audio_module is None:
+            feedback_module = getattr(self.orchestrator, 'feedback_module', None)
+            if feedback_module is not None and hasattr(feedback_module, 'speak_stream'):
+                kwargs = {'priority': priority} if priority is not None else {}
+                return lambda stream: feedback_module.speak_stream(stream, **kwargs)
+            audio_module = getattr(self.orchestrator, 'audio_module', None)
+        
+        if audio_module is not None and hasattr(audio_module, 'speak_sentences'):
+            return lambda stream: threading.Thread(
+                target=audio_module.speak_sentences, args=(stream,), daemon=True, name="StreamedSpeech"
+            ).start()
+        return None
+    
     def _handle_module_error(self, module_name: str, error: Exception, operation: str) -> Dict[str, Any]:
         """
         Handle errors from module operations with consistent logging and error reporting.
@@ -7,7 +7,7 @@ GUI automation tasks.
 """
 
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .base_handler import BaseHandler
 
 
@@ -53,11 +53,15 @@ class ConversationHandler(BaseHandler):
             # Build conversation context
             conversation_context = self._build_conversation_context()
             
-            # Generate conversational response (placeholder for now)
-            response = self._generate_conversational_response(command, conversation_context, execution_id)
+            # Speak the response while it is generated, if the reasoning backend can stream
+            response = self._stream_conversational_response(command, conversation_context, execution_id)
             
-            # Speak the response
-            self._speak_response(response, execution_id)
+            if response is None:
+                # Generate conversational response (placeholder for now)
+                response = self._generate_conversational_response(command, conversation_context, execution_id)
+                
+                # Speak the response
+                self._speak_response(response, execution_id)
             
             # Update conversation history
             self._update_conversation_history(command, response)
@@ -121,6 +125,41 @@ class ConversationHandler(BaseHandler):
             self.logger.error(f"[{execution_id}] Conversational response generation failed: {e}")
             return self._get_error_fallback_response(str(e))
     
+    def _stream_conversational_response(self, query: str, context: Dict[str, Any], execution_id: str) -> Optional[str]:
+        """
+        Generate and speak a conversational response sentence by sentence.
+        
+        Args:
+            query: User's conversational query
+            context: Conversation context
+            execution_id: Unique execution identifier
+            
+        Returns:
+            The spoken response, or None if streaming was not possible and
+            nothing was spoken
+        """
+        reasoning_module = getattr(self.orchestrator, 'reasoning_module', None)
+        if reasoning_module is None or not hasattr(reasoning_module, 'stream_query'):
+            return None
+        
+        try:
+            tokens = reasoning_module.stream_query(
+                query=query,
+                prompt_template='CONVERSATIONAL_PROMPT',
+                context=context
+            )
+            stream = self._stream_llm_to_speech(tokens, max_chars=500)
+        except Exception as e:
+            self.logger.debug(f"[{execution_id}] Streaming conversational response failed: {e}")
+            return None
+        
+        if stream is None:
+            return None
+        
+        response = stream.text
+        self.logger.info(f"[{execution_id}] Streamed conversational response: {response[:100]}...")
+        return response
+    
     def _get_error_fallback_response(self, error_message: str) -> str:
         """
         Generate an appropriate fallback response based on the error type.
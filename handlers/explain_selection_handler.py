@@ -128,7 +128,11 @@ class ExplainSelectionHandler(BaseHandler):
             self.logger.debug("Step 2: Generating explanation")
             explanation_start_time = time.time()
             
-            explanation = self._generate_explanation(selected_text, command)
+            # Speak the explanation while it is generated, if the reasoning backend can stream
+            explanation = self._stream_explanation(selected_text, command)
+            streamed = explanation is not None
+            if not streamed:
+                explanation = self._generate_explanation(selected_text, command)
             explanation_time = time.time() - explanation_start_time
             
             if not explanation:
@@ -153,7 +157,11 @@ class ExplainSelectionHandler(BaseHandler):
             
             # Step 3: Provide spoken feedback
             self.logger.debug("Step 3: Speaking explanation to user")
-            self._speak_explanation(explanation)
+            if streamed:
+                print(f"\n🤖 AURA: {explanation}\n")
+                self.logger.info(f"AURA Explanation delivered: {explanation[:100]}...")
+            else:
+                self._speak_explanation(explanation)
             
             # Step 4: Provide success confirmation and return to ready state
             self.logger.debug("Step 4: Providing success confirmation")
@@ -169,7 +177,8 @@ class ExplainSelectionHandler(BaseHandler):
                 capture_time=capture_time,
                 explanation_time=explanation_time,
                 selected_text_length=len(selected_text),
-                explanation_length=len(explanation)
+                explanation_length=len(explanation),
+                streamed=streamed
             )
             
             self._log_execution_end(start_time, result, context)
@@ -194,7 +203,8 @@ class ExplainSelectionHandler(BaseHandler):
         Capture selected text using accessibility API with clipboard fallback.
         
         This method uses the unified text capture interface from AccessibilityModule
-        which tries accessibility API first, then falls back to clipboard method.
+        which tries accessibility API first, then falls back to clipboard method
+        (or races the two, with hedged capture enabled).
         
         Returns:
             Tuple of (selected text if successful or None if failed, capture method used)
@@ -210,10 +220,10 @@ class ExplainSelectionHandler(BaseHandler):
             selected_text = accessibility_module.get_selected_text()
             
             if selected_text:
-                # Determine which method was actually used by checking the module's last operation
-                # This is a simplified approach - in practice, the accessibility module could
-                # provide more detailed information about which method succeeded
-                capture_method = "accessibility_api_or_clipboard_fallback"
+                # Hedged capture records which method won; otherwise it isn't known
+                capture_method = getattr(accessibility_module, 'last_text_capture_method', None)
+                if not isinstance(capture_method, str):
+                    capture_method = "accessibility_api_or_clipboard_fallback"
                 
                 # Basic validation of captured text
                 if len(selected_text.strip()) == 0:
@@ -490,6 +500,82 @@ class ExplainSelectionHandler(BaseHandler):
             self.logger.error(f"Unexpected error during explanation generation: {e}")
             return self._handle_generation_exception(e, selected_text)
     
+    def _stream_explanation(self, selected_text: str, command: str) -> Optional[str]:
+        """
+        Generate and speak an explanation sentence by sentence.
+        
+        Each sentence is cleaned up for speech (wrapper text, markdown,
+        abbreviations) as soon as it arrives and spoken while the rest of the
+        explanation is still being generated.
+        
+        Args:
+            selected_text: The text to explain
+            command: The original user command for context
+            
+        Returns:
+            The spoken explanation, or None if nothing was spoken (streaming
+            unavailable or failed, or a cached explanation exists)
+        """
+        reasoning_module = getattr(self.orchestrator, 'reasoning_module', None)
+        if reasoning_module is None or not hasattr(reasoning_module, 'stream_query'):
+            return None
+        
+        try:
+            from modules.performance_monitor import get_performance_monitor
+            monitor = get_performance_monitor()
+        except ImportError:
+            monitor = None
+        
+        # Cached explanations are returned immediately by _generate_explanation()
+        cache_key = self._create_explanation_cache_key(selected_text, command)
+        if monitor and monitor.explanation_cache.get(cache_key):
+            return None
+        
+        # Same limit as the non-streaming path (2000 char query limit minus prompt template)
+        max_text_length = 1685
+        if len(selected_text) > max_text_length:
+            selected_text = selected_text[:max_text_length] + "..."
+        
+        first_sentence = [True]
+        
+        def prepare_sentence(sentence: str) -> str:
+            if first_sentence:
+                first_sentence.clear()
+                sentence = self._strip_explanation_wrapper(sentence)
+            if not sentence:
+                return ""
+            sentence = self._improve_explanation_quality(sentence, selected_text)
+            return self._optimize_for_spoken_delivery(sentence)
+        
+        try:
+            from config import EXPLAIN_TEXT_PROMPT
+            
+            tokens = reasoning_module.stream_query(
+                query=EXPLAIN_TEXT_PROMPT.format(selected_text=selected_text),
+                context={
+                    "command": command,
+                    "text_length": len(selected_text),
+                    "content_type": self._determine_content_type(selected_text)
+                }
+            )
+            stream = self._stream_llm_to_speech(
+                tokens,
+                transform=prepare_sentence,
+                max_chars=400,  # Same budget as _optimize_for_spoken_delivery()
+                priority=FeedbackPriority.HIGH
+            )
+        except Exception as e:
+            self.logger.debug(f"Streaming explanation unavailable: {e}")
+            return None
+        
+        if stream is None:
+            return None
+        
+        explanation = stream.text
+        if monitor and len(explanation) > 10:
+            monitor.explanation_cache.put(cache_key, explanation, ttl=300.0)
+        return explanation
+    
     def _create_explanation_cache_key(self, selected_text: str, command: str) -> str:
         """Create a cache key for explanation caching."""
         import hashlib
@@ -606,23 +692,7 @@ Provide a clear, concise explanation."""
         try:
             # Handle direct string responses (most common for process_query)
             if isinstance(response, str):
-                explanation = response.strip()
-                
-                # Remove common wrapper text that might be added by the model
-                unwrap_patterns = [
-                    "Here's an explanation:",
-                    "Here is an explanation:",
-                    "Explanation:",
-                    "The explanation is:",
-                    "This text means:",
-                    "This means:"
-                ]
-                
-                for pattern in unwrap_patterns:
-                    if explanation.lower().startswith(pattern.lower()):
-                        explanation = explanation[len(pattern):].strip()
-                        break
-                
+                explanation = self._strip_explanation_wrapper(response)
                 return explanation if explanation else None
             
             # Handle dictionary responses (from get_action_plan or structured responses)
@@ -696,6 +766,33 @@ Provide a clear, concise explanation."""
             self.logger.debug(f"Response type: {type(response)}, Response: {str(response)[:200]}...")
             return None
     
+    def _strip_explanation_wrapper(self, text: str) -> str:
+        """
+        Remove common wrapper text that might be added by the model.
+        
+        Args:
+            text: Start of the model's response
+            
+        Returns:
+            The text without a leading "Explanation:"-style wrapper
+        """
+        explanation = text.strip()
+        unwrap_patterns = [
+            "Here's an explanation:",
+            "Here is an explanation:",
+            "Explanation:",
+            "The explanation is:",
+            "This text means:",
+            "This means:"
+        ]
+        
+        for pattern in unwrap_patterns:
+            if explanation.lower().startswith(pattern.lower()):
+                explanation = explanation[len(pattern):].strip()
+                break
+        
+        return explanation
+    
     def _validate_explanation_quality(self, explanation: str, original_text: str) -> bool:
         """
         Validate the quality of the generated explanation with enhanced checks.
@@ -8,8 +8,11 @@ and vision fallback approaches for maximum reliability.
 
 import time
 import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from .base_handler import BaseHandler
+from modules.vision_scheduler import VisionRequestPriority
+from modules.action_pipeline import action_pipeline
+from config import UI_DETECTOR_ENABLED
 
 
 class GUIHandler(BaseHandler):
@@ -24,7 +27,8 @@ class GUIHandler(BaseHandler):
     
     The handler uses a two-tier approach:
     1. Fast path: Uses accessibility API for quick, precise actions
-    2. Vision fallback: Uses computer vision when fast path fails
+    2. Vision fallback: Uses computer vision when fast path fails, trying the
+       local OpenCV element detector before calling the vision model
     """
     
     def handle(self, command: str, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -58,6 +62,22 @@ class GUIHandler(BaseHandler):
                     system_health=system_health
                 )
             
+            # Type, key and scroll commands recognized by the fast command router need no element lookup
+            fast_route = (context.get('intent') or {}).get('fast_route')
+            if fast_route and fast_route.get('grammar') in ('type', 'key', 'scroll'):
+                routed_result = self._execute_routed_command(command, fast_route)
+                if routed_result.get('success'):
+                    result = self._create_success_result(
+                        routed_result.get('message', 'GUI command executed successfully'),
+                        method=routed_result.get('method'),
+                        execution_time=routed_result.get('execution_time')
+                    )
+                else:
+                    result = self._create_error_result(routed_result.get('error', 'Routed command failed'),
+                                                       method=routed_result.get('method'))
+                self._log_execution_end(start_time, result, context)
+                return result
+            
             # Attempt fast path execution first
             fast_path_result = self._attempt_fast_path(command, context)
             if fast_path_result.get('success'):
@@ -73,7 +93,7 @@ class GUIHandler(BaseHandler):
             
             # Fast path failed, attempt vision fallback
             self.logger.info("Fast path failed, attempting vision fallback")
-            vision_result = self._attempt_vision_fallback(command, context)
+            vision_result = self._attempt_vision_fallback(command, context, fast_path_result=fast_path_result)
             
             if vision_result.get('success'):
                 result = self._create_success_result(
@@ -160,8 +180,12 @@ class GUIHandler(BaseHandler):
             if command_info.get('command_type') == 'type':
                 return self._execute_direct_typing_command(command, command_info, automation_module)
             
-            # Extract GUI elements from command for other types
-            gui_elements = self._extract_gui_elements_from_command(command)
+            # Extract GUI elements from command for other types (clean label from the fast command router)
+            fast_route = (context.get('intent') or {}).get('fast_route') or {}
+            if fast_route.get('grammar') == 'click':
+                gui_elements = self._gui_elements_from_route(fast_route)
+            else:
+                gui_elements = self._extract_gui_elements_from_command(command)
             if not gui_elements:
                 return {
                     'success': False,
@@ -184,7 +208,8 @@ class GUIHandler(BaseHandler):
                     'error': 'Element not found via accessibility search',
                     'method': 'fast_path',
                     'gui_elements': gui_elements,
-                    'enhanced_search_details': enhanced_result.to_dict() if enhanced_result else None
+                    'enhanced_search_details': enhanced_result.to_dict() if enhanced_result else None,
+                    'fuzzy_matches': list(enhanced_result.fuzzy_matches or []) if enhanced_result else []
                 }
             
             # Execute the action using automation module
@@ -225,13 +250,16 @@ class GUIHandler(BaseHandler):
                 'method': 'fast_path'
             }
     
-    def _attempt_vision_fallback(self, command: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _attempt_vision_fallback(self, command: str, context: Dict[str, Any],
+                                 fast_path_result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Fallback to vision-based execution when fast path fails.
         
         Args:
             command: GUI command to execute
             context: Execution context
+            fast_path_result: Failed fast path result (its fuzzy accessibility
+                matches are used to confirm locally detected elements)
             
         Returns:
             Vision fallback execution result with success/failure status
@@ -251,9 +279,23 @@ class GUIHandler(BaseHandler):
             
             start_time = time.time()
             
+            # Step 0: Local element detection (no vision model call)
+            hints = None
+            hint_screenshot = None
+            if UI_DETECTOR_ENABLED:
+                local_result = self._attempt_local_detection(
+                    command, context, vision_module, automation_module, fast_path_result
+                )
+                if local_result.get('success'):
+                    return local_result
+                hints = local_result.get('hints')
+                hint_screenshot = local_result.get('screenshot_b64')
+            
             # Step 1: Screen perception
             self.logger.info("Performing screen perception for vision fallback")
-            screen_context = self._perform_screen_perception(vision_module)
+            screen_context = self._perform_screen_perception(
+                vision_module, context, hints=hints, screenshot_b64=hint_screenshot
+            )
             
             if not screen_context:
                 return {
@@ -312,6 +354,99 @@ class GUIHandler(BaseHandler):
                 'method': 'vision_fallback'
             }
     
+    def _attempt_local_detection(self, command: str, context: Dict[str, Any], vision_module,
+                                 automation_module, fast_path_result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Locate the target element with the local OpenCV detector.
+        
+        Detected controls are matched against elements the accessibility layer
+        already knows (fuzzy matches from the failed fast path). A confident
+        match is clicked directly; otherwise the candidates are returned as
+        hints for the vision model.
+        
+        Args:
+            command: GUI command to execute
+            context: Execution context
+            vision_module: Vision module used to capture the screen
+            automation_module: Automation module used to execute the action
+            fast_path_result: Failed fast path result
+            
+        Returns:
+            Result with success status, and 'hints' (in pixels of the returned
+            'screenshot_b64') when no confident match was found
+        """
+        try:
+            from modules.ui_element_detector import ui_element_detector, match_known_elements, build_vision_hints
+            
+            start_time = time.time()
+            perception = self._get_perception_context(context)
+            if perception is not None and perception.vision_module is vision_module:
+                screenshot_b64 = perception.get_screenshot("clickable")
+            else:
+                screenshot_b64 = vision_module.capture_screen_as_base64(analysis_type="clickable")
+            
+            image = ui_element_detector.decode_screenshot(screenshot_b64) if screenshot_b64 else None
+            if image is None:
+                return {'success': False, 'error': 'Screenshot unavailable for local detection', 'method': 'local_detection'}
+            
+            candidates = ui_element_detector.detect(image)
+            if not candidates:
+                return {'success': False, 'error': 'No candidate elements detected', 'method': 'local_detection'}
+            
+            # Detection runs on the encoded screenshot; map boxes to screen coordinates
+            try:
+                screen_width, screen_height = vision_module.get_screen_resolution()
+                scale = (screen_width / image.shape[1], screen_height / image.shape[0])
+            except Exception:
+                scale = (1.0, 1.0)
+            screen_candidates = [candidate.scaled(*scale) for candidate in candidates]
+            
+            fast_path_result = fast_path_result or {}
+            gui_elements = fast_path_result.get('gui_elements') or self._extract_gui_elements_from_command(command) or {}
+            action_type = gui_elements.get('action', 'click')
+            match = match_known_elements(
+                screen_candidates,
+                fast_path_result.get('fuzzy_matches', []),
+                gui_elements.get('label', '')
+            )
+            
+            if match and action_type in ('click', 'double_click', 'right_click'):
+                candidate = match['candidate']
+                action_result = automation_module.execute_fast_path_action(
+                    action_type=action_type,
+                    coordinates=list(candidate.center),
+                    element_info=match['element']
+                )
+                if action_result.get('success', False):
+                    label = match['element'].get('title') or gui_elements.get('label', 'element')
+                    self.logger.info(f"Local detection matched '{label}' "
+                                     f"(confidence {match['confidence']:.2f}, {ui_element_detector.last_detection_ms:.0f}ms)")
+                    return {
+                        'success': True,
+                        'execution_time': time.time() - start_time,
+                        'method': 'local_detection',
+                        'element_found': match['element'],
+                        'action_result': action_result,
+                        'match_confidence': match['confidence'],
+                        'message': f"Successfully executed {action_type} on {label} using local detection"
+                    }
+            
+            return {
+                'success': False,
+                'error': 'No confident local match',
+                'method': 'local_detection',
+                'hints': build_vision_hints(image, candidates),
+                'screenshot_b64': screenshot_b64
+            }
+            
+        except Exception as e:
+            self.logger.warning(f"Local element detection failed: {e}")
+            return {
+                'success': False,
+                'error': f"Local detection exception: {str(e)}",
+                'method': 'local_detection'
+            }
+    
     def _check_system_health(self) -> Dict[str, Any]:
         """
         Check system health before GUI operations.
@@ -429,6 +564,72 @@ class GUIHandler(BaseHandler):
             self.logger.error(f"GUI element extraction failed: {e}")
             return None
     
+    def _gui_elements_from_route(self, fast_route: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        GUI element info for a click command recognized by the fast command router.
+        
+        Args:
+            fast_route: Routed command from the intent
+            
+        Returns:
+            Dictionary with GUI element info
+        """
+        parameters = fast_route.get('parameters', {})
+        action = parameters.get('action', 'click')
+        label = parameters.get('label', '')
+        # Role words the command named ("the Save button"); others (folder, icon, ...) are inferred
+        role = {'button': 'button', 'link': 'link', 'menu': 'menu', 'field': 'textfield'}.get(parameters.get('role'))
+        return {
+            'action': action,
+            'label': label,
+            'role': role or self._infer_element_role(label, action),
+            'app_name': None
+        }
+    
+    def _execute_routed_command(self, command: str, fast_route: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a type, key or scroll command recognized by the fast command router.
+        
+        These go straight to the automation module, without the accessibility
+        fast path or vision.
+        
+        Args:
+            command: Original command
+            fast_route: Routed command from the intent ('grammar', 'parameters')
+            
+        Returns:
+            Execution result with success status
+        """
+        grammar = fast_route.get('grammar')
+        parameters = fast_route.get('parameters', {})
+        method = f"direct_{grammar}"
+        
+        automation_module = self._get_module_safely('automation_module')
+        if not automation_module:
+            return {'success': False, 'error': 'Automation module not available', 'method': method}
+        
+        if grammar == 'type':
+            return self._execute_direct_typing_command(command, {'command_type': 'type'}, automation_module,
+                                                       text=parameters.get('text'))
+        
+        start_time = time.time()
+        try:
+            if grammar == 'key':
+                keys = parameters.get('keys', [])
+                if not automation_module.press_keys(keys):
+                    return {'success': False, 'error': f"Could not press {'+'.join(keys)}", 'method': method}
+                message = f"Pressed {'+'.join(keys)}"
+            else:
+                action = {'action': 'scroll', 'direction': parameters.get('direction', 'down')}
+                if 'amount' in parameters:
+                    action['amount'] = parameters['amount']
+                automation_module.execute_action(action)
+                message = f"Scrolled {action['direction']}"
+        except Exception as e:
+            return {'success': False, 'error': f"Routed {grammar} command failed: {str(e)}", 'method': method}
+        
+        return {'success': True, 'execution_time': time.time() - start_time, 'method': method, 'message': message}
+    
     def _infer_element_role(self, label: str, action: str) -> str:
         """
         Infer the likely accessibility role of an element based on its label and action.
@@ -464,21 +665,27 @@ class GUIHandler(BaseHandler):
         else:
             return 'button'
     
-    def _execute_direct_typing_command(self, command: str, command_info: Dict[str, Any], automation_module) -> Dict[str, Any]:
+    def _execute_direct_typing_command(self, command: str, command_info: Dict[str, Any], automation_module,
+                                       text: Optional[str] = None) -> Dict[str, Any]:
         """
         Execute a direct typing command without needing to find GUI elements.
         
+        The text is typed into the focused element.
+        
         Args:
             command: Original command
             command_info: Preprocessed command information
             automation_module: Automation module instance
+            text: Text to type; extracted from the command if None
             
         Returns:
             Execution result
         """
         try:
+            start_time = time.time()
+            
             # Extract text to type from command
-            text_to_type = self._extract_text_to_type(command)
+            text_to_type = text or self._extract_text_to_type(command)
             if not text_to_type:
                 return {
                     'success': False,
@@ -486,27 +693,23 @@ class GUIHandler(BaseHandler):
                     'method': 'direct_typing'
                 }
             
-            # Execute typing action
-            action_result = automation_module.execute_fast_path_action(
-                action_type='type',
-                coordinates=None,  # Not needed for typing
-                element_info={'text': text_to_type}
-            )
-            
-            if action_result.get('success', False):
-                return {
-                    'success': True,
-                    'method': 'direct_typing',
-                    'text_typed': text_to_type,
-                    'action_result': action_result,
-                    'message': f"Successfully typed: {text_to_type}"
-                }
-            else:
+            # Type at the current focus (no element to click first)
+            try:
+                automation_module.execute_action({'action': 'type', 'text': text_to_type})
+            except Exception as e:
                 return {
                     'success': False,
-                    'error': f"Direct typing failed: {action_result.get('error', 'Unknown error')}",
+                    'error': f"Direct typing failed: {str(e)}",
                     'method': 'direct_typing'
                 }
+            
+            return {
+                'success': True,
+                'method': 'direct_typing',
+                'execution_time': time.time() - start_time,
+                'text_typed': text_to_type,
+                'message': f"Successfully typed: {text_to_type}"
+            }
                 
         except Exception as e:
             return {
@@ -558,18 +761,31 @@ class GUIHandler(BaseHandler):
         
         return None
     
-    def _perform_screen_perception(self, vision_module) -> Optional[Dict[str, Any]]:
+    def _perform_screen_perception(self, vision_module, context: Optional[Dict[str, Any]] = None,
+                                   hints: Optional[List[Dict[str, Any]]] = None,
+                                   screenshot_b64: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Perform screen perception using the vision module.
         
+        Hints are boxes in the pixels of the "clickable" screenshot the local
+        detector ran on, so they are sent with that screenshot and an analysis
+        type that returns coordinates.
+        
         Args:
             vision_module: Vision module instance
+            context: Optional execution context carrying the shared perception context
+            hints: Optional local detector candidates passed to the vision model
+            screenshot_b64: Screenshot the hints were detected in
             
         Returns:
             Screen analysis results or None if failed
         """
         try:
-            screen_context = vision_module.describe_screen(analysis_type="simple")
+            analysis_type = "clickable" if hints else "simple"
+            screen_context = self._describe_screen(
+                vision_module, analysis_type, context, priority=VisionRequestPriority.FALLBACK,
+                hints=hints, screenshot_b64=screenshot_b64
+            )
             
             if not screen_context or not screen_context.get("description"):
                 self.logger.warning("Invalid screen analysis result")
@@ -621,38 +837,16 @@ class GUIHandler(BaseHandler):
         Returns:
             Execution results summary
         """
-        execution_results = {
-            "total_actions": len(actions),
-            "successful_actions": 0,
-            "failed_actions": 0,
-            "action_details": [],
-            "errors": []
-        }
+        def execute_step(action: Dict[str, Any]) -> Optional[str]:
+            automation_module.execute_action(action)
+            return None
         
-        for i, action in enumerate(actions):
-            action_start_time = time.time()
-            action_result = {
-                "index": i,
-                "action": action.copy(),
-                "start_time": action_start_time,
-                "status": "pending"
-            }
-            
-            try:
-                # Execute the action
-                automation_module.execute_action(action)
-                action_result["status"] = "success"
-                execution_results["successful_actions"] += 1
-                
-            except Exception as e:
-                action_result["status"] = "failed"
-                action_result["error"] = str(e)
-                execution_results["failed_actions"] += 1
-                execution_results["errors"].append(f"Action {i + 1} failed: {str(e)}")
-                self.logger.error(f"Action {i + 1} failed: {e}")
-            
-            action_result["end_time"] = time.time()
-            action_result["duration"] = action_result["end_time"] - action_start_time
-            execution_results["action_details"].append(action_result)
+        # Step N+1 is validated (and its target element looked up) while step N runs
+        execution_results = action_pipeline.execute(
+            actions,
+            execute_step,
+            automation_module=automation_module,
+            accessibility_module=self._get_module_safely('accessibility_module')
+        )
         
         return execution_results
\ No newline at end of file
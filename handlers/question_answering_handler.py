@@ -10,6 +10,7 @@ import logging
 import time
 from typing import Dict, Any, Optional, TYPE_CHECKING, List
 from handlers.base_handler import BaseHandler
+from modules.vision_scheduler import VisionRequestPriority
 from dataclasses import dataclass, field
 from collections import deque, defaultdict
 import threading
@@ -98,6 +99,9 @@ class QuestionAnsweringHandler(BaseHandler):
         self._fast_path_successes = 0
         self._fallback_count = 0
         self._last_fallback_reason = "unknown"
+        
+        # Set when the fast-path summary was already spoken while it streamed
+        self._result_spoken = False
     
     def handle(self, command: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -137,14 +141,16 @@ class QuestionAnsweringHandler(BaseHandler):
             self.logger.info(f"Processing question answering command: '{command[:50]}...'")
             
             # Try fast path first
+            self._result_spoken = False
             fast_path_result, fallback_reason = self._try_fast_path_with_reason(command)
             
             if fast_path_result:
                 self.logger.info("Fast path successful, speaking result to user")
                 self._fast_path_successes += 1
                 
-                # Speak the summarized content to the user
-                self._speak_result(fast_path_result)
+                # Speak the summarized content to the user (unless it was streamed)
+                if not self._result_spoken:
+                    self._speak_result(fast_path_result)
                 
                 result = self._create_success_result(
                     fast_path_result,
@@ -290,7 +296,9 @@ class QuestionAnsweringHandler(BaseHandler):
             self.logger.debug("Step 6: Summarizing content")
             summarization_start_time = time.time()
             
-            summarized_content = self._summarize_content(processed_content, command)
+            summarized_content = self._stream_summary(processed_content, command)
+            if not summarized_content:
+                summarized_content = self._summarize_content(processed_content, command)
             if not summarized_content:
                 self.logger.debug("Content summarization failed, returning processed content")
                 # Fallback to processed content if summarization fails
@@ -749,7 +757,9 @@ class QuestionAnsweringHandler(BaseHandler):
             
             # Capture screen with appropriate analysis type
             self.logger.info(f"Using {analysis_type} analysis for screen capture")
-            screen_context = vision_module.describe_screen(analysis_type=analysis_type)
+            screen_context = self._describe_screen(
+                vision_module, analysis_type, priority=VisionRequestPriority.FALLBACK
+            )
             
             if not screen_context:
                 self.logger.warning("Vision module returned empty screen context")
@@ -1399,39 +1409,7 @@ Provide a clear, concise answer that directly addresses the user's question."""
                 self._reasoning_module = ReasoningModule()
                 self.logger.debug("ReasoningModule initialized for summarization")
             
-            # Truncate content for reasoning module (2000 char limit)
-            # Reserve space for prompt text (~400 chars), so limit content to ~1200 chars
-            max_content_for_reasoning = 1200
-            truncated_content = content
-            
-            self.logger.info(f"Content length before truncation: {len(content)} characters")
-            
-            if len(content) > max_content_for_reasoning:
-                self.logger.info(f"Content ({len(content)} chars) exceeds reasoning module limit, truncating to {max_content_for_reasoning} chars")
-                
-                # Try to truncate at sentence boundary
-                truncated = content[:max_content_for_reasoning]
-                sentence_endings = ['. ', '! ', '? ', '.\n', '!\n', '?\n']
-                best_break = -1
-                
-                for ending in sentence_endings:
-                    last_occurrence = truncated.rfind(ending)
-                    if last_occurrence > max_content_for_reasoning - 300:  # Within last 300 chars
-                        best_break = max(best_break, last_occurrence + len(ending))
-                
-                if best_break > 0:
-                    truncated_content = truncated[:best_break].strip()
-                    self.logger.debug(f"Truncated content at sentence boundary: {len(truncated_content)} characters")
-                else:
-                    # No good sentence boundary found, truncate at word boundary
-                    words = truncated.split()
-                    truncated_content = ' '.join(words[:-1])  # Remove last potentially incomplete word
-                    self.logger.debug(f"Truncated content at word boundary: {len(truncated_content)} characters")
-                
-                # Add truncation indicator
-                truncated_content += "... [content truncated]"
-            
-            self.logger.info(f"Content length after truncation: {len(truncated_content)} characters")
+            truncated_content = self._truncate_for_summarization(content)
             
             # Prepare summarization prompt with truncated content
             summarization_prompt = self._build_summarization_prompt(truncated_content, command)
@@ -1514,6 +1492,105 @@ Provide a clear, concise answer that directly addresses the user's question."""
             self.logger.error(f"Error in content summarization: {e}")
             return None
     
+    def _truncate_for_summarization(self, content: str) -> str:
+        """
+        Truncate content to fit the reasoning module's prompt limit.
+        
+        Args:
+            content: Processed content to summarize
+            
+        Returns:
+            Content cut at a sentence (or word) boundary if it was too long
+        """
+        # Truncate content for reasoning module (2000 char limit)
+        # Reserve space for prompt text (~400 chars), so limit content to ~1200 chars
+        max_content_for_reasoning = 1200
+        truncated_content = content
+        
+        self.logger.info(f"Content length before truncation: {len(content)} characters")
+        
+        if len(content) > max_content_for_reasoning:
+            self.logger.info(f"Content ({len(content)} chars) exceeds reasoning module limit, truncating to {max_content_for_reasoning} chars")
+            
+            # Try to truncate at sentence boundary
+            truncated = content[:max_content_for_reasoning]
+            sentence_endings = ['. ', '! ', '? ', '.\n', '!\n', '?\n']
+            best_break = -1
+            
+            for ending in sentence_endings:
+                last_occurrence = truncated.rfind(ending)
+                if last_occurrence > max_content_for_reasoning - 300:  # Within last 300 chars
+                    best_break = max(best_break, last_occurrence + len(ending))
+            
+            if best_break > 0:
+                truncated_content = truncated[:best_break].strip()
+                self.logger.debug(f"Truncated content at sentence boundary: {len(truncated_content)} characters")
+            else:
+                # No good sentence boundary found, truncate at word boundary
+                words = truncated.split()
+                truncated_content = ' '.join(words[:-1])  # Remove last potentially incomplete word
+                self.logger.debug(f"Truncated content at word boundary: {len(truncated_content)} characters")
+            
+            # Add truncation indicator
+            truncated_content += "... [content truncated]"
+        
+        self.logger.info(f"Content length after truncation: {len(truncated_content)} characters")
+        
+        return truncated_content
+    
+    def _stream_summary(self, content: str, command: str) -> Optional[str]:
+        """
+        Summarize content while speaking the summary sentence by sentence.
+        
+        Each sentence is formatted for speech as it arrives, so the user hears
+        the start of the answer before the rest has been generated.
+        
+        Args:
+            content: Processed content to summarize
+            command: Original user command for context
+            
+        Returns:
+            The spoken summary, or None if streaming was not possible and
+            nothing was spoken
+        """
+        try:
+            if not self._reasoning_module:
+                from modules.reasoning import ReasoningModule
+                self._reasoning_module = ReasoningModule()
+                self.logger.debug("ReasoningModule initialized for summarization")
+            if not hasattr(self._reasoning_module, 'stream_query'):
+                return None
+            
+            if not self._audio_module:
+                from modules.audio import AudioModule
+                self._audio_module = AudioModule()
+                self.logger.debug("AudioModule initialized for speech output")
+            
+            summarization_prompt = self._build_summarization_prompt(
+                self._truncate_for_summarization(content), command
+            )
+            tokens = self._reasoning_module.stream_query(
+                query=summarization_prompt,
+                context={"content_length": len(content), "command": command}
+            )
+            stream = self._stream_llm_to_speech(
+                tokens,
+                transform=self._format_result_for_speech,
+                max_chars=min(500, len(content)),
+                first_sentence_timeout=3.0,
+                audio_module=self._audio_module
+            )
+        except Exception as e:
+            self.logger.debug(f"Streaming summarization unavailable: {e}")
+            return None
+        
+        if stream is None:
+            return None
+        
+        self._result_spoken = True
+        self.logger.info(f"Streamed summary: {len(stream.text)} characters")
+        return stream.text
+    
     def _build_summarization_prompt(self, content: str, command: str) -> str:
         """
         Build a prompt for content summarization based on the user's command.
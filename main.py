@@ -19,13 +19,17 @@ from config import (
     PROJECT_NAME, PROJECT_VERSION, PROJECT_DESCRIPTION,
     LOG_LEVEL, LOG_FORMAT, LOG_FILE, DEBUG_MODE,
     validate_config, PORCUPINE_API_KEY, REASONING_API_KEY,
-    VISION_API_BASE, REASONING_API_BASE
+    VISION_API_BASE, REASONING_API_BASE,
+    SPECULATIVE_PERCEPTION_ENABLED, STT_WORKER_ENABLED,
+    IDLE_POWER_MODE_ENABLED
 )
 from orchestrator import Orchestrator
 from modules.audio import AudioModule
 from modules.feedback import FeedbackModule
 from modules.performance import cleanup_performance_resources
 from modules.performance_dashboard import create_performance_dashboard
+from modules.speculative_perception import speculative_perception
+from modules.idle_power import idle_power
 
 
 class AURAApplication:
@@ -322,6 +326,14 @@ class AURAApplication:
                 if hasattr(self.audio_module, 'tts_engine') and self.audio_module.tts_engine:
                     self.audio_module.tts_engine.stop()
                     logger.debug("TTS engine stopped")
+                
+                # Close the shared microphone stream
+                if hasattr(self.audio_module, 'capture_service'):
+                    self.audio_module.capture_service.stop()
+                
+                # Stop the STT worker process
+                if getattr(self.audio_module, 'stt_worker', None):
+                    self.audio_module.stt_worker.stop()
                     
         except Exception as e:
             logger.error(f"Error cleaning up audio resources: {e}")
@@ -412,7 +424,7 @@ class AURAApplication:
             logger.info("Step 3: Initializing core modules...")
             
             # Initialize audio module first (needed for wake word detection)
-            self.audio_module = AudioModule()
+            self.audio_module = AudioModule(use_stt_worker=STT_WORKER_ENABLED)
             
             # Initialize feedback module
             self.feedback_module = FeedbackModule(audio_module=self.audio_module)
@@ -509,6 +521,10 @@ class AURAApplication:
                 if self.is_shutting_down:
                     break
                 
+                # Suspended while waiting for the wake word
+                if not idle_power.wait_until_active(lambda: self.is_shutting_down):
+                    break
+                
                 self._run_health_checks()
                 
             except Exception as e:
@@ -635,6 +651,10 @@ class AURAApplication:
         
         while self.is_running and not self.is_shutting_down:
             try:
+                # Let the CPU sleep: background workers pause until the wake word
+                if IDLE_POWER_MODE_ENABLED:
+                    idle_power.enter_idle()
+                
                 # Listen for wake word (with timeout to allow periodic checks)
                 wake_word_detected = self.audio_module.listen_for_wake_word(
                     timeout=5.0,  # 5 second timeout
@@ -642,9 +662,13 @@ class AURAApplication:
                 )
                 
                 if wake_word_detected:
+                    idle_power.exit_idle()
                     self.wake_words_detected += 1
                     logger.info(f"Wake word detected (#{self.wake_words_detected})")
                     
+                    # Analyze the screen while the user is still speaking
+                    self._start_speculative_perception()
+                    
                     # Process command in main thread context
                     self._process_voice_command()
                 
@@ -653,8 +677,26 @@ class AURAApplication:
                 # Brief pause before retrying
                 time.sleep(2.0)
         
+        idle_power.exit_idle()
         logger.info("Wake word monitoring stopped")
     
+    def _start_speculative_perception(self) -> None:
+        """
+        Start speculative screen analysis in parallel with speech capture.
+        
+        The result is cached for VisionModule.describe_screen and discarded if
+        the intent doesn't need vision or the screen changes in the meantime.
+        """
+        if not SPECULATIVE_PERCEPTION_ENABLED or not self.orchestrator:
+            return
+        
+        try:
+            if not self.orchestrator.module_availability.get('vision', False):
+                return
+            speculative_perception.start(self.orchestrator.vision_module)
+        except Exception as e:
+            logger.debug(f"Could not start speculative perception: {e}")
+    
     def _process_voice_command(self) -> None:
         """
         Process a voice command after wake word detection.
@@ -719,6 +761,7 @@ class AURAApplication:
             self.feedback_module.speak("I had trouble processing your command. Please try again.")
         
         finally:
+            speculative_perception.discard("command_finished")
             self.command_processing_active = False
     
     def _log_status(self) -> None:
@@ -799,6 +842,9 @@ class AURAApplication:
             # Step 1: Stop monitoring threads
             logger.info("Step 1: Stopping monitoring threads...")
             
+            # Wake workers suspended in idle power mode so they can exit
+            idle_power.exit_idle()
+            
             # Stop wake word monitoring
             if self.wake_word_thread and self.wake_word_thread.is_alive():
                 logger.debug("Stopping wake word monitoring thread...")
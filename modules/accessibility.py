@@ -67,6 +67,13 @@ except ImportError:
     except:
         ACCESSIBILITY_FUNCTIONS_AVAILABLE = False
 
+# Hit-testing (element under a screen point), optional in older PyObjC releases
+try:
+    from ApplicationServices import AXUIElementCopyElementAtPosition
+    HIT_TEST_AVAILABLE = True
+except ImportError:
+    HIT_TEST_AVAILABLE = False
+
 # Set overall availability flag
 ACCESSIBILITY_AVAILABLE = APPKIT_AVAILABLE and ACCESSIBILITY_FUNCTIONS_AVAILABLE
 
@@ -434,6 +441,23 @@ class AccessibilityModule:
             self.max_performance_history = 100
             self.performance_warning_threshold_ms = 1500
         
+        # Races accessibility and clipboard selected-text capture (None: sequential fallback)
+        try:
+            from config import SELECTION_CAPTURE_HEDGED
+            from .selection_capture import HedgedSelectionCapture
+            self.selection_capture = HedgedSelectionCapture() if SELECTION_CAPTURE_HEDGED else None
+        except ImportError:
+            self.selection_capture = None
+        self.last_text_capture_method: Optional[str] = None
+        self._automation_module_lock = threading.Lock()
+        
+        # Shared display bounds for on-screen checks (None: coordinate heuristics)
+        try:
+            from .display_geometry import display_geometry
+            self.display_geometry = display_geometry if display_geometry.available else None
+        except ImportError:
+            self.display_geometry = None
+        
         # Use validated configuration values
         self.fast_path_timeout_ms = self.config['fast_path_timeout_ms']
         self.fuzzy_matching_timeout_ms = self.config['fuzzy_matching_timeout_ms']
@@ -2929,6 +2953,43 @@ class AccessibilityModule:
         # Fallback to original implementation logic for maximum backward compatibility
         return self._find_element_original_implementation(role, label, app_name)
     
+    def element_at_point(self, x: float, y: float) -> Optional[Dict[str, Any]]:
+        """
+        Hit-test the element under a global point.
+        
+        Reads only the element at the point instead of traversing the tree,
+        so it is cheap enough to re-check an element found earlier.
+        
+        Args:
+            x: X coordinate in global points
+            y: Y coordinate in global points
+        
+        Returns:
+            Dictionary with 'coordinates', 'center_point', 'role', 'title'
+            and 'enabled' (as returned by find_element), or None if nothing
+            is there or hit-testing is unavailable
+        """
+        if not (ACCESSIBILITY_AVAILABLE and HIT_TEST_AVAILABLE) or not self.accessibility_enabled:
+            return None
+        try:
+            error, element = AXUIElementCopyElementAtPosition(AXUIElementCreateSystemWide(), float(x), float(y), None)
+            if error != 0 or element is None:
+                return None
+            info = self._extract_element_info(element)
+            coordinates = self._calculate_element_coordinates(element)
+            if info is None or not coordinates:
+                return None
+            return {
+                'coordinates': coordinates,
+                'center_point': [coordinates[0] + coordinates[2] // 2, coordinates[1] + coordinates[3] // 2],
+                'role': info.get('role', ''),
+                'title': info.get('title', ''),
+                'enabled': info.get('enabled', True)
+            }
+        except Exception as e:
+            self.logger.debug(f"Hit-test at ({x}, {y}) failed: {e}")
+            return None
+    
     def _is_web_element_search(self, label: str, app_name: Optional[str] = None) -> bool:
         """Check if this search is likely for a web element."""
         if app_name and app_name in self.CHROME_APP_NAMES:
@@ -3880,6 +3941,98 @@ class AccessibilityModule:
         
         return elements
     
+    # Roles that take keyboard focus when tabbing through a form
+    FOCUSABLE_ROLES = {
+        'AXTextField', 'AXSecureTextField', 'AXTextArea', 'AXComboBox',
+        'AXPopUpButton', 'AXCheckBox', 'AXRadioButton', 'AXButton', 'AXLink'
+    }
+    
+    def get_focusable_elements(self, app_name: Optional[str] = None, max_depth: int = 20) -> List[Dict[str, Any]]:
+        """
+        Collect the focusable elements of the focused window in one traversal.
+        
+        Elements are returned in tree order, which is the Tab order of web
+        forms and of most native dialogs. Children of focusable elements are
+        not visited.
+        
+        Args:
+            app_name: Optional application name (defaults to the focused app)
+            max_depth: Maximum depth to traverse
+        
+        Returns:
+            List of dictionaries with 'element', 'role', 'title', 'value',
+            'coordinates' ([x, y, width, height]) and 'center_point'
+        """
+        if not ACCESSIBILITY_FUNCTIONS_AVAILABLE:
+            return []
+        
+        try:
+            app_element = self._get_target_application_element(app_name)
+            if not app_element:
+                return []
+        
+            root = app_element
+            window_result = AXUIElementCopyAttributeValue(app_element, "AXFocusedWindow", None)
+            if window_result[0] == 0 and window_result[1]:
+                root = window_result[1]
+        
+            elements = []
+            stack = [(root, 0)]
+            while stack:
+                element, depth = stack.pop()
+                role_result = AXUIElementCopyAttributeValue(element, kAXRoleAttribute, None)
+                role = role_result[1] if role_result[0] == 0 else None
+            
+                if role in self.FOCUSABLE_ROLES:
+                    coordinates = self._calculate_element_coordinates(element)
+                    if coordinates:
+                        title = None
+                        for attribute in (kAXTitleAttribute, kAXDescriptionAttribute):
+                            title_result = AXUIElementCopyAttributeValue(element, attribute, None)
+                            if title_result[0] == 0 and title_result[1]:
+                                title = str(title_result[1])
+                                break
+                        value_result = AXUIElementCopyAttributeValue(element, "AXValue", None)
+                        elements.append({
+                            'element': element,
+                            'role': role,
+                            'title': title or '',
+                            'value': value_result[1] if value_result[0] == 0 else None,
+                            'coordinates': coordinates,
+                            'center_point': [coordinates[0] + coordinates[2] // 2, coordinates[1] + coordinates[3] // 2]
+                        })
+                    continue
+            
+                if depth < max_depth:
+                    # Push in reverse so children are visited in tree order
+                    for child in reversed(self._get_element_children(element)):
+                        stack.append((child, depth + 1))
+        except Exception as e:
+            self.logger.debug(f"Error collecting focusable elements: {e}")
+            return []
+        
+        return elements
+    
+    def read_element_values(self, elements: List[Any]) -> List[Any]:
+        """
+        Read the current AXValue of each element.
+        
+        Args:
+            elements: Accessibility element references
+        
+        Returns:
+            Values in the same order (None where the value can't be read)
+        """
+        values = []
+        for element in elements:
+            try:
+                result = AXUIElementCopyAttributeValue(element, "AXValue", None)
+                values.append(result[1] if result[0] == 0 else None)
+            except Exception as e:
+                self.logger.debug(f"Error reading element value: {e}")
+                values.append(None)
+        return values
+    
     def _get_target_application_element(self, app_name: Optional[str]):
         """Get the accessibility element for the target application."""
         if app_name:
@@ -4016,8 +4169,13 @@ class AccessibilityModule:
                 int(size.height)
             ]
             
-            # Validate coordinates
-            if all(coord >= 0 for coord in coordinates) and coordinates[2] > 0 and coordinates[3] > 0:
+            # Validate coordinates (secondary displays may have negative offsets)
+            if coordinates[2] <= 0 or coordinates[3] <= 0:
+                return None
+            layout = self.display_geometry.layout() if self.display_geometry else None
+            if layout is not None:
+                return coordinates if layout.intersects(*coordinates) else None
+            if all(coord >= 0 for coord in coordinates):
                 return coordinates
             
             return None
@@ -4152,7 +4310,9 @@ class AccessibilityModule:
         
         This is the main public interface for text capture. It tries the accessibility
         API method first for speed and non-intrusiveness, then falls back to the
-        clipboard method if needed.
+        clipboard method if needed. With hedged capture enabled the clipboard
+        method starts after a per-application delay instead of after the
+        accessibility method finishes, and the first valid result is used.
         
         Returns:
             Optional[str]: The selected text if successful, None if no text is selected
@@ -4160,6 +4320,9 @@ class AccessibilityModule:
         Raises:
             Exception: If both capture methods fail due to system errors
         """
+        if self.selection_capture is not None:
+            return self._get_selected_text_hedged()
+        
         from dataclasses import dataclass
         from typing import Optional
         
@@ -4329,23 +4492,7 @@ class AccessibilityModule:
                 })
                 
                 # Provide specific error feedback based on the type of failures
-                if "permission" in accessibility_result.error_message.lower():
-                    raise Exception(
-                        "Text capture failed: Accessibility permissions required. "
-                        "Please grant accessibility permissions in System Preferences > "
-                        "Security & Privacy > Privacy > Accessibility"
-                    )
-                elif "clipboard" in clipboard_result.error_message.lower():
-                    raise Exception(
-                        "Text capture failed: Cannot access clipboard. "
-                        "Please ensure the application has permission to access the clipboard."
-                    )
-                else:
-                    raise Exception(
-                        f"Text capture failed: Both accessibility API and clipboard methods failed. "
-                        f"Accessibility: {accessibility_result.error_message}. "
-                        f"Clipboard: {clipboard_result.error_message}"
-                    )
+                self._raise_text_capture_failure(accessibility_result.error_message, clipboard_result.error_message)
             
             # If we got here, no text was selected (both methods returned None successfully)
             # This is a successful operation - just no text to capture
@@ -4394,6 +4541,118 @@ class AccessibilityModule:
             else:
                 raise Exception(f"Text capture failed: {e}")
     
+    def _get_selected_text_hedged(self) -> Optional[str]:
+        """
+        Race the accessibility and clipboard methods for get_selected_text.
+        
+        Returns:
+            Optional[str]: The selected text from the first method that found it,
+                None if no text is selected
+            
+        Raises:
+            Exception: If both capture methods fail due to system errors
+        """
+        start_time = time.time()
+        operation_name = "get_selected_text_unified"
+        
+        outcome = self.selection_capture.capture(
+            self.get_selected_text_via_accessibility,
+            self._get_selected_text_via_clipboard_method,
+            self._get_frontmost_app_id()
+        )
+        total_time = (time.time() - start_time) * 1000
+        self.last_text_capture_method = outcome.method
+        
+        if outcome.method is not None:
+            self._log_performance_metrics(operation_name, total_time, True, {
+                'method_used': outcome.method,
+                'text_length': len(outcome.text),
+                'fallback_triggered': outcome.clipboard_started,
+                'hedge_delay_ms': outcome.hedge_delay * 1000,
+                'app': outcome.app_id
+            })
+            
+            if self.debug_logging:
+                self.logger.debug(f"Text capture successful via {outcome.method}: "
+                                f"{len(outcome.text)} chars in {total_time:.1f}ms "
+                                f"(hedge delay {outcome.hedge_delay * 1000:.0f}ms for {outcome.app_id})")
+            return outcome.text
+        
+        accessibility_error = None
+        if outcome.accessibility.error is not None:
+            accessibility_error = self._describe_accessibility_capture_error(outcome.accessibility.error)
+        clipboard_error = None
+        if outcome.clipboard.error is not None:
+            clipboard_error = f"Clipboard error: {outcome.clipboard.error}"
+        
+        if accessibility_error and clipboard_error:
+            self._log_performance_metrics(operation_name, total_time, False, {
+                'method_used': 'both_failed',
+                'fallback_triggered': True,
+                'accessibility_error': accessibility_error,
+                'clipboard_error': clipboard_error
+            })
+            self._raise_text_capture_failure(accessibility_error, clipboard_error)
+        
+        self._log_performance_metrics(operation_name, total_time, True, {
+            'method_used': 'both_attempted',
+            'text_length': 0,
+            'fallback_triggered': True,
+            'result': 'no_text_selected',
+            'accessibility_time_ms': outcome.accessibility.elapsed * 1000,
+            'clipboard_time_ms': outcome.clipboard.elapsed * 1000
+        })
+        
+        self.logger.info("No text is currently selected")
+        return None
+    
+    def _get_selected_text_via_clipboard_method(self) -> Optional[str]:
+        """Clipboard capture through the (lazily created) automation module."""
+        from .automation import AutomationModule
+        
+        with self._automation_module_lock:
+            if not hasattr(self, '_automation_module'):
+                self._automation_module = AutomationModule()
+        return self._automation_module.get_selected_text_via_clipboard()
+    
+    def _get_frontmost_app_id(self) -> str:
+        """Bundle identifier (or name) of the frontmost application, for capture learning."""
+        try:
+            app = self.workspace.frontmostApplication()
+            app_id = app.bundleIdentifier() or app.localizedName()
+            return app_id if isinstance(app_id, str) else "unknown"
+        except Exception:
+            return "unknown"
+    
+    @staticmethod
+    def _describe_accessibility_capture_error(error: Exception) -> str:
+        if isinstance(error, AccessibilityPermissionError):
+            return f"Permission error: {error}"
+        if isinstance(error, AccessibilityAPIUnavailableError):
+            return f"API unavailable: {error}"
+        return f"Unexpected error: {error}"
+    
+    @staticmethod
+    def _raise_text_capture_failure(accessibility_error: str, clipboard_error: str) -> None:
+        """Raise the user-facing error for both capture methods failing."""
+        if "permission" in accessibility_error.lower():
+            raise Exception(
+                "Text capture failed: Accessibility permissions required. "
+                "Please grant accessibility permissions in System Preferences > "
+                "Security & Privacy > Privacy > Accessibility"
+            )
+        elif "clipboard" in clipboard_error.lower():
+            raise Exception(
+                "Text capture failed: Cannot access clipboard. "
+                "Please ensure the application has permission to access the clipboard."
+            )
+        else:
+            raise Exception(
+                f"Text capture failed: Both accessibility API and clipboard methods failed. "
+                f"Accessibility: {accessibility_error}. "
+                f"Clipboard: {clipboard_error}"
+            )
+    
     def _get_focused_element_in_application(self, app_element) -> Optional[Any]:
         """
         Get the focused element within a specific application.
@@ -5057,8 +5316,11 @@ class AccessibilityModule:
             if width <= 0 or height <= 0:
                 return False
             
-            # Check if element is on screen (basic check)
+            # Check if element is on screen
             x, y = coordinates[0], coordinates[1]
+            layout = self.display_geometry.layout() if self.display_geometry else None
+            if layout is not None:
+                return layout.intersects(x, y, width, height)
             if x < -1000 or y < -1000:  # Likely off-screen
                 return False
             
@@ -15,6 +15,8 @@ from collections import defaultdict, deque
 import hashlib
 import weakref
 
+from .idle_power import idle_power
+
 
 @dataclass
 class AccessibilityConnection:
@@ -132,6 +134,9 @@ class AccessibilityCacheOptimizer:
         if self.prefetch_enabled:
             def prefetch_worker():
                 while not self._stop_prefetch.wait(1.0):
+                    # Suspended while waiting for the wake word
+                    if not idle_power.wait_until_active(self._stop_prefetch.is_set):
+                        break
                     try:
                         self._process_prefetch_queue()
                     except Exception as e:
@@ -143,6 +148,8 @@ class AccessibilityCacheOptimizer:
         # Start cleanup worker
         def cleanup_worker():
             while not self._stop_cleanup.wait(60.0):  # Run every minute
+                if not idle_power.wait_until_active(self._stop_cleanup.is_set):
+                    break
                 try:
                     self._cleanup_expired_entries()
                 except Exception as e:
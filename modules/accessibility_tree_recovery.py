@@ -24,6 +24,7 @@ from .accessibility import (
     AccessibilityTreeTraversalError,
     ElementNotFoundError
 )
+from .idle_power import idle_power
 
 try:
     from AppKit import NSWorkspace, NSApplication, NSNotificationCenter
@@ -510,9 +511,8 @@ class AccessibilityTreeRecoveryManager:
                     None
                 )
                 
-                # Monitor loop
-                while not self.shutdown_event.is_set():
-                    time.sleep(1)
+                # Keep the observer alive until shutdown (notifications drive the work)
+                self.shutdown_event.wait()
                     
             except Exception as e:
                 self.logger.error(f"Focus monitoring error: {e}")
@@ -602,6 +602,10 @@ class AccessibilityTreeRecoveryManager:
                     if self.shutdown_event.wait(self.periodic_refresh_interval):
                         break
                     
+                    # Suspended while waiting for the wake word
+                    if not idle_power.wait_until_active(self.shutdown_event.is_set):
+                        break
+                    
                     # Refresh expired caches
                     with self.lock:
                         apps_to_refresh = []
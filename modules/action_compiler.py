@@ -0,0 +1,201 @@
+# modules/action_compiler.py
+"""
+Action Compiler for AURA
+
+Turns a validated action plan into as few cliclick invocations as possible.
+Consecutive actions that don't need intermediate feedback are compiled into
+one cliclick command line, with cliclick w: waits between actions instead of
+Python sleeps. Actions whose outcome decides what happens next (clicks with
+fallback coordinates, scrolling, unknown action types) are left to
+per-action execution and split the plan into several segments.
+
+Text is typed with cliclick t: when it is short, single-line printable
+ASCII. Anything else goes through the clipboard (pbcopy, then Cmd+V) like
+the per-action path; since there is only one clipboard, each batch holds at
+most one clipboard paste.
+"""
+
+import logging
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Longest text typed keystroke by keystroke; longer text is pasted
+MAX_TYPED_TEXT_LENGTH = 200
+
+# cliclick key names for keys whose names differ
+KEY_NAMES = {
+    'enter': 'return',
+    'return': 'return',
+    'delete': 'delete',
+    'backspace': 'delete',
+    'tab': 'tab',
+    'space': 'space',
+    'escape': 'esc',
+    'esc': 'esc'
+}
+
+MODIFIER_NAMES = {
+    'cmd': 'cmd',
+    'command': 'cmd',
+    'ctrl': 'ctrl',
+    'control': 'ctrl',
+    'alt': 'alt',
+    'option': 'alt',
+    'shift': 'shift'
+}
+
+PASTE_COMMANDS = ['kd:cmd', 't:v', 'ku:cmd']
+
+
+def key_commands(key: str) -> List[str]:
+    """cliclick commands for a single key press."""
+    return [f"kp:{KEY_NAMES.get(key.lower(), key.lower())}"]
+
+
+def hotkey_commands(keys: List[str]) -> List[str]:
+    """
+    cliclick commands for a key combination such as ['cmd', 'a'].
+
+    Modifiers are held down around the last key and released in reverse order.
+    """
+    if not keys:
+        return []
+    modifiers = [MODIFIER_NAMES[k.lower()] for k in keys[:-1] if k.lower() in MODIFIER_NAMES]
+    main_key = keys[-1].lower()
+    if not modifiers:
+        return key_commands(main_key)
+    return ([f"kd:{mod}" for mod in modifiers] + [f"kp:{KEY_NAMES.get(main_key, main_key)}"] +
+            [f"ku:{mod}" for mod in reversed(modifiers)])
+
+
+def can_type_directly(text: str) -> bool:
+    """Whether text can be typed with cliclick t: instead of pasted."""
+    return (0 < len(text) <= MAX_TYPED_TEXT_LENGTH and text.isascii() and text.isprintable())
+
+
+class CompiledSegment:
+    """
+    A run of consecutive actions from a plan.
+
+    Batched segments carry the cliclick commands for all of their actions
+    (and the text to put on the clipboard first, if any). Unbatched
+    segments hold a single action that must be executed on its own.
+    """
+
+    def __init__(self, action_indices: List[int], commands: Optional[List[str]] = None,
+                 clipboard_text: Optional[str] = None):
+        self.action_indices = action_indices
+        self.commands = commands
+        self.clipboard_text = clipboard_text
+
+    @property
+    def batched(self) -> bool:
+        """Whether the segment runs as one cliclick invocation."""
+        return self.commands is not None
+
+    @property
+    def command_line(self) -> List[str]:
+        """Full cliclick argument vector for a batched segment."""
+        return ['cliclick'] + (self.commands or [])
+
+    def __repr__(self) -> str:
+        if self.batched:
+            return f"CompiledSegment(actions={self.action_indices}, commands={self.commands})"
+        return f"CompiledSegment(actions={self.action_indices}, per-action)"
+
+
+class ActionCompiler:
+    """
+    Compiles validated action plans into batched cliclick invocations.
+    """
+
+    def __init__(self, action_pause_ms: int = 20, focus_pause_ms: int = 100):
+        """
+        Initialize the compiler.
+
+        Args:
+            action_pause_ms: Wait inserted between consecutive actions
+            focus_pause_ms: Wait between a click and typing or pressing keys in
+                the clicked field
+        """
+        self.action_pause_ms = action_pause_ms
+        self.focus_pause_ms = focus_pause_ms
+
+    def needs_feedback(self, action: Dict[str, Any]) -> bool:
+        """
+        Whether an action must run on its own because its outcome matters.
+
+        Clicks with fallback coordinates are retried elsewhere on failure,
+        scrolling has no cliclick command, and unknown actions are left to
+        the per-action path to reject.
+        """
+        action_type = action.get("action")
+        if action_type in ("click", "double_click"):
+            return bool(action.get("fallback_coordinates"))
+        if action_type == "type":
+            return not isinstance(action.get("text"), str) or not action["text"]
+        if action_type == "key":
+            return not action.get("key")
+        if action_type == "hotkey":
+            return not action.get("keys")
+        return True
+
+    def compile(self, actions: List[Dict[str, Any]]) -> List[CompiledSegment]:
+        """
+        Split an action plan into batched and per-action segments.
+
+        Args:
+            actions: Validated action dictionaries
+
+        Returns:
+            Segments in plan order; executing them in turn executes the plan
+        """
+        segments: List[CompiledSegment] = []
+        current: Optional[CompiledSegment] = None
+        previous_type: Optional[str] = None
+
+        for index, action in enumerate(actions):
+            if self.needs_feedback(action):
+                current, previous_type = None, None
+                segments.append(CompiledSegment([index]))
+                continue
+
+            action_type = action["action"]
+            paste_text = None
+            if action_type == "type" and not can_type_directly(action["text"]):
+                paste_text = action["text"]
+
+            # One clipboard per batch: a second paste starts a new batch
+            if current is None or (paste_text is not None and current.clipboard_text is not None):
+                current, previous_type = CompiledSegment([], []), None
+                segments.append(current)
+
+            if previous_type is not None:
+                pause = self.action_pause_ms
+                if previous_type in ("click", "double_click") and action_type in ("type", "key", "hotkey"):
+                    pause = self.focus_pause_ms
+                if pause > 0:
+                    current.commands.append(f"w:{pause}")
+
+            current.commands.extend(self._action_commands(action, paste_text is not None))
+            current.action_indices.append(index)
+            if paste_text is not None:
+                current.clipboard_text = paste_text
+            previous_type = action_type
+
+        logger.debug(f"Compiled {len(actions)} actions into {len(segments)} segments "
+                     f"({sum(1 for s in segments if s.batched)} batched)")
+        return segments
+
+    def _action_commands(self, action: Dict[str, Any], paste: bool) -> List[str]:
+        """cliclick commands for one compilable action."""
+        action_type = action["action"]
+        if action_type in ("click", "double_click"):
+            x, y = int(action["coordinates"][0]), int(action["coordinates"][1])
+            return [f"{'c' if action_type == 'click' else 'dc'}:{x},{y}"]
+        if action_type == "type":
+            return list(PASTE_COMMANDS) if paste else [f"t:{action['text']}"]
+        if action_type == "key":
+            return key_commands(action["key"])
+        return hotkey_commands(action["keys"])
@@ -0,0 +1,423 @@
+# modules/action_pipeline.py
+"""
+Pipelined Action Plan Execution for AURA
+
+Executes an action plan step by step while resolving the next step in the
+background: format and coordinate validation, and an accessibility lookup
+for click steps that name a target element (the plan's "target" field).
+Resolution of step N+1 overlaps step N's input injection and settle wait.
+
+A prefetched resolution that read the UI (an element lookup) is re-checked
+when the automation module reported a UI change after the lookup started:
+the element under the resolved point is hit-tested, and the lookup is only
+redone if it is no longer the element that was found. Validation-only
+resolutions don't depend on the UI and are always reused.
+"""
+
+import concurrent.futures
+import logging
+import threading
+import time
+from typing import Dict, Any, Optional, List, Callable
+
+from config import ACTION_PIPELINE_ENABLED
+
+logger = logging.getLogger(__name__)
+
+# Action types resolved by the pipeline (other steps, e.g. speak, pass through)
+AUTOMATION_ACTIONS = {"click", "double_click", "type", "scroll"}
+
+# Action types that can take their coordinates from a target element
+TARGETED_ACTIONS = {"click", "double_click"}
+
+
+class ResolvedStep:
+    """Resolution of one action plan step."""
+
+    def __init__(self, index: int, action: Dict[str, Any]):
+        self.index = index
+        self.action = dict(action)
+        self.error: Optional[Exception] = None
+        self.element_info: Optional[Dict[str, Any]] = None
+        self.uses_ui = False
+        self.ui_generation = 0
+        self.started_at = time.time()
+        self.finished_at = self.started_at
+
+    @property
+    def duration(self) -> float:
+        return self.finished_at - self.started_at
+
+
+class UIChangeTracker:
+    """Counts UI changes reported by the automation module during one plan."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._automation_module = None
+
+    @property
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def _on_ui_changed(self, action_type: str) -> None:
+        """Automation listener callback."""
+        with self._lock:
+            self._generation += 1
+
+    def attach(self, automation_module) -> None:
+        """
+        Subscribe to UI-mutation notifications from the automation module.
+
+        Args:
+            automation_module: AutomationModule to listen to
+        """
+        if automation_module is None or not hasattr(automation_module, 'add_ui_change_listener'):
+            return
+        automation_module.add_ui_change_listener(self._on_ui_changed)
+        self._automation_module = automation_module
+
+    def detach(self) -> None:
+        """Unsubscribe from automation notifications."""
+        if self._automation_module is not None:
+            try:
+                self._automation_module.remove_ui_change_listener(self._on_ui_changed)
+            except Exception as e:
+                logger.debug(f"Failed to detach UI change tracker: {e}")
+            self._automation_module = None
+
+
+class ActionResolver:
+    """Validates actions and looks up target elements before execution."""
+
+    def __init__(self, automation_module, accessibility_module=None,
+                 ui_tracker: Optional[UIChangeTracker] = None):
+        """
+        Initialize the resolver.
+
+        Args:
+            automation_module: AutomationModule used for format validation
+            accessibility_module: Optional AccessibilityModule for target lookups
+            ui_tracker: Optional tracker whose generation is recorded on
+                steps that read the UI
+        """
+        self.automation_module = automation_module
+        self.accessibility_module = accessibility_module
+        self.ui_tracker = ui_tracker
+
+    def resolve(self, index: int, action: Dict[str, Any]) -> ResolvedStep:
+        """
+        Resolve one step.
+
+        An action with a "target" ({"role", "label", "app_name"}) gets the
+        center of the matching element as coordinates. The element position
+        replaces coordinates estimated from the screenshot; if the element
+        isn't found, those coordinates are kept.
+
+        Args:
+            index: Step index in the plan
+            action: Action dictionary from the plan
+
+        Returns:
+            ResolvedStep; error is set if the step can't be executed
+        """
+        step = ResolvedStep(index, action)
+        action_type = action.get("action")
+        try:
+            target = action.get("target")
+            if action_type in TARGETED_ACTIONS and isinstance(target, dict) and self.accessibility_module:
+                step.uses_ui = True
+                if self.ui_tracker is not None:
+                    step.ui_generation = self.ui_tracker.generation
+                self._resolve_target(step, target)
+
+            if step.error is None and action_type in AUTOMATION_ACTIONS:
+                self._validate(step)
+        except Exception as e:
+            # Leave it to execution, which validates again
+            logger.debug(f"Could not resolve step {index + 1}: {e}")
+        finally:
+            step.finished_at = time.time()
+        return step
+
+    def _resolve_target(self, step: ResolvedStep, target: Dict[str, Any]) -> None:
+        role, label = target.get("role", ""), target.get("label", "")
+        element = self.accessibility_module.find_element(role, label, target.get("app_name"))
+        if not element or not element.get("center_point"):
+            if step.action.get("coordinates"):
+                logger.debug(f"Target element not found: {role} '{label}', using plan coordinates")
+            else:
+                step.error = ValueError(f"Target element not found: {role} '{label}'")
+            return
+        step.element_info = element
+        step.action["coordinates"] = [int(value) for value in element["center_point"][:2]]
+
+    def still_valid(self, step: ResolvedStep) -> bool:
+        """
+        Whether a step's element lookup survived a UI change.
+
+        Hit-tests the resolved point (one accessibility call instead of a
+        tree traversal). The lookup holds if the element there has the
+        frame of the element found, or its title matches the target label
+        (the frame moved with the element still under the point).
+
+        Args:
+            step: Resolved step with a target element
+
+        Returns:
+            False if the lookup has to be redone
+        """
+        hit_test = getattr(self.accessibility_module, "element_at_point", None)
+        coordinates = step.action.get("coordinates")
+        if hit_test is None or not step.element_info or not coordinates:
+            return False
+        try:
+            hit = hit_test(*coordinates[:2])
+        except Exception as e:
+            logger.debug(f"Could not re-check step {step.index + 1}: {e}")
+            return False
+        if not isinstance(hit, dict):
+            return False
+        frame = step.element_info.get("coordinates")
+        if frame and hit.get("coordinates") == frame:
+            return True
+        label = str((step.action.get("target") or {}).get("label", "")).strip().lower()
+        return bool(label) and label == str(hit.get("title") or "").strip().lower()
+
+    def _validate(self, step: ResolvedStep) -> None:
+        is_valid, error_msg = self.automation_module.validate_action_format(step.action)
+        if is_valid is False:
+            step.error = ValueError(f"Invalid action format: {error_msg}")
+
+
+class PipelinedActionExecutor:
+    """
+    Executes action plans with the next step resolved in the background.
+
+    The caller supplies the modules and the per-step execution function, so
+    the orchestrator and handlers keep their own action type handling and
+    share one prefetch worker.
+    """
+
+    def __init__(self, enabled: bool = ACTION_PIPELINE_ENABLED):
+        """
+        Initialize the executor.
+
+        Args:
+            enabled: Resolve the next step in the background. When False,
+                steps are executed as given without resolution.
+        """
+        self.enabled = enabled
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="ActionPrefetch")
+        self._lock = threading.Lock()
+        self._stats = {
+            'plans': 0,
+            'steps': 0,
+            'prefetched': 0,
+            'invalidated': 0,
+            'rechecked': 0,
+            'overlap_time': 0.0,
+            'saved_time': 0.0
+        }
+
+    def execute(self, actions: List[Dict[str, Any]],
+                execute_step: Callable[[Dict[str, Any]], Optional[str]],
+                automation_module, accessibility_module=None,
+                should_stop: Optional[Callable[[Dict[str, Any], Exception], bool]] = None,
+                log_prefix: str = "") -> Dict[str, Any]:
+        """
+        Execute an action plan.
+
+        Args:
+            actions: Plan steps in order
+            execute_step: Executes one (resolved) action. Returns None on
+                success or an error message for a handled failure, and raises
+                on errors.
+            automation_module: AutomationModule used for validation; its UI
+                change notifications invalidate prefetched element lookups
+            accessibility_module: Optional AccessibilityModule for target lookups
+            should_stop: Called with the action and exception of a failed
+                step; returning True stops execution
+            log_prefix: Prefix for log messages (e.g. "[execution_id] ")
+
+        Returns:
+            Execution results summary with per-step pipeline timings
+        """
+        results = {
+            "total_actions": len(actions),
+            "successful_actions": 0,
+            "failed_actions": 0,
+            "action_details": [],
+            "errors": [],
+            "pipeline": {
+                "enabled": self.enabled,
+                "prefetched_steps": 0,
+                "invalidated_steps": 0,
+                "rechecked_steps": 0,
+                "overlap_time": 0.0,
+                "saved_time": 0.0
+            }
+        }
+
+        ui_tracker = UIChangeTracker()
+        if self.enabled:
+            ui_tracker.attach(automation_module)
+        resolver = ActionResolver(automation_module, accessibility_module, ui_tracker)
+
+        try:
+            self._run(actions, execute_step, resolver, ui_tracker, should_stop, log_prefix, results)
+        finally:
+            ui_tracker.detach()
+
+        self._record(results)
+        return results
+
+    def _run(self, actions: List[Dict[str, Any]], execute_step: Callable[[Dict[str, Any]], Optional[str]],
+             resolver: ActionResolver, ui_tracker: UIChangeTracker,
+             should_stop: Optional[Callable[[Dict[str, Any], Exception], bool]],
+             log_prefix: str, results: Dict[str, Any]) -> None:
+        # The first step has nothing to overlap with and is resolved in line
+        pending = None
+        for i, action in enumerate(actions):
+            action_start_time = time.time()
+            action_result = {
+                "index": i,
+                "action": action.copy(),
+                "start_time": action_start_time,
+                "status": "pending"
+            }
+
+            step, timing = self._take(resolver, ui_tracker, pending, i, action, results)
+            action_result["pipeline"] = timing
+
+            # Resolve the next step while this one executes
+            pending = self._submit(resolver, i + 1, actions)
+            execute_start = time.time()
+
+            try:
+                if step is not None and step.error is not None:
+                    raise step.error
+
+                error_msg = execute_step(step.action if step is not None else action)
+                if error_msg:
+                    action_result["status"] = "failed"
+                    action_result["error"] = error_msg
+                    results["failed_actions"] += 1
+                    results["errors"].append(error_msg)
+                else:
+                    action_result["status"] = "success"
+                    results["successful_actions"] += 1
+
+            except Exception as e:
+                action_result["status"] = "failed"
+                action_result["error"] = str(e)
+                results["failed_actions"] += 1
+                results["errors"].append(f"Action {i + 1} failed: {str(e)}")
+                logger.error(f"{log_prefix}Action {i + 1} failed: {e}")
+
+                if should_stop is not None and should_stop(action, e):
+                    logger.error(f"{log_prefix}Critical action failure, stopping execution")
+                    self._finish(action_result, action_start_time, results)
+                    break
+
+            if pending is not None:
+                pending.execute_window = (execute_start, time.time())
+            self._finish(action_result, action_start_time, results)
+
+        if pending is not None:
+            pending.cancel()
+
+    def _submit(self, resolver: ActionResolver, index: int, actions: List[Dict[str, Any]]) -> Optional[concurrent.futures.Future]:
+        if not self.enabled or index >= len(actions):
+            return None
+        future = self._pool.submit(resolver.resolve, index, actions[index])
+        future.execute_window = None
+        return future
+
+    def _take(self, resolver: ActionResolver, ui_tracker: UIChangeTracker,
+              pending: Optional[concurrent.futures.Future], index: int, action: Dict[str, Any],
+              results: Dict[str, Any]):
+        """Get the resolution for a step, redoing it if the UI changed under it."""
+        if not self.enabled:
+            return None, {'prefetched': False}
+
+        if pending is None:
+            step = resolver.resolve(index, action)
+            return step, {'prefetched': False, 'resolve_time': step.duration, 'wait_time': step.duration}
+
+        wait_start = time.time()
+        step = pending.result()
+        rechecked = False
+        if step.uses_ui and ui_tracker.generation != step.ui_generation:
+            rechecked = resolver.still_valid(step)
+        wait_time = time.time() - wait_start
+
+        if rechecked:
+            logger.debug(f"Prefetched step {index + 1} re-checked after a UI change")
+            results["pipeline"]["rechecked_steps"] += 1
+        elif step.uses_ui and ui_tracker.generation != step.ui_generation:
+            logger.debug(f"Prefetched step {index + 1} invalidated by a UI change")
+            results["pipeline"]["invalidated_steps"] += 1
+            retry = resolver.resolve(index, action)
+            return retry, {
+                'prefetched': False,
+                'invalidated': True,
+                'resolve_time': retry.duration,
+                'wait_time': wait_time + retry.duration
+            }
+
+        overlap = 0.0
+        if pending.execute_window:
+            execute_start, execute_end = pending.execute_window
+            overlap = max(0.0, min(step.finished_at, execute_end) - max(step.started_at, execute_start))
+        saved = max(0.0, step.duration - wait_time)
+
+        results["pipeline"]["prefetched_steps"] += 1
+        results["pipeline"]["overlap_time"] += overlap
+        results["pipeline"]["saved_time"] += saved
+        return step, {
+            'prefetched': True,
+            'rechecked': rechecked,
+            'resolve_time': step.duration,
+            'wait_time': wait_time,
+            'overlap_time': overlap,
+            'saved_time': saved
+        }
+
+    @staticmethod
+    def _finish(action_result: Dict[str, Any], action_start_time: float, results: Dict[str, Any]) -> None:
+        action_result["end_time"] = time.time()
+        action_result["duration"] = action_result["end_time"] - action_start_time
+        results["action_details"].append(action_result)
+
+    def _record(self, results: Dict[str, Any]) -> None:
+        pipeline = results["pipeline"]
+        with self._lock:
+            self._stats['plans'] += 1
+            self._stats['steps'] += len(results["action_details"])
+            self._stats['prefetched'] += pipeline["prefetched_steps"]
+            self._stats['invalidated'] += pipeline["invalidated_steps"]
+            self._stats['rechecked'] += pipeline["rechecked_steps"]
+            self._stats['overlap_time'] += pipeline["overlap_time"]
+            self._stats['saved_time'] += pipeline["saved_time"]
+        if pipeline["prefetched_steps"]:
+            logger.debug(f"Action pipeline: {pipeline['prefetched_steps']} steps prefetched, "
+                         f"{pipeline['saved_time'] * 1000:.1f}ms saved, "
+                         f"{pipeline['invalidated_steps']} invalidated")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cumulative pipeline statistics."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['prefetch_rate_percent'] = (stats['prefetched'] / stats['steps'] * 100) if stats['steps'] else 0.0
+        return stats
+
+    def shutdown(self) -> None:
+        """Stop the prefetch worker."""
+        self._pool.shutdown(wait=False)
+
+
+# Global pipelined executor (one shared prefetch worker)
+action_pipeline = PipelinedActionExecutor()
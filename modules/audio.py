@@ -9,15 +9,12 @@ Handles all audio input/output including:
 """
 
 import logging
-import tempfile
-import os
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
 import sounddevice as sd
 import numpy as np
 import whisper
 import pyttsx3
-from pydub import AudioSegment
 from pydub.playback import play
 import threading
 import queue
@@ -34,10 +31,22 @@ from config import (
     PORCUPINE_API_KEY,
     WAKE_WORD,
     SILENCE_DETECTION_ENABLED,
-    SILENCE_DETECTION_DURATION,
     SILENCE_DETECTION_CHUNK_SIZE,
-    SILENCE_DETECTION_SENSITIVITY,
-    MIN_RECORDING_DURATION
+    MIN_RECORDING_DURATION,
+    AUDIO_DEBUG_CAPTURE_ENABLED,
+    STREAMING_STT_ENABLED,
+    AUDIO_CAPTURE_SHARED_STREAM,
+    AUDIO_CAPTURE_PREROLL,
+    STT_ENGINE,
+    STT_MODEL,
+    TTS_PHRASE_CACHE_ENABLED,
+    TTS_PHRASE_CACHE_DIR,
+    TTS_PHRASE_CACHE_MAX_CHARS,
+    TTS_PHRASE_CACHE_PHRASES,
+    TTS_PHRASE_CACHE_TEMPLATES,
+    TTS_PIPELINE_ENABLED,
+    WAKE_WORD_ENERGY_GATE_ENABLED,
+    WAKE_WORD_FRAME_BATCH
 )
 from .error_handler import (
     global_error_handler,
@@ -45,9 +54,26 @@ from .error_handler import (
     ErrorCategory,
     ErrorSeverity
 )
+from .speech_preprocessing import (
+    prepare_whisper_input,
+    audio_stats,
+    debug_audio_ring,
+    WHISPER_SAMPLE_RATE
+)
+from .streaming_transcriber import StreamingTranscriber, PartialTranscript
+from .audio_capture import AudioCaptureService
+from .voice_activity import Endpointer
+from .stt_engines import create_stt_engine
+from .stt_worker import SpeechWorkerClient
+from .tts_phrase_cache import PhraseAudioCache
+from .tts_pipeline import PipelinedSpeaker, MixerSpeechBackend
+from .wake_word_gate import WakeWordGate
 
 logger = logging.getLogger(__name__)
 
+# pyttsx3 engines run one event loop at a time (live speech and phrase rendering)
+_PYTTSX3_LOCK = threading.Lock()
+
 
 class AudioModule:
     """
@@ -59,30 +85,69 @@ class AudioModule:
     - Audio input validation and preprocessing
     """
     
-    def __init__(self):
-        """Initialize the AudioModule with required components."""
+    def __init__(self, use_stt_worker: bool = False):
+        """
+        Initialize the AudioModule with required components.
+        
+        Args:
+            use_stt_worker: Run speech-to-text in a dedicated worker process
+                instead of loading the model in this process
+        """
         self.whisper_model = None
+        self.stt_worker: Optional[SpeechWorkerClient] = None
         self.tts_engine = None
         self.porcupine = None
         self.is_recording = False
         self.is_listening_for_wake_word = False
         self.audio_queue = queue.Queue()
         self.wake_word_thread = None
+        self.latest_partial_transcript: Optional[PartialTranscript] = None
+        self._partial_transcript_listeners = []
+        self._partial_listener_lock = threading.Lock()
+        
+        # Shared microphone stream, opened on first wake word listen
+        self.capture_service = AudioCaptureService()
+        self._wake_word_end_position: Optional[int] = None
+        self.wake_word_gate: Optional[WakeWordGate] = None
+        
+        # Pre-rendered feedback phrases, enabled once a pygame mixer is available
+        self.phrase_cache: Optional[PhraseAudioCache] = None
+        self.speech_pipeline: Optional[PipelinedSpeaker] = None
         
         # Initialize components
-        self._initialize_whisper()
+        self._initialize_whisper(use_stt_worker)
         self._initialize_tts()
         self._initialize_porcupine()
         
         logger.info("AudioModule initialized successfully")
     
-    def _initialize_whisper(self) -> None:
-        """Initialize the Whisper model for speech-to-text with error handling."""
+    def _initialize_whisper(self, use_stt_worker: bool = False) -> None:
+        """
+        Initialize the speech-to-text model with error handling.
+        
+        With use_stt_worker the model is loaded in a worker process and
+        self.whisper_model is the worker client (same transcribe() interface);
+        if the worker can't start, the model is loaded in-process instead.
+        """
+        if use_stt_worker:
+            try:
+                logger.info(f"Starting STT worker process ({STT_ENGINE} '{STT_MODEL}')...")
+                worker = SpeechWorkerClient(STT_ENGINE, STT_MODEL)
+                worker.start()
+                self.stt_worker = self.whisper_model = worker
+                return
+            except Exception as e:
+                logger.warning(f"STT worker unavailable ({e}), loading the model in-process")
+        
         try:
-            logger.info("Loading Whisper model...")
-            # Use small model for better sensitivity to quiet speech
-            self.whisper_model = whisper.load_model("small")
-            logger.info("Whisper model loaded successfully")
+            logger.info(f"Loading {STT_ENGINE} model '{STT_MODEL}'...")
+            if STT_ENGINE == "whisper":
+                self.whisper_model = whisper.load_model(STT_MODEL)
+            else:
+                engine = create_stt_engine(STT_ENGINE, STT_MODEL)
+                engine.load()
+                self.whisper_model = engine
+            logger.info("Speech-to-text model loaded successfully")
         except Exception as e:
             error_info = global_error_handler.handle_error(
                 error=e,
@@ -256,10 +321,28 @@ class AudioModule:
             
             logger.info(f"Starting speech recording for {duration} seconds...")
             
+            # Transcribe incrementally while recording when streaming is enabled
+            transcriber = self._create_streaming_transcriber() if STREAMING_STT_ENABLED else None
+            
+            def feed_transcriber(chunk):
+                transcriber.feed(chunk)
+            
+            def restart_transcriber():
+                # Chunks fed so far belong to an abandoned recording attempt
+                nonlocal transcriber
+                transcriber.cancel()
+                transcriber = self._create_streaming_transcriber()
+            
             # Record audio with error handling
             try:
-                audio_data = self._record_audio(duration, silence_threshold)
+                audio_data = self._record_audio(
+                    duration, silence_threshold,
+                    on_chunk=feed_transcriber if transcriber else None,
+                    on_fallback=restart_transcriber if transcriber else None
+                )
             except Exception as e:
+                if transcriber:
+                    transcriber.cancel()
                 error_info = global_error_handler.handle_error(
                     error=e,
                     module="audio",
@@ -271,242 +354,198 @@ class AudioModule:
             
             if audio_data is None or len(audio_data) == 0:
                 logger.warning("No audio data recorded")
+                if transcriber:
+                    transcriber.cancel()
                 return ""
             
             # Validate audio data
             if len(audio_data) < AUDIO_SAMPLE_RATE * 0.1:  # Less than 0.1 seconds
                 logger.warning("Audio recording too short for transcription")
+                if transcriber:
+                    transcriber.cancel()
                 return ""
             
-            # Save audio to temporary file for Whisper
-            temp_path = None
+            # Streaming path: only the uncommitted tail is left to transcribe,
+            # provided the transcriber saw exactly the recording being returned
+            if transcriber:
+                if transcriber.samples_received == len(audio_data):
+                    streamed_text = self._finalize_streaming_transcription(transcriber)
+                    if streamed_text is not None:
+                        return streamed_text
+                else:
+                    if transcriber.samples_received > 0:
+                        logger.warning(f"Streaming transcriber received {transcriber.samples_received} samples "
+                                       f"for a {len(audio_data)} sample recording, transcribing full recording")
+                    transcriber.cancel()
+            
+            # Prepare Whisper input in memory (no temp files on the hot path)
             try:
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                    temp_path = temp_file.name
+                prepare_start = time.time()
+                whisper_input = prepare_whisper_input(audio_data, AUDIO_SAMPLE_RATE)
+                stats = audio_stats(whisper_input)
+                duration_ms = stats['duration'] * 1000
+                logger.info(f"Prepared {whisper_input.size} samples for Whisper in "
+                            f"{(time.time() - prepare_start) * 1000:.1f}ms")
+                logger.info(f"  Duration: {duration_ms:.0f}ms ({stats['duration']:.2f}s)")
+                logger.info(f"  Audio stats - RMS: {stats['rms']:.4f}, Max: {stats['peak']:.4f}")
                 
-                # Convert numpy array to audio file with error handling
-                try:
-                    # Create audio segment from raw audio data
-                    audio_segment = AudioSegment(
-                        audio_data.tobytes(),
-                        frame_rate=AUDIO_SAMPLE_RATE,
-                        sample_width=audio_data.dtype.itemsize,
-                        channels=1
-                    )
-                    
-                    # Apply some audio processing to improve transcription quality
-                    # Normalize volume
-                    audio_segment = audio_segment.normalize()
-                    
-                    # Apply a slight high-pass filter to reduce low-frequency noise
-                    # This is a simple approach - more sophisticated filtering could be added
-                    if len(audio_segment) > 1000:  # Only if we have enough audio
-                        # Simple high-pass by reducing low frequencies
-                        audio_segment = audio_segment.high_pass_filter(80)
-                    
-                    # Export to WAV file
-                    audio_segment.export(temp_path, format="wav")
-                    
-                    # Log audio file info for debugging
-                    file_size = os.path.getsize(temp_path)
-                    duration_ms = len(audio_segment)
-                    logger.info(f"Created audio file for Whisper: {temp_path}")
-                    logger.info(f"  File size: {file_size} bytes")
-                    logger.info(f"  Duration: {duration_ms}ms ({duration_ms/1000:.2f}s)")
-                    logger.info(f"  Sample rate: {audio_segment.frame_rate}Hz")
-                    logger.info(f"  Channels: {audio_segment.channels}")
-                    
-                    # Save a copy for debugging (optional)
-                    debug_path = "debug_audio.wav"
+                if stats['rms'] < 0.001:
+                    logger.warning("Audio appears to be silent or very quiet")
+                
+                # Check if audio is too short for transcription
+                if duration_ms < 500:  # Less than 0.5 seconds
+                    logger.warning(f"Audio is very short ({duration_ms:.0f}ms). This may cause transcription issues.")
+                elif duration_ms < 1000:  # Less than 1 second
+                    logger.info(f"Audio is short ({duration_ms:.0f}ms). Transcription may be less accurate.")
+                
+                if AUDIO_DEBUG_CAPTURE_ENABLED:
+                    debug_audio_ring.add(whisper_input, WHISPER_SAMPLE_RATE)
+                
+            except Exception as e:
+                error_info = global_error_handler.handle_error(
+                    error=e,
+                    module="audio",
+                    function="speech_to_text",
+                    category=ErrorCategory.PROCESSING_ERROR,
+                    context={"audio_length": len(audio_data), "sample_rate": AUDIO_SAMPLE_RATE}
+                )
+                raise RuntimeError(f"Audio processing failed: {error_info.user_message}")
+            
+            # Transcribe using Whisper with timeout
+            try:
+                logger.info("Transcribing audio with Whisper...")
+                
+                # Use threading to implement timeout for Whisper
+                result_queue = queue.Queue()
+                error_queue = queue.Queue()
+                
+                def transcribe_worker():
                     try:
-                        audio_segment.export(debug_path, format="wav")
-                        logger.info(f"Debug audio saved to: {debug_path}")
+                        logger.info("Running Whisper transcription...")
+                        
+                        # First try with minimal parameters
+                        try:
+                            result = self.whisper_model.transcribe(
+                                whisper_input,
+                                language="en",
+                                no_speech_threshold=0.1,
+                                temperature=0.0,
+                                fp16=False
+                            )
+                            logger.info("Whisper transcription with minimal parameters completed")
+                        except Exception as e:
+                            logger.warning(f"Minimal transcription failed: {e}, trying with default parameters")
+                            # Fallback to default parameters
+                            result = self.whisper_model.transcribe(whisper_input)
+                            logger.info("Whisper transcription with default parameters completed")
+                        
+                        # Log detailed result information
+                        if isinstance(result, dict):
+                            text = result.get("text", "").strip()
+                            language = result.get("language", "unknown")
+                            segments = result.get("segments", [])
+                            
+                            logger.info(f"Whisper result details:")
+                            logger.info(f"  Text: '{text}'")
+                            logger.info(f"  Language: {language}")
+                            logger.info(f"  Segments: {len(segments)}")
+                            
+                            if segments:
+                                for i, segment in enumerate(segments[:3]):  # Log first 3 segments
+                                    seg_text = segment.get("text", "").strip()
+                                    seg_start = segment.get("start", 0)
+                                    seg_end = segment.get("end", 0)
+                                    seg_prob = segment.get("avg_logprob", 0)
+                                    logger.info(f"    Segment {i+1}: '{seg_text}' ({seg_start:.2f}-{seg_end:.2f}s, prob: {seg_prob:.3f})")
+                            
+                            # Check if result indicates no speech
+                            if not text and segments:
+                                logger.warning("Whisper detected segments but no text - possible silence or unclear speech")
+                            elif not text:
+                                logger.warning("Whisper returned no text and no segments - likely silence")
+                        
+                        result_queue.put(result)
+                        
                     except Exception as e:
-                        logger.debug(f"Could not save debug audio: {e}")
-                    
-                    # Check if file is too short for transcription
-                    if duration_ms < 500:  # Less than 0.5 seconds
-                        logger.warning(f"Audio file is very short ({duration_ms}ms). This may cause transcription issues.")
-                    elif duration_ms < 1000:  # Less than 1 second
-                        logger.info(f"Audio file is short ({duration_ms}ms). Transcription may be less accurate.")
-                    
-                except Exception as e:
+                        logger.error(f"Whisper transcription error: {e}")
+                        error_queue.put(e)
+                
+                transcribe_thread = threading.Thread(target=transcribe_worker, daemon=True)
+                transcribe_thread.start()
+                
+                # Wait for result with timeout
+                transcribe_thread.join(timeout=AUDIO_API_TIMEOUT)
+                
+                if transcribe_thread.is_alive():
                     error_info = global_error_handler.handle_error(
-                        error=e,
+                        error=Exception("Whisper transcription timeout"),
                         module="audio",
                         function="speech_to_text",
-                        category=ErrorCategory.PROCESSING_ERROR,
-                        context={"audio_length": len(audio_data), "sample_rate": AUDIO_SAMPLE_RATE}
+                        category=ErrorCategory.TIMEOUT_ERROR,
+                        context={"timeout": AUDIO_API_TIMEOUT}
                     )
-                    raise RuntimeError(f"Audio processing failed: {error_info.user_message}")
+                    raise RuntimeError(f"Speech recognition timed out: {error_info.user_message}")
                 
-                # Transcribe using Whisper with timeout
-                try:
-                    logger.info("Transcribing audio with Whisper...")
-                    
-                    # Use threading to implement timeout for Whisper
-                    result_queue = queue.Queue()
-                    error_queue = queue.Queue()
-                    
-                    def transcribe_worker():
-                        try:
-                            # Add more detailed logging for Whisper transcription
-                            logger.info(f"Starting Whisper transcription of {temp_path}")
-                            
-                            # First, try a simple transcription to see if Whisper can process the file
-                            try:
-                                # Load the audio file to check if it's valid
-                                import librosa
-                                audio_data_check, sr = librosa.load(temp_path, sr=16000)
-                                logger.info(f"Audio file loaded successfully: {len(audio_data_check)} samples at {sr}Hz")
-                                
-                                # Check audio statistics
-                                audio_rms = np.sqrt(np.mean(audio_data_check ** 2))
-                                audio_max = np.max(np.abs(audio_data_check))
-                                logger.info(f"Audio stats - RMS: {audio_rms:.4f}, Max: {audio_max:.4f}")
-                                
-                                if audio_rms < 0.001:
-                                    logger.warning("Audio file appears to be silent or very quiet")
-                                
-                            except ImportError:
-                                logger.debug("librosa not available for audio validation")
-                            except Exception as e:
-                                logger.warning(f"Could not validate audio file: {e}")
-                            
-                            # Try different approaches to transcription
-                            logger.info("Running Whisper transcription...")
-                            
-                            # First try with minimal parameters
-                            try:
-                                result = self.whisper_model.transcribe(
-                                    temp_path,
-                                    language="en",
-                                    no_speech_threshold=0.1,
-                                    temperature=0.0,
-                                    fp16=False
-                                )
-                                logger.info("Whisper transcription with minimal parameters completed")
-                            except Exception as e:
-                                logger.warning(f"Minimal transcription failed: {e}, trying with default parameters")
-                                # Fallback to default parameters
-                                result = self.whisper_model.transcribe(temp_path)
-                                logger.info("Whisper transcription with default parameters completed")
-                            
-                            logger.info(f"Whisper transcription completed")
-                            
-                            # Log detailed result information
-                            if isinstance(result, dict):
-                                text = result.get("text", "").strip()
-                                language = result.get("language", "unknown")
-                                segments = result.get("segments", [])
-                                
-                                logger.info(f"Whisper result details:")
-                                logger.info(f"  Text: '{text}'")
-                                logger.info(f"  Language: {language}")
-                                logger.info(f"  Segments: {len(segments)}")
-                                
-                                if segments:
-                                    for i, segment in enumerate(segments[:3]):  # Log first 3 segments
-                                        seg_text = segment.get("text", "").strip()
-                                        seg_start = segment.get("start", 0)
-                                        seg_end = segment.get("end", 0)
-                                        seg_prob = segment.get("avg_logprob", 0)
-                                        logger.info(f"    Segment {i+1}: '{seg_text}' ({seg_start:.2f}-{seg_end:.2f}s, prob: {seg_prob:.3f})")
-                                
-                                # Check if result indicates no speech
-                                if not text and segments:
-                                    logger.warning("Whisper detected segments but no text - possible silence or unclear speech")
-                                elif not text:
-                                    logger.warning("Whisper returned no text and no segments - likely silence")
-                            
-                            result_queue.put(result)
-                            
-                        except Exception as e:
-                            logger.error(f"Whisper transcription error: {e}")
-                            error_queue.put(e)
-                    
-                    transcribe_thread = threading.Thread(target=transcribe_worker, daemon=True)
-                    transcribe_thread.start()
-                    
-                    # Wait for result with timeout
-                    transcribe_thread.join(timeout=AUDIO_API_TIMEOUT)
-                    
-                    if transcribe_thread.is_alive():
-                        error_info = global_error_handler.handle_error(
-                            error=Exception("Whisper transcription timeout"),
-                            module="audio",
-                            function="speech_to_text",
-                            category=ErrorCategory.TIMEOUT_ERROR,
-                            context={"timeout": AUDIO_API_TIMEOUT}
-                        )
-                        raise RuntimeError(f"Speech recognition timed out: {error_info.user_message}")
-                    
-                    # Check for errors
-                    if not error_queue.empty():
-                        transcribe_error = error_queue.get()
-                        error_info = global_error_handler.handle_error(
-                            error=transcribe_error,
-                            module="audio",
-                            function="speech_to_text",
-                            category=ErrorCategory.PROCESSING_ERROR,
-                            context={"temp_file": temp_path}
-                        )
-                        raise RuntimeError(f"Speech transcription failed: {error_info.user_message}")
-                    
-                    # Get result
-                    if result_queue.empty():
-                        error_info = global_error_handler.handle_error(
-                            error=Exception("No transcription result"),
-                            module="audio",
-                            function="speech_to_text",
-                            category=ErrorCategory.PROCESSING_ERROR
-                        )
-                        raise RuntimeError(f"No transcription result: {error_info.user_message}")
-                    
-                    result = result_queue.get()
-                    
-                    # Validate result
-                    if not isinstance(result, dict) or "text" not in result:
-                        error_info = global_error_handler.handle_error(
-                            error=Exception("Invalid transcription result format"),
-                            module="audio",
-                            function="speech_to_text",
-                            category=ErrorCategory.PROCESSING_ERROR,
-                            context={"result_type": type(result).__name__}
-                        )
-                        raise RuntimeError(f"Invalid transcription result: {error_info.user_message}")
-                    
-                    text = result["text"].strip()
-                    
-                    # Log confidence if available
-                    if "segments" in result and result["segments"]:
-                        avg_confidence = sum(seg.get("avg_logprob", 0) for seg in result["segments"]) / len(result["segments"])
-                        logger.debug(f"Average transcription confidence: {avg_confidence:.3f}")
-                    
-                    logger.info(f"Transcription result: '{text}'")
-                    return text
-                    
-                except Exception as e:
-                    if "Speech recognition" in str(e) or "Speech transcription" in str(e):
-                        raise  # Re-raise already handled errors
-                    
+                # Check for errors
+                if not error_queue.empty():
+                    transcribe_error = error_queue.get()
                     error_info = global_error_handler.handle_error(
-                        error=e,
+                        error=transcribe_error,
                         module="audio",
                         function="speech_to_text",
                         category=ErrorCategory.PROCESSING_ERROR,
-                        context={"temp_file": temp_path}
+                        context={"samples": int(whisper_input.size)}
                     )
                     raise RuntimeError(f"Speech transcription failed: {error_info.user_message}")
                 
-            finally:
-                # Clean up temporary file
-                if temp_path:
-                    try:
-                        os.unlink(temp_path)
-                        logger.debug(f"Cleaned up temporary file: {temp_path}")
-                    except OSError as e:
-                        logger.warning(f"Failed to clean up temporary file {temp_path}: {e}")
+                # Get result
+                if result_queue.empty():
+                    error_info = global_error_handler.handle_error(
+                        error=Exception("No transcription result"),
+                        module="audio",
+                        function="speech_to_text",
+                        category=ErrorCategory.PROCESSING_ERROR
+                    )
+                    raise RuntimeError(f"No transcription result: {error_info.user_message}")
+                
+                result = result_queue.get()
+                
+                # Validate result
+                if not isinstance(result, dict) or "text" not in result:
+                    error_info = global_error_handler.handle_error(
+                        error=Exception("Invalid transcription result format"),
+                        module="audio",
+                        function="speech_to_text",
+                        category=ErrorCategory.PROCESSING_ERROR,
+                        context={"result_type": type(result).__name__}
+                    )
+                    raise RuntimeError(f"Invalid transcription result: {error_info.user_message}")
+                
+                text = result["text"].strip()
+                
+                # Log confidence if available
+                if "segments" in result and result["segments"]:
+                    avg_confidence = sum(seg.get("avg_logprob", 0) for seg in result["segments"]) / len(result["segments"])
+                    logger.debug(f"Average transcription confidence: {avg_confidence:.3f}")
+                
+                if AUDIO_DEBUG_CAPTURE_ENABLED:
+                    debug_audio_ring.annotate_latest(text=text)
+                
+                logger.info(f"Transcription result: '{text}'")
+                return text
+                
+            except Exception as e:
+                if "Speech recognition" in str(e) or "Speech transcription" in str(e):
+                    raise  # Re-raise already handled errors
+                
+                error_info = global_error_handler.handle_error(
+                    error=e,
+                    module="audio",
+                    function="speech_to_text",
+                    category=ErrorCategory.PROCESSING_ERROR,
+                    context={"samples": int(whisper_input.size)}
+                )
+                raise RuntimeError(f"Speech transcription failed: {error_info.user_message}")
                     
         except Exception as e:
             # Re-raise with additional context if not already handled
@@ -521,13 +560,114 @@ class AudioModule:
                 raise RuntimeError(f"Speech recognition failed: {error_info.user_message}")
             raise
     
-    def _record_audio(self, duration: float, silence_threshold: float) -> Optional[np.ndarray]:
+    def _create_streaming_transcriber(self) -> StreamingTranscriber:
+        """Create a streaming transcriber that publishes partial transcripts."""
+        return StreamingTranscriber(self._transcribe_samples, on_partial=self._notify_partial_transcript)
+    
+    def _transcribe_samples(self, samples: np.ndarray, initial_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Transcribe a float32 audio window with Whisper.
+        
+        Args:
+            samples: Raw float32 samples (processed in place)
+            initial_prompt: Already committed text, given to Whisper as context
+            
+        Returns:
+            Whisper result dictionary
+        """
+        whisper_input = prepare_whisper_input(samples, AUDIO_SAMPLE_RATE)
+        return self.whisper_model.transcribe(
+            whisper_input,
+            language="en",
+            no_speech_threshold=0.1,
+            temperature=0.0,
+            fp16=False,
+            initial_prompt=initial_prompt
+        )
+    
+    def _finalize_streaming_transcription(self, transcriber: StreamingTranscriber) -> Optional[str]:
+        """
+        Finish a streaming transcription with a timeout.
+        
+        Args:
+            transcriber: Transcriber fed during recording
+            
+        Returns:
+            Transcribed text, or None if the full recording should be transcribed instead
+        """
+        result_queue = queue.Queue()
+        
+        def finalize_worker():
+            try:
+                result_queue.put(transcriber.finalize(timeout=AUDIO_API_TIMEOUT))
+            except Exception as e:
+                result_queue.put(e)
+        
+        finalize_thread = threading.Thread(target=finalize_worker, daemon=True)
+        finalize_thread.start()
+        finalize_thread.join(timeout=AUDIO_API_TIMEOUT)
+        
+        if finalize_thread.is_alive() or result_queue.empty():
+            logger.warning("Streaming transcription timed out, transcribing full recording")
+            return None
+        
+        outcome = result_queue.get()
+        if isinstance(outcome, Exception):
+            logger.warning(f"Streaming transcription failed: {outcome}, transcribing full recording")
+            return None
+        
+        logger.info(f"Transcription result (streaming): '{outcome}'")
+        return outcome
+    
+    def add_partial_transcript_listener(self, callback) -> None:
+        """
+        Register a callback receiving partial transcripts while the user speaks.
+        
+        Args:
+            callback: Callable receiving a PartialTranscript
+        """
+        with self._partial_listener_lock:
+            if callback not in self._partial_transcript_listeners:
+                self._partial_transcript_listeners.append(callback)
+    
+    def remove_partial_transcript_listener(self, callback) -> None:
+        """
+        Unregister a partial transcript callback.
+        
+        Args:
+            callback: Callback previously passed to add_partial_transcript_listener
+        """
+        with self._partial_listener_lock:
+            if callback in self._partial_transcript_listeners:
+                self._partial_transcript_listeners.remove(callback)
+    
+    def _notify_partial_transcript(self, partial: PartialTranscript) -> None:
+        """Store the latest partial transcript and notify listeners."""
+        self.latest_partial_transcript = partial
+        logger.debug(f"Partial transcript: {partial.to_dict()}")
+        
+        with self._partial_listener_lock:
+            listeners = list(self._partial_transcript_listeners)
+        
+        for callback in listeners:
+            try:
+                callback(partial)
+            except Exception as e:
+                logger.debug(f"Partial transcript listener failed: {e}")
+    
+    def _record_audio(self, duration: float, silence_threshold: float, on_chunk=None,
+                      on_fallback=None) -> Optional[np.ndarray]:
         """
         Record audio from the default microphone with silence detection and fallback.
         
         Args:
             duration: Maximum recording duration in seconds
-            silence_threshold: Threshold for detecting silence (legacy parameter, now uses SILENCE_DETECTION_SENSITIVITY)
+            silence_threshold: Threshold for detecting silence (legacy parameter, end of speech now comes from voice activity detection)
+            on_chunk: Optional callable receiving each raw float32 chunk as it is
+                recorded (used for streaming transcription)
+            on_fallback: Optional callable invoked when recording falls back to
+                another source; chunks given to on_chunk before it belong to
+                the abandoned attempt
             
         Returns:
             Recorded audio data as numpy array
@@ -547,13 +687,17 @@ class AudioModule:
             if SILENCE_DETECTION_ENABLED:
                 try:
                     logger.info("Attempting audio recording with silence detection...")
-                    audio_data = self._record_audio_with_silence_detection(duration)
+                    audio_data = self._record_audio_with_silence_detection(
+                        duration, on_chunk=on_chunk, on_fallback=on_fallback
+                    )
                     if audio_data is not None:
                         return audio_data
                     else:
                         logger.warning("Silence detection recording failed, falling back to fixed duration")
                 except Exception as e:
                     logger.warning(f"Silence detection failed: {e}, falling back to fixed duration recording")
+                if on_fallback is not None:
+                    on_fallback()
             
             # Fallback to fixed-duration recording
             logger.info("Using fixed-duration recording fallback...")
@@ -563,36 +707,32 @@ class AudioModule:
             logger.error(f"Audio recording failed: {e}")
             raise
 
-    def _record_audio_with_silence_detection(self, max_duration: float) -> Optional[np.ndarray]:
+    def _record_audio_with_silence_detection(self, max_duration: float, on_chunk=None,
+                                             on_fallback=None) -> Optional[np.ndarray]:
         """
-        Record audio with adaptive silence detection to automatically stop when user finishes speaking.
+        Record audio until voice activity detection finds the end of the utterance.
         
         Args:
             max_duration: Maximum recording duration in seconds
+            on_chunk: Optional callable receiving each raw float32 chunk
+            on_fallback: Optional callable invoked before retrying on a
+                dedicated stream after the shared capture failed
             
         Returns:
             Recorded audio data as numpy array, or None if failed
         """
+        # Read from the always-on stream when wake word listening opened it
+        if AUDIO_CAPTURE_SHARED_STREAM and self.capture_service.is_healthy():
+            audio_data = self._record_from_shared_capture(max_duration, on_chunk=on_chunk)
+            if audio_data is not None:
+                return audio_data
+            logger.warning("Shared capture recording failed, opening a dedicated input stream")
+            if on_fallback is not None:
+                on_fallback()
+        
         try:
             chunk_size = int(SILENCE_DETECTION_CHUNK_SIZE * AUDIO_SAMPLE_RATE)
-            audio_chunks = []
-            silence_chunks = 0
-            required_silence_chunks = int(SILENCE_DETECTION_DURATION / SILENCE_DETECTION_CHUNK_SIZE)
-            min_recording_chunks = int(MIN_RECORDING_DURATION / SILENCE_DETECTION_CHUNK_SIZE)
-            max_chunks = int(max_duration / SILENCE_DETECTION_CHUNK_SIZE)
-            
-            # Adaptive baseline measurement
-            baseline_chunks = min(10, int(0.5 / SILENCE_DETECTION_CHUNK_SIZE))  # 0.5 seconds or 10 chunks max
-            baseline_levels = []
-            
-            logger.info(f"Recording with adaptive silence detection:")
-            logger.info(f"  Chunk size: {chunk_size} samples ({SILENCE_DETECTION_CHUNK_SIZE}s)")
-            logger.info(f"  Required silence: {required_silence_chunks} chunks ({SILENCE_DETECTION_DURATION}s)")
-            logger.info(f"  Minimum recording: {min_recording_chunks} chunks ({MIN_RECORDING_DURATION}s)")
-            logger.info(f"  Base silence threshold: {SILENCE_DETECTION_SENSITIVITY}")
-            logger.info(f"  Measuring baseline for {baseline_chunks} chunks...")
-            
-            # Start recording stream
+            
             with sd.InputStream(
                 samplerate=AUDIO_SAMPLE_RATE,
                 channels=1,
@@ -600,99 +740,134 @@ class AudioModule:
                 blocksize=chunk_size
             ) as stream:
                 
-                start_time = time.time()
-                chunk_count = 0
-                adaptive_threshold = SILENCE_DETECTION_SENSITIVITY
-                speech_detected = False
-                
-                while chunk_count < max_chunks:
-                    # Read audio chunk
+                def read_chunk():
                     audio_chunk, overflowed = stream.read(chunk_size)
-                    
                     if overflowed:
-                        logger.warning("Audio input overflow detected")
-                    
-                    # Flatten the chunk
-                    audio_chunk = audio_chunk.flatten()
-                    audio_chunks.append(audio_chunk)
-                    chunk_count += 1
-                    
-                    # Calculate RMS volume for this chunk
-                    chunk_rms = np.sqrt(np.mean(audio_chunk ** 2))
-                    
-                    # Collect baseline measurements
-                    if chunk_count <= baseline_chunks:
-                        baseline_levels.append(chunk_rms)
-                        if chunk_count == baseline_chunks:
-                            # Calculate adaptive threshold
-                            baseline_avg = np.mean(baseline_levels)
-                            baseline_max = np.max(baseline_levels)
-                            # Set threshold to 2x the baseline average, but at least the configured minimum
-                            adaptive_threshold = max(baseline_avg * 2.0, SILENCE_DETECTION_SENSITIVITY)
-                            # Cap it at a reasonable maximum to avoid being too insensitive
-                            adaptive_threshold = min(adaptive_threshold, 0.15)
-                            
-                            logger.info(f"Baseline measurement complete:")
-                            logger.info(f"  Baseline average: {baseline_avg:.4f}")
-                            logger.info(f"  Baseline max: {baseline_max:.4f}")
-                            logger.info(f"  Adaptive threshold: {adaptive_threshold:.4f}")
-                        continue
-                    
-                    # Check if this chunk is silent using adaptive threshold
-                    is_silent = chunk_rms < adaptive_threshold
-                    
-                    # Track if we've detected speech (helps with very quiet speakers)
-                    if chunk_rms > adaptive_threshold * 1.2:  # 1.2x threshold indicates clear speech
-                        speech_detected = True
-                    
-                    if is_silent:
-                        silence_chunks += 1
-                        logger.info(f"Chunk {chunk_count}: Silent (RMS: {chunk_rms:.4f} < {adaptive_threshold:.4f}), silence: {silence_chunks}/{required_silence_chunks}")
-                    else:
-                        silence_chunks = 0  # Reset silence counter on any sound
-                        logger.info(f"Chunk {chunk_count}: Sound (RMS: {chunk_rms:.4f} >= {adaptive_threshold:.4f}), reset silence count")
-                    
-                    # Check if we should stop recording
-                    # Only stop if we've detected speech at some point (prevents stopping on pure silence)
-                    if (chunk_count >= min_recording_chunks and 
-                        silence_chunks >= required_silence_chunks and 
-                        speech_detected):
-                        elapsed_time = time.time() - start_time
-                        logger.info(f"Speech followed by silence detected after {elapsed_time:.2f}s, stopping recording")
-                        break
-                    
-                    # Log progress every second
-                    if chunk_count % int(1.0 / SILENCE_DETECTION_CHUNK_SIZE) == 0:
-                        elapsed_time = time.time() - start_time
-                        logger.debug(f"Recording progress: {elapsed_time:.1f}s, silence: {silence_chunks}/{required_silence_chunks}, speech_detected: {speech_detected}")
+                        logger.debug("Audio input overflow detected")
+                    return audio_chunk.flatten()
+                
+                audio_chunks, endpointer = self._capture_until_endpoint(read_chunk, max_duration, on_chunk=on_chunk)
             
-            # Combine all audio chunks
             if not audio_chunks:
                 logger.warning("No audio chunks recorded")
                 return None
             
             audio_data = np.concatenate(audio_chunks)
+            self._log_endpoint_summary(endpointer, len(audio_data) / AUDIO_SAMPLE_RATE, max_duration)
+            return self._process_recorded_audio(audio_data)
             
-            # Calculate final statistics
-            duration_recorded = len(audio_data) / AUDIO_SAMPLE_RATE
-            volume_rms = np.sqrt(np.mean(audio_data ** 2))
-            volume_max = np.max(np.abs(audio_data))
+        except Exception as e:
+            logger.error(f"Silence detection recording failed: {e}")
+            return None
+
+    def _record_from_shared_capture(self, max_duration: float, on_chunk=None) -> Optional[np.ndarray]:
+        """
+        Record a command from the shared capture ring buffer.
+        
+        Recording starts AUDIO_CAPTURE_PREROLL seconds in the past (but never
+        before the end of the wake word), so speech that began before this call
+        is kept. Voice activity detection starts from the continuously tracked
+        noise floor, so there is no baseline measurement phase.
+        
+        Args:
+            max_duration: Maximum recording duration in seconds
+            on_chunk: Optional callable receiving each raw float32 chunk
             
-            logger.info(f"Adaptive silence detection recording completed:")
-            logger.info(f"  Duration: {duration_recorded:.2f}s (saved {max_duration - duration_recorded:.2f}s)")
-            logger.info(f"  Samples: {len(audio_data)}")
-            logger.info(f"  RMS volume: {volume_rms:.4f}")
-            logger.info(f"  Max volume: {volume_max:.4f}")
-            logger.info(f"  Speech detected: {speech_detected}")
-            logger.info(f"  Final threshold used: {adaptive_threshold:.4f}")
+        Returns:
+            Recorded audio data as numpy array, or None if the stream stalled
+        """
+        try:
+            capture = self.capture_service
+            sample_rate = capture.sample_rate
+            chunk_size = int(SILENCE_DETECTION_CHUNK_SIZE * sample_rate)
+            chunk_timeout = max(0.5, 5 * SILENCE_DETECTION_CHUNK_SIZE)
+            
+            # Start with pre-roll, bounded by the wake word end
+            now = capture.position
+            cursor = now
+            wake_word_end, self._wake_word_end_position = self._wake_word_end_position, None
+            if wake_word_end is not None:
+                cursor = max(now - int(AUDIO_CAPTURE_PREROLL * sample_rate), wake_word_end)
+            cursor = max(cursor, capture.ring.oldest_position)
+            logger.info(f"Recording from shared capture: pre-roll {(now - cursor) / sample_rate:.2f}s, "
+                        f"noise floor {capture.noise_floor.level or 0.0:.4f}")
+            
+            stalled = False
+            
+            def read_chunk():
+                nonlocal cursor, stalled
+                audio_chunk, cursor = capture.read(cursor, chunk_size, timeout=chunk_timeout)
+                if len(audio_chunk) < chunk_size:
+                    stalled = True
+                    return None
+                return audio_chunk
+            
+            audio_chunks, endpointer = self._capture_until_endpoint(
+                read_chunk, max_duration, on_chunk=on_chunk, noise_floor=capture.noise_floor.level
+            )
             
-            # Apply the same post-processing as the fixed duration method
+            if stalled:
+                logger.warning("Shared audio capture stopped delivering audio")
+                capture.stop()
+            if not audio_chunks:
+                return None
+            
+            audio_data = np.concatenate(audio_chunks)
+            self._log_endpoint_summary(endpointer, len(audio_data) / sample_rate, max_duration)
             return self._process_recorded_audio(audio_data)
             
         except Exception as e:
-            logger.error(f"Adaptive silence detection recording failed: {e}")
+            logger.error(f"Shared capture recording failed: {e}")
             return None
 
+    def _capture_until_endpoint(self, read_chunk, max_duration: float, on_chunk=None,
+                                noise_floor: Optional[float] = None):
+        """
+        Read chunks until the endpointer detects the end of the utterance.
+        
+        Args:
+            read_chunk: Callable returning the next float32 chunk, or None if no
+                more audio is available
+            max_duration: Maximum recording duration in seconds
+            on_chunk: Optional callable receiving each chunk
+            noise_floor: Initial noise floor for voice activity detection
+            
+        Returns:
+            Tuple of (list of chunks, Endpointer)
+        """
+        endpointer = Endpointer(noise_floor=noise_floor)
+        max_chunks = int(max_duration / SILENCE_DETECTION_CHUNK_SIZE)
+        min_recording_chunks = int(MIN_RECORDING_DURATION / SILENCE_DETECTION_CHUNK_SIZE)
+        audio_chunks = []
+        
+        while len(audio_chunks) < max_chunks:
+            audio_chunk = read_chunk()
+            if audio_chunk is None:
+                break
+            audio_chunks.append(audio_chunk)
+            
+            if on_chunk is not None:
+                try:
+                    on_chunk(audio_chunk)
+                except Exception as e:
+                    logger.debug(f"Audio chunk consumer failed: {e}")
+            
+            if endpointer.process(audio_chunk) and len(audio_chunks) >= min_recording_chunks:
+                break
+        
+        return audio_chunks, endpointer
+
+    def _log_endpoint_summary(self, endpointer: Endpointer, duration_recorded: float, max_duration: float) -> None:
+        """Log the outcome of an endpointed recording."""
+        summary = endpointer.get_summary()
+        if summary['ended']:
+            logger.info(f"End of utterance detected: recorded {duration_recorded:.2f}s "
+                        f"(speech {summary['speech_start']:.2f}s-{summary['speech_end']:.2f}s, "
+                        f"saved {max_duration - duration_recorded:.2f}s)")
+        else:
+            logger.info(f"Recording reached {duration_recorded:.2f}s without an endpoint "
+                        f"(speech detected: {summary['speech_detected']})")
+
     def _record_audio_fixed_duration(self, duration: float) -> Optional[np.ndarray]:
         """
         Record audio for a fixed duration (fallback method).
@@ -818,19 +993,22 @@ class AudioModule:
             logger.info(f"Listening for wake word '{WAKE_WORD}'...")
             self.is_listening_for_wake_word = True
             
-            # Audio buffer for Porcupine
-            audio_buffer = []
             frame_length = self.porcupine.frame_length
             sample_rate = self.porcupine.sample_rate
+            gate = self._get_wake_word_gate(frame_length, sample_rate)
+            batch_length = frame_length * WAKE_WORD_FRAME_BATCH
+            
+            if self._start_shared_capture(sample_rate):
+                return self._listen_on_shared_capture(gate, batch_length, timeout, provide_feedback)
+            
+            # Start audio stream; the callback only hands over blocks of whole
+            # frame batches, the energy gate and Porcupine run on this thread
+            blocks = queue.Queue()
             
-            # Start audio stream
             def audio_callback(indata, frames, time, status):
                 if status:
                     logger.warning(f"Audio input status: {status}")
-                
-                # Convert to int16 and add to buffer
-                audio_data = (indata[:, 0] * 32767).astype(np.int16)
-                audio_buffer.extend(audio_data)
+                blocks.put(indata[:, 0].copy())
             
             # Start recording
             with sd.InputStream(
@@ -838,9 +1016,10 @@ class AudioModule:
                 channels=1,
                 samplerate=sample_rate,
                 dtype=np.float32,
-                blocksize=frame_length
+                blocksize=batch_length
             ):
                 start_time = time.time()
+                pending = np.zeros(0, dtype=np.float32)
                 
                 while self.is_listening_for_wake_word:
                     # Check timeout
@@ -848,27 +1027,20 @@ class AudioModule:
                         logger.info("Wake word detection timeout reached")
                         return False
                     
-                    # Process audio frames when we have enough data
-                    if len(audio_buffer) >= frame_length:
-                        # Extract frame
-                        frame = audio_buffer[:frame_length]
-                        audio_buffer = audio_buffer[frame_length:]
-                        
-                        # Process with Porcupine
-                        keyword_index = self.porcupine.process(frame)
-                        
-                        if keyword_index >= 0:
-                            logger.info(f"Wake word '{WAKE_WORD}' detected!")
-                            self.is_listening_for_wake_word = False
-                            
-                            # Provide audio confirmation if requested
-                            if provide_feedback:
-                                self._provide_wake_word_confirmation()
-                            
-                            return True
+                    # Block until the next batch arrives instead of polling
+                    try:
+                        pending = np.concatenate((pending, blocks.get(timeout=0.1)))
+                    except queue.Empty:
+                        continue
+                    
+                    whole = len(pending) - len(pending) % frame_length
+                    if whole == 0:
+                        continue
+                    batch, pending = pending[:whole], pending[whole:]
                     
-                    # Small sleep to prevent excessive CPU usage
-                    time.sleep(0.01)
+                    if gate.process(batch) is not None:
+                        self._on_wake_word_detected(provide_feedback)
+                        return True
                 
                 return False
                 
@@ -878,6 +1050,82 @@ class AudioModule:
         finally:
             self.is_listening_for_wake_word = False
     
+    def _start_shared_capture(self, sample_rate: int) -> bool:
+        """
+        Open the shared capture stream for wake word detection.
+        
+        Args:
+            sample_rate: Sample rate required by Porcupine
+            
+        Returns:
+            True if the shared stream is running and can be used
+        """
+        if not AUDIO_CAPTURE_SHARED_STREAM or sample_rate != self.capture_service.sample_rate:
+            return False
+        try:
+            return self.capture_service.start()
+        except Exception as e:
+            logger.warning(f"Shared audio capture unavailable, using a dedicated stream: {e}")
+            return False
+    
+    def _listen_on_shared_capture(self, gate: WakeWordGate, batch_length: int,
+                                  timeout: Optional[float], provide_feedback: bool) -> bool:
+        """
+        Feed batches of Porcupine frames from the shared capture stream.
+        
+        Starts at the current capture position, so audio already handled
+        (e.g. the previous command) is not processed again. The position where
+        the wake word ended is kept as the lower bound for command pre-roll.
+        """
+        capture = self.capture_service
+        cursor = capture.position
+        start_time = time.time()
+        read_timeout = 0.2
+        
+        while self.is_listening_for_wake_word:
+            if timeout and (time.time() - start_time) > timeout:
+                logger.info("Wake word detection timeout reached")
+                return False
+            
+            samples, cursor = capture.read(cursor, batch_length, timeout=read_timeout, partial=False)
+            if len(samples) < batch_length:
+                if not capture.is_healthy(read_timeout=read_timeout):
+                    capture.stop()
+                    raise RuntimeError("Shared audio capture stopped delivering audio")
+                continue
+            
+            frame_index = gate.process(samples)
+            if frame_index is not None:
+                frames_after = batch_length // gate.frame_length - frame_index - 1
+                self._wake_word_end_position = cursor - frames_after * gate.frame_length
+                self._on_wake_word_detected(provide_feedback)
+                return True
+        
+        return False
+    
+    def _get_wake_word_gate(self, frame_length: int, sample_rate: int) -> WakeWordGate:
+        """Get the energy gate in front of Porcupine (kept across listens for its noise floor)."""
+        gate = self.wake_word_gate
+        if gate is None or gate.frame_length != frame_length or gate.sample_rate != sample_rate:
+            gate = self.wake_word_gate = WakeWordGate(
+                self.porcupine.process,
+                frame_length,
+                sample_rate,
+                enabled=WAKE_WORD_ENERGY_GATE_ENABLED
+            )
+        return gate
+    
+    def _on_wake_word_detected(self, provide_feedback: bool) -> None:
+        """Stop listening and interrupt speech after a wake word."""
+        logger.info(f"Wake word '{WAKE_WORD}' detected!")
+        self.is_listening_for_wake_word = False
+        self.wake_word_gate.reset()
+        self.stop_speaking()
+        
+        # Provide audio confirmation if requested
+        if provide_feedback:
+            self._provide_wake_word_confirmation()
+    
     def start_continuous_wake_word_monitoring(self, callback=None, session_timeout: Optional[float] = None) -> None:
         """
         Start continuous wake word monitoring in a separate thread.
@@ -992,9 +1240,26 @@ class AudioModule:
         """
         Internal method to handle TTS with proper method selection.
         
+        Fixed feedback phrases are played from the phrase cache and
+        multi-sentence text through the speech pipeline when available.
+        
         Args:
             text: Text to speak
         """
+        phrase_cache = getattr(self, 'phrase_cache', None)
+        if phrase_cache is not None and phrase_cache.play(text):
+            logger.debug(f"Played cached TTS phrase: '{text[:50]}'")
+            return
+        
+        # Multi-sentence text starts playing once its first sentence is synthesized
+        speech_pipeline = getattr(self, 'speech_pipeline', None)
+        if speech_pipeline is not None and speech_pipeline.should_pipeline(text):
+            result = speech_pipeline.speak(text)
+            if result.error is None or result.cancelled:
+                return
+            logger.warning(f"Pipelined TTS failed ({result.error}), speaking the rest directly")
+            text = " ".join(result.remaining)
+        
         if hasattr(self, 'tts_method') and self.tts_method == 'system':
             # Use macOS 'say' command
             import subprocess
@@ -1019,11 +1284,147 @@ class AudioModule:
                 
         elif hasattr(self, 'tts_method') and self.tts_method == 'pyttsx3':
             # Use pyttsx3
-            self.tts_engine.say(text)
-            self.tts_engine.runAndWait()
+            with _PYTTSX3_LOCK:
+                self.tts_engine.say(text)
+                self.tts_engine.runAndWait()
+        else:
+            raise Exception("No valid TTS method available")
+    
+    def _render_speech_to_file(self, text: str, path: str) -> None:
+        """
+        Render text to a WAV file with the active TTS method.
+        
+        Args:
+            text: Text to render
+            path: Output file path
+            
+        Raises:
+            Exception: If rendering fails
+        """
+        if self.tts_method == 'system':
+            import subprocess
+            
+            rate = int(200 * TTS_SPEED)
+            result = subprocess.run(
+                ['say', '-r', str(rate), '-o', path, '--file-format=WAVE', '--data-format=LEI16@22050', text],
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+            if result.returncode != 0:
+                raise Exception(f"macOS 'say' rendering failed: {result.stderr}")
+        elif self.tts_method == 'pyttsx3':
+            with _PYTTSX3_LOCK:
+                self.tts_engine.save_to_file(text, path)
+                self.tts_engine.runAndWait()
         else:
             raise Exception("No valid TTS method available")
     
+    def enable_phrase_cache(self) -> Optional[PhraseAudioCache]:
+        """
+        Play fixed feedback phrases from pre-rendered audio.
+        
+        Called once the pygame mixer is initialized (by FeedbackModule).
+        Configured phrases are rendered in the background, so startup isn't
+        delayed; until a phrase is ready it is spoken live.
+        
+        Returns:
+            The phrase cache, or None if disabled or TTS is unavailable
+        """
+        if not TTS_PHRASE_CACHE_ENABLED or not self.tts_engine or self.phrase_cache is not None:
+            return self.phrase_cache
+        
+        voice = "default"
+        if self.tts_method == 'pyttsx3':
+            try:
+                voice = str(self.tts_engine.getProperty('voice'))
+            except Exception:
+                pass
+        
+        self.phrase_cache = PhraseAudioCache(
+            renderer=self._render_speech_to_file,
+            cache_dir=TTS_PHRASE_CACHE_DIR,
+            voice=f"{self.tts_method}:{voice}",
+            rate=int(200 * TTS_SPEED),
+            templates=TTS_PHRASE_CACHE_TEMPLATES,
+            max_chars=TTS_PHRASE_CACHE_MAX_CHARS
+        )
+        threading.Thread(
+            target=self.phrase_cache.prerender,
+            args=(TTS_PHRASE_CACHE_PHRASES,),
+            daemon=True,
+            name="TTSPhrasePrerender"
+        ).start()
+        logger.info("TTS phrase cache enabled")
+        return self.phrase_cache
+    
+    def enable_speech_pipeline(self) -> Optional[PipelinedSpeaker]:
+        """
+        Speak multi-sentence text sentence by sentence through the pygame mixer.
+        
+        Called once the pygame mixer is initialized (by FeedbackModule).
+        
+        Returns:
+            The speech pipeline, or None if disabled or TTS is unavailable
+        """
+        if not TTS_PIPELINE_ENABLED or not self.tts_engine or self.speech_pipeline is not None:
+            return self.speech_pipeline
+        
+        self.speech_pipeline = PipelinedSpeaker(MixerSpeechBackend(self._render_speech_to_file))
+        logger.info("Sentence-pipelined TTS enabled")
+        return self.speech_pipeline
+    
+    def speak_sentences(self, sentences: Iterable[str]) -> None:
+        """
+        Speak sentences as they arrive (e.g. a SpeechStream of an LLM response).
+        
+        Blocks until the sentences are spoken. With the speech pipeline the
+        next sentence is synthesized while the current one plays; otherwise
+        each sentence is spoken as soon as it is available.
+        
+        Args:
+            sentences: Iterable of sentences, consumed lazily
+        """
+        if not self.tts_engine:
+            logger.warning("TTS engine not available, skipping text-to-speech")
+            return
+        
+        iterator = iter(sentences)
+        speech_pipeline = getattr(self, 'speech_pipeline', None)
+        if speech_pipeline is not None:
+            result = speech_pipeline.speak_sentences(iterator)
+            if result.cancelled:
+                cancel = getattr(sentences, 'cancel', None)
+                if cancel is not None:
+                    cancel()
+                return
+            if result.error is None:
+                return
+            logger.warning(f"Pipelined TTS failed ({result.error}), speaking the rest directly")
+            for sentence in result.remaining:
+                self._speak_text_internal(sentence)
+        
+        for sentence in iterator:
+            self._speak_text_internal(sentence)
+    
+    def stop_speaking(self) -> bool:
+        """
+        Interrupt pipelined speech or a cached phrase in progress (barge-in).
+        
+        Returns:
+            True if speech was interrupted
+        """
+        interrupted = False
+        speech_pipeline = getattr(self, 'speech_pipeline', None)
+        if speech_pipeline is not None and speech_pipeline.cancel():
+            interrupted = True
+        phrase_cache = getattr(self, 'phrase_cache', None)
+        if phrase_cache is not None and phrase_cache.stop():
+            interrupted = True
+        if interrupted:
+            logger.info("Speech interrupted")
+        return interrupted
+    
     def test_speech_to_text(self, duration: float = 3.0) -> Dict[str, Any]:
         """
         Test the complete speech-to-text pipeline and return detailed results.
@@ -1320,8 +1721,19 @@ class AudioModule:
             if self.tts_engine:
                 self.tts_engine.stop()
             
-            # Stop any ongoing recordings
+            # Stop any ongoing recordings and the shared stream
             sd.stop()
+            self.capture_service.stop()
+            
+            # Stop pipelined speech and release pre-rendered phrases
+            self.stop_speaking()
+            if self.phrase_cache:
+                self.phrase_cache.clear_memory()
+            
+            # Stop the STT worker process
+            if self.stt_worker:
+                self.stt_worker.stop()
+                self.stt_worker = None
             
             logger.info("AudioModule cleanup completed")
             
@@ -0,0 +1,318 @@
+# modules/audio_capture.py
+"""
+Shared Audio Capture for AURA
+
+A single persistent microphone stream feeding a ring buffer that every
+audio consumer reads from:
+
+- wake word detection (Porcupine) and command recording share one stream,
+  so no stream is opened or closed between the wake word and the command
+- command capture can start from a pre-roll offset, so syllables spoken
+  right after the wake word are not clipped
+- the noise floor is tracked continuously, so recording doesn't need a
+  baseline measurement phase
+
+The ring buffer is single-producer / multi-reader and lock-free: the
+PortAudio callback writes samples and then publishes the new write
+position; readers keep their own absolute cursor and detect overruns by
+comparing it with the write position.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional, Tuple, Dict, Any
+
+import numpy as np
+import sounddevice as sd
+
+from config import (
+    AUDIO_SAMPLE_RATE,
+    AUDIO_CAPTURE_BUFFER_SECONDS,
+    AUDIO_CAPTURE_BLOCK_SIZE,
+    SILENCE_DETECTION_SENSITIVITY
+)
+
+logger = logging.getLogger(__name__)
+
+# Stream is considered stalled if no callback arrived for this long
+_STALL_TIMEOUT = 0.5
+
+# Readers using longer (idle mode) read timeouts get this many empty reads
+# before the stream is considered stalled
+_STALL_READS = 5
+
+
+class AudioRingBuffer:
+    """
+    Lock-free single-producer ring buffer of float32 samples.
+
+    Positions are absolute sample counts since the buffer was created; a
+    position is readable while it is within `capacity` samples of the
+    current write position.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize the ring buffer.
+
+        Args:
+            capacity: Number of samples kept
+        """
+        self.capacity = capacity
+        self._data = np.zeros(capacity, dtype=np.float32)
+        self._write_position = 0
+        self.overruns = 0
+
+    @property
+    def write_position(self) -> int:
+        """Absolute position one past the newest sample."""
+        return self._write_position
+
+    @property
+    def oldest_position(self) -> int:
+        """Absolute position of the oldest sample still held."""
+        return max(0, self._write_position - self.capacity)
+
+    def write(self, samples: np.ndarray) -> None:
+        """
+        Append samples (producer side only).
+
+        Args:
+            samples: Mono float32 samples
+        """
+        count = len(samples)
+        if count > self.capacity:
+            samples = samples[-self.capacity:]
+        start = (self._write_position + count - len(samples)) % self.capacity
+        first = min(len(samples), self.capacity - start)
+        self._data[start:start + first] = samples[:first]
+        self._data[:len(samples) - first] = samples[first:]
+        # Publish only after the samples are in place
+        self._write_position += count
+
+    def read(self, position: int, count: int) -> Tuple[np.ndarray, int]:
+        """
+        Copy up to `count` samples starting at `position`.
+
+        Args:
+            position: Absolute read position
+            count: Maximum number of samples
+
+        Returns:
+            Tuple of (samples, next position). If the reader fell behind by more
+            than the capacity, reading resumes at the oldest retained sample.
+        """
+        write_position = self._write_position
+        oldest = write_position - self.capacity
+        if position < oldest:
+            self.overruns += 1
+            position = oldest
+
+        available = min(count, write_position - position)
+        if available <= 0:
+            return np.zeros(0, dtype=np.float32), position
+
+        start = position % self.capacity
+        first = min(available, self.capacity - start)
+        out = np.empty(available, dtype=np.float32)
+        out[:first] = self._data[start:start + first]
+        out[first:] = self._data[:available - first]
+
+        # Drop samples the producer overwrote while we were copying
+        overwritten = self._write_position - self.capacity - position
+        if overwritten > 0:
+            self.overruns += 1
+            out = out[overwritten:]
+            position += overwritten
+
+        return out, position + len(out)
+
+
+class NoiseFloorTracker:
+    """
+    Continuous noise floor estimate from per-block RMS levels.
+
+    The estimate falls quickly to quieter blocks and rises slowly during
+    louder ones, so speech barely moves it while a change in background
+    noise is followed within a few seconds.
+    """
+
+    def __init__(self, rise_rate: float = 0.01, fall_rate: float = 0.3):
+        """
+        Initialize the tracker.
+
+        Args:
+            rise_rate: Fraction of the gap closed per louder block
+            fall_rate: Fraction of the gap closed per quieter block
+        """
+        self.rise_rate = rise_rate
+        self.fall_rate = fall_rate
+        self.level: Optional[float] = None
+
+    def update(self, rms: float) -> float:
+        """
+        Add a block level.
+
+        Args:
+            rms: RMS level of the latest block
+
+        Returns:
+            Updated noise floor
+        """
+        if self.level is None:
+            self.level = rms
+        else:
+            rate = self.rise_rate if rms > self.level else self.fall_rate
+            self.level += rate * (rms - self.level)
+        return self.level
+
+
+class AudioCaptureService:
+    """
+    Persistent microphone stream shared by wake word detection and recording.
+    """
+
+    def __init__(self, sample_rate: int = AUDIO_SAMPLE_RATE,
+                 buffer_seconds: float = AUDIO_CAPTURE_BUFFER_SECONDS,
+                 block_size: int = AUDIO_CAPTURE_BLOCK_SIZE):
+        """
+        Initialize the capture service (the stream is opened by start()).
+
+        Args:
+            sample_rate: Capture sample rate
+            buffer_seconds: Seconds of audio kept in the ring buffer
+            block_size: Samples per PortAudio callback
+        """
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self.ring = AudioRingBuffer(int(buffer_seconds * sample_rate))
+        self.noise_floor = NoiseFloorTracker()
+        self._stream = None
+        self._start_lock = threading.Lock()
+        self._last_callback = 0.0
+        self._status_warnings = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the stream is open."""
+        return self._stream is not None
+
+    @property
+    def position(self) -> int:
+        """Absolute position of the newest captured sample."""
+        return self.ring.write_position
+
+    def is_healthy(self, read_timeout: float = 0.0) -> bool:
+        """
+        Whether the stream is open and delivering audio.
+
+        Args:
+            read_timeout: Timeout of the caller's reads; the stall timeout is
+                scaled up with it, so a reader waiting in long idle-mode reads
+                doesn't declare a stall after one or two empty reads
+
+        Returns:
+            True if a callback arrived within the stall timeout
+        """
+        stall_timeout = max(_STALL_TIMEOUT, _STALL_READS * read_timeout)
+        return self.is_running and (time.monotonic() - self._last_callback) < stall_timeout
+
+    def start(self) -> bool:
+        """
+        Open the shared input stream if it isn't open yet.
+
+        Returns:
+            True if the stream is running
+        """
+        with self._start_lock:
+            if self._stream is not None:
+                return True
+            stream = sd.InputStream(
+                samplerate=self.sample_rate,
+                channels=1,
+                dtype=np.float32,
+                blocksize=self.block_size,
+                callback=self._callback
+            )
+            stream.start()
+            self._stream = stream
+            self._last_callback = time.monotonic()
+            logger.info(f"Shared audio capture started ({self.sample_rate}Hz, "
+                        f"{self.ring.capacity / self.sample_rate:.0f}s ring buffer)")
+            return True
+
+    def stop(self) -> None:
+        """Close the shared input stream."""
+        with self._start_lock:
+            stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                stream.stop()
+                stream.close()
+            except Exception as e:
+                logger.debug(f"Error closing audio capture stream: {e}")
+            logger.info("Shared audio capture stopped")
+
+    def _callback(self, indata, frames, time_info, status) -> None:
+        """PortAudio callback: append samples and update the noise floor."""
+        if status:
+            self._status_warnings += 1
+        samples = indata[:, 0] if indata.ndim > 1 else indata
+        self.ring.write(samples)
+        self.noise_floor.update(float(np.sqrt(np.dot(samples, samples) / max(1, len(samples)))))
+        self._last_callback = time.monotonic()
+
+    def read(self, position: int, count: int, timeout: float,
+             partial: bool = True) -> Tuple[np.ndarray, int]:
+        """
+        Read `count` samples from `position`, waiting up to `timeout` for them.
+
+        Args:
+            position: Absolute read position
+            count: Number of samples wanted
+            timeout: Seconds to wait for the samples to be captured
+            partial: Return the samples available on timeout; if False nothing
+                is consumed unless all `count` samples are available
+
+        Returns:
+            Tuple of (samples, next position)
+        """
+        deadline = time.monotonic() + timeout
+        while self.ring.write_position - position < count and self.is_running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Sleep until the missing samples are due rather than polling
+            missing = count - (self.ring.write_position - position)
+            time.sleep(min(max(0.005, missing / self.sample_rate), remaining))
+        if not partial and self.ring.write_position - position < count:
+            return np.zeros(0, dtype=np.float32), position
+        return self.ring.read(position, count)
+
+    def silence_threshold(self, multiplier: float = 2.0, minimum: float = SILENCE_DETECTION_SENSITIVITY,
+                          maximum: float = 0.15) -> float:
+        """
+        RMS level below which a chunk counts as silence.
+
+        Args:
+            multiplier: Factor applied to the noise floor
+            minimum: Lower bound of the threshold
+            maximum: Upper bound of the threshold
+
+        Returns:
+            Silence threshold derived from the current noise floor
+        """
+        level = self.noise_floor.level or 0.0
+        return min(max(level * multiplier, minimum), maximum)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get capture statistics."""
+        return {
+            'running': self.is_running,
+            'healthy': self.is_healthy(),
+            'captured_seconds': self.ring.write_position / self.sample_rate,
+            'noise_floor': self.noise_floor.level,
+            'overruns': self.ring.overruns,
+            'status_warnings': self._status_warnings
+        }
@@ -10,10 +10,33 @@ import pyautogui
 import time
 import logging
 import platform
+import threading
 import subprocess
 import pyperclip
 from typing import Dict, Any, Tuple, Optional, List
-from config import MOUSE_MOVE_DURATION, TYPE_INTERVAL, SCROLL_AMOUNT
+from config import (
+    MOUSE_MOVE_DURATION, TYPE_INTERVAL, SCROLL_AMOUNT,
+    AUTOMATION_INPUT_BACKEND, AUTOMATION_BATCH_ENABLED, AUTOMATION_BATCH_ACTION_PAUSE_MS,
+    AUTOMATION_BATCH_FOCUS_PAUSE_MS, AUTOMATION_BATCH_TIMEOUT, FORM_FILL_BATCH_ENABLED,
+    CLIPBOARD_CAPTURE_BACKEND
+)
+from .action_compiler import ActionCompiler, CompiledSegment, hotkey_commands, can_type_directly
+from .automation_telemetry import AutomationTelemetry, ActionHistory, ACTION_TYPES
+from .clipboard_capture import ClipboardCapture, CaptureResult, create_pasteboard_backend
+from .display_geometry import display_geometry, DisplayLayout
+from .form_filler import FormFillEngine, match_field_value
+from .input_backends import create_input_backend
+from .ui_settle import (
+    wait_for,
+    AnyOf,
+    AppResponsive,
+    AXNotificationReceived,
+    FocusAt,
+    FocusedValueChanged,
+    PasteboardChanged,
+    ScreenRegionChanged,
+    SelectionChanged
+)
 from .error_handler import (
     global_error_handler,
     with_error_handling,
@@ -27,6 +50,15 @@ pyautogui.PAUSE = 0.1      # Small pause between actions
 
 logger = logging.getLogger(__name__)
 
+# Key names (as used by the input backends) that PyAutoGUI spells differently
+PYAUTOGUI_KEY_NAMES = {
+    'cmd': 'command',
+    'return': 'enter',
+    'delete': 'backspace',
+    'page-up': 'pageup',
+    'page-down': 'pagedown'
+}
+
 
 class AutomationModule:
     """
@@ -46,25 +78,48 @@ class AutomationModule:
         """
         self.is_macos = platform.system() == "Darwin"
         
+        # Display bounds from the shared display geometry service (None: detect the screen size here)
+        self.display_geometry = display_geometry if display_geometry.available else None
+        layout = self.display_geometry.layout() if self.display_geometry else None
+        
         # Get screen size safely based on platform
-        if self.is_macos:
+        if layout is not None:
+            self.screen_width, self.screen_height = int(layout.main.width), int(layout.main.height)
+            self.display_geometry.add_listener(self._on_displays_changed)
+        elif self.is_macos:
             self.screen_width, self.screen_height = self._get_macos_screen_size()
-            # Check for cliclick availability
-            self.has_cliclick = self._check_cliclick_available()
         else:
             try:
                 self.screen_width, self.screen_height = pyautogui.size()
             except Exception as e:
                 logger.warning(f"PyAutoGUI size detection failed: {e}")
                 self.screen_width, self.screen_height = (1920, 1080)  # Default fallback
-            self.has_cliclick = False
+        # Check for cliclick availability
+        self.has_cliclick = self._check_cliclick_available() if self.is_macos else False
             
+        # Input injection backend, selected once (in-process Quartz events when available)
+        self.input_backend = create_input_backend(AUTOMATION_INPUT_BACKEND, self.is_macos, self.has_cliclick)
+        
+        # Selected-text capture through the pasteboard (None: pyperclip fallback)
+        pasteboard_backend = create_pasteboard_backend(CLIPBOARD_CAPTURE_BACKEND)
+        self.clipboard_capture = ClipboardCapture(pasteboard_backend) if pasteboard_backend is not None else None
+        
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self.action_history = []  # Track executed actions for debugging
+        self._action_history = ActionHistory()  # Track executed actions for debugging (bounded)
+        self.telemetry = AutomationTelemetry()  # Performance records and per-action aggregates (bounded)
+        
+        # Compiles action plans into batched cliclick invocations
+        self.action_compiler = ActionCompiler(AUTOMATION_BATCH_ACTION_PAUSE_MS, AUTOMATION_BATCH_FOCUS_PAUSE_MS)
+        
+        # Listeners notified after actions that may have changed the UI
+        self._ui_change_listeners = []
+        self._ui_listener_lock = threading.Lock()
         
         logger.info(f"AutomationModule initialized. Screen size: {self.screen_width}x{self.screen_height}")
         logger.info(f"Retry settings: max_retries={max_retries}, retry_delay={retry_delay}s")
+        if self.input_backend is not None:
+            logger.info(f"Input backend: {self.input_backend.name}")
         if self.is_macos:
             if self.has_cliclick:
                 logger.info("macOS detected - using cliclick as PRIMARY automation method")
@@ -73,6 +128,31 @@ class AutomationModule:
                 logger.warning("macOS detected but cliclick NOT available - using AppleScript only")
                 logger.warning("Install cliclick for better reliability: brew install cliclick")
     
+    def _inject(self, method: str, *args) -> bool:
+        """
+        Post input through the in-process input backend.
+        
+        Args:
+            method: InputBackend method name ('click', 'hotkey', ...)
+            *args: Arguments for the method
+            
+        Returns:
+            bool: True if the input was posted; False if there is no in-process
+                  backend or it failed, in which case the built-in methods are used
+        """
+        backend = self.input_backend
+        if backend is None or not backend.in_process:
+            return False
+        try:
+            return bool(getattr(backend, method)(*args))
+        except Exception as e:
+            logger.warning(f"{backend.name} input backend {method} failed: {e}")
+            return False
+    
+    def _inject_text(self, text: str) -> bool:
+        """Type short plain text through the input backend, paste anything else."""
+        return self._inject('type_text' if can_type_directly(text) else 'paste_text', text)
+    
     def _check_cliclick_available(self) -> bool:
         """Check if cliclick is available on the system."""
         try:
@@ -167,10 +247,18 @@ class AutomationModule:
         logger.warning("Could not detect screen size, using default 1440x900")
         return (1440, 900)
     
+    def _on_displays_changed(self, layout: DisplayLayout) -> None:
+        """Track the main display size after displays are reconfigured."""
+        self.screen_width, self.screen_height = int(layout.main.width), int(layout.main.height)
+        logger.info(f"Screen size changed: {self.screen_width}x{self.screen_height}")
+    
     def _validate_coordinates(self, x: int, y: int) -> bool:
         """
         Validate that coordinates are within screen bounds.
         
+        With display geometry, points on any display are valid, including
+        secondary displays at negative offsets.
+        
         Args:
             x: X coordinate
             y: Y coordinate
@@ -178,6 +266,12 @@ class AutomationModule:
         Returns:
             bool: True if coordinates are valid, False otherwise
         """
+        layout = self.display_geometry.layout() if self.display_geometry else None
+        if layout is not None:
+            if not layout.contains(x, y):
+                logger.error(f"Coordinates ({x}, {y}) are not on any display (bounds {layout.bounds})")
+                return False
+            return True
         if not (0 <= x <= self.screen_width):
             logger.error(f"X coordinate {x} is out of bounds (0-{self.screen_width})")
             return False
@@ -204,6 +298,39 @@ class AutomationModule:
             return False
         return True
     
+    def add_ui_change_listener(self, callback) -> None:
+        """
+        Register a callback invoked after any action that may mutate the UI.
+        
+        Args:
+            callback: Callable receiving the action type string
+        """
+        with self._ui_listener_lock:
+            if callback not in self._ui_change_listeners:
+                self._ui_change_listeners.append(callback)
+    
+    def remove_ui_change_listener(self, callback) -> None:
+        """
+        Unregister a UI change callback.
+        
+        Args:
+            callback: Callback previously passed to add_ui_change_listener
+        """
+        with self._ui_listener_lock:
+            if callback in self._ui_change_listeners:
+                self._ui_change_listeners.remove(callback)
+    
+    def _notify_ui_changed(self, action_type: str) -> None:
+        """Notify registered listeners that an action may have changed the UI."""
+        with self._ui_listener_lock:
+            listeners = list(self._ui_change_listeners)
+        
+        for callback in listeners:
+            try:
+                callback(action_type)
+            except Exception as e:
+                logger.debug(f"UI change listener failed: {e}")
+    
     @with_error_handling(
         category=ErrorCategory.HARDWARE_ERROR,
         severity=ErrorSeverity.MEDIUM,
@@ -254,7 +381,7 @@ class AutomationModule:
             "status": "attempting",
             "attempts": 0
         }
-        self.action_history.append(action_record)
+        self._action_history.append(action_record)
         
         last_exception = None
         
@@ -294,9 +421,10 @@ class AutomationModule:
                     self._execute_scroll(action)
                 
                 # Success - update history and return
-                action_record["status"] = "success"
+                self._action_history.set_status(action_record, "success")
                 action_record["completion_time"] = time.time()
                 logger.info(f"Successfully executed action: {action_type}")
+                self._notify_ui_changed(action_type)
                 return
                 
             except pyautogui.FailSafeException as e:
@@ -309,7 +437,7 @@ class AutomationModule:
                     category=ErrorCategory.HARDWARE_ERROR,
                     context={"action_type": action_type, "attempt": attempt + 1}
                 )
-                action_record["status"] = "failed"
+                self._action_history.set_status(action_record, "failed")
                 action_record["error"] = str(e)
                 raise RuntimeError(f"Automation failsafe triggered: {error_info.user_message}")
                 
@@ -332,8 +460,9 @@ class AutomationModule:
                 logger.warning(f"Action {action_type} failed on attempt {attempt + 1}: {error_info.message}")
                 
                 if attempt < self.max_retries:
-                    logger.info(f"Retrying in {self.retry_delay} seconds...")
-                    time.sleep(self.retry_delay)
+                    logger.info(f"Retrying within {self.retry_delay} seconds...")
+                    # Retry as soon as the frontmost app answers again, at most retry_delay later
+                    wait_for(AppResponsive(), timeout=self.retry_delay)
                     
                     # Try to recover by moving mouse to center of screen
                     try:
@@ -359,10 +488,13 @@ class AutomationModule:
                         # Continue anyway
         
         # All retries failed
-        action_record["status"] = "failed"
+        self._action_history.set_status(action_record, "failed")
         action_record["error"] = str(last_exception)
         action_record["completion_time"] = time.time()
         
+        # A failed attempt may still have partially changed the UI
+        self._notify_ui_changed(action_type)
+        
         # Log final failure
         final_error_info = global_error_handler.handle_error(
             error=last_exception or Exception("Unknown error"),
@@ -383,6 +515,10 @@ class AutomationModule:
         """
         Execute a sequence of actions with comprehensive error handling.
         
+        On macOS with cliclick, runs of actions that need no intermediate
+        feedback are executed as a single cliclick invocation (see
+        modules/action_compiler.py); other actions run one at a time.
+        
         Args:
             actions: List of action dictionaries to execute
             stop_on_error: If True, stop execution on first error; if False, continue with remaining actions
@@ -393,6 +529,7 @@ class AutomationModule:
                 "total_actions": int,
                 "successful_actions": int,
                 "failed_actions": int,
+                "batched_actions": int,
                 "errors": List[str],
                 "execution_time": float
             }
@@ -402,33 +539,147 @@ class AutomationModule:
             "total_actions": len(actions),
             "successful_actions": 0,
             "failed_actions": 0,
+            "batched_actions": 0,
             "errors": [],
             "execution_time": 0.0
         }
         
         logger.info(f"Starting execution of {len(actions)} actions (stop_on_error={stop_on_error})")
         
-        for i, action in enumerate(actions):
-            try:
-                self.execute_action(action)
-                results["successful_actions"] += 1
-                logger.debug(f"Action {i + 1}/{len(actions)} completed successfully")
-                
-            except Exception as e:
-                results["failed_actions"] += 1
-                error_msg = f"Action {i + 1} failed: {str(e)}"
-                results["errors"].append(error_msg)
-                logger.error(error_msg)
-                
-                if stop_on_error:
-                    logger.info("Stopping execution due to error (stop_on_error=True)")
-                    break
+        segments = self._compile_action_sequence(actions)
+        stopped = False
+        
+        for segment in segments:
+            pending = segment.action_indices
+            
+            if segment.batched:
+                try:
+                    if self._execute_compiled_segment(segment, actions):
+                        results["successful_actions"] += len(pending)
+                        results["batched_actions"] += len(pending)
+                        logger.debug(f"Actions {pending[0] + 1}-{pending[-1] + 1}/{len(actions)} completed in one batch")
+                        continue
+                    logger.warning("Batched cliclick invocation failed, executing its actions one at a time")
+                except Exception as e:
+                    # The batch may have partially run, so its actions are not repeated
+                    results["failed_actions"] += len(pending)
+                    error_msg = f"Actions {pending[0] + 1}-{pending[-1] + 1} failed: {str(e)}"
+                    results["errors"].append(error_msg)
+                    logger.error(error_msg)
+                    if stop_on_error:
+                        logger.info("Stopping execution due to error (stop_on_error=True)")
+                        break
+                    continue
+            
+            for i in pending:
+                try:
+                    self.execute_action(actions[i])
+                    results["successful_actions"] += 1
+                    logger.debug(f"Action {i + 1}/{len(actions)} completed successfully")
+                    
+                except Exception as e:
+                    results["failed_actions"] += 1
+                    error_msg = f"Action {i + 1} failed: {str(e)}"
+                    results["errors"].append(error_msg)
+                    logger.error(error_msg)
+                    
+                    if stop_on_error:
+                        logger.info("Stopping execution due to error (stop_on_error=True)")
+                        stopped = True
+                        break
+            
+            if stopped:
+                break
         
         results["execution_time"] = time.time() - start_time
-        logger.info(f"Action sequence completed: {results['successful_actions']}/{results['total_actions']} successful")
+        logger.info(f"Action sequence completed: {results['successful_actions']}/{results['total_actions']} successful "
+                    f"({results['batched_actions']} batched)")
         
         return results
     
+    def _compile_action_sequence(self, actions: List[Dict[str, Any]]) -> List[CompiledSegment]:
+        """
+        Compile a plan into batched segments when batching is possible.
+        
+        Plans containing an invalid action are not batched so that every
+        action is validated and reported by execute_action as before. With
+        an in-process input backend actions are cheap enough to run one at
+        a time, keeping per-action feedback.
+        """
+        in_process = self.input_backend is not None and self.input_backend.in_process
+        batchable = (AUTOMATION_BATCH_ENABLED and self.is_macos and self.has_cliclick and not in_process and
+                     all(self.validate_action_format(action)[0] for action in actions))
+        if not batchable:
+            return [CompiledSegment([i]) for i in range(len(actions))]
+        return self.action_compiler.compile(actions)
+    
+    def _execute_compiled_segment(self, segment: CompiledSegment, actions: List[Dict[str, Any]]) -> bool:
+        """
+        Run a batched segment as one cliclick invocation.
+        
+        cliclick parses its whole command line before posting any event, so
+        a failed invocation hasn't run any of the actions and they can be
+        retried one at a time.
+        
+        Args:
+            segment: Batched CompiledSegment
+            actions: The full action plan
+            
+        Returns:
+            bool: True if the batch ran, False if it didn't run at all
+            
+        Raises:
+            RuntimeError: If the batch timed out part way through
+        """
+        start_time = time.time()
+        records = []
+        for i in segment.action_indices:
+            record = {
+                "action": actions[i].copy(),
+                "timestamp": start_time,
+                "status": "attempting",
+                "attempts": 1,
+                "batched": True
+            }
+            self._action_history.append(record)
+            records.append(record)
+        
+        def finish(status: str, error: Optional[str] = None) -> None:
+            for record in records:
+                self._action_history.set_status(record, status)
+                record["completion_time"] = time.time()
+                if error:
+                    record["error"] = error
+        
+        try:
+            if segment.clipboard_text is not None:
+                copy = subprocess.run(['pbcopy'], input=segment.clipboard_text, text=True,
+                                      capture_output=True, timeout=5)
+                if copy.returncode != 0:
+                    finish("failed", "pbcopy failed")
+                    return False
+            
+            logger.debug(f"Executing batch of {len(records)} actions: {' '.join(segment.command_line)}")
+            result = subprocess.run(segment.command_line, capture_output=True, text=True,
+                                    timeout=AUTOMATION_BATCH_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            finish("failed", "batch timed out")
+            self._notify_ui_changed(actions[segment.action_indices[-1]].get("action"))
+            raise RuntimeError(f"Batched actions timed out after {AUTOMATION_BATCH_TIMEOUT}s")
+        except Exception as e:
+            finish("failed", str(e))
+            return False
+        
+        if result.returncode != 0:
+            finish("failed", result.stderr.strip())
+            logger.warning(f"Batched cliclick invocation failed: {result.stderr.strip()}")
+            return False
+        
+        finish("success")
+        logger.info(f"Executed {len(records)} actions in one cliclick invocation in {time.time() - start_time:.3f}s")
+        self._notify_ui_changed(actions[segment.action_indices[-1]].get("action"))
+        return True
+    
     def _execute_click(self, action: Dict[str, Any]) -> None:
         """Execute a single click action with enhanced validation and fallback."""
         coordinates = action.get("coordinates")
@@ -474,6 +725,14 @@ class AutomationModule:
             bool: True if click succeeded, False otherwise
         """
         try:
+            start_time = time.time()
+            inject_x, inject_y = x, y
+            if fast_path and element_info:
+                inject_x, inject_y = self._adjust_accessibility_coordinates(x, y, element_info)
+            if self._inject('click', inject_x, inject_y):
+                self._log_click_performance(time.time() - start_time, fast_path, True, element_info)
+                return True
+            
             if self.is_macos:
                 # cliclick is PRIMARY method - most reliable
                 if self.has_cliclick:
@@ -625,9 +884,7 @@ class AutomationModule:
                         'app_name': element_info.get('app_name', '')
                     })
                 
-                if not hasattr(self, 'performance_history'):
-                    self.performance_history = []
-                self.performance_history.append(perf_record)
+                self.telemetry.record(perf_record)
                 
                 return True
             else:
@@ -721,9 +978,7 @@ class AutomationModule:
                         'app_name': element_info.get('app_name', '')
                     })
                 
-                if not hasattr(self, 'performance_history'):
-                    self.performance_history = []
-                self.performance_history.append(perf_record)
+                self.telemetry.record(perf_record)
                 
                 return success
             else:
@@ -747,9 +1002,7 @@ class AutomationModule:
                     'method': 'multiline' if '\n' in text else 'single_line'
                 }
                 
-                if not hasattr(self, 'performance_history'):
-                    self.performance_history = []
-                self.performance_history.append(perf_record)
+                self.telemetry.record(perf_record)
                 
                 return False
                 
@@ -775,11 +1028,12 @@ class AutomationModule:
         try:
             logger.warning("Attempting to clear corrupted content...")
             
+            selection = SelectionChanged()
             if self.is_macos:
                 # Select all content
                 success = self._macos_hotkey(['cmd', 'a'])
                 if success:
-                    time.sleep(0.1)  # Brief pause
+                    wait_for(selection, timeout=0.25, fallback=0.1)
                     # Delete selected content
                     success = self._macos_key('delete')
                     if success:
@@ -788,7 +1042,7 @@ class AutomationModule:
             else:
                 # Use PyAutoGUI for other platforms
                 pyautogui.hotkey('ctrl', 'a')
-                time.sleep(0.1)
+                wait_for(selection, timeout=0.25, fallback=0.1)
                 pyautogui.press('delete')
                 logger.info("Successfully cleared corrupted content using PyAutoGUI")
                 return True
@@ -990,6 +1244,7 @@ class AutomationModule:
                     
                     # CRITICAL DEBUG: Log the exact cliclick command
                     cliclick_cmd = ['cliclick', f't:{line}']
+                    typed = FocusedValueChanged()
                     logger.info(f"cliclick {path_type} PATH: EXECUTING: {' '.join(cliclick_cmd)}")
                     
                     # Use cliclick to type the line with increased timeout
@@ -1007,8 +1262,8 @@ class AutomationModule:
                     else:
                         logger.info(f"cliclick {path_type} PATH: ✅ Successfully typed line {i+1}: {repr(line[:30])}{'...' if len(line) > 30 else ''}")
                         
-                    # CRITICAL FIX: Longer delay after typing each line for application processing
-                    time.sleep(0.1 if fast_path else 0.2)  # Increased delays for application processing
+                    # Let the application process the line before pressing Return
+                    wait_for(typed, timeout=1.0, fallback=0.1 if fast_path else 0.2)
                         
                 else:  # Empty line - just preserve the spacing
                     logger.debug(f"cliclick {path_type} PATH: Preserving empty line {i+1}")
@@ -1029,6 +1284,7 @@ class AutomationModule:
                     
                     # Retry Return key press up to 3 times for reliability
                     return_success = False
+                    new_line = FocusedValueChanged()
                     for retry in range(3):
                         # Check timeout before each retry
                         elapsed_time = time.time() - start_time
@@ -1052,24 +1308,24 @@ class AutomationModule:
                                 logger.error(f"cliclick {path_type} PATH: ❌ Return key attempt {retry+1} failed: {result.stderr}")
                                 logger.error(f"cliclick {path_type} PATH: FAILED RETURN COMMAND: {' '.join(return_cmd)}")
                                 if retry < 2:  # Not the last attempt
-                                    time.sleep(0.2)  # Longer delay before retry for reliability
+                                    wait_for(AppResponsive(), timeout=0.2)
                                     
                         except subprocess.TimeoutExpired:
                             logger.warning(f"cliclick {path_type} PATH: Return key attempt {retry+1} timed out")
                             if retry < 2:  # Not the last attempt
-                                time.sleep(0.2)  # Longer delay before retry for reliability
+                                wait_for(AppResponsive(), timeout=0.2)
                         except Exception as e:
                             logger.warning(f"cliclick {path_type} PATH: Return key attempt {retry+1} error: {e}")
                             if retry < 2:  # Not the last attempt
-                                time.sleep(0.2)  # Longer delay before retry for reliability
+                                wait_for(AppResponsive(), timeout=0.2)
                     
                     if not return_success:
                         logger.error(f"cliclick {path_type} PATH: CRITICAL - All Return key attempts failed after line {i+1}")
                         logger.error(f"cliclick {path_type} PATH: This will cause newlines to be missing in output")
                         return False
                     
-                    # CRITICAL FIX: Longer delay after Return key for proper line processing
-                    time.sleep(0.2 if fast_path else 0.3)  # Increased delays for proper line processing
+                    # Let the application process the new line before typing the next one
+                    wait_for(new_line, timeout=1.5, fallback=0.2 if fast_path else 0.3)
             
             # Final timeout check
             elapsed_time = time.time() - start_time
@@ -1098,6 +1354,7 @@ class AutomationModule:
             import subprocess
             
             # Use pbcopy to set clipboard content
+            pasteboard = PasteboardChanged()
             process = subprocess.Popen(
                 ['pbcopy'],
                 stdin=subprocess.PIPE,
@@ -1112,8 +1369,8 @@ class AutomationModule:
             
             logger.debug(f"cliclick {path_type} PATH: Successfully copied {len(text)} characters to clipboard")
             
-            # Small delay to ensure clipboard is set
-            time.sleep(0.1)
+            # Make sure the clipboard is set before pasting
+            wait_for(pasteboard, timeout=0.1)
             
             # Paste using Cmd+V with cliclick (correct syntax for key combination)
             # Method 1: Use single command for Cmd+V
@@ -1199,9 +1456,7 @@ class AutomationModule:
                         'app_name': element_info.get('app_name', '')
                     })
                 
-                if not hasattr(self, 'performance_history'):
-                    self.performance_history = []
-                self.performance_history.append(perf_record)
+                self.telemetry.record(perf_record)
                 
                 return True
             else:
@@ -1233,7 +1488,11 @@ class AutomationModule:
                 'tab': 'tab',
                 'space': 'space',
                 'escape': 'esc',
-                'esc': 'esc'
+                'esc': 'esc',
+                'up': 'arrow-up',
+                'down': 'arrow-down',
+                'left': 'arrow-left',
+                'right': 'arrow-right'
             }
             
             cliclick_key = key_map.get(key.lower(), key.lower())
@@ -1262,60 +1521,21 @@ class AutomationModule:
     def _cliclick_hotkey(self, keys: List[str]) -> bool:
         """Execute hotkey combination using cliclick on macOS."""
         try:
-            # cliclick hotkey format: kd:cmd kp:a ku:cmd (for cmd+a)
-            if not keys:
+            # cliclick hotkey format: kd:cmd kp:a ku:cmd (for cmd+a), run as one invocation
+            commands = hotkey_commands(keys)
+            if not commands:
                 return False
             
-            # Map modifier keys
-            modifier_map = {
-                'cmd': 'cmd',
-                'command': 'cmd', 
-                'ctrl': 'ctrl',
-                'control': 'ctrl',
-                'alt': 'alt',
-                'option': 'alt',
-                'shift': 'shift'
-            }
-            
-            # Separate modifiers from main key
-            modifiers = []
-            main_key = keys[-1].lower()  # Last key is usually the main key
-            
-            for key in keys[:-1]:
-                mapped_key = modifier_map.get(key.lower())
-                if mapped_key:
-                    modifiers.append(mapped_key)
-            
-            if not modifiers:
-                # No modifiers, just press the key
-                return self._cliclick_key(main_key)
-            
-            # Build cliclick command: press modifiers down, press main key, release modifiers
-            commands = []
-            
-            # Press modifiers down
-            for mod in modifiers:
-                commands.append(f'kd:{mod}')
-            
-            # Press main key
-            commands.append(f'kp:{main_key}')
-            
-            # Release modifiers up (in reverse order)
-            for mod in reversed(modifiers):
-                commands.append(f'ku:{mod}')
+            result = subprocess.run(
+                ['cliclick'] + commands,
+                capture_output=True,
+                text=True,
+                timeout=2
+            )
             
-            # Execute all commands in sequence
-            for cmd in commands:
-                result = subprocess.run(
-                    ['cliclick', cmd],
-                    capture_output=True,
-                    text=True,
-                    timeout=2
-                )
-                
-                if result.returncode != 0:
-                    logger.warning(f"cliclick hotkey command '{cmd}' failed: {result.stderr}")
-                    return False
+            if result.returncode != 0:
+                logger.warning(f"cliclick hotkey '{' '.join(commands)}' failed: {result.stderr}")
+                return False
             
             logger.debug(f"cliclick hotkey {'+'.join(keys)} executed successfully")
             return True
@@ -1470,6 +1690,7 @@ class AutomationModule:
                         logger.error(f"INDENTATION LOST during AppleScript escaping! Original: {leading_spaces} spaces, Escaped: {escaped_spaces} spaces")
                     
                     # Type the line using AppleScript keystroke
+                    typed = FocusedValueChanged()
                     applescript = f'''
                     tell application "System Events"
                         keystroke "{applescript_line}"
@@ -1488,11 +1709,12 @@ class AutomationModule:
                         logger.warning(f"AppleScript typing failed for line {i+1}: {result.stderr}")
                         return False
                     
-                    # Small delay for character processing
-                    time.sleep(0.01)
+                    # Wait for the characters to be processed
+                    wait_for(typed, timeout=0.1, fallback=0.01)
                 
                 # Add newline (return key) after each line except the last one
                 if i < len(lines) - 1:
+                    new_line = FocusedValueChanged()
                     return_applescript = '''
                     tell application "System Events"
                         key code 36
@@ -1511,8 +1733,8 @@ class AutomationModule:
                         logger.warning(f"AppleScript return key failed after line {i+1}: {result.stderr}")
                         return False
                     
-                    # Small delay for line processing
-                    time.sleep(0.01)
+                    # Wait for the new line to be processed
+                    wait_for(new_line, timeout=0.1, fallback=0.01)
             
             logger.debug(f"AppleScript typing executed successfully: {len(text)} characters, {len(lines)} lines")
             return True
@@ -1625,6 +1847,8 @@ class AutomationModule:
     
     def _macos_hotkey(self, keys: List[str]) -> bool:
         """Execute hotkey combination using AppleScript on macOS."""
+        if self._inject('hotkey', keys):
+            return True
         try:
             # Convert keys to AppleScript keystroke format
             if keys == ['cmd', 'a']:
@@ -1680,6 +1904,8 @@ class AutomationModule:
     
     def _macos_key(self, key: str) -> bool:
         """Execute single key press using AppleScript on macOS."""
+        if self._inject('key', key):
+            return True
         try:
             # Map common key names to AppleScript equivalents
             key_map = {
@@ -1730,6 +1956,10 @@ class AutomationModule:
         if not self._validate_coordinates(x, y):
             raise ValueError(f"Invalid coordinates: ({x}, {y})")
         
+        if self._inject('double_click', x, y):
+            logger.debug(f"Double-clicked at ({x}, {y}) via {self.input_backend.name} backend")
+            return
+        
         if self.is_macos:
             # cliclick is PRIMARY method for double-click
             success = False
@@ -1759,6 +1989,10 @@ class AutomationModule:
         if not self._validate_text_input(text):
             raise ValueError(f"Invalid text input")
         
+        if self._inject_text(text):
+            logger.debug(f"Typed {len(text)} characters via {self.input_backend.name} backend")
+            return
+        
         if self.is_macos:
             # cliclick is PRIMARY method for typing
             success = False
@@ -1794,6 +2028,10 @@ class AutomationModule:
         except (ValueError, TypeError):
             raise ValueError(f"Invalid scroll amount: {amount}")
         
+        if self._inject('scroll', direction, amount):
+            logger.debug(f"Scrolled {direction} by {amount} via {self.input_backend.name} backend")
+            return
+        
         if self.is_macos:
             # cliclick is PRIMARY method for scrolling (up/down only)
             success = False
@@ -1820,6 +2058,42 @@ class AutomationModule:
         
         logger.debug(f"Scrolled {direction} by {amount}")
     
+    def press_keys(self, keys: List[str]) -> bool:
+        """
+        Press a key or key combination in the frontmost application.
+        
+        Args:
+            keys: Key names, modifiers first (e.g. ['return'], ['cmd', 'shift', 't'])
+            
+        Returns:
+            bool: True if the keys were posted
+        """
+        if not keys:
+            return False
+        single = len(keys) == 1
+        
+        success = self._inject('key', keys[0]) if single else self._inject('hotkey', keys)
+        if not success and self.is_macos:
+            if self.has_cliclick:
+                success = self._cliclick_key(keys[0]) if single else self._cliclick_hotkey(keys)
+            if not success:
+                success = self._macos_key(keys[0]) if single else self._macos_hotkey(keys)
+        elif not success:
+            names = [PYAUTOGUI_KEY_NAMES.get(key, key) for key in keys]
+            try:
+                if single:
+                    pyautogui.press(names[0])
+                else:
+                    pyautogui.hotkey(*names)
+                success = True
+            except Exception as e:
+                logger.error(f"PyAutoGUI key press {'+'.join(keys)} failed: {e}")
+        
+        if success:
+            logger.debug(f"Pressed {'+'.join(keys)}")
+            self._notify_ui_changed('key')
+        return success
+    
     def get_screen_size(self) -> Tuple[int, int]:
         """
         Get the current screen size.
@@ -1923,18 +2197,11 @@ class AutomationModule:
                     'app_name': element_info.get('app_name', '')
                 })
             
-            # Store in performance history (initialize if needed)
-            if not hasattr(self, 'performance_history'):
-                self.performance_history = []
-            
-            self.performance_history.append(perf_record)
-            
-            # Keep history size manageable (last 200 operations)
-            if len(self.performance_history) > 200:
-                self.performance_history = self.performance_history[-100:]
+            # Store in bounded performance telemetry
+            self.telemetry.record(perf_record)
             
             # Log performance summary periodically
-            if len(self.performance_history) % 10 == 0:
+            if self.telemetry.total_records % 10 == 0:
                 self._log_performance_summary()
                 
         except Exception as e:
@@ -1943,11 +2210,10 @@ class AutomationModule:
     def _log_performance_summary(self):
         """Log a summary of recent performance metrics."""
         try:
-            if not hasattr(self, 'performance_history') or not self.performance_history:
+            recent_records = self.telemetry.recent(10)  # Last 10 operations
+            if not recent_records:
                 return
             
-            recent_records = self.performance_history[-10:]  # Last 10 operations
-            
             fast_path_records = [r for r in recent_records if r['path_type'] == 'fast']
             slow_path_records = [r for r in recent_records if r['path_type'] == 'slow']
             
@@ -2016,23 +2282,31 @@ class AutomationModule:
         logger.warning("Could not get mouse position, returning screen center")
         return (self.screen_width // 2, self.screen_height // 2)
     
+    @property
+    def action_history(self) -> List[Dict[str, Any]]:
+        """Retained action records, oldest first (a copy; use get_action_history)."""
+        return self._action_history.recent()
+    
+    @action_history.setter
+    def action_history(self, records: List[Dict[str, Any]]) -> None:
+        self._action_history.replace(records)
+    
     def get_action_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get the history of executed actions for debugging and monitoring.
         
         Args:
-            limit: Maximum number of recent actions to return (None for all)
+            limit: Maximum number of recent actions to return (None for all
+                retained actions, see AUTOMATION_ACTION_HISTORY_SIZE)
             
         Returns:
             List of action history entries
         """
-        if limit is None:
-            return self.action_history.copy()
-        return self.action_history[-limit:] if self.action_history else []
+        return self._action_history.recent(limit)
     
     def clear_action_history(self) -> None:
         """Clear the action history."""
-        self.action_history.clear()
+        self._action_history.clear()
         logger.info("Action history cleared")
     
     def get_failure_rate(self) -> float:
@@ -2042,11 +2316,7 @@ class AutomationModule:
         Returns:
             float: Failure rate as a percentage (0.0 to 100.0)
         """
-        if not self.action_history:
-            return 0.0
-        
-        failed_count = sum(1 for action in self.action_history if action.get("status") == "failed")
-        return (failed_count / len(self.action_history)) * 100.0
+        return self._action_history.failure_rate()
     
     def validate_action_format(self, action: Dict[str, Any]) -> Tuple[bool, str]:
         """
@@ -2115,6 +2385,10 @@ class AutomationModule:
         """
         Get performance metrics for fast path vs slow path execution.
         
+        Metrics over all operations come from the incrementally maintained
+        telemetry aggregates; with a limit, only the last `limit` records
+        are aggregated.
+        
         Args:
             path_type: Filter by path type ('fast' or 'slow'), None for all
             limit: Maximum number of recent records to analyze, None for all
@@ -2123,7 +2397,12 @@ class AutomationModule:
             Dictionary containing performance statistics
         """
         try:
-            if not hasattr(self, 'performance_history') or not self.performance_history:
+            if limit:
+                aggregates = self.telemetry.aggregate_records(self.telemetry.recent(limit))
+            else:
+                aggregates = self.telemetry.aggregates()
+            
+            if not aggregates:
                 return {
                     'total_operations': 0,
                     'fast_path_operations': 0,
@@ -2137,42 +2416,29 @@ class AutomationModule:
                     'speedup_factor': 0.0
                 }
             
-            # Get records to analyze
-            records = self.performance_history
-            if limit:
-                records = records[-limit:]
-            
             # Filter by path type if specified
             if path_type:
-                records = [r for r in records if r.get('path_type') == path_type]
+                aggregates = {key: aggregate for key, aggregate in aggregates.items() if key[1] == path_type}
             
-            if not records:
+            if not aggregates:
                 return {'error': f'No records found for path_type: {path_type}'}
             
             # Calculate metrics
-            total_ops = len(records)
-            fast_records = [r for r in records if r.get('path_type') == 'fast']
-            slow_records = [r for r in records if r.get('path_type') == 'slow']
-            
-            successful_ops = sum(1 for r in records if r.get('success', False))
-            total_time = sum(r.get('execution_time', 0) for r in records)
-            
-            fast_successful = sum(1 for r in fast_records if r.get('success', False))
-            fast_total_time = sum(r.get('execution_time', 0) for r in fast_records)
-            
-            slow_successful = sum(1 for r in slow_records if r.get('success', False))
-            slow_total_time = sum(r.get('execution_time', 0) for r in slow_records)
+            total = AutomationTelemetry.merge(aggregates)
+            fast = AutomationTelemetry.merge(aggregates, path_type='fast')
+            slow = AutomationTelemetry.merge(aggregates, path_type='slow')
             
             metrics = {
-                'total_operations': total_ops,
-                'fast_path_operations': len(fast_records),
-                'slow_path_operations': len(slow_records),
-                'average_execution_time': total_time / total_ops if total_ops > 0 else 0.0,
-                'fast_path_avg_time': fast_total_time / len(fast_records) if fast_records else 0.0,
-                'slow_path_avg_time': slow_total_time / len(slow_records) if slow_records else 0.0,
-                'success_rate': (successful_ops / total_ops * 100) if total_ops > 0 else 0.0,
-                'fast_path_success_rate': (fast_successful / len(fast_records) * 100) if fast_records else 0.0,
-                'slow_path_success_rate': (slow_successful / len(slow_records) * 100) if slow_records else 0.0
+                'total_operations': total.count,
+                'fast_path_operations': fast.count,
+                'slow_path_operations': slow.count,
+                'average_execution_time': total.latency.mean,
+                'fast_path_avg_time': fast.latency.mean,
+                'slow_path_avg_time': slow.latency.mean,
+                'p95_execution_time': total.latency.percentile(95),
+                'success_rate': total.success_rate,
+                'fast_path_success_rate': fast.success_rate,
+                'slow_path_success_rate': slow.success_rate
             }
             
             # Calculate speedup factor
@@ -2183,13 +2449,14 @@ class AutomationModule:
             
             # Add breakdown by action type
             action_breakdown = {}
-            for action_type in ['click', 'double_click', 'type', 'scroll']:
-                action_records = [r for r in records if r.get('action') == action_type]
-                if action_records:
+            for action_type in ACTION_TYPES:
+                action = AutomationTelemetry.merge(aggregates, action=action_type)
+                if action.count:
                     action_breakdown[action_type] = {
-                        'count': len(action_records),
-                        'avg_time': sum(r.get('execution_time', 0) for r in action_records) / len(action_records),
-                        'success_rate': sum(1 for r in action_records if r.get('success', False)) / len(action_records) * 100
+                        'count': action.count,
+                        'avg_time': action.latency.mean,
+                        'p95_time': action.latency.percentile(95),
+                        'success_rate': action.success_rate
                     }
             
             metrics['action_breakdown'] = action_breakdown
@@ -2200,15 +2467,32 @@ class AutomationModule:
             logger.error(f"Failed to calculate performance metrics: {e}")
             return {'error': str(e)}
     
+    def get_performance_breakdown(self) -> List[Dict[str, Any]]:
+        """
+        Get lifetime statistics per (action, path_type, app).
+        
+        Returns:
+            List of {'action', 'path_type', 'app_name', 'count', 'success_rate',
+            'latency'} dictionaries, latency being a histogram summary
+        """
+        return self.telemetry.get_breakdown()
+    
     def fill_form(self, form_data: Dict[str, Any], form_values: Dict[str, str], 
-                  confirm_before_submit: bool = True) -> Dict[str, Any]:
+                  confirm_before_submit: bool = True, accessibility_module=None) -> Dict[str, Any]:
         """
-        Fill a web form with provided values using sequential click and type actions.
+        Fill a web form with provided values.
+        
+        When input can be batched (in-process backend, or cliclick on macOS),
+        all fields are filled as one input stream by FormFillEngine (see
+        modules/form_filler.py); otherwise fields are clicked and typed into
+        one at a time.
         
         Args:
             form_data: Form structure data from vision analysis
             form_values: Dictionary mapping field labels to values
             confirm_before_submit: Whether to require confirmation before submitting
+            accessibility_module: Optional AccessibilityModule used to resolve
+                fields, navigate with Tab and verify values after a batched fill
             
         Returns:
             Dict containing form filling results and any errors
@@ -2234,27 +2518,35 @@ class AutomationModule:
             if not forms:
                 raise ValueError("No forms found in form data")
             
-            for form in forms:
-                form_id = form.get('form_id', 'unknown')
-                logger.info(f"Processing form: {form_id}")
-                
-                fields = form.get('fields', [])
-                results["total_fields"] += len(fields)
-                
-                # Fill each field
-                for field in fields:
-                    field_result = self._fill_form_field(field, form_values)
+            engine = FormFillEngine(self, accessibility_module)
+            if FORM_FILL_BATCH_ENABLED and engine.can_batch():
+                # Resolve all fields at once and fill them as one input stream
+                results["total_fields"] = sum(len(form.get('fields', [])) for form in forms)
+                field_results, results["batch"] = engine.fill(forms, form_values)
+            else:
+                field_results = []
+                for form in forms:
+                    form_id = form.get('form_id', 'unknown')
+                    logger.info(f"Processing form: {form_id}")
                     
-                    if field_result["status"] == "filled":
-                        results["filled_fields"] += 1
-                    elif field_result["status"] == "skipped":
-                        results["skipped_fields"] += 1
-                    elif field_result["status"] == "failed":
-                        results["failed_fields"] += 1
-                        results["errors"].append(field_result["error"])
+                    fields = form.get('fields', [])
+                    results["total_fields"] += len(fields)
                     
-                    if field_result.get("warning"):
-                        results["warnings"].append(field_result["warning"])
+                    # Fill each field
+                    for field in fields:
+                        field_results.append(self._fill_form_field(field, form_values))
+            
+            for field_result in field_results:
+                if field_result["status"] == "filled":
+                    results["filled_fields"] += 1
+                elif field_result["status"] == "skipped":
+                    results["skipped_fields"] += 1
+                elif field_result["status"] == "failed":
+                    results["failed_fields"] += 1
+                    results["errors"].append(field_result["error"])
+                
+                if field_result.get("warning"):
+                    results["warnings"].append(field_result["warning"])
             
             # Handle form submission if requested
             if confirm_before_submit:
@@ -2269,6 +2561,7 @@ class AutomationModule:
             results["execution_time"] = time.time() - start_time
             logger.info(f"Form filling completed: {results['filled_fields']}/{results['total_fields']} fields filled")
             
+            self._notify_ui_changed("fill_form")
             return results
             
         except Exception as e:
@@ -2300,11 +2593,7 @@ class AutomationModule:
         coordinates = field.get('coordinates', [0, 0, 0, 0])
         
         # Check if we have a value for this field
-        field_value = None
-        for label_key, value in form_values.items():
-            if label_key.lower() in field_label.lower() or field_label.lower() in label_key.lower():
-                field_value = value
-                break
+        field_value = match_field_value(field_label, form_values)
         
         if field_value is None:
             return {
@@ -2367,11 +2656,12 @@ class AutomationModule:
             })
             
             # Clear existing content (Ctrl+A, then type)
+            selection = SelectionChanged()
             if self.is_macos:
                 self._macos_hotkey(['cmd', 'a'])
             else:
                 pyautogui.hotkey('ctrl', 'a')
-            time.sleep(0.1)
+            wait_for(selection, timeout=0.25, fallback=0.1)
             
             # Type the new value
             self.execute_action({
@@ -2403,11 +2693,12 @@ class AutomationModule:
             })
             
             # Clear existing content
+            selection = SelectionChanged()
             if self.is_macos:
                 self._macos_hotkey(['cmd', 'a'])
             else:
                 pyautogui.hotkey('ctrl', 'a')
-            time.sleep(0.1)
+            wait_for(selection, timeout=0.25, fallback=0.1)
             
             # Type the new value (preserve newlines)
             self.execute_action({
@@ -2433,12 +2724,17 @@ class AutomationModule:
         """Fill a select dropdown field."""
         try:
             # Click on the dropdown to open it
-            self.execute_action({
-                "action": "click",
-                "coordinates": [x, y]
-            })
-            
-            time.sleep(0.5)  # Wait for dropdown to open
+            opened = AnyOf(AXNotificationReceived("AXMenuOpened"), ScreenRegionChanged(x - 160, y, 320, 240))
+            try:
+                self.execute_action({
+                    "action": "click",
+                    "coordinates": [x, y]
+                })
+                
+                # Wait for the dropdown to open
+                wait_for(opened, timeout=1.0, fallback=0.5)
+            finally:
+                opened.close()
             
             # Try to find matching option
             matching_option = None
@@ -2784,10 +3080,15 @@ class AutomationModule:
         
         This method preserves the original clipboard content, simulates Cmd+C to copy
         selected text, captures the text, and restores the original clipboard.
+        With a pasteboard backend the copy is detected through the pasteboard
+        changeCount and the original contents are restored in the background.
         
         Returns:
             Optional[str]: The selected text if successful, None if failed
         """
+        if self.clipboard_capture is not None:
+            return self._get_selected_text_via_pasteboard()
+        
         start_time = time.time()
         original_clipboard = None
         captured_text = None
@@ -2811,43 +3112,12 @@ class AutomationModule:
                 raise Exception("Clipboard access failed during clear operation")
             
             # Step 3: Simulate Cmd+C to copy selected text
+            copied = PasteboardChanged()
             try:
-                if self.is_macos:
-                    # Use cliclick for Cmd+C on macOS
-                    if self.has_cliclick:
-                        logger.debug("Using cliclick for Cmd+C simulation")
-                        result = subprocess.run(
-                            ['cliclick', 'kd:cmd', 't:c', 'ku:cmd'],
-                            capture_output=True,
-                            text=True,
-                            timeout=3
-                        )
-                        if result.returncode != 0:
-                            logger.warning(f"cliclick Cmd+C failed: {result.stderr}")
-                            # Fall back to AppleScript
-                            raise Exception("cliclick Cmd+C failed")
-                    else:
-                        # Use AppleScript for Cmd+C
-                        logger.debug("Using AppleScript for Cmd+C simulation")
-                        applescript = '''tell application "System Events"
-    key code 8 using command down
-end tell'''
-                        result = subprocess.run(
-                            ['osascript', '-e', applescript],
-                            capture_output=True,
-                            text=True,
-                            timeout=3
-                        )
-                        if result.returncode != 0:
-                            logger.error(f"AppleScript Cmd+C failed: {result.stderr}")
-                            raise Exception("AppleScript Cmd+C failed")
-                else:
-                    # Use PyAutoGUI for other platforms
-                    pyautogui.hotkey('ctrl', 'c')
-                    logger.debug("Used PyAutoGUI for Ctrl+C simulation")
+                self._send_copy_keystroke()
                 
-                # Small delay to allow copy operation to complete
-                time.sleep(0.2)
+                # Wait for the copy operation to complete
+                wait_for(copied, timeout=0.5, fallback=0.2)
                 
             except Exception as e:
                 logger.error(f"Failed to simulate copy command: {e}")
@@ -2904,7 +3174,103 @@ end tell'''
         
         return captured_text
     
-    def _log_clipboard_capture_performance(self, execution_time: float, success: bool, captured_text: Optional[str]) -> None:
+    def capture_selection(self) -> Optional[CaptureResult]:
+        """
+        Copy the selection through the pasteboard, including non-text types.
+        
+        Returns:
+            Optional[CaptureResult]: Captured text and data (HTML, RTF, images,
+                file URLs), or None without a pasteboard backend
+        """
+        if self.clipboard_capture is None:
+            return None
+        return self.clipboard_capture.capture(self._send_copy_keystroke)
+    
+    def _get_selected_text_via_pasteboard(self) -> Optional[str]:
+        """Pasteboard capture path of get_selected_text_via_clipboard."""
+        start_time = time.time()
+        captured_text = None
+        
+        try:
+            result = self.capture_selection()
+            if not result.changed:
+                logger.info("No text captured - pasteboard unchanged after copy (no text selected)")
+            elif result.text is None:
+                logger.info(f"Copied selection has no plain text (types: {', '.join(result.types)})")
+            else:
+                captured_text = result.text
+                logger.info(f"Successfully captured {len(captured_text)} characters via pasteboard "
+                            f"in {result.latency * 1000:.1f}ms")
+        except Exception as e:
+            error_info = global_error_handler.handle_error(
+                error=e,
+                module="automation",
+                function="get_selected_text_via_clipboard",
+                category=ErrorCategory.HARDWARE_ERROR,
+                severity=ErrorSeverity.MEDIUM,
+                context={
+                    "execution_time": time.time() - start_time,
+                    "platform": platform.system(),
+                    "pasteboard_backend": self.clipboard_capture.backend.name
+                }
+            )
+            logger.error(f"Pasteboard text capture failed: {error_info.message}")
+        
+        self._log_clipboard_capture_performance(time.time() - start_time, captured_text is not None,
+                                                captured_text, method='pasteboard')
+        return captured_text
+    
+    def _send_copy_keystroke(self) -> bool:
+        """
+        Post Cmd+C (Ctrl+C off macOS) to the frontmost application.
+        
+        Returns:
+            bool: True once the keystroke is posted
+            
+        Raises:
+            Exception: If no method could post the keystroke
+        """
+        if self._inject('hotkey', ['cmd', 'c']):
+            logger.debug("Posted Cmd+C through the input backend")
+            return True
+        
+        if self.is_macos:
+            # Use cliclick for Cmd+C on macOS
+            if self.has_cliclick:
+                logger.debug("Using cliclick for Cmd+C simulation")
+                result = subprocess.run(
+                    ['cliclick', 'kd:cmd', 't:c', 'ku:cmd'],
+                    capture_output=True,
+                    text=True,
+                    timeout=3
+                )
+                if result.returncode != 0:
+                    logger.warning(f"cliclick Cmd+C failed: {result.stderr}")
+                    # Fall back to AppleScript
+                    raise Exception("cliclick Cmd+C failed")
+            else:
+                # Use AppleScript for Cmd+C
+                logger.debug("Using AppleScript for Cmd+C simulation")
+                applescript = '''tell application "System Events"
+    key code 8 using command down
+end tell'''
+                result = subprocess.run(
+                    ['osascript', '-e', applescript],
+                    capture_output=True,
+                    text=True,
+                    timeout=3
+                )
+                if result.returncode != 0:
+                    logger.error(f"AppleScript Cmd+C failed: {result.stderr}")
+                    raise Exception("AppleScript Cmd+C failed")
+        else:
+            # Use PyAutoGUI for other platforms
+            pyautogui.hotkey('ctrl', 'c')
+            logger.debug("Used PyAutoGUI for Ctrl+C simulation")
+        return True
+    
+    def _log_clipboard_capture_performance(self, execution_time: float, success: bool, captured_text: Optional[str],
+                                           method: str = 'clipboard_fallback') -> None:
         """
         Log performance metrics for clipboard-based text capture.
         
@@ -2912,13 +3278,14 @@ end tell'''
             execution_time: Time taken for the capture operation
             success: Whether the capture was successful
             captured_text: The captured text (for length metrics)
+            method: Capture method ('clipboard_fallback' or 'pasteboard')
         """
         try:
             # Create performance record
             perf_record = {
                 'timestamp': time.time(),
                 'execution_time': execution_time,
-                'method': 'clipboard_fallback',
+                'method': method,
                 'success': success,
                 'action': 'text_capture',
                 'platform': platform.system(),
@@ -2977,7 +3344,11 @@ end tell'''
             
             # Skip coordinate validation for trusted accessibility coordinates
             # but still do basic sanity checks
-            if x < 0 or y < 0 or x > self.screen_width * 2 or y > self.screen_height * 2:
+            layout = self.display_geometry.layout() if self.display_geometry else None
+            if layout is not None:
+                if not layout.contains(x, y):
+                    raise ValueError(f"Coordinates ({x}, {y}) are not on any display")
+            elif x < 0 or y < 0 or x > self.screen_width * 2 or y > self.screen_height * 2:
                 raise ValueError(f"Coordinates ({x}, {y}) are outside reasonable bounds")
             
             element_info = kwargs.get('element_info', {})
@@ -2991,7 +3362,9 @@ end tell'''
                 success = self._attempt_click(x, y, fast_path=True, element_info=element_info)
                 
             elif action_type == 'double_click':
-                if self.is_macos:
+                if self._inject('double_click', x, y):
+                    success = True
+                elif self.is_macos:
                     success = self._cliclick_double_click(x, y, fast_path=True, element_info=element_info)
                     if not success:
                         success = self._macos_double_click(x, y)
@@ -3012,8 +3385,10 @@ end tell'''
                 # First click to focus the element
                 click_success = self._attempt_click(x, y, fast_path=True, element_info=element_info)
                 if click_success:
-                    time.sleep(0.1)  # Brief pause to ensure focus
-                    if self.is_macos:
+                    wait_for(FocusAt(x, y), timeout=0.3, fallback=0.1)  # Wait for the element to take focus
+                    if self._inject_text(text):
+                        success = True
+                    elif self.is_macos:
                         success = self._cliclick_type(text, fast_path=True, element_info=element_info)
                         if not success:
                             success = self._macos_type(text)
@@ -3039,15 +3414,15 @@ end tell'''
                                 'app_name': element_info.get('app_name', '')
                             })
                         
-                        if not hasattr(self, 'performance_history'):
-                            self.performance_history = []
-                        self.performance_history.append(perf_record)
+                        self.telemetry.record(perf_record)
                         success = True
                 
             elif action_type == 'scroll':
                 direction = kwargs.get('direction', 'up')
                 amount = kwargs.get('amount', SCROLL_AMOUNT)
-                if self.is_macos:
+                if self._inject('scroll', direction, amount):
+                    success = True
+                elif self.is_macos:
                     success = self._cliclick_scroll(direction, amount, fast_path=True, element_info=element_info)
                     if not success:
                         success = self._macos_scroll(direction, amount)
@@ -3082,9 +3457,7 @@ end tell'''
                             'app_name': element_info.get('app_name', '')
                         })
                     
-                    if not hasattr(self, 'performance_history'):
-                        self.performance_history = []
-                    self.performance_history.append(perf_record)
+                    self.telemetry.record(perf_record)
                     success = True
                 
             else:
@@ -3092,6 +3465,8 @@ end tell'''
             
             execution_time = time.time() - start_time
             
+            self._notify_ui_changed(action_type)
+            
             # Record action in history
             action_record = {
                 'action': action_type,
@@ -3103,11 +3478,7 @@ end tell'''
                 'element_info': element_info
             }
             
-            if hasattr(self, 'action_history'):
-                self.action_history.append(action_record)
-                # Keep history size manageable
-                if len(self.action_history) > 100:
-                    self.action_history = self.action_history[-50:]
+            self._action_history.append(action_record)
             
             result = {
                 'success': success,
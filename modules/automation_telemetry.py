@@ -0,0 +1,233 @@
+# modules/automation_telemetry.py
+"""
+Bounded Automation Telemetry for AURA
+
+Keeps automation performance records and the action history in fixed-size
+ring buffers, and maintains aggregates incrementally as records arrive, so
+memory stays bounded in long-running sessions and summaries don't rescan
+the history:
+
+- Per (action, path_type, app) aggregates: count, success rate and a
+  latency histogram with fixed buckets. Lifetime metrics are computed from
+  the aggregates (O(number of keys)); metrics over the last N records scan
+  only those N.
+- The action history keeps a count per status for the retained records,
+  updated on append, status change and eviction, so the failure rate is O(1).
+"""
+
+import bisect
+import threading
+from collections import deque, Counter
+from itertools import islice
+from typing import Dict, Any, List, Optional, Tuple, Iterable
+
+from config import AUTOMATION_TELEMETRY_HISTORY_SIZE, AUTOMATION_ACTION_HISTORY_SIZE
+
+# Upper bucket edges of the latency histogram in seconds (last bucket is open)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+ACTION_TYPES = ('click', 'double_click', 'type', 'scroll')
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram."""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.total += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.total if self.total else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Upper edge of the bucket holding the q-th percentile (q in 0-100)."""
+        if not self.total:
+            return 0.0
+        rank = q / 100 * self.total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'buckets': list(LATENCY_BUCKETS),
+            'counts': list(self.counts),
+            'mean': self.mean,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'max': self.max
+        }
+
+
+class ActionAggregate:
+    """Running statistics for one (action, path_type, app) key."""
+
+    def __init__(self):
+        self.count = 0
+        self.successes = 0
+        self.latency = LatencyHistogram()
+
+    def add(self, success: bool, execution_time: float) -> None:
+        self.count += 1
+        self.successes += 1 if success else 0
+        self.latency.add(execution_time)
+
+    def merge(self, other: 'ActionAggregate') -> None:
+        self.count += other.count
+        self.successes += other.successes
+        self.latency.merge(other.latency)
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.count * 100 if self.count else 0.0
+
+
+class AutomationTelemetry:
+    """Ring buffer of performance records with incremental aggregates."""
+
+    def __init__(self, history_size: int = AUTOMATION_TELEMETRY_HISTORY_SIZE):
+        """
+        Initialize telemetry.
+
+        Args:
+            history_size: Number of most recent performance records kept
+        """
+        self.records = deque(maxlen=history_size)
+        self.total_records = 0
+        self._aggregates: Dict[Tuple[str, str, str], ActionAggregate] = {}
+        self._lock = threading.Lock()
+
+    def record(self, perf_record: Dict[str, Any]) -> None:
+        """Add a performance record ('action', 'path_type', 'success', 'execution_time', ...)."""
+        key = (perf_record.get('action', 'unknown'), perf_record.get('path_type', 'unknown'),
+               perf_record.get('app_name') or 'unknown')
+        with self._lock:
+            self.records.append(perf_record)
+            self.total_records += 1
+            aggregate = self._aggregates.get(key)
+            if aggregate is None:
+                aggregate = self._aggregates[key] = ActionAggregate()
+            aggregate.add(bool(perf_record.get('success', False)), perf_record.get('execution_time', 0.0))
+
+    def recent(self, limit: int) -> List[Dict[str, Any]]:
+        """The last `limit` records, oldest first."""
+        with self._lock:
+            start = max(0, len(self.records) - limit)
+            return list(islice(self.records, start, None))
+
+    def aggregates(self) -> Dict[Tuple[str, str, str], ActionAggregate]:
+        """Snapshot of the lifetime aggregates by (action, path_type, app)."""
+        with self._lock:
+            snapshot = {}
+            for key, aggregate in self._aggregates.items():
+                copy = snapshot[key] = ActionAggregate()
+                copy.merge(aggregate)
+            return snapshot
+
+    def aggregate_records(self, records: Iterable[Dict[str, Any]]) -> Dict[Tuple[str, str, str], ActionAggregate]:
+        """Aggregate a list of records the same way (for windowed metrics)."""
+        aggregates: Dict[Tuple[str, str, str], ActionAggregate] = {}
+        for record in records:
+            key = (record.get('action', 'unknown'), record.get('path_type', 'unknown'),
+                   record.get('app_name') or 'unknown')
+            aggregates.setdefault(key, ActionAggregate()).add(
+                bool(record.get('success', False)), record.get('execution_time', 0.0))
+        return aggregates
+
+    @staticmethod
+    def merge(aggregates: Dict[Tuple[str, str, str], ActionAggregate], action: Optional[str] = None,
+              path_type: Optional[str] = None) -> ActionAggregate:
+        """Combine the aggregates matching an action and/or path type."""
+        merged = ActionAggregate()
+        for (key_action, key_path, _), aggregate in aggregates.items():
+            if (action is None or key_action == action) and (path_type is None or key_path == path_type):
+                merged.merge(aggregate)
+        return merged
+
+    def get_breakdown(self) -> List[Dict[str, Any]]:
+        """Per (action, path_type, app) statistics."""
+        return [
+            {
+                'action': action,
+                'path_type': path_type,
+                'app_name': app_name,
+                'count': aggregate.count,
+                'success_rate': aggregate.success_rate,
+                'latency': aggregate.latency.to_dict()
+            }
+            for (action, path_type, app_name), aggregate in sorted(self.aggregates().items())
+        ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.records.clear()
+            self.total_records = 0
+            self._aggregates.clear()
+
+
+class ActionHistory:
+    """Ring buffer of action records with per-status counts."""
+
+    def __init__(self, maxlen: int = AUTOMATION_ACTION_HISTORY_SIZE):
+        self._records = deque(maxlen=maxlen)
+        self._status_counts = Counter()
+        self._lock = threading.Lock()
+
+    def append(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            if len(self._records) == self._records.maxlen:
+                self._status_counts[self._records[0].get("status")] -= 1
+            self._records.append(record)
+            self._status_counts[record.get("status")] += 1
+        return record
+
+    def set_status(self, record: Dict[str, Any], status: str) -> None:
+        """Change a record's status, keeping the counts in step."""
+        with self._lock:
+            self._status_counts[record.get("status")] -= 1
+            record["status"] = status
+            self._status_counts[status] += 1
+
+    def replace(self, records: Iterable[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._records.clear()
+            self._records.extend(records)
+            self._status_counts = Counter(record.get("status") for record in self._records)
+
+    def recent(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """The last `limit` records (all retained records if None), oldest first."""
+        with self._lock:
+            if limit is None:
+                return list(self._records)
+            return list(islice(self._records, max(0, len(self._records) - limit), None)) if limit > 0 else []
+
+    def failure_rate(self) -> float:
+        """Percentage of retained records with status 'failed'."""
+        with self._lock:
+            return self._status_counts["failed"] / len(self._records) * 100.0 if self._records else 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self._status_counts.clear()
+
+    def __len__(self) -> int:
+        return len(self._records)
@@ -0,0 +1,347 @@
+# modules/clipboard_capture.py
+"""
+Pasteboard-Aware Clipboard Capture for AURA
+
+Captures the current selection by sending Cmd+C and reading the pasteboard,
+without the fixed sleeps and process round trips of the pyperclip path:
+
+- The pasteboard is read and written in process (NSPasteboard on macOS).
+- Completion of the copy is detected by polling the pasteboard changeCount
+  with a tight interval up to a deadline, instead of sleeping a fixed time.
+- The original pasteboard contents (every item and type, not only text)
+  are restored on a background thread after the captured text has been
+  returned. The next capture waits for a pending restore first, and a
+  restore is skipped if something else was copied in the meantime.
+- Non-text types on the pasteboard after the copy (HTML, RTF, images, file
+  URLs) are captured alongside the plain text.
+
+Backends follow the same pattern as input injection backends: "appkit" for
+the real pasteboard and "memory" for an in-process fake used by tests and
+benchmarks.
+"""
+
+import concurrent.futures
+import logging
+import threading
+import time
+from typing import Dict, Any, List, Optional, Callable, Type
+
+from config import CLIPBOARD_CAPTURE_TIMEOUT, CLIPBOARD_CAPTURE_LAZY_RESTORE
+from .ui_settle import wait_for, Predicate
+
+# NSPasteboard (macOS only)
+try:
+    from AppKit import NSPasteboard, NSPasteboardItem
+    from Foundation import NSData
+    APPKIT_PASTEBOARD_AVAILABLE = True
+except ImportError:
+    APPKIT_PASTEBOARD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+TEXT_TYPE = "public.utf8-plain-text"
+
+# Non-text types captured with the text when the copy put them on the pasteboard
+RICH_TYPES = ["public.html", "public.rtf", "public.png", "public.tiff", "public.file-url"]
+
+# changeCount poll intervals (the copy usually lands within a few milliseconds)
+POLL_INITIAL_INTERVAL = 0.001
+POLL_MAX_INTERVAL = 0.005
+
+
+class PasteboardSnapshot:
+    """Contents of the pasteboard: one {type: data} dictionary per item."""
+
+    def __init__(self, items: List[Dict[str, bytes]], change_count: int):
+        self.items = items
+        self.change_count = change_count
+
+    @property
+    def size(self) -> int:
+        return sum(len(data) for item in self.items for data in item.values())
+
+
+class PasteboardBackend:
+    """Base class for pasteboard backends."""
+
+    name = "base"
+
+    def change_count(self) -> int:
+        """Counter incremented whenever the pasteboard contents change."""
+        raise NotImplementedError
+
+    def types(self) -> List[str]:
+        """Types available on the pasteboard."""
+        raise NotImplementedError
+
+    def read_data(self, pasteboard_type: str) -> Optional[bytes]:
+        """Data of the first item for a type."""
+        raise NotImplementedError
+
+    def read_text(self) -> Optional[str]:
+        """Plain text on the pasteboard."""
+        data = self.read_data(TEXT_TYPE)
+        return data.decode('utf-8', errors='replace') if data is not None else None
+
+    def snapshot(self) -> PasteboardSnapshot:
+        """Copy of every item and type on the pasteboard."""
+        raise NotImplementedError
+
+    def restore(self, snapshot: PasteboardSnapshot) -> bool:
+        """Replace the pasteboard contents with a snapshot."""
+        raise NotImplementedError
+
+
+class AppKitPasteboardBackend(PasteboardBackend):
+    """The general NSPasteboard, accessed in process."""
+
+    name = "appkit"
+
+    def __init__(self):
+        if not APPKIT_PASTEBOARD_AVAILABLE:
+            raise RuntimeError("AppKit (pyobjc-framework-Cocoa) is not available")
+        self.pasteboard = NSPasteboard.generalPasteboard()
+
+    def change_count(self) -> int:
+        return int(self.pasteboard.changeCount())
+
+    def types(self) -> List[str]:
+        return [str(t) for t in (self.pasteboard.types() or [])]
+
+    def read_data(self, pasteboard_type: str) -> Optional[bytes]:
+        data = self.pasteboard.dataForType_(pasteboard_type)
+        return bytes(data) if data is not None else None
+
+    def snapshot(self) -> PasteboardSnapshot:
+        change_count = self.change_count()
+        items = []
+        for item in self.pasteboard.pasteboardItems() or []:
+            contents = {}
+            for pasteboard_type in item.types():
+                data = item.dataForType_(pasteboard_type)
+                if data is not None:
+                    contents[str(pasteboard_type)] = bytes(data)
+            items.append(contents)
+        return PasteboardSnapshot(items, change_count)
+
+    def restore(self, snapshot: PasteboardSnapshot) -> bool:
+        self.pasteboard.clearContents()
+        if not snapshot.items:
+            return True
+        objects = []
+        for contents in snapshot.items:
+            item = NSPasteboardItem.alloc().init()
+            for pasteboard_type, data in contents.items():
+                item.setData_forType_(NSData.dataWithBytes_length_(data, len(data)), pasteboard_type)
+            objects.append(item)
+        return bool(self.pasteboard.writeObjects_(objects))
+
+
+class MemoryPasteboardBackend(PasteboardBackend):
+    """In-process fake pasteboard (tests, benchmarks)."""
+
+    name = "memory"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items: List[Dict[str, bytes]] = []
+        self._change_count = 0
+
+    def write(self, items: List[Dict[str, bytes]]) -> None:
+        """Replace the contents, as a copy in another application would."""
+        with self._lock:
+            self._items = [dict(item) for item in items]
+            self._change_count += 1
+
+    def write_text(self, text: str) -> None:
+        self.write([{TEXT_TYPE: text.encode('utf-8')}])
+
+    def change_count(self) -> int:
+        with self._lock:
+            return self._change_count
+
+    def types(self) -> List[str]:
+        with self._lock:
+            return list(self._items[0]) if self._items else []
+
+    def read_data(self, pasteboard_type: str) -> Optional[bytes]:
+        with self._lock:
+            return self._items[0].get(pasteboard_type) if self._items else None
+
+    def snapshot(self) -> PasteboardSnapshot:
+        with self._lock:
+            return PasteboardSnapshot([dict(item) for item in self._items], self._change_count)
+
+    def restore(self, snapshot: PasteboardSnapshot) -> bool:
+        self.write(snapshot.items)
+        return True
+
+
+# Registered backends by name
+PASTEBOARD_BACKENDS: Dict[str, Type[PasteboardBackend]] = {
+    AppKitPasteboardBackend.name: AppKitPasteboardBackend,
+    MemoryPasteboardBackend.name: MemoryPasteboardBackend
+}
+
+
+def create_pasteboard_backend(name: str) -> Optional[PasteboardBackend]:
+    """
+    Create the pasteboard backend for clipboard capture.
+
+    Args:
+        name: "auto", "none" or a registered backend name. "auto" uses the
+            AppKit pasteboard when available.
+
+    Returns:
+        PasteboardBackend instance, or None to use the pyperclip capture path
+    """
+    if name == "none":
+        return None
+
+    if name == "auto":
+        if not APPKIT_PASTEBOARD_AVAILABLE:
+            return None
+        name = AppKitPasteboardBackend.name
+
+    if name not in PASTEBOARD_BACKENDS:
+        raise ValueError(f"Unknown pasteboard backend '{name}'. Available: {', '.join(sorted(PASTEBOARD_BACKENDS))}")
+
+    try:
+        return PASTEBOARD_BACKENDS[name]()
+    except Exception as e:
+        logger.warning(f"Pasteboard backend '{name}' unavailable ({e}), using pyperclip clipboard capture")
+        return None
+
+
+class CaptureResult:
+    """Outcome of one clipboard capture."""
+
+    def __init__(self):
+        self.text: Optional[str] = None
+        self.data: Dict[str, bytes] = {}
+        self.types: List[str] = []
+        self.changed = False
+        self.latency = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'text_length': len(self.text) if self.text else 0,
+            'types': list(self.types),
+            'changed': self.changed,
+            'latency': self.latency
+        }
+
+
+class ClipboardCapture:
+    """
+    Captures the selection through the pasteboard with deferred restoration.
+    """
+
+    def __init__(self, backend: PasteboardBackend, timeout: float = CLIPBOARD_CAPTURE_TIMEOUT,
+                 lazy_restore: bool = CLIPBOARD_CAPTURE_LAZY_RESTORE,
+                 capture_types: Optional[List[str]] = None):
+        """
+        Initialize clipboard capture.
+
+        Args:
+            backend: Pasteboard backend
+            timeout: Seconds to wait for the copy to reach the pasteboard
+            lazy_restore: Restore the original contents on a background
+                thread after returning (otherwise before returning)
+            capture_types: Non-text types to capture (defaults to RICH_TYPES)
+        """
+        self.backend = backend
+        self.timeout = timeout
+        self.lazy_restore = lazy_restore
+        self.capture_types = list(RICH_TYPES if capture_types is None else capture_types)
+        self._restorer = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="ClipboardRestore")
+        self._pending_restore: Optional[concurrent.futures.Future] = None
+        self._lock = threading.Lock()
+        self._stats = {'captures': 0, 'copied': 0, 'timed_out': 0, 'restored': 0, 'restore_skipped': 0}
+
+    def capture(self, send_copy: Callable[[], bool]) -> CaptureResult:
+        """
+        Copy the selection and read it from the pasteboard.
+
+        Args:
+            send_copy: Posts the copy keystroke; returns False if it couldn't
+
+        Returns:
+            CaptureResult; text is None if nothing was copied before the deadline
+
+        Raises:
+            Exception: Whatever send_copy raises (the pasteboard is untouched)
+        """
+        start = time.perf_counter()
+        result = CaptureResult()
+        self.flush_restore()
+
+        original = self.backend.snapshot()
+        with self._lock:
+            self._stats['captures'] += 1
+
+        if not send_copy():
+            result.latency = time.perf_counter() - start
+            return result
+
+        result.changed = wait_for(
+            Predicate(lambda: self.backend.change_count() != original.change_count, "pasteboard_changed"),
+            timeout=self.timeout,
+            initial_interval=POLL_INITIAL_INTERVAL,
+            max_interval=POLL_MAX_INTERVAL
+        )
+
+        if result.changed:
+            copied_count = self.backend.change_count()
+            result.types = self.backend.types()
+            result.text = self.backend.read_text() or None
+            for pasteboard_type in self.capture_types:
+                if pasteboard_type in result.types:
+                    data = self.backend.read_data(pasteboard_type)
+                    if data is not None:
+                        result.data[pasteboard_type] = data
+            result.latency = time.perf_counter() - start
+
+            if self.lazy_restore:
+                self._pending_restore = self._restorer.submit(self._restore, original, copied_count)
+            else:
+                self._restore(original, copied_count)
+        else:
+            result.latency = time.perf_counter() - start
+
+        with self._lock:
+            self._stats['copied' if result.changed else 'timed_out'] += 1
+        return result
+
+    def _restore(self, original: PasteboardSnapshot, copied_count: int) -> None:
+        """Put the original contents back unless something else was copied since."""
+        try:
+            if self.backend.change_count() != copied_count:
+                with self._lock:
+                    self._stats['restore_skipped'] += 1
+                logger.debug("Pasteboard changed after capture, not restoring original contents")
+                return
+            self.backend.restore(original)
+            with self._lock:
+                self._stats['restored'] += 1
+        except Exception as e:
+            logger.warning(f"Failed to restore pasteboard contents: {e}")
+
+    def flush_restore(self, timeout: Optional[float] = None) -> None:
+        """Wait for a pending background restore to finish."""
+        pending, self._pending_restore = self._pending_restore, None
+        if pending is not None:
+            try:
+                pending.result(timeout=timeout)
+            except Exception as e:
+                logger.debug(f"Pending pasteboard restore did not complete: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Capture statistics."""
+        with self._lock:
+            return dict(self._stats, backend=self.backend.name)
+
+    def shutdown(self) -> None:
+        """Finish pending restores and stop the restore worker."""
+        self.flush_restore()
+        self._restorer.shutdown(wait=True)
@@ -0,0 +1,458 @@
+# modules/command_router.py
+"""
+Pre-Intent Command Router for AURA
+
+Recognizes commands with unambiguous grammar before LLM intent recognition,
+so they can go straight to automation or the accessibility fast path:
+
+- type:   'type hello world', 'type "Dear Sam,"'
+- key:    'press enter', 'hit cmd+shift+t', 'press the down arrow'
+- scroll: 'scroll down', 'scroll up by 300'
+- click:  'click Submit', 'double-click the Downloads folder', 'click on the Save button'
+
+Commands that only look similar ("type in the search field ...", "click it",
+"type a function that ...", "type my email address", anything chained with
+"and"/"then" and another action) are left to the LLM.
+
+Each grammar keeps its precision against the LLM's intent labels. In shadow
+mode a match is only recorded: the command still goes through intent
+recognition and the router's prediction (action type and extracted
+parameters) is compared with the LLM label. Labels that can't be compared
+(no target, an action type outside the GUI vocabulary) are skipped rather
+than counted as agreement. In
+"auto" mode a grammar is enforced (intent recognition skipped) once its
+precision reaches FAST_COMMAND_ROUTER_MIN_PRECISION over at least
+FAST_COMMAND_ROUTER_MIN_SAMPLES shadowed commands. The counts are kept in
+FAST_COMMAND_ROUTER_STATS_FILE so they carry over between sessions.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List
+
+from config import (
+    FAST_COMMAND_ROUTER_MODE,
+    FAST_COMMAND_ROUTER_MIN_CONFIDENCE,
+    FAST_COMMAND_ROUTER_MIN_PRECISION,
+    FAST_COMMAND_ROUTER_MIN_SAMPLES,
+    FAST_COMMAND_ROUTER_STATS_FILE
+)
+from .action_compiler import KEY_NAMES, MODIFIER_NAMES
+
+logger = logging.getLogger(__name__)
+
+ROUTER_MODES = ("off", "shadow", "auto", "enforce")
+
+# GUI action types in the intent prompt's vocabulary
+GUI_ACTION_TYPES = {"click", "type", "scroll"}
+
+# LLM action_type labels compatible with each grammar (None: not compared, the
+# intent vocabulary has no key press action; the keys are compared instead)
+EXPECTED_ACTION_TYPES = {
+    "type": {"type"},
+    "key": None,
+    "scroll": {"scroll"},
+    "click": {"click"}
+}
+
+_POLITE = r"(?:(?:please|can\s+you|could\s+you)\s+)?"
+_END = r"\s*[.!]?$"
+_MODIFIER = r"(?:cmd|command|ctrl|control|alt|option|shift)"
+_KEY = (r"(?:page\s+up|page\s+down|space\s*bar|enter|return|tab|escape|esc|space|delete|backspace|"
+        r"home|end|(?:up|down|left|right)(?:\s+arrow)?|[a-z0-9])")
+_COMBO = rf"(?:{_MODIFIER}\s*[+\s-]\s*)*{_KEY}"
+
+TYPE_PATTERN = re.compile(
+    rf"^{_POLITE}type\s+(?:\"(?P<dquoted>[^\"]+)\"|'(?P<squoted>[^']+)'|(?P<text>.+))$", re.IGNORECASE | re.DOTALL)
+KEY_PATTERN = re.compile(rf"^{_POLITE}(?:press|hit)\s+(?:the\s+)?(?P<keys>{_COMBO})(?:\s+key)?{_END}", re.IGNORECASE)
+KEY_TARGET_PATTERN = re.compile(
+    rf"^(?:(?:press|hit)\s+)?(?:the\s+)?(?P<keys>{_COMBO})(?:\s+key)?{_END}", re.IGNORECASE)
+KEY_TOKEN_PATTERN = re.compile(rf"{_MODIFIER}|{_KEY}", re.IGNORECASE)
+SCROLL_PATTERN = re.compile(
+    rf"^{_POLITE}scroll\s+(?P<direction>up|down|left|right)(?:\s+(?:by\s+)?(?P<amount>\d+))?{_END}", re.IGNORECASE)
+CLICK_PATTERN = re.compile(
+    rf"^{_POLITE}(?P<verb>double[\s-]?click|right[\s-]?click|click|tap)\s+(?:on\s+)?(?:the\s+)?"
+    rf"(?P<label>[\w][\w .'&-]*?)(?:\s+(?P<role>button|link|tab|menu|checkbox|field|icon|folder))?{_END}",
+    re.IGNORECASE)
+
+# Verbs that start a second action after "and"/"then"
+_FOLLOW_UP_VERB = (r"(?:press|hit|click|tap|double[\s-]?click|scroll|type|enter|submit|send|save|open|close|"
+                   r"select|choose|go|switch|move|copy|paste|delete|search|find|run|launch|tab)")
+
+# Unquoted "type ..." text that names a target field, chains another action,
+# describes the text instead of spelling it out, or asks for generated content
+AMBIGUOUS_TYPE_TEXT = re.compile(
+    r"^(?:in|into|on)\s|\s(?:in|into)\s+the\s|"
+    rf"\b(?:and\s+then|(?:and|then)\s+{_FOLLOW_UP_VERB})\b|"
+    r"^(?:my|your|our|his|her|their)\s|"
+    r"^(?:the\s+)?(?:current|today'?s|selected|previous|last|same|following|above)\s|"
+    r"^(?:out\s+)?(?:a|an|some|me\s+a)\s+(?:\w+\s+){0,3}?"
+    r"(?:function|class|script|program|code|email|letter|essay|story|poem|summary|paragraph)s?\b",
+    re.IGNORECASE)
+
+# Click targets that need vision or context to resolve
+AMBIGUOUS_LABELS = {"it", "this", "that", "here", "there", "them", "me", "something", "anything"}
+MAX_LABEL_WORDS = 5
+
+
+def _parse_keys(keys_text: str) -> List[str]:
+    """Key names of a key combination ("cmd+shift+t", "the down arrow"); empty if it ends in a modifier."""
+    keys = []
+    for token in KEY_TOKEN_PATTERN.findall(keys_text.lower()):
+        token = re.sub(r"\s+arrow$", "", token)
+        token = re.sub(r"^page\s+", "page-", token)
+        token = re.sub(r"^space\s*bar$", "space", token)
+        keys.append(MODIFIER_NAMES.get(token) or KEY_NAMES.get(token, token))
+    if not keys or keys[-1] in MODIFIER_NAMES.values():
+        return []
+    return keys
+
+
+def _normalize(value: Any) -> str:
+    """Lowercase text with quotes, trailing punctuation and extra whitespace removed."""
+    if not isinstance(value, str):
+        return ""
+    value = value.strip().strip("\"'").strip().rstrip(".!")
+    return " ".join(value.lower().split())
+
+
+@dataclass
+class RoutedCommand:
+    """A command recognized by one of the router grammars."""
+
+    grammar: str
+    parameters: Dict[str, Any]
+    confidence: float
+
+    def to_intent(self) -> Dict[str, Any]:
+        """Intent result in the format of Orchestrator._recognize_intent."""
+        return {
+            "intent": "gui_interaction",
+            "confidence": self.confidence,
+            "parameters": {
+                "action_type": self.grammar,
+                "target": self.parameters.get("label") or self.parameters.get("text", ""),
+                "content_type": "text"
+            },
+            "reasoning": f"Matched the '{self.grammar}' command grammar",
+            "source": "fast_router",
+            "fast_route": self.to_dict()
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"grammar": self.grammar, "parameters": dict(self.parameters), "confidence": self.confidence}
+
+
+@dataclass
+class GrammarStats:
+    """Shadow-mode agreement of one grammar with the LLM labels."""
+
+    shadowed: int = 0
+    agreed: int = 0
+    skipped: int = 0
+    enforced: int = 0
+    disagreements: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def precision(self) -> float:
+        return self.agreed / self.shadowed if self.shadowed else 0.0
+
+
+class FastCommandRouter:
+    """Compiled-grammar router for commands that don't need intent recognition."""
+
+    MAX_DISAGREEMENTS = 20  # Most recent disagreeing commands kept per grammar for inspection
+    SAVE_EVERY = 10         # Shadowed commands between automatic saves of the stats file
+
+    def __init__(self, mode: str = FAST_COMMAND_ROUTER_MODE,
+                 min_confidence: float = FAST_COMMAND_ROUTER_MIN_CONFIDENCE,
+                 min_precision: float = FAST_COMMAND_ROUTER_MIN_PRECISION,
+                 min_samples: int = FAST_COMMAND_ROUTER_MIN_SAMPLES,
+                 stats_file: Optional[str] = FAST_COMMAND_ROUTER_STATS_FILE):
+        """
+        Initialize the router.
+
+        Args:
+            mode: "off", "shadow" (compare with LLM labels only), "auto"
+                (enforce grammars proven in shadow mode) or "enforce"
+            min_confidence: Minimum match confidence for routing
+            min_precision: Shadow precision a grammar needs before "auto" enforces it
+            min_samples: Shadowed commands a grammar needs before "auto" enforces it
+            stats_file: JSON file the shadow counts are loaded from and saved to (None: memory only)
+        """
+        if mode not in ROUTER_MODES:
+            raise ValueError(f"Unknown command router mode '{mode}'. Available: {', '.join(ROUTER_MODES)}")
+        self.mode = mode
+        self.min_confidence = min_confidence
+        self.min_precision = min_precision
+        self.min_samples = min_samples
+        self.stats_file = stats_file
+        self._stats: Dict[str, GrammarStats] = {grammar: GrammarStats() for grammar in EXPECTED_ACTION_TYPES}
+        self._unsaved = 0
+        self._lock = threading.Lock()
+
+        if stats_file and os.path.exists(stats_file):
+            self.load_stats(stats_file)
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def match(self, command: str) -> Optional[RoutedCommand]:
+        """
+        Recognize a command with unambiguous grammar.
+
+        Args:
+            command: User command
+
+        Returns:
+            RoutedCommand, or None if the command needs intent recognition
+        """
+        if not self.enabled or not command:
+            return None
+        command = command.strip()
+        routed = (self._match_type(command) or self._match_key(command) or
+                  self._match_scroll(command) or self._match_click(command))
+        if routed is None or routed.confidence < self.min_confidence:
+            return None
+        return routed
+
+    def _match_type(self, command: str) -> Optional[RoutedCommand]:
+        match = TYPE_PATTERN.match(command)
+        if not match:
+            return None
+        quoted = match.group("dquoted") or match.group("squoted")
+        if quoted:
+            return RoutedCommand("type", {"text": quoted}, 0.99)
+        text = match.group("text").strip()
+        if not text or AMBIGUOUS_TYPE_TEXT.search(text):
+            return None
+        return RoutedCommand("type", {"text": text}, 0.95)
+
+    def _match_key(self, command: str) -> Optional[RoutedCommand]:
+        match = KEY_PATTERN.match(command)
+        if not match:
+            return None
+        keys = _parse_keys(match.group("keys"))
+        if not keys:
+            return None
+        return RoutedCommand("key", {"keys": keys}, 0.98)
+
+    def _match_scroll(self, command: str) -> Optional[RoutedCommand]:
+        match = SCROLL_PATTERN.match(command)
+        if not match:
+            return None
+        parameters = {"direction": match.group("direction").lower()}
+        if match.group("amount"):
+            parameters["amount"] = int(match.group("amount"))
+        return RoutedCommand("scroll", parameters, 0.98)
+
+    def _match_click(self, command: str) -> Optional[RoutedCommand]:
+        match = CLICK_PATTERN.match(command)
+        if not match:
+            return None
+        label = match.group("label").strip()
+        words = label.lower().split()
+        if (not words or len(words) > MAX_LABEL_WORDS or words[0] in AMBIGUOUS_LABELS or
+                "and" in words or "then" in words):
+            return None
+        verb = re.sub(r"[\s-]", "", match.group("verb").lower())
+        action = {"doubleclick": "double_click", "rightclick": "right_click"}.get(verb, "click")
+        parameters = {"action": action, "label": label}
+        if match.group("role"):
+            parameters["role"] = match.group("role").lower()
+        return RoutedCommand("click", parameters, 0.9)
+
+    def should_enforce(self, routed: RoutedCommand) -> bool:
+        """Whether to skip intent recognition for a routed command."""
+        if self.mode == "enforce":
+            return True
+        if self.mode != "auto":
+            return False
+        with self._lock:
+            stats = self._stats[routed.grammar]
+            return stats.shadowed >= self.min_samples and stats.precision >= self.min_precision
+
+    def record_enforced(self, routed: RoutedCommand) -> None:
+        with self._lock:
+            self._stats[routed.grammar].enforced += 1
+
+    @staticmethod
+    def agrees(routed: RoutedCommand, intent_result: Dict[str, Any]) -> Optional[bool]:
+        """
+        Whether an LLM intent label agrees with the router's prediction.
+
+        The action type has to match, and so do the extracted parameters:
+        the typed text has to equal the LLM's target, every word of the
+        click label has to appear in it (the LLM often adds the role, e.g.
+        "Save button"), the keys have to parse from it, and it has to name
+        the scroll direction and amount.
+
+        Returns:
+            True or False, or None if the label can't be compared (an
+            action type outside the GUI vocabulary, or no target)
+        """
+        if intent_result.get("intent") != "gui_interaction":
+            return False
+        expected = EXPECTED_ACTION_TYPES[routed.grammar]
+        parameters = intent_result.get("parameters") or {}
+        action_type = parameters.get("action_type")
+        if expected is not None:
+            if action_type not in GUI_ACTION_TYPES:
+                return None
+            if action_type not in expected:
+                return False
+
+        target = _normalize(parameters.get("target"))
+        if not target:
+            return None
+        if routed.grammar == "type":
+            return _normalize(routed.parameters.get("text")) == target
+        if routed.grammar == "click":
+            return set(_normalize(routed.parameters.get("label")).split()) <= set(target.split())
+        if routed.grammar == "key":
+            match = KEY_TARGET_PATTERN.match(target)
+            return _parse_keys(match.group("keys")) == routed.parameters.get("keys") if match else None
+        if routed.grammar == "scroll":
+            words = set(re.findall(r"[a-z]+", target))
+            directions = words & {"up", "down", "left", "right"}
+            if not directions:
+                return None
+            amount = routed.parameters.get("amount")
+            numbers = re.findall(r"\d+", target)
+            return directions == {routed.parameters["direction"]} and numbers == ([str(amount)] if amount else [])
+        return None
+
+    def record_llm_label(self, command: str, routed: RoutedCommand, intent_result: Dict[str, Any]) -> Optional[bool]:
+        """
+        Record a shadowed prediction against the LLM intent label.
+
+        Labels that can't be compared are counted as skipped and don't
+        affect precision.
+
+        Args:
+            command: User command
+            routed: Router prediction
+            intent_result: Intent recognized by the LLM
+
+        Returns:
+            True if the LLM label agreed with the router, None if it couldn't be compared
+        """
+        agreed = self.agrees(routed, intent_result)
+        if agreed is None:
+            with self._lock:
+                self._stats[routed.grammar].skipped += 1
+            logger.debug(f"Command router '{routed.grammar}' prediction not comparable with LLM label for: {command[:80]}")
+            return None
+        with self._lock:
+            stats = self._stats[routed.grammar]
+            stats.shadowed += 1
+            if agreed:
+                stats.agreed += 1
+            else:
+                stats.disagreements.append({
+                    "command": command,
+                    "intent": intent_result.get("intent"),
+                    "action_type": (intent_result.get("parameters") or {}).get("action_type"),
+                    "target": (intent_result.get("parameters") or {}).get("target"),
+                    "routed": dict(routed.parameters),
+                    "timestamp": time.time()
+                })
+                del stats.disagreements[:-self.MAX_DISAGREEMENTS]
+            self._unsaved += 1
+            save = self._unsaved >= self.SAVE_EVERY
+        if not agreed:
+            logger.info(f"Command router '{routed.grammar}' disagreed with LLM label "
+                        f"'{intent_result.get('intent')}' for: {command[:80]}")
+        if save and self.stats_file:
+            self.save_stats()
+        return agreed
+
+    def flush(self) -> None:
+        """Save shadow counts recorded since the last save."""
+        if self.stats_file and self._unsaved:
+            self.save_stats()
+
+    def load_stats(self, path: str) -> int:
+        """
+        Load shadow counts saved by save_stats.
+
+        Args:
+            path: Stats JSON file
+
+        Returns:
+            Number of grammars loaded
+        """
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            grammars = {grammar: entry for grammar, entry in data.get("grammars", {}).items()
+                        if grammar in self._stats}
+            with self._lock:
+                for grammar, entry in grammars.items():
+                    self._stats[grammar] = GrammarStats(
+                        shadowed=int(entry.get("shadowed", 0)),
+                        agreed=int(entry.get("agreed", 0)),
+                        skipped=int(entry.get("skipped", 0)),
+                        disagreements=list(entry.get("disagreements", []))[-self.MAX_DISAGREEMENTS:]
+                    )
+            return len(grammars)
+        except Exception as e:
+            logger.warning(f"Failed to load command router stats from {path}: {e}")
+            return 0
+
+    def save_stats(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Save shadow counts (also done every SAVE_EVERY shadowed commands).
+
+        Args:
+            path: Output file (defaults to the configured stats file)
+
+        Returns:
+            Path written, or None if saving failed
+        """
+        path = path or self.stats_file
+        with self._lock:
+            self._unsaved = 0
+            data = {
+                "generated_at": time.time(),
+                "grammars": {
+                    grammar: {"shadowed": stats.shadowed, "agreed": stats.agreed, "skipped": stats.skipped,
+                              "disagreements": list(stats.disagreements)}
+                    for grammar, stats in self._stats.items()
+                }
+            }
+        try:
+            with open(path, "w") as f:
+                json.dump(data, f, indent=2)
+            return path
+        except Exception as e:
+            logger.warning(f"Failed to save command router stats to {path}: {e}")
+            return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Shadow precision and enforcement state per grammar."""
+        with self._lock:
+            grammars = {
+                grammar: {
+                    "shadowed": stats.shadowed,
+                    "agreed": stats.agreed,
+                    "precision": stats.precision,
+                    "skipped": stats.skipped,
+                    "enforced": stats.enforced,
+                    "recent_disagreements": list(stats.disagreements[-5:])
+                }
+                for grammar, stats in self._stats.items()
+            }
+        for grammar, entry in grammars.items():
+            entry["enforcing"] = self.should_enforce(RoutedCommand(grammar, {}, 1.0))
+        return {"mode": self.mode, "grammars": grammars}
+
+
+# Global command router (shadow counts shared across commands)
+command_router = FastCommandRouter()
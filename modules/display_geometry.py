@@ -0,0 +1,387 @@
+# modules/display_geometry.py
+"""
+Display Geometry Service for AURA
+
+One cached description of the connected displays, shared by automation,
+vision and accessibility:
+
+- Display bounds in global points (the coordinate space of clicks,
+  accessibility element positions and CGEvents; the main display's top-left
+  is the origin, other displays may have negative offsets), pixel sizes and
+  backing scale factors.
+- Read through Quartz (CGGetActiveDisplayList/CGDisplayBounds), which takes
+  well under a millisecond, instead of parsing `system_profiler` output.
+- Cached until the displays are reconfigured (CGDisplayRegisterReconfiguration-
+  Callback). Reconfiguration callbacks are delivered through the main run
+  loop, so the layout is also re-read once it is older than
+  DISPLAY_GEOMETRY_MAX_AGE in processes without one.
+- Conversion from screenshot image coordinates (as reported by the vision
+  model) to global points.
+
+Providers follow the same pattern as the input backends: "quartz" on macOS,
+"pyautogui" (single display, scale 1) elsewhere and "static" for tests.
+"""
+
+import logging
+import threading
+import time
+import weakref
+from typing import Dict, Any, List, Optional, Tuple, Callable, Type
+
+from config import DISPLAY_GEOMETRY_PROVIDER, DISPLAY_GEOMETRY_MAX_AGE
+
+# Display enumeration and reconfiguration callbacks (macOS only)
+try:
+    import Quartz
+    QUARTZ_DISPLAYS_AVAILABLE = True
+except ImportError:
+    QUARTZ_DISPLAYS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MAX_DISPLAYS = 16
+
+
+class Display:
+    """One display: bounds in global points, size in pixels."""
+
+    def __init__(self, display_id: int, x: float, y: float, width: float, height: float,
+                 pixel_width: Optional[int] = None, pixel_height: Optional[int] = None, is_main: bool = False):
+        self.display_id = display_id
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.pixel_width = pixel_width or int(width)
+        self.pixel_height = pixel_height or int(height)
+        self.is_main = is_main
+
+    @property
+    def scale(self) -> float:
+        """Backing scale factor (2.0 on Retina displays)."""
+        return self.pixel_width / self.width if self.width else 1.0
+
+    def contains(self, x: float, y: float) -> bool:
+        return self.x <= x < self.x + self.width and self.y <= y < self.y + self.height
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'display_id': self.display_id,
+            'bounds': [self.x, self.y, self.width, self.height],
+            'pixel_size': [self.pixel_width, self.pixel_height],
+            'scale': self.scale,
+            'is_main': self.is_main
+        }
+
+
+class DisplayLayout:
+    """The set of active displays at one point in time."""
+
+    def __init__(self, displays: List[Display]):
+        if not displays:
+            raise ValueError("A display layout needs at least one display")
+        self.displays = displays
+        self.main = next((display for display in displays if display.is_main), displays[0])
+        self.read_at = time.monotonic()
+
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """Bounding box of all displays (x, y, width, height) in points."""
+        left = min(display.x for display in self.displays)
+        top = min(display.y for display in self.displays)
+        right = max(display.x + display.width for display in self.displays)
+        bottom = max(display.y + display.height for display in self.displays)
+        return left, top, right - left, bottom - top
+
+    def display_at(self, x: float, y: float) -> Optional[Display]:
+        """Display containing a global point."""
+        for display in self.displays:
+            if display.contains(x, y):
+                return display
+        return None
+
+    def contains(self, x: float, y: float) -> bool:
+        """Whether a global point is on some display (the far edges included)."""
+        return any(display.x <= x <= display.x + display.width and display.y <= y <= display.y + display.height
+                   for display in self.displays)
+
+    def intersects(self, x: float, y: float, width: float, height: float) -> bool:
+        """Whether a rectangle in global points is at least partly on some display."""
+        return any(x < display.x + display.width and display.x < x + width and
+                   y < display.y + display.height and display.y < y + height
+                   for display in self.displays)
+
+    def display(self, index: int = 0) -> Display:
+        """Display by index, main display first (index 0 is the main display)."""
+        ordered = [self.main] + [display for display in self.displays if display is not self.main]
+        return ordered[index]
+
+    def image_to_points(self, x: float, y: float, image_width: int, image_height: int,
+                        display: Optional[Display] = None) -> Tuple[int, int]:
+        """
+        Map a position in a screenshot of a display to a global point.
+
+        Args:
+            x: X position in the image
+            y: Y position in the image
+            image_width: Screenshot width (pixels, possibly downscaled)
+            image_height: Screenshot height
+            display: Display the screenshot shows (main display by default)
+
+        Returns:
+            Global point (x, y)
+        """
+        display = display or self.main
+        return (int(round(display.x + x * display.width / image_width)),
+                int(round(display.y + y * display.height / image_height)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'displays': [display.to_dict() for display in self.displays], 'bounds': list(self.bounds)}
+
+
+class DisplayProvider:
+    """Base class for display geometry providers."""
+
+    name = "base"
+
+    def read(self) -> List[Display]:
+        """Read the active displays."""
+        raise NotImplementedError
+
+    def watch(self, on_change: Callable[[], None]) -> bool:
+        """Call on_change after displays are reconfigured; False if unsupported."""
+        return False
+
+
+class QuartzDisplayProvider(DisplayProvider):
+    """Active displays from CoreGraphics."""
+
+    name = "quartz"
+
+    def __init__(self):
+        if not QUARTZ_DISPLAYS_AVAILABLE:
+            raise RuntimeError("Quartz (pyobjc-framework-Quartz) is not available")
+        self._callback = None
+
+    def read(self) -> List[Display]:
+        error, display_ids, count = Quartz.CGGetActiveDisplayList(MAX_DISPLAYS, None, None)
+        if error:
+            raise RuntimeError(f"CGGetActiveDisplayList failed with error {error}")
+        main_id = Quartz.CGMainDisplayID()
+        displays = []
+        for display_id in display_ids[:count]:
+            bounds = Quartz.CGDisplayBounds(display_id)
+            pixel_width = pixel_height = None
+            mode = Quartz.CGDisplayCopyDisplayMode(display_id)
+            if mode is not None:
+                pixel_width = Quartz.CGDisplayModeGetPixelWidth(mode)
+                pixel_height = Quartz.CGDisplayModeGetPixelHeight(mode)
+            displays.append(Display(int(display_id), bounds.origin.x, bounds.origin.y,
+                                    bounds.size.width, bounds.size.height,
+                                    pixel_width, pixel_height, is_main=(display_id == main_id)))
+        return displays
+
+    def watch(self, on_change: Callable[[], None]) -> bool:
+        def callback(display_id, flags, user_info):
+            # Each change is reported twice; re-read once it is done
+            if not flags & Quartz.kCGDisplayBeginConfigurationFlag:
+                on_change()
+
+        # Keep a reference, PyObjC doesn't retain the callable
+        self._callback = callback
+        return Quartz.CGDisplayRegisterReconfigurationCallback(callback, None) == 0
+
+
+class PyAutoGUIDisplayProvider(DisplayProvider):
+    """Single display of pyautogui.size() at scale 1 (non-macOS)."""
+
+    name = "pyautogui"
+
+    def read(self) -> List[Display]:
+        import pyautogui
+        width, height = pyautogui.size()
+        return [Display(0, 0, 0, width, height, is_main=True)]
+
+
+class StaticDisplayProvider(DisplayProvider):
+    """Fixed displays (tests, benchmarks)."""
+
+    name = "static"
+
+    def __init__(self, displays: Optional[List[Display]] = None):
+        self.displays = displays or [Display(1, 0, 0, 1440, 900, 2880, 1800, is_main=True)]
+        self.reads = 0
+        self._on_change = None
+
+    def read(self) -> List[Display]:
+        self.reads += 1
+        return list(self.displays)
+
+    def watch(self, on_change: Callable[[], None]) -> bool:
+        self._on_change = on_change
+        return True
+
+    def reconfigure(self, displays: List[Display]) -> None:
+        """Replace the displays and send a reconfiguration event."""
+        self.displays = displays
+        if self._on_change is not None:
+            self._on_change()
+
+
+# Registered providers by name
+DISPLAY_PROVIDERS: Dict[str, Type[DisplayProvider]] = {
+    QuartzDisplayProvider.name: QuartzDisplayProvider,
+    PyAutoGUIDisplayProvider.name: PyAutoGUIDisplayProvider,
+    StaticDisplayProvider.name: StaticDisplayProvider
+}
+
+
+def create_display_provider(name: str) -> Optional[DisplayProvider]:
+    """
+    Create the display geometry provider.
+
+    Args:
+        name: "auto", "none" or a registered provider name. "auto" uses
+            Quartz when available and otherwise no provider, leaving screen
+            size detection to each module.
+
+    Returns:
+        DisplayProvider instance, or None
+    """
+    if name == "none":
+        return None
+
+    if name == "auto":
+        if not QUARTZ_DISPLAYS_AVAILABLE:
+            return None
+        name = QuartzDisplayProvider.name
+
+    if name not in DISPLAY_PROVIDERS:
+        raise ValueError(f"Unknown display provider '{name}'. Available: {', '.join(sorted(DISPLAY_PROVIDERS))}")
+
+    try:
+        return DISPLAY_PROVIDERS[name]()
+    except Exception as e:
+        logger.warning(f"Display provider '{name}' unavailable: {e}")
+        return None
+
+
+class DisplayGeometryService:
+    """
+    Cached display layout with change notifications.
+    """
+
+    def __init__(self, provider: Optional[DisplayProvider] = None, max_age: float = DISPLAY_GEOMETRY_MAX_AGE,
+                 provider_name: str = DISPLAY_GEOMETRY_PROVIDER):
+        """
+        Initialize the service. Displays are read on first use.
+
+        Args:
+            provider: Display provider; created from provider_name if None
+            max_age: Seconds after which the layout is re-read even without
+                a reconfiguration event (0 disables)
+            provider_name: Provider to create when none is given
+        """
+        self.provider = provider if provider is not None else create_display_provider(provider_name)
+        self.max_age = max_age
+        self._layout: Optional[DisplayLayout] = None
+        self._listeners: List[Callable[[], Optional[Callable[[DisplayLayout], None]]]] = []
+        self._lock = threading.RLock()
+        self._watching = False
+        self._failed_at: Optional[float] = None
+        self._stats = {'reads': 0, 'reconfigurations': 0, 'read_time': 0.0}
+
+    @property
+    def available(self) -> bool:
+        return self.provider is not None
+
+    def layout(self) -> Optional[DisplayLayout]:
+        """
+        Current display layout (cached).
+
+        Returns:
+            DisplayLayout, or None without a provider or if reading failed
+        """
+        if self.provider is None:
+            return None
+        layout = self._layout
+        now = time.monotonic()
+        if layout is not None and (not self.max_age or now - layout.read_at < self.max_age):
+            return layout
+        # Don't retry a failed read on every call
+        if layout is None and self._failed_at is not None and (not self.max_age or now - self._failed_at < self.max_age):
+            return None
+        return self._refresh()
+
+    def _refresh(self) -> Optional[DisplayLayout]:
+        """Re-read the layout and notify listeners if it changed."""
+        with self._lock:
+            previous = self._layout
+            start = time.perf_counter()
+            try:
+                self._layout = DisplayLayout(self.provider.read())
+                self._failed_at = None
+            except Exception as e:
+                logger.warning(f"Failed to read display geometry from {self.provider.name}: {e}")
+                self._failed_at = time.monotonic()
+                return previous
+            finally:
+                self._stats['reads'] += 1
+                self._stats['read_time'] += time.perf_counter() - start
+
+            layout = self._layout
+            if not self._watching:
+                self._watching = self.provider.watch(self._on_reconfigured)
+            changed = previous is not None and previous.to_dict() != layout.to_dict()
+            listeners = [reference() for reference in self._listeners] if changed else []
+
+        if changed:
+            logger.info(f"Displays reconfigured: {len(layout.displays)} display(s), main "
+                        f"{layout.main.width:.0f}x{layout.main.height:.0f}pt @{layout.main.scale:g}x")
+        for listener in listeners:
+            if listener is None:
+                continue
+            try:
+                listener(layout)
+            except Exception as e:
+                logger.warning(f"Display change listener failed: {e}")
+        return layout
+
+    def _on_reconfigured(self) -> None:
+        with self._lock:
+            self._stats['reconfigurations'] += 1
+        self._refresh()
+
+    def add_listener(self, listener: Callable[[DisplayLayout], None]) -> None:
+        """
+        Call listener with the new layout after displays are reconfigured.
+
+        Bound methods are held weakly, so registering doesn't keep their
+        object alive.
+        """
+        reference = weakref.WeakMethod(listener) if hasattr(listener, '__func__') else (lambda: listener)
+        with self._lock:
+            self._listeners = [r for r in self._listeners if r() is not None]
+            self._listeners.append(reference)
+
+    def remove_listener(self, listener: Callable[[DisplayLayout], None]) -> None:
+        with self._lock:
+            self._listeners = [r for r in self._listeners if r() is not None and r() != listener]
+
+    def invalidate(self) -> None:
+        """Re-read the layout on next use."""
+        with self._lock:
+            self._layout = None
+            self._failed_at = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['provider'] = self.provider.name if self.provider else None
+            stats['watching'] = self._watching
+            stats['layout'] = self._layout.to_dict() if self._layout else None
+        return stats
+
+
+# Global display geometry service (shared cache and reconfiguration callback)
+display_geometry = DisplayGeometryService()
@@ -9,7 +9,7 @@ for all AURA modules with automatic retry logic and user-friendly messaging.
 import logging
 import time
 import traceback
-from typing import Dict, Any, Optional, Callable, List, Union
+from typing import Dict, Any, Optional, Callable, List, Union, Tuple, Type
 from enum import Enum
 from dataclasses import dataclass
 from functools import wraps
@@ -477,7 +477,8 @@ def with_error_handling(
     max_retries: int = 3,
     retry_delay: float = 1.0,
     user_message: Optional[str] = None,
-    fallback_return=None
+    fallback_return=None,
+    no_retry: Tuple[Type[BaseException], ...] = ()
 ):
     """
     Decorator for automatic error handling with retry logic.
@@ -489,6 +490,8 @@ def with_error_handling(
         retry_delay: Base delay between retries in seconds
         user_message: Custom user-friendly error message
         fallback_return: Value to return if all retries fail
+        no_retry: Exception types re-raised at once, without handling or
+            retrying (e.g. deliberate cancellation)
     """
     def decorator(func):
         @wraps(func)
@@ -500,6 +503,9 @@ def with_error_handling(
                 try:
                     return func(*args, **kwargs)
                     
+                except no_retry:
+                    raise
+                    
                 except Exception as e:
                     last_error = e
                     
@@ -8,14 +8,20 @@ Manages user communication and system status updates.
 
 import logging
 import threading
-import queue
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, Hashable
 import pygame
 from enum import Enum
 
-from config import SOUNDS, TTS_VOLUME
+from config import (
+    SOUNDS,
+    TTS_VOLUME,
+    FEEDBACK_SOUND_DEADLINE,
+    FEEDBACK_SPEECH_DEADLINE,
+    FEEDBACK_PREEMPT_PRIORITY
+)
+from .feedback_queue import FeedbackQueue, FeedbackChannel, QueuedFeedback
 from .error_handler import (
     global_error_handler,
     with_error_handling,
@@ -42,6 +48,7 @@ class FeedbackType(Enum):
     HYBRID_FAST = "hybrid_fast"
     HYBRID_SLOW = "hybrid_slow"
     HYBRID_FALLBACK = "hybrid_fallback"
+    SPEECH_STREAM = "speech_stream"
 
 
 class FeedbackModule:
@@ -61,9 +68,14 @@ class FeedbackModule:
         """
         self.audio_module = audio_module
         self.is_initialized = False
-        self.feedback_queue = queue.PriorityQueue()
+        self.feedback_queue = FeedbackQueue()
         self.is_processing = False
         self.processing_thread = None
+        self.effects_thread = None
+        self._current_speech: Optional[QueuedFeedback] = None
+        self.preempt_priority = (
+            FeedbackPriority[FEEDBACK_PREEMPT_PRIORITY] if FEEDBACK_PREEMPT_PRIORITY else None
+        )
         self.sound_cache = {}
         
         # Initialize hybrid feedback configuration from config
@@ -91,6 +103,15 @@ class FeedbackModule:
         # Load and cache sound files
         self._load_sound_files()
         
+        # Play fixed TTS phrases from pre-rendered audio and pipeline long
+        # responses sentence by sentence through the mixer
+        if self.audio_module is not None and hasattr(self.audio_module, 'enable_phrase_cache'):
+            try:
+                self.audio_module.enable_phrase_cache()
+                self.audio_module.enable_speech_pipeline()
+            except Exception as e:
+                logger.warning(f"Mixer TTS playback unavailable: {e}")
+        
         # Start feedback processing thread
         self._start_processing_thread()
         
@@ -186,45 +207,64 @@ class FeedbackModule:
             logger.error(f"Error loading sound files: {e}")
     
     def _start_processing_thread(self) -> None:
-        """Start the background thread for processing feedback queue."""
+        """Start the background threads for the speech and sound effect channels."""
         try:
             self.is_processing = True
             self.processing_thread = threading.Thread(
                 target=self._process_feedback_queue,
+                args=(FeedbackChannel.SPEECH,),
                 daemon=True,
                 name="FeedbackProcessor"
             )
             self.processing_thread.start()
-            logger.info("Feedback processing thread started")
+            
+            # Sound effects get their own thread so they don't wait behind speech
+            self.effects_thread = threading.Thread(
+                target=self._process_feedback_queue,
+                args=(FeedbackChannel.EFFECTS,),
+                daemon=True,
+                name="FeedbackEffects"
+            )
+            self.effects_thread.start()
+            logger.info("Feedback processing threads started")
             
         except Exception as e:
             logger.error(f"Failed to start feedback processing thread: {e}")
             self.is_processing = False
     
-    def _process_feedback_queue(self) -> None:
-        """Process feedback items from the queue with priority handling."""
-        logger.info("Feedback processing loop started")
+    def _process_feedback_queue(self, channel: FeedbackChannel = FeedbackChannel.SPEECH) -> None:
+        """
+        Process feedback items of one channel with priority handling.
+        
+        Args:
+            channel: Channel drained by this thread
+        """
+        logger.info(f"Feedback processing loop started ({channel.value})")
         
         while self.is_processing:
             try:
-                # Get next feedback item (blocks until available)
-                try:
-                    # Use timeout to allow checking stop condition
-                    priority, timestamp, feedback_item = self.feedback_queue.get(timeout=1.0)
-                except queue.Empty:
+                # Get next live feedback item (stale items are dropped by the queue)
+                # Use timeout to allow checking stop condition
+                entry = self.feedback_queue.get(channel, timeout=1.0)
+                if entry is None:
                     continue
                 
-                # Process the feedback item
-                self._execute_feedback(feedback_item)
-                
-                # Mark task as done
-                self.feedback_queue.task_done()
+                if channel == FeedbackChannel.SPEECH:
+                    self._current_speech = entry
+                try:
+                    # Process the feedback item
+                    self._execute_feedback(entry.item)
+                finally:
+                    if channel == FeedbackChannel.SPEECH:
+                        self._current_speech = None
+                    # Mark task as done
+                    self.feedback_queue.task_done(entry)
                 
             except Exception as e:
                 logger.error(f"Error processing feedback queue: {e}")
                 time.sleep(0.1)  # Brief pause before continuing
         
-        logger.info("Feedback processing loop ended")
+        logger.info(f"Feedback processing loop ended ({channel.value})")
     
     def _execute_feedback(self, feedback_item: Dict[str, Any]) -> None:
         """
@@ -243,6 +283,8 @@ class FeedbackModule:
                 self._play_sound_effect(feedback_item)
             elif feedback_type == FeedbackType.SPEECH:
                 self._play_enhanced_speech(feedback_item)
+            elif feedback_type == FeedbackType.SPEECH_STREAM:
+                self._play_speech_stream(feedback_item)
             elif feedback_type == FeedbackType.COMBINED:
                 # Play sound first, then speech with enhanced timing
                 self._play_sound_effect(feedback_item)
@@ -325,6 +367,29 @@ class FeedbackModule:
         except Exception as e:
             logger.error(f"Error playing TTS message: {e}")
     
+    def _play_speech_stream(self, feedback_item: Dict[str, Any]) -> None:
+        """
+        Speak sentences of a response that is still being generated.
+        
+        Args:
+            feedback_item: Dictionary containing the sentence stream
+        """
+        try:
+            sentences = feedback_item.get("sentences")
+            if sentences is None or not self.audio_module:
+                logger.warning("No sentence stream or AudioModule for streamed speech")
+                return
+            
+            if hasattr(self.audio_module, 'speak_sentences'):
+                self.audio_module.speak_sentences(sentences)
+            else:
+                for sentence in sentences:
+                    self.audio_module.text_to_speech(sentence)
+            logger.debug("Played streamed TTS response")
+            
+        except Exception as e:
+            logger.error(f"Error playing streamed TTS response: {e}")
+    
     def _play_enhanced_speech(self, feedback_item: Dict[str, Any]) -> None:
         """
         Play enhanced text-to-speech with conversational and deferred action optimizations.
@@ -523,13 +588,16 @@ class FeedbackModule:
         max_retries=1,
         user_message="Having trouble playing sound effects."
     )
-    def play(self, sound_name: str, priority: FeedbackPriority = FeedbackPriority.NORMAL) -> None:
+    def play(self, sound_name: str, priority: FeedbackPriority = FeedbackPriority.NORMAL,
+             deadline: Optional[float] = None) -> None:
         """
         Play a sound effect with specified priority and error handling.
         
         Args:
             sound_name: Name of the sound to play (success, failure, thinking)
             priority: Priority level for the feedback
+            deadline: Seconds after which the sound is dropped if it has not
+                played yet (default FEEDBACK_SOUND_DEADLINE)
         """
         if not self.is_initialized:
             error_info = global_error_handler.handle_error(
@@ -571,7 +639,7 @@ class FeedbackModule:
             
             # Add to queue with priority
             try:
-                self._add_to_queue(feedback_item, priority)
+                self._add_to_queue(feedback_item, priority, deadline)
                 logger.debug(f"Queued sound effect: {sound_name} with priority {priority.name}")
             except Exception as e:
                 error_info = global_error_handler.handle_error(
@@ -598,13 +666,16 @@ class FeedbackModule:
             )
             logger.error(f"Error playing sound effect: {error_info.message}")
     
-    def speak(self, message: str, priority: FeedbackPriority = FeedbackPriority.NORMAL) -> None:
+    def speak(self, message: str, priority: FeedbackPriority = FeedbackPriority.NORMAL,
+              deadline: Optional[float] = None) -> None:
         """
         Speak a message using text-to-speech with specified priority.
         
         Args:
             message: Text message to speak
             priority: Priority level for the feedback
+            deadline: Seconds after which the message is dropped if it has not
+                started yet (default FEEDBACK_SPEECH_DEADLINE below HIGH priority)
         """
         if not message or not message.strip():
             logger.warning("Empty message provided for TTS")
@@ -618,13 +689,33 @@ class FeedbackModule:
             }
             
             # Add to queue with priority
-            self._add_to_queue(feedback_item, priority)
+            self._add_to_queue(feedback_item, priority, deadline)
             
             logger.debug(f"Queued TTS message: {message[:50]}... with priority {priority.name}")
             
         except Exception as e:
             logger.error(f"Error queuing TTS message: {e}")
     
+    def speak_stream(self, sentences, priority: FeedbackPriority = FeedbackPriority.NORMAL) -> None:
+        """
+        Speak a response sentence by sentence while it is still being generated.
+        
+        Args:
+            sentences: Iterable of sentences (e.g. a SpeechStream), consumed
+                when the item reaches the front of the queue
+            priority: Priority level for the feedback
+        """
+        try:
+            feedback_item = {
+                "type": FeedbackType.SPEECH_STREAM,
+                "sentences": sentences
+            }
+            self._add_to_queue(feedback_item, priority)
+            logger.debug(f"Queued streamed TTS response with priority {priority.name}")
+            
+        except Exception as e:
+            logger.error(f"Error queuing streamed TTS response: {e}")
+    
     def play_with_message(
         self, 
         sound_name: str, 
@@ -995,26 +1086,88 @@ class FeedbackModule:
         except Exception as e:
             logger.error(f"Error queuing success feedback: {e}")
     
-    def _add_to_queue(self, feedback_item: Dict[str, Any], priority: FeedbackPriority) -> None:
+    def _add_to_queue(self, feedback_item: Dict[str, Any], priority: FeedbackPriority,
+                      deadline: Optional[float] = None) -> None:
         """
         Add feedback item to the priority queue.
         
+        Pending items with the same coalescing key are replaced, and HIGH
+        priority speech interrupts lower-priority speech that is playing.
+        
         Args:
             feedback_item: Dictionary containing feedback details
             priority: Priority level for the feedback
+            deadline: Seconds until the item is stale (None: default for its type)
         """
         try:
-            # Create priority tuple (lower number = higher priority)
-            # Use negative priority value so higher enum values get higher priority
-            priority_value = -priority.value
-            timestamp = time.time()
+            channel = self._get_channel(feedback_item)
+            if deadline is None:
+                deadline = self._get_default_deadline(feedback_item, channel, priority)
+            
+            entry = self.feedback_queue.put(
+                feedback_item,
+                priority.value,
+                channel=channel,
+                timeout=deadline,
+                coalesce_key=self._get_coalesce_key(feedback_item)
+            )
             
-            # Add to priority queue
-            self.feedback_queue.put((priority_value, timestamp, feedback_item))
+            if channel == FeedbackChannel.SPEECH:
+                self._preempt_speech_for(entry)
             
         except Exception as e:
             logger.error(f"Error adding feedback to queue: {e}")
     
+    def _get_channel(self, feedback_item: Dict[str, Any]) -> FeedbackChannel:
+        """Sound-only items play on the effects channel, everything else on speech."""
+        feedback_type = feedback_item.get("type", FeedbackType.SOUND)
+        if feedback_type in (FeedbackType.SOUND, FeedbackType.HYBRID_FAST):
+            return FeedbackChannel.EFFECTS
+        if feedback_type in (FeedbackType.HYBRID_SLOW, FeedbackType.HYBRID_FALLBACK) and not feedback_item.get("message"):
+            return FeedbackChannel.EFFECTS
+        return FeedbackChannel.SPEECH
+    
+    def _get_default_deadline(self, feedback_item: Dict[str, Any], channel: FeedbackChannel,
+                              priority: FeedbackPriority) -> Optional[float]:
+        """Sound effects go stale quickly; HIGH priority speech and streamed responses never do."""
+        if channel == FeedbackChannel.EFFECTS:
+            return FEEDBACK_SOUND_DEADLINE
+        if feedback_item.get("type") == FeedbackType.SPEECH_STREAM or priority.value >= FeedbackPriority.HIGH.value:
+            return None
+        return FEEDBACK_SPEECH_DEADLINE
+    
+    def _get_coalesce_key(self, feedback_item: Dict[str, Any]) -> Optional[Hashable]:
+        """
+        Key under which a newer pending item replaces an older one.
+        
+        Identical sounds and messages are coalesced, and a newer fast/slow
+        path or deferred action status supersedes a pending older one.
+        """
+        feedback_type = feedback_item.get("type", FeedbackType.SOUND)
+        if feedback_type == FeedbackType.SPEECH_STREAM:
+            return None
+        if feedback_type in (FeedbackType.HYBRID_FAST, FeedbackType.HYBRID_SLOW, FeedbackType.HYBRID_FALLBACK):
+            return ("hybrid_path",)
+        if feedback_item.get("completion_feedback") or feedback_item.get("timeout_feedback"):
+            return ("deferred_action_status",)
+        if feedback_type == FeedbackType.SOUND:
+            return ("sound", feedback_item.get("sound_name"))
+        return ("speech", feedback_item.get("sound_name"), feedback_item.get("message"))
+    
+    def _preempt_speech_for(self, entry: QueuedFeedback) -> None:
+        """Interrupt lower-priority speech in progress when a HIGH priority item is queued."""
+        current = self._current_speech
+        if self.preempt_priority is None or current is None:
+            return
+        if entry.priority < self.preempt_priority.value or current.priority >= self.preempt_priority.value:
+            return
+        
+        stop_speaking = getattr(self.audio_module, 'stop_speaking', None)
+        if stop_speaking is not None and stop_speaking():
+            self.feedback_queue.record_preemption()
+            logger.info(f"Preempted {FeedbackPriority(current.priority).name} speech for "
+                        f"{FeedbackPriority(entry.priority).name} feedback")
+    
     def clear_queue(self, priority_threshold: Optional[FeedbackPriority] = None) -> int:
         """
         Clear feedback queue, optionally only items below a priority threshold.
@@ -1028,39 +1181,13 @@ class FeedbackModule:
         try:
             if priority_threshold is None:
                 # Clear entire queue
-                cleared_count = self.feedback_queue.qsize()
-                
-                # Create new empty queue
-                self.feedback_queue = queue.PriorityQueue()
-                
+                cleared_count = self.feedback_queue.clear()
                 logger.info(f"Cleared entire feedback queue ({cleared_count} items)")
                 return cleared_count
             
             else:
                 # Clear only items below priority threshold
-                temp_items = []
-                cleared_count = 0
-                
-                # Extract all items
-                while not self.feedback_queue.empty():
-                    try:
-                        item = self.feedback_queue.get_nowait()
-                        priority_value, timestamp, feedback_item = item
-                        
-                        # Convert back to priority enum
-                        item_priority = FeedbackPriority(-priority_value)
-                        
-                        if item_priority.value < priority_threshold.value:
-                            cleared_count += 1
-                        else:
-                            temp_items.append(item)
-                    except queue.Empty:
-                        break
-                
-                # Put back items that should remain
-                for item in temp_items:
-                    self.feedback_queue.put(item)
-                
+                cleared_count = self.feedback_queue.clear(below_priority=priority_threshold.value)
                 logger.info(f"Cleared {cleared_count} items below priority {priority_threshold.name}")
                 return cleared_count
                 
@@ -1097,23 +1224,22 @@ class FeedbackModule:
             True if all feedback completed, False if timeout
         """
         try:
-            if timeout:
-                # Wait with timeout
-                start_time = time.time()
-                while not self.feedback_queue.empty():
-                    if time.time() - start_time > timeout:
-                        return False
-                    time.sleep(0.1)
-                return True
-            else:
-                # Wait indefinitely
-                self.feedback_queue.join()
-                return True
+            return self.feedback_queue.join(timeout)
                 
         except Exception as e:
             logger.error(f"Error waiting for feedback completion: {e}")
             return False
     
+    def get_queue_metrics(self) -> Dict[str, Any]:
+        """
+        Get feedback queue metrics.
+        
+        Returns:
+            Dictionary with queue depth, played/expired/coalesced/preempted
+            counts and enqueue-to-playback latency per channel
+        """
+        return self.feedback_queue.get_metrics()
+    
     def play_fast_path_feedback(self, success: bool = True, priority: FeedbackPriority = FeedbackPriority.LOW) -> None:
         """
         Play audio feedback for fast path execution.
@@ -1313,16 +1439,22 @@ class FeedbackModule:
         try:
             logger.info("Cleaning up FeedbackModule...")
             
-            # Stop processing thread
+            # Stop processing threads
             self.is_processing = False
-            if self.processing_thread and self.processing_thread.is_alive():
-                self.processing_thread.join(timeout=2.0)
-                if self.processing_thread.is_alive():
-                    logger.warning("Feedback processing thread did not stop gracefully")
+            for thread in (self.processing_thread, self.effects_thread):
+                if thread and thread.is_alive():
+                    thread.join(timeout=2.0)
+                    if thread.is_alive():
+                        logger.warning(f"Feedback thread {thread.name} did not stop gracefully")
             
             # Clear queue
             self.clear_queue()
             
+            # Release cached phrase sounds before the mixer goes away
+            phrase_cache = getattr(self.audio_module, 'phrase_cache', None)
+            if phrase_cache is not None:
+                phrase_cache.clear_memory()
+            
             # Clean up pygame
             if self.is_initialized:
                 pygame.mixer.quit()
@@ -0,0 +1,242 @@
+# modules/feedback_queue.py
+"""
+Feedback Queue for AURA
+
+Priority queue behind FeedbackModule with:
+- Per-item deadlines: stale items (e.g. a "thinking" sound queued behind a
+  long answer) are dropped instead of played late
+- Coalescing: a pending item with the same coalescing key is replaced by
+  the newer one (identical duplicates or superseded status updates)
+- Separate channels so sound effects are not queued behind speech
+- Enqueue-to-playback latency metrics per channel
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Dict, Any, Optional, Hashable, List
+
+logger = logging.getLogger(__name__)
+
+
+class FeedbackChannel(Enum):
+    """Playback channels drained by separate worker threads."""
+    EFFECTS = "effects"
+    SPEECH = "speech"
+
+
+class QueuedFeedback:
+    """A feedback item waiting in (or taken from) the queue."""
+
+    def __init__(self, sequence: int, item: Dict[str, Any], priority: int,
+                 channel: FeedbackChannel, deadline: Optional[float] = None,
+                 coalesce_key: Optional[Hashable] = None):
+        self.sequence = sequence
+        self.item = item
+        self.priority = priority
+        self.channel = channel
+        self.deadline = deadline
+        self.coalesce_key = coalesce_key
+        self.enqueued_at = time.time()
+        self.started_at: Optional[float] = None
+
+    @property
+    def expired(self) -> bool:
+        """Whether the item's deadline has passed."""
+        return self.deadline is not None and time.time() > self.deadline
+
+
+class FeedbackQueue:
+    """
+    Thread-safe multi-channel priority queue for feedback items.
+
+    Higher priority values are taken first, ties in enqueue order. Each
+    channel is drained independently with get(); task_done() records the
+    playback latency and wakes join().
+    """
+
+    def __init__(self, metrics_window: int = 200):
+        """
+        Initialize the queue.
+
+        Args:
+            metrics_window: Number of recent latencies kept per channel
+        """
+        self._condition = threading.Condition()
+        self._sequence = itertools.count()
+        self._pending: Dict[FeedbackChannel, List[QueuedFeedback]] = {
+            channel: [] for channel in FeedbackChannel
+        }
+        self._unfinished = 0
+
+        self._latencies = {channel: deque(maxlen=metrics_window) for channel in FeedbackChannel}
+        self._stats = {
+            'enqueued': 0,
+            'played': 0,
+            'expired': 0,
+            'coalesced': 0,
+            'cleared': 0,
+            'preempted': 0,
+            'max_queue_depth': 0
+        }
+
+    def put(self, item: Dict[str, Any], priority: int,
+            channel: FeedbackChannel = FeedbackChannel.SPEECH,
+            timeout: Optional[float] = None,
+            coalesce_key: Optional[Hashable] = None) -> QueuedFeedback:
+        """
+        Queue a feedback item.
+
+        Args:
+            item: Feedback item dictionary
+            priority: Priority value (higher plays first)
+            channel: Channel the item plays on
+            timeout: Seconds until the item is stale and dropped (None: never)
+            coalesce_key: Pending items on the same channel with this key are
+                replaced by the new item
+
+        Returns:
+            The queued entry
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+        entry = QueuedFeedback(next(self._sequence), item, priority, channel, deadline, coalesce_key)
+
+        with self._condition:
+            pending = self._pending[channel]
+            if coalesce_key is not None:
+                for previous in [e for e in pending if e.coalesce_key == coalesce_key]:
+                    pending.remove(previous)
+                    self._unfinished -= 1
+                    self._stats['coalesced'] += 1
+                    entry.priority = max(entry.priority, previous.priority)
+                    logger.debug(f"Feedback item {previous.sequence} coalesced into {entry.sequence} "
+                                 f"(key: {coalesce_key})")
+
+            pending.append(entry)
+            self._unfinished += 1
+            self._stats['enqueued'] += 1
+            self._stats['max_queue_depth'] = max(self._stats['max_queue_depth'], self._depth())
+            self._condition.notify_all()
+        return entry
+
+    def get(self, channel: FeedbackChannel, timeout: Optional[float] = None) -> Optional[QueuedFeedback]:
+        """
+        Take the next item for a channel, dropping items past their deadline.
+
+        Args:
+            channel: Channel to take from
+            timeout: Maximum seconds to wait for an item
+
+        Returns:
+            The next entry, or None if none arrived in time
+        """
+        end = None if timeout is None else time.time() + timeout
+        with self._condition:
+            while True:
+                entry = self._next(channel)
+                if entry is not None:
+                    entry.started_at = time.time()
+                    return entry
+
+                remaining = None if end is None else end - time.time()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+
+    def _next(self, channel: FeedbackChannel) -> Optional[QueuedFeedback]:
+        """Pop the highest priority live entry. Caller holds the lock."""
+        pending = self._pending[channel]
+        while pending:
+            entry = max(pending, key=lambda e: (e.priority, -e.sequence))
+            pending.remove(entry)
+            if not entry.expired:
+                return entry
+            self._unfinished -= 1
+            self._stats['expired'] += 1
+            logger.debug(f"Dropped stale feedback item {entry.sequence} "
+                         f"({time.time() - entry.enqueued_at:.2f}s old)")
+        self._condition.notify_all()
+        return None
+
+    def task_done(self, entry: QueuedFeedback) -> None:
+        """Mark an entry taken with get() as played."""
+        with self._condition:
+            self._unfinished -= 1
+            self._stats['played'] += 1
+            if entry.started_at is not None:
+                self._latencies[entry.channel].append(entry.started_at - entry.enqueued_at)
+            self._condition.notify_all()
+
+    def record_preemption(self) -> None:
+        """Count speech interrupted by a higher-priority item."""
+        with self._condition:
+            self._stats['preempted'] += 1
+
+    def clear(self, below_priority: Optional[int] = None) -> int:
+        """
+        Remove pending items.
+
+        Args:
+            below_priority: Only remove items with a lower priority value
+                (all items when None)
+
+        Returns:
+            Number of removed items
+        """
+        with self._condition:
+            cleared = 0
+            for channel, pending in self._pending.items():
+                kept = [e for e in pending if below_priority is not None and e.priority >= below_priority]
+                cleared += len(pending) - len(kept)
+                self._pending[channel] = kept
+            self._unfinished -= cleared
+            self._stats['cleared'] += cleared
+            self._condition.notify_all()
+            return cleared
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued item has been played, dropped or cleared.
+
+        Returns:
+            True if the queue drained within the timeout
+        """
+        end = None if timeout is None else time.time() + timeout
+        with self._condition:
+            while self._unfinished > 0:
+                remaining = None if end is None else end - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def qsize(self) -> int:
+        """Number of pending items on all channels."""
+        with self._condition:
+            return self._depth()
+
+    def empty(self) -> bool:
+        """Whether no items are pending."""
+        return self.qsize() == 0
+
+    def _depth(self) -> int:
+        return sum(len(pending) for pending in self._pending.values())
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get queue depth, drop counts and enqueue-to-playback latency per channel."""
+        with self._condition:
+            metrics = dict(self._stats)
+            metrics['queue_depth'] = self._depth()
+            metrics['latency'] = {}
+            for channel, latencies in self._latencies.items():
+                values = sorted(latencies)
+                metrics['latency'][channel.value] = {
+                    'count': len(values),
+                    'avg': sum(values) / len(values) if values else 0.0,
+                    'p95': values[int(0.95 * (len(values) - 1))] if values else 0.0,
+                    'max': values[-1] if values else 0.0
+                }
+            return metrics
@@ -0,0 +1,417 @@
+# modules/form_filler.py
+"""
+Batched Form Filling for AURA
+
+Fills a whole form as one input stream instead of field by field:
+
+1. Every field's target is resolved in one accessibility traversal of the
+   focused window (vision coordinates are matched to the element under
+   them), which also gives the fields' Tab order and current values.
+2. Fields are filled in Tab order. Moving from a single-line text field to
+   the next focusable element uses Tab instead of a click.
+3. Clicks, select-all, typing and Tab presses are compiled into as few
+   cliclick invocations as possible, or posted through the in-process input
+   backend. Select fields still open their dropdown on their own, since the
+   menu has to appear before an option can be chosen.
+4. All filled fields are checked with one read of their values after the
+   stream has run.
+
+Without accessibility access, fields are filled in reading order with a
+click per field and the post-fill check is skipped.
+"""
+
+import logging
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+import pyautogui
+
+from config import (
+    AUTOMATION_BATCH_ENABLED, AUTOMATION_BATCH_ACTION_PAUSE_MS, AUTOMATION_BATCH_FOCUS_PAUSE_MS,
+    FORM_FILL_TAB_NAVIGATION, FORM_FILL_TRAVERSAL_DEPTH
+)
+from .ui_settle import wait_for, FocusAt, FocusedElementChanged
+
+logger = logging.getLogger(__name__)
+
+# Field types typed into (after select-all)
+TEXT_FIELD_TYPES = {'text_input', 'email', 'password', 'number', 'textarea'}
+
+# Field types Tab leaves without side effects (Tab inserts a tab character in native text views)
+SINGLE_LINE_TYPES = {'text_input', 'email', 'password', 'number'}
+
+CHECKED_VALUES = ['true', '1', 'yes', 'on', 'checked']
+SELECTED_VALUES = ['true', '1', 'yes', 'selected']
+
+
+def match_field_value(field_label: str, form_values: Dict[str, str]) -> Optional[str]:
+    """
+    Find the value for a field by label.
+
+    A value matches when its key and the field label contain one another
+    (case-insensitive).
+
+    Args:
+        field_label: Label of the form field
+        form_values: Dictionary mapping field labels to values
+
+    Returns:
+        The value, or None if no key matches
+    """
+    for label_key, value in form_values.items():
+        if label_key.lower() in field_label.lower() or field_label.lower() in label_key.lower():
+            return value
+    return None
+
+
+def field_center(coordinates: List[int]) -> Optional[Tuple[int, int]]:
+    """Center of a vision bounding box [x1, y1, x2, y2]."""
+    if len(coordinates) < 4:
+        return None
+    return (coordinates[0] + coordinates[2]) // 2, (coordinates[1] + coordinates[3]) // 2
+
+
+class FieldTarget:
+    """A form field to fill and the accessibility element resolved for it."""
+
+    def __init__(self, field: Dict[str, Any], value: str, x: int, y: int, order: int):
+        self.field = field
+        self.label = field.get('label', '')
+        self.field_type = field.get('type', 'text_input')
+        self.value = value
+        self.x = x
+        self.y = y
+        self.order = order
+        self.element: Optional[Dict[str, Any]] = None
+        self.focus_index: Optional[int] = None
+        self.result: Optional[Dict[str, Any]] = None
+
+    def filled(self, value: Any, **extra) -> None:
+        self.result = {"status": "filled", "field": self.label, "value": value, **extra}
+
+    def __repr__(self) -> str:
+        return f"FieldTarget({self.label!r}, type={self.field_type}, focus_index={self.focus_index})"
+
+
+class FormFillEngine:
+    """
+    Fills forms as one batched input stream.
+
+    Uses AutomationModule's input backend, action compiler and per-action
+    methods, so fills follow the same execution paths as action plans.
+    """
+
+    def __init__(self, automation_module, accessibility_module=None,
+                 tab_navigation: bool = FORM_FILL_TAB_NAVIGATION):
+        """
+        Initialize the engine.
+
+        Args:
+            automation_module: AutomationModule that posts the input
+            accessibility_module: Optional AccessibilityModule for target
+                resolution and post-fill verification
+            tab_navigation: Use Tab between adjacent text fields
+        """
+        self.automation = automation_module
+        self.accessibility_module = accessibility_module
+        self.tab_navigation = tab_navigation
+
+    def can_batch(self) -> bool:
+        """Whether input can be posted in process or as batched cliclick invocations."""
+        backend = self.automation.input_backend
+        if backend is not None and backend.in_process:
+            return True
+        return AUTOMATION_BATCH_ENABLED and self.automation.is_macos and self.automation.has_cliclick
+
+    def fill(self, forms: List[Dict[str, Any]], form_values: Dict[str, str]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Fill the fields of the given forms.
+
+        Args:
+            forms: Forms from vision analysis ('fields' with label, type,
+                coordinates and options)
+            form_values: Dictionary mapping field labels to values
+
+        Returns:
+            Tuple of per-field results (the same dictionaries as
+            AutomationModule._fill_form_field) and a fill summary with the
+            resolution, stream and validation details
+        """
+        start_time = time.time()
+        field_results, targets = self._plan(forms, form_values)
+
+        elements = self._snapshot()
+        resolved = self._resolve(targets, elements)
+        targets = self._order(targets, resolved)
+        resolve_time = time.time() - start_time
+
+        stream_stats = self._execute(targets)
+        validation = self._verify(targets)
+
+        for target in targets:
+            field_results.append(target.result or {
+                "status": "failed",
+                "field": target.label,
+                "error": "Field was not filled"
+            })
+
+        summary = {
+            "method": "batched",
+            "resolved_fields": resolved,
+            "resolve_time": resolve_time,
+            "validation": validation,
+            **stream_stats
+        }
+        logger.info(f"Batched form fill: {len(targets)} fields, {resolved} resolved via accessibility, "
+                    f"{stream_stats['tab_moves']} Tab moves, {stream_stats['streams']} input streams")
+        return field_results, summary
+
+    def _plan(self, forms: List[Dict[str, Any]], form_values: Dict[str, str]) -> Tuple[List[Dict[str, Any]], List[FieldTarget]]:
+        """Match values to fields; fields without a value or usable coordinates get their result now."""
+        results, targets = [], []
+        for form in forms:
+            for field in form.get('fields', []):
+                field_label = field.get('label', '')
+                field_type = field.get('type', 'text_input')
+                value = match_field_value(field_label, form_values)
+
+                if value is None:
+                    results.append({"status": "skipped", "field": field_label, "reason": "No value provided for field"})
+                    continue
+
+                center = field_center(field.get('coordinates', [0, 0, 0, 0]))
+                if center is None:
+                    logger.warning(f"Invalid coordinates for field {field_label}")
+                    results.append({"status": "failed", "field": field_label, "error": "Invalid field coordinates"})
+                    continue
+
+                if field_type not in TEXT_FIELD_TYPES | {'select', 'checkbox', 'radio'}:
+                    results.append({"status": "skipped", "field": field_label,
+                                    "reason": f"Unsupported field type: {field_type}"})
+                    continue
+
+                if field_type == 'radio' and value.lower() not in SELECTED_VALUES:
+                    results.append({"status": "skipped", "field": field_label,
+                                    "reason": "Radio button not selected based on value"})
+                    continue
+
+                targets.append(FieldTarget(field, value, center[0], center[1], len(targets)))
+        return results, targets
+
+    def _snapshot(self) -> List[Dict[str, Any]]:
+        """All focusable elements of the focused window, in Tab order (one traversal)."""
+        if self.accessibility_module is None:
+            return []
+        try:
+            return self.accessibility_module.get_focusable_elements(max_depth=FORM_FILL_TRAVERSAL_DEPTH)
+        except Exception as e:
+            logger.debug(f"Accessibility snapshot for form filling failed: {e}")
+            return []
+
+    def _resolve(self, targets: List[FieldTarget], elements: List[Dict[str, Any]]) -> int:
+        """Match each field to the focusable element under its center point."""
+        resolved = 0
+        for target in targets:
+            best = None
+            for index, element in enumerate(elements):
+                x, y, width, height = element['coordinates'][:4]
+                if x <= target.x <= x + width and y <= target.y <= y + height:
+                    # Prefer the smallest element containing the point
+                    if best is None or width * height < best[1]:
+                        best = (index, width * height)
+            if best is not None:
+                target.focus_index = best[0]
+                target.element = elements[best[0]]
+                resolved += 1
+        return resolved
+
+    @staticmethod
+    def _order(targets: List[FieldTarget], resolved: int) -> List[FieldTarget]:
+        """Tab order when every field was resolved, reading order otherwise."""
+        if targets and resolved == len(targets):
+            return sorted(targets, key=lambda t: t.focus_index)
+        return sorted(targets, key=lambda t: (t.y, t.x, t.order))
+
+    def _uses_tab(self, previous: Optional[FieldTarget], target: FieldTarget) -> bool:
+        """Whether Tab from the previous field lands on this one."""
+        return (self.tab_navigation and previous is not None
+                and previous.field_type in SINGLE_LINE_TYPES
+                and previous.focus_index is not None and target.focus_index is not None
+                and target.focus_index == previous.focus_index + 1)
+
+    def _field_actions(self, previous: Optional[FieldTarget], target: FieldTarget) -> Optional[List[Dict[str, Any]]]:
+        """Actions that fill a field, or None if it can't go into the stream."""
+        if target.field_type == 'select':
+            return None
+
+        if target.field_type in TEXT_FIELD_TYPES:
+            select_all = ['cmd', 'a'] if self.automation.is_macos else ['ctrl', 'a']
+            if self._uses_tab(previous, target):
+                actions = [{"action": "key", "key": "tab"}]
+            else:
+                actions = [{"action": "click", "coordinates": [target.x, target.y]}]
+            actions.append({"action": "hotkey", "keys": select_all})
+            if target.value:
+                actions.append({"action": "type", "text": target.value})
+            else:
+                actions.append({"action": "key", "key": "delete"})
+            target.filled(target.value)
+            return actions
+
+        if target.field_type == 'checkbox':
+            should_check = target.value.lower() in CHECKED_VALUES
+            target.filled(str(should_check))
+            current = self._current_toggle(target)
+            if current is not None and current == should_check:
+                # Already in the requested state; a click would flip it
+                return []
+            return [{"action": "click", "coordinates": [target.x, target.y]}]
+
+        # Radio button to select
+        target.filled("selected")
+        if self._current_toggle(target):
+            return []
+        return [{"action": "click", "coordinates": [target.x, target.y]}]
+
+    @staticmethod
+    def _current_toggle(target: FieldTarget) -> Optional[bool]:
+        if target.element is None or target.element.get('value') is None:
+            return None
+        try:
+            return bool(int(target.element['value']))
+        except (TypeError, ValueError):
+            return None
+
+    def _execute(self, targets: List[FieldTarget]) -> Dict[str, Any]:
+        """Fill all targets, streaming everything except select fields."""
+        stats = {"streams": 0, "stream_actions": 0, "tab_moves": 0, "separate_fields": 0}
+        stream: List[Dict[str, Any]] = []
+        stream_targets: List[FieldTarget] = []
+        previous: Optional[FieldTarget] = None
+
+        def flush() -> None:
+            if stream:
+                stats["streams"] += 1
+                stats["stream_actions"] += len(stream)
+                error = self._run_stream(list(stream))
+                if error:
+                    for streamed in stream_targets:
+                        streamed.result = {"status": "failed", "field": streamed.label, "error": error}
+            stream.clear()
+            stream_targets.clear()
+
+        for target in targets:
+            actions = self._field_actions(previous, target)
+            if actions is None:
+                flush()
+                stats["separate_fields"] += 1
+                target.result = self.automation._fill_select_field(
+                    target.x, target.y, target.value, target.label, target.field.get('options', []))
+                previous = None
+                continue
+
+            if actions and actions[0].get("key") == "tab":
+                stats["tab_moves"] += 1
+            stream.extend(actions)
+            stream_targets.append(target)
+            previous = target
+        flush()
+        return stats
+
+    def _run_stream(self, actions: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Post a stream of click/type/key/hotkey actions.
+
+        Returns:
+            None on success, or an error message
+        """
+        backend = self.automation.input_backend
+        try:
+            if backend is not None and backend.in_process:
+                self._run_in_process(actions)
+            else:
+                for segment in self.automation.action_compiler.compile(actions):
+                    if segment.batched and self.automation._execute_compiled_segment(segment, actions):
+                        continue
+                    for i in segment.action_indices:
+                        self._run_action(actions[i])
+        except Exception as e:
+            logger.error(f"Form fill input stream failed: {e}")
+            return str(e)
+        finally:
+            self.automation._notify_ui_changed("fill_form")
+        return None
+
+    def _run_in_process(self, actions: List[Dict[str, Any]]) -> None:
+        """Post actions through the in-process backend, waiting only for focus moves."""
+        for action in actions:
+            action_type = action["action"]
+            if action_type == "click":
+                x, y = action["coordinates"]
+                posted = self.automation._inject('click', x, y)
+                if posted:
+                    wait_for(FocusAt(x, y), timeout=0.3, fallback=AUTOMATION_BATCH_FOCUS_PAUSE_MS / 1000)
+            elif action_type == "key" and action["key"] == "tab":
+                moved = FocusedElementChanged()
+                posted = self.automation._inject('key', 'tab')
+                if posted:
+                    wait_for(moved, timeout=0.3, fallback=AUTOMATION_BATCH_ACTION_PAUSE_MS / 1000)
+                else:
+                    moved.close()
+            elif action_type == "key":
+                posted = self.automation._inject('key', action["key"])
+            elif action_type == "hotkey":
+                posted = self.automation._inject('hotkey', action["keys"])
+            else:
+                posted = self.automation._inject_text(action["text"])
+
+            if not posted:
+                self._run_action(action)
+
+    def _run_action(self, action: Dict[str, Any]) -> None:
+        """Post one stream action with the per-action methods."""
+        action_type = action["action"]
+        if action_type in ("click", "type"):
+            self.automation.execute_action(action)
+        elif action_type == "key":
+            if self.automation.is_macos:
+                self.automation._macos_key(action["key"])
+            else:
+                pyautogui.press(action["key"])
+        elif self.automation.is_macos:
+            self.automation._macos_hotkey(action["keys"])
+        else:
+            pyautogui.hotkey(*action["keys"])
+
+    def _verify(self, targets: List[FieldTarget]) -> Dict[str, Any]:
+        """Check every filled, resolved field with one read of the element values."""
+        checkable = [t for t in targets
+                     if t.element is not None and t.result and t.result["status"] == "filled"
+                     and t.field_type != 'password' and t.element.get('role') != 'AXSecureTextField']
+        if self.accessibility_module is None or not checkable:
+            return {"available": False, "checked": 0, "mismatched": []}
+
+        try:
+            values = self.accessibility_module.read_element_values([t.element['element'] for t in checkable])
+        except Exception as e:
+            logger.debug(f"Post-fill value check failed: {e}")
+            return {"available": False, "checked": 0, "mismatched": []}
+
+        mismatched = []
+        for target, actual in zip(checkable, values):
+            if actual is None:
+                continue
+            if target.field_type in TEXT_FIELD_TYPES:
+                expected = target.result["value"]
+                matches = str(actual) == expected
+            else:
+                expected = True if target.field_type == 'radio' else target.result["value"] == "True"
+                try:
+                    matches = bool(int(actual)) == expected
+                except (TypeError, ValueError):
+                    continue
+            if not matches:
+                mismatched.append({"field": target.label, "expected": expected, "actual": actual})
+                target.result["warning"] = f"Field '{target.label}' shows a different value after filling"
+
+        return {"available": True, "checked": len(checkable), "mismatched": mismatched}
@@ -0,0 +1,88 @@
+# modules/idle_power.py
+"""
+Idle Power Mode for AURA
+
+A process-wide idle flag set while AURA waits for the wake word.
+Non-essential background workers (health checks, permission monitoring,
+dashboard updates, cache cleanup and prefetching) call wait_until_active()
+before each round of work and stay suspended until the wake word fires,
+so an idle machine isn't woken up by periodic housekeeping. Wake word
+listening itself is kept cheap by the WakeWordGate (modules/wake_word_gate.py).
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+class IdlePowerState:
+    """
+    Process-wide idle flag for suspending non-essential background work.
+    """
+
+    def __init__(self):
+        """Initialize in the active state."""
+        self._active = threading.Event()
+        self._active.set()
+        self._lock = threading.Lock()
+        self._idle_since: Optional[float] = None
+        self.idle_periods = 0
+        self.total_idle_time = 0.0
+
+    @property
+    def is_idle(self) -> bool:
+        """Whether AURA is waiting for the wake word."""
+        return not self._active.is_set()
+
+    def enter_idle(self) -> None:
+        """Suspend background workers until exit_idle() is called."""
+        with self._lock:
+            if self._active.is_set():
+                self._active.clear()
+                self._idle_since = time.time()
+                self.idle_periods += 1
+                logger.debug("Entered idle power mode")
+
+    def exit_idle(self) -> None:
+        """Resume background workers."""
+        with self._lock:
+            if not self._active.is_set():
+                self.total_idle_time += time.time() - self._idle_since
+                self._idle_since = None
+                self._active.set()
+                logger.debug("Left idle power mode")
+
+    def wait_until_active(self, should_stop: Optional[Callable[[], bool]] = None,
+                          poll_interval: float = 5.0) -> bool:
+        """
+        Block while AURA is idle.
+
+        Args:
+            should_stop: Worker stop condition (e.g. stop_event.is_set),
+                checked every poll_interval so shutdown isn't held up
+            poll_interval: Seconds between stop checks
+
+        Returns:
+            True when active, False if the worker should stop
+        """
+        while not self._active.wait(poll_interval):
+            if should_stop is not None and should_stop():
+                return False
+        return should_stop is None or not should_stop()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get idle time statistics."""
+        with self._lock:
+            current = time.time() - self._idle_since if self._idle_since is not None else 0.0
+            return {
+                'idle': self.is_idle,
+                'idle_periods': self.idle_periods,
+                'total_idle_time': self.total_idle_time + current
+            }
+
+
+# Shared idle state so every background worker follows the wake word loop
+idle_power = IdlePowerState()
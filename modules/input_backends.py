@@ -0,0 +1,321 @@
+# modules/input_backends.py
+"""
+Input Injection Backends for AURA
+
+Pluggable interface for posting mouse and keyboard input, selected once at
+startup by AutomationModule:
+
+- "quartz": in-process Quartz CGEvents and NSPasteboard on macOS. No
+  process start-up per action, so an action costs microseconds instead of
+  tens of milliseconds.
+- "cliclick": the cliclick command line tool (one process per call). Kept
+  as the fallback when PyObjC's Quartz bindings aren't available.
+- "recording": records events without posting them, for tests on machines
+  without a display.
+
+Every method returns True if the input was posted and False otherwise, so
+callers can fall back to another method.
+"""
+
+import logging
+import subprocess
+import time
+from typing import Dict, Any, List, Optional, Type
+
+from .action_compiler import KEY_NAMES, MODIFIER_NAMES, PASTE_COMMANDS, hotkey_commands, key_commands
+
+# Quartz event posting and the pasteboard (macOS only)
+try:
+    import Quartz
+    from AppKit import NSPasteboard, NSPasteboardTypeString
+    QUARTZ_AVAILABLE = True
+except ImportError:
+    QUARTZ_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class InputBackend:
+    """
+    Base class for input injection backends.
+
+    in_process backends post input directly; others start a helper process
+    per call and are better driven through batched command lines.
+    """
+
+    name = "base"
+    in_process = False
+
+    def click(self, x: int, y: int) -> bool:
+        """Left click at screen coordinates."""
+        raise NotImplementedError
+
+    def double_click(self, x: int, y: int) -> bool:
+        """Double click at screen coordinates."""
+        raise NotImplementedError
+
+    def type_text(self, text: str) -> bool:
+        """Type text keystroke by keystroke."""
+        raise NotImplementedError
+
+    def paste_text(self, text: str) -> bool:
+        """Put text on the clipboard and paste it with Cmd+V."""
+        raise NotImplementedError
+
+    def key(self, key: str) -> bool:
+        """Press a single key (e.g. 'return', 'tab')."""
+        raise NotImplementedError
+
+    def hotkey(self, keys: List[str]) -> bool:
+        """Press a key combination such as ['cmd', 'a']."""
+        raise NotImplementedError
+
+    def scroll(self, direction: str, amount: int) -> bool:
+        """Scroll up, down, left or right by amount pixels."""
+        raise NotImplementedError
+
+    def describe(self) -> Dict[str, Any]:
+        """Describe the backend for logging and benchmarks."""
+        return {'backend': self.name, 'in_process': self.in_process}
+
+
+class QuartzInputBackend(InputBackend):
+    """In-process CGEvent/NSPasteboard backend."""
+
+    name = "quartz"
+    in_process = True
+
+    # Virtual key codes (US layout) for keys pressed by name
+    KEY_CODES = {
+        'a': 0, 's': 1, 'd': 2, 'f': 3, 'h': 4, 'g': 5, 'z': 6, 'x': 7, 'c': 8, 'v': 9,
+        'b': 11, 'q': 12, 'w': 13, 'e': 14, 'r': 15, 'y': 16, 't': 17, '1': 18, '2': 19,
+        '3': 20, '4': 21, '6': 22, '5': 23, '=': 24, '9': 25, '7': 26, '-': 27, '8': 28,
+        '0': 29, ']': 30, 'o': 31, 'u': 32, '[': 33, 'i': 34, 'p': 35, 'l': 37, 'j': 38,
+        "'": 39, 'k': 40, ';': 41, '\\': 42, ',': 43, '/': 44, 'n': 45, 'm': 46, '.': 47,
+        '`': 50, 'return': 36, 'tab': 48, 'space': 49, 'delete': 51, 'esc': 53,
+        'home': 115, 'page-up': 116, 'fwd-delete': 117, 'end': 119, 'page-down': 121,
+        'arrow-left': 123, 'arrow-right': 124, 'arrow-down': 125, 'arrow-up': 126,
+        'left': 123, 'right': 124, 'down': 125, 'up': 126
+    }
+
+    # Unicode characters per keyboard event when typing
+    TYPE_CHUNK = 20
+
+    def __init__(self):
+        if not QUARTZ_AVAILABLE:
+            raise RuntimeError("Quartz bindings (pyobjc-framework-Quartz) are not available")
+        self._flags = {
+            'cmd': Quartz.kCGEventFlagMaskCommand,
+            'ctrl': Quartz.kCGEventFlagMaskControl,
+            'alt': Quartz.kCGEventFlagMaskAlternate,
+            'shift': Quartz.kCGEventFlagMaskShift
+        }
+
+    def _post_mouse(self, event_type, x: int, y: int, click_state: int = 1) -> None:
+        event = Quartz.CGEventCreateMouseEvent(None, event_type, (x, y), Quartz.kCGMouseButtonLeft)
+        Quartz.CGEventSetIntegerValueField(event, Quartz.kCGMouseEventClickState, click_state)
+        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+    def _post_key(self, key_code: int, flags: int = 0) -> None:
+        for down in (True, False):
+            event = Quartz.CGEventCreateKeyboardEvent(None, key_code, down)
+            if flags:
+                Quartz.CGEventSetFlags(event, flags)
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+    def click(self, x: int, y: int) -> bool:
+        self._post_mouse(Quartz.kCGEventMouseMoved, x, y)
+        self._post_mouse(Quartz.kCGEventLeftMouseDown, x, y)
+        self._post_mouse(Quartz.kCGEventLeftMouseUp, x, y)
+        return True
+
+    def double_click(self, x: int, y: int) -> bool:
+        self._post_mouse(Quartz.kCGEventMouseMoved, x, y)
+        for click_state in (1, 2):
+            self._post_mouse(Quartz.kCGEventLeftMouseDown, x, y, click_state)
+            self._post_mouse(Quartz.kCGEventLeftMouseUp, x, y, click_state)
+        return True
+
+    def type_text(self, text: str) -> bool:
+        for start in range(0, len(text), self.TYPE_CHUNK):
+            chunk = text[start:start + self.TYPE_CHUNK]
+            length = len(chunk.encode('utf-16-le')) // 2
+            for down in (True, False):
+                event = Quartz.CGEventCreateKeyboardEvent(None, 0, down)
+                Quartz.CGEventKeyboardSetUnicodeString(event, length, chunk)
+                Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+        return True
+
+    def paste_text(self, text: str) -> bool:
+        pasteboard = NSPasteboard.generalPasteboard()
+        pasteboard.clearContents()
+        if not pasteboard.setString_forType_(text, NSPasteboardTypeString):
+            logger.warning("Quartz backend: could not write text to the pasteboard")
+            return False
+        return self.hotkey(['cmd', 'v'])
+
+    def key(self, key: str) -> bool:
+        name = KEY_NAMES.get(key.lower(), key.lower())
+        key_code = self.KEY_CODES.get(name)
+        if key_code is None:
+            logger.debug(f"Quartz backend: no key code for '{key}'")
+            return False
+        self._post_key(key_code)
+        return True
+
+    def hotkey(self, keys: List[str]) -> bool:
+        if not keys:
+            return False
+        flags = 0
+        for modifier in keys[:-1]:
+            name = MODIFIER_NAMES.get(modifier.lower())
+            if name:
+                flags |= self._flags[name]
+        main_key = KEY_NAMES.get(keys[-1].lower(), keys[-1].lower())
+        key_code = self.KEY_CODES.get(main_key)
+        if key_code is None:
+            logger.debug(f"Quartz backend: no key code for '{keys[-1]}'")
+            return False
+        self._post_key(key_code, flags)
+        return True
+
+    def scroll(self, direction: str, amount: int) -> bool:
+        vertical = {'up': amount, 'down': -amount}.get(direction, 0)
+        horizontal = {'left': amount, 'right': -amount}.get(direction, 0)
+        event = Quartz.CGEventCreateScrollWheelEvent(None, Quartz.kCGScrollEventUnitPixel, 2,
+                                                     vertical, horizontal)
+        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+        return True
+
+
+class CliclickInputBackend(InputBackend):
+    """cliclick backend: one cliclick (and pbcopy) process per call."""
+
+    name = "cliclick"
+    in_process = False
+
+    def __init__(self, timeout: float = 5.0):
+        self.timeout = timeout
+
+    def run(self, commands: List[str], timeout: Optional[float] = None) -> bool:
+        """Run one cliclick invocation with the given commands."""
+        try:
+            result = subprocess.run(['cliclick'] + commands, capture_output=True, text=True,
+                                    timeout=timeout or self.timeout)
+        except (subprocess.TimeoutExpired, OSError) as e:
+            logger.warning(f"cliclick {' '.join(commands)} failed: {e}")
+            return False
+        if result.returncode != 0:
+            logger.warning(f"cliclick {' '.join(commands)} failed: {result.stderr.strip()}")
+            return False
+        return True
+
+    def click(self, x: int, y: int) -> bool:
+        return self.run([f"c:{x},{y}"])
+
+    def double_click(self, x: int, y: int) -> bool:
+        return self.run([f"dc:{x},{y}"])
+
+    def type_text(self, text: str) -> bool:
+        return self.run([f"t:{text}"])
+
+    def paste_text(self, text: str) -> bool:
+        try:
+            copy = subprocess.run(['pbcopy'], input=text, text=True, capture_output=True, timeout=self.timeout)
+        except (subprocess.TimeoutExpired, OSError) as e:
+            logger.warning(f"pbcopy failed: {e}")
+            return False
+        return copy.returncode == 0 and self.run(list(PASTE_COMMANDS))
+
+    def key(self, key: str) -> bool:
+        return self.run(key_commands(key))
+
+    def hotkey(self, keys: List[str]) -> bool:
+        commands = hotkey_commands(keys)
+        return bool(commands) and self.run(commands)
+
+    def scroll(self, direction: str, amount: int) -> bool:
+        # cliclick has no scroll command
+        return False
+
+
+class RecordingInputBackend(InputBackend):
+    """Records input events instead of posting them (tests, dry runs)."""
+
+    name = "recording"
+    in_process = True
+
+    def __init__(self):
+        self.events: List[Dict[str, Any]] = []
+
+    def _record(self, event_type: str, **details) -> bool:
+        self.events.append({'type': event_type, 'timestamp': time.time(), **details})
+        return True
+
+    def click(self, x: int, y: int) -> bool:
+        return self._record('click', x=x, y=y)
+
+    def double_click(self, x: int, y: int) -> bool:
+        return self._record('double_click', x=x, y=y)
+
+    def type_text(self, text: str) -> bool:
+        return self._record('type', text=text)
+
+    def paste_text(self, text: str) -> bool:
+        return self._record('paste', text=text)
+
+    def key(self, key: str) -> bool:
+        return self._record('key', key=key)
+
+    def hotkey(self, keys: List[str]) -> bool:
+        return self._record('hotkey', keys=list(keys))
+
+    def scroll(self, direction: str, amount: int) -> bool:
+        return self._record('scroll', direction=direction, amount=amount)
+
+    def clear(self) -> None:
+        """Forget recorded events."""
+        self.events.clear()
+
+
+# Registered backends by name
+INPUT_BACKENDS: Dict[str, Type[InputBackend]] = {
+    QuartzInputBackend.name: QuartzInputBackend,
+    CliclickInputBackend.name: CliclickInputBackend,
+    RecordingInputBackend.name: RecordingInputBackend
+}
+
+
+def create_input_backend(name: str, is_macos: bool, has_cliclick: bool) -> Optional[InputBackend]:
+    """
+    Create the input backend to use for this process.
+
+    Args:
+        name: "auto", "none" or a registered backend name. "auto" picks
+            Quartz on macOS when available, then cliclick.
+        is_macos: Whether running on macOS
+        has_cliclick: Whether cliclick is installed
+
+    Returns:
+        InputBackend instance, or None to use the built-in per-platform
+        methods (AppleScript on macOS, PyAutoGUI elsewhere)
+    """
+    if name == "none":
+        return None
+
+    if name == "auto":
+        if is_macos and QUARTZ_AVAILABLE:
+            name = QuartzInputBackend.name
+        elif is_macos and has_cliclick:
+            name = CliclickInputBackend.name
+        else:
+            return None
+
+    if name not in INPUT_BACKENDS:
+        raise ValueError(f"Unknown input backend '{name}'. Available: {', '.join(sorted(INPUT_BACKENDS))}")
+
+    try:
+        return INPUT_BACKENDS[name]()
+    except Exception as e:
+        logger.warning(f"Input backend '{name}' unavailable ({e}), using built-in automation methods")
+        return None
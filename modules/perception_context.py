@@ -0,0 +1,257 @@
+# modules/perception_context.py
+"""
+Per-Command Perception Context for AURA
+
+Memoizes screen perception results for the lifetime of a single command so
+that handlers and orchestrator helpers share one screenshot, one vision
+description per analysis type, one accessibility snapshot per query and one
+active-application lookup. The context is invalidated automatically whenever
+the automation module reports an action that mutates the UI.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Any, Optional, Callable, List, Tuple
+
+from config import PERCEPTION_CONTEXT_MAX_AGE
+from .vision_scheduler import VisionRequestPriority
+from .screenshot_profiles import screenshot_profiles
+from .ui_element_detector import hints_signature
+
+logger = logging.getLogger(__name__)
+
+
+class PerceptionContext:
+    """
+    Shared perception state for one command execution.
+
+    Results are keyed by namespace and cached until either the context is
+    invalidated (for example after a click or keystroke) or the entry is
+    older than PERCEPTION_CONTEXT_MAX_AGE seconds. Values computed while an
+    invalidation happens are discarded rather than stored, so a handler never
+    receives a result that was captured before the UI changed.
+    """
+
+    def __init__(self, execution_id: str, vision_module=None, accessibility_module=None,
+                 application_detector=None, max_age: float = PERCEPTION_CONTEXT_MAX_AGE):
+        """
+        Initialize the perception context.
+
+        Args:
+            execution_id: Identifier of the command this context belongs to
+            vision_module: VisionModule used for screenshots and descriptions
+            accessibility_module: AccessibilityModule used for snapshots and app info
+            application_detector: Optional ApplicationDetector for detailed app info
+            max_age: Maximum age in seconds before a cached entry is refreshed
+        """
+        self.execution_id = execution_id
+        self.vision_module = vision_module
+        self.accessibility_module = accessibility_module
+        self.application_detector = application_detector
+        self.max_age = max_age
+
+        self._cache: Dict[Tuple[str, Any], Tuple[float, Any]] = {}
+        self._lock = threading.RLock()
+        self._generation = 0
+        self._attached_automation = None
+
+        self.created_at = time.time()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.last_invalidation_reason: Optional[str] = None
+
+    @property
+    def generation(self) -> int:
+        """Number of invalidations seen so far; changes whenever the UI changes."""
+        return self._generation
+
+    def _get_or_compute(self, namespace: str, key: Any, producer: Callable[[], Any]) -> Any:
+        """
+        Return a cached value or compute, store and return it.
+
+        Args:
+            namespace: Cache namespace (e.g. "vision", "accessibility")
+            key: Key within the namespace
+            producer: Zero-argument callable producing the value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        cache_key = (namespace, key)
+        now = time.time()
+
+        with self._lock:
+            entry = self._cache.get(cache_key)
+            if entry is not None and now - entry[0] <= self.max_age:
+                self.hits += 1
+                logger.debug(f"[{self.execution_id}] Perception cache hit: {namespace}/{key}")
+                return entry[1]
+            self.misses += 1
+            generation = self._generation
+
+        # Compute outside the lock so slow vision calls don't block other lookups
+        value = producer()
+
+        with self._lock:
+            if generation == self._generation and value is not None:
+                self._cache[cache_key] = (time.time(), value)
+            elif generation != self._generation:
+                logger.debug(f"[{self.execution_id}] Discarding {namespace}/{key}: UI changed during capture")
+
+        return value
+
+    def get_screenshot(self, analysis_type: Optional[str] = None) -> Optional[str]:
+        """
+        Get the base64 screenshot for the current UI state.
+
+        Screenshots are memoized per encoding profile, so analysis types that
+        share a profile also share one capture.
+
+        Args:
+            analysis_type: Analysis type whose encoding profile to use
+
+        Returns:
+            Base64 encoded screenshot, or None if no vision module is available
+        """
+        if not self.vision_module:
+            return None
+        profile = screenshot_profiles.get_profile(analysis_type)
+        return self._get_or_compute(
+            "screenshot", profile.key,
+            lambda: self.vision_module.capture_screen_as_base64(analysis_type=analysis_type)
+        )
+
+    def describe_screen(self, analysis_type: str = "simple",
+                        priority=VisionRequestPriority.INTERACTIVE,
+                        hints: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Get the vision description for the current UI state.
+
+        Analysis types with the same encoding profile share one memoized
+        screenshot, so a command that asks for both a "detailed" and a
+        "clickable" description only captures the screen once.
+
+        Args:
+            analysis_type: Vision analysis type (simple, detailed, form, clickable)
+            priority: Vision request priority used if the description isn't cached
+            hints: Optional local detector candidates passed to the vision model
+
+        Returns:
+            Screen analysis dictionary from the vision module
+        """
+        if not self.vision_module:
+            raise RuntimeError("Vision module not available for perception")
+
+        def produce():
+            screenshot = self.get_screenshot(analysis_type)
+            if hints:
+                return self.vision_module.describe_screen(
+                    analysis_type=analysis_type,
+                    screenshot_b64=screenshot,
+                    priority=priority,
+                    hints=hints
+                )
+            return self.vision_module.describe_screen(
+                analysis_type=analysis_type,
+                screenshot_b64=screenshot,
+                priority=priority
+            )
+
+        key = (analysis_type, hints_signature(hints)) if hints else analysis_type
+        return self._get_or_compute("vision", key, produce)
+
+    def get_accessibility_snapshot(self, key: Any, producer: Callable[[], Any]) -> Any:
+        """
+        Memoize an accessibility query for the current UI state.
+
+        Args:
+            key: Hashable description of the query (e.g. ("role", "AXScrollArea"))
+            producer: Callable that performs the query
+
+        Returns:
+            Query result
+        """
+        return self._get_or_compute("accessibility", key, producer)
+
+    def get_active_application(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the active application from the accessibility module.
+
+        Returns:
+            Active application dictionary or None
+        """
+        if not self.accessibility_module:
+            return None
+        return self._get_or_compute("app", "active", self.accessibility_module.get_active_application)
+
+    def get_application_info(self):
+        """
+        Get detailed active application info from the application detector.
+
+        Returns:
+            ApplicationInfo object or None
+        """
+        if not self.application_detector:
+            return None
+        return self._get_or_compute("app", "info", self.application_detector.get_active_application_info)
+
+    def invalidate(self, reason: str = "manual") -> None:
+        """
+        Drop every cached perception result.
+
+        Args:
+            reason: Why the context was invalidated (logged and kept for diagnostics)
+        """
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            self.last_invalidation_reason = reason
+            cleared = len(self._cache)
+            self._cache.clear()
+
+        logger.debug(f"[{self.execution_id}] Perception context invalidated ({reason}), {cleared} entries cleared")
+
+    def _on_ui_changed(self, action_type: str) -> None:
+        """Automation listener callback."""
+        self.invalidate(f"automation:{action_type}")
+
+    def attach(self, automation_module) -> None:
+        """
+        Subscribe to UI-mutation notifications from the automation module.
+
+        Args:
+            automation_module: AutomationModule to listen to
+        """
+        if automation_module is None or not hasattr(automation_module, 'add_ui_change_listener'):
+            return
+        automation_module.add_ui_change_listener(self._on_ui_changed)
+        self._attached_automation = automation_module
+
+    def detach(self) -> None:
+        """Unsubscribe from automation notifications and release cached data."""
+        if self._attached_automation is not None:
+            try:
+                self._attached_automation.remove_ui_change_listener(self._on_ui_changed)
+            except Exception as e:
+                logger.debug(f"[{self.execution_id}] Failed to detach perception context: {e}")
+            self._attached_automation = None
+
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics for this context."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'execution_id': self.execution_id,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate_percent': (self.hits / total * 100) if total > 0 else 0.0,
+                'invalidations': self.invalidations,
+                'last_invalidation_reason': self.last_invalidation_reason,
+                'cached_entries': len(self._cache),
+                'age_seconds': time.time() - self.created_at
+            }
@@ -40,6 +40,8 @@ from config import (
     MAX_SCREENSHOT_SIZE
 )
 
+from .idle_power import idle_power
+
 logger = logging.getLogger(__name__)
 
 
@@ -185,12 +187,14 @@ class ImageCache:
         
         logger.info(f"Image cache initialized: {max_size_mb}MB, {max_entries} entries")
     
-    def _generate_cache_key(self, image_data: bytes, quality: int = None) -> str:
+    def _generate_cache_key(self, image_data: bytes, quality: int = None, grayscale: bool = False) -> str:
         """Generate cache key from image data."""
         hasher = hashlib.md5()
         hasher.update(image_data)
         if quality:
             hasher.update(str(quality).encode())
+        if grayscale:
+            hasher.update(b"gray")
         return hasher.hexdigest()
     
     def _evict_lru_entries(self, required_space: int) -> None:
@@ -218,18 +222,20 @@ class ImageCache:
         
         logger.debug(f"Evicted {entries_removed} cache entries, freed {freed_space} bytes")
     
-    def get_compressed_image(self, image_data: bytes, quality: int = SCREENSHOT_QUALITY) -> Optional[str]:
+    def get_compressed_image(self, image_data: bytes, quality: int = SCREENSHOT_QUALITY,
+                             grayscale: bool = False) -> Optional[str]:
         """
         Get compressed image from cache or compress and cache it.
         
         Args:
             image_data: Raw image data
             quality: JPEG compression quality (1-100)
+            grayscale: Keep the image single-channel instead of converting to RGB
             
         Returns:
             Base64 encoded compressed image or None if error
         """
-        cache_key = self._generate_cache_key(image_data, quality)
+        cache_key = self._generate_cache_key(image_data, quality, grayscale)
         
         with self.cache_lock:
             # Check cache first
@@ -252,7 +258,7 @@ class ImageCache:
         
         # Compress image
         try:
-            compressed_data = self._compress_image(image_data, quality)
+            compressed_data = self._compress_image(image_data, quality, grayscale)
             if not compressed_data:
                 return None
             
@@ -284,13 +290,14 @@ class ImageCache:
             logger.error(f"Image compression failed: {e}")
             return None
     
-    def _compress_image(self, image_data: bytes, quality: int) -> Optional[str]:
+    def _compress_image(self, image_data: bytes, quality: int, grayscale: bool = False) -> Optional[str]:
         """
         Compress image data to base64 JPEG.
         
         Args:
             image_data: Raw image data
             quality: JPEG compression quality
+            grayscale: Encode as single-channel grayscale
             
         Returns:
             Base64 encoded compressed image
@@ -299,9 +306,10 @@ class ImageCache:
             # Load image
             image = Image.open(io.BytesIO(image_data))
             
-            # Convert to RGB if necessary
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
+            # Convert to the target color mode if necessary
+            target_mode = 'L' if grayscale else 'RGB'
+            if image.mode != target_mode:
+                image = image.convert(target_mode)
             
             # Resize if too large
             if image.width > MAX_SCREENSHOT_SIZE or image.height > MAX_SCREENSHOT_SIZE:
@@ -702,6 +710,10 @@ class PerformanceMonitor:
                 if not self.monitoring_active:
                     break
                 
+                # Suspended while waiting for the wake word
+                if not idle_power.wait_until_active(lambda: not self.monitoring_active):
+                    break
+                
                 # Get system metrics
                 cpu_percent = psutil.cpu_percent(interval=1)
                 memory = psutil.virtual_memory()
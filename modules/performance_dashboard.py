@@ -15,6 +15,8 @@ from datetime import datetime, timedelta
 import json
 import statistics
 
+from .idle_power import idle_power
+
 
 @dataclass
 class PerformanceTrend:
@@ -83,6 +85,9 @@ class PerformanceDashboard:
         """Start background dashboard update thread."""
         def update_worker():
             while not self._stop_updates.wait(self.update_interval):
+                # Suspended while waiting for the wake word
+                if not idle_power.wait_until_active(self._stop_updates.is_set):
+                    break
                 try:
                     self._update_dashboard_data()
                     self._analyze_performance_trends()
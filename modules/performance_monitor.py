@@ -17,6 +17,8 @@ import json
 import statistics
 from datetime import datetime, timedelta
 
+from .idle_power import idle_power
+
 
 @dataclass
 class PerformanceMetric:
@@ -238,6 +240,9 @@ class PerformanceMonitor:
         """Start background cleanup thread."""
         def cleanup_worker():
             while not self._stop_cleanup.wait(60):  # Run every minute
+                # Suspended while waiting for the wake word
+                if not idle_power.wait_until_active(self._stop_cleanup.is_set):
+                    break
                 try:
                     self._cleanup_expired_cache_entries()
                 except Exception as e:
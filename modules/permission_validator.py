@@ -14,6 +14,8 @@ from dataclasses import dataclass, asdict
 from datetime import datetime
 import threading
 
+from .idle_power import idle_power
+
 # Import macOS frameworks for permission detection
 try:
     import objc
@@ -910,6 +912,10 @@ class PermissionValidator:
         
         while self.monitoring_active:
             try:
+                # Suspended while waiting for the wake word
+                if not idle_power.wait_until_active(lambda: not self.monitoring_active):
+                    break
+                
                 current_status = self.check_accessibility_permissions()
                 
                 # Check if status changed
@@ -10,7 +10,7 @@ import json
 import logging
 import requests
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Iterator
 from config import (
     REASONING_API_BASE,
     REASONING_API_KEY,
@@ -42,6 +42,9 @@ from .performance import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Prefixes models sometimes put before conversational responses
+RESPONSE_PREFIXES = ("AURA: ", "Assistant: ", "AI: ", "Response: ")
+
 
 class ReasoningModule:
     """
@@ -780,6 +783,113 @@ Please analyze the user's command and the current screen state, then provide a d
             logger.error(f"Failed to process conversational query: {str(e)}")
             return self._get_conversational_fallback(str(e))
     
+    def stream_query(self, query: str, prompt_template: str = None,
+                     context: Dict[str, Any] = None) -> Iterator[str]:
+        """
+        Stream a conversational response as text deltas while it is generated.
+        
+        Uses the same prompt as process_query(). There are no retries or
+        fallback responses: callers fall back to process_query() if the
+        stream fails before producing any text.
+        
+        Args:
+            query (str): The user's conversational query
+            prompt_template (str): The prompt template to use (e.g., 'CONVERSATIONAL_PROMPT')
+            context (Dict[str, Any]): Additional context for the conversation
+            
+        Yields:
+            str: Response text deltas, with a leading role prefix removed
+            
+        Raises:
+            Exception: If the request fails or the configuration is invalid
+        """
+        if not query or not query.strip():
+            raise ValueError("Query cannot be empty")
+        if len(query) > 2000:
+            raise ValueError("Query too long (maximum 2000 characters)")
+        if not self.api_base:
+            raise ValueError("Reasoning API base URL not configured")
+        if not self.api_key or self.api_key == "your_ollama_cloud_api_key_here":
+            raise ValueError("Reasoning API key not configured")
+        
+        prompt = self._build_conversational_prompt(query, self._get_prompt_template(prompt_template), context or {})
+        logger.info(f"Streaming conversational query: '{query[:100]}...'")
+        
+        if self.ollama_client:
+            deltas = self._stream_ollama_request(prompt)
+        else:
+            deltas = self._stream_requests_api_call(prompt)
+        
+        # Hold back the start of the response until a role prefix can be ruled out
+        head = ""
+        longest_prefix = max(len(prefix) for prefix in RESPONSE_PREFIXES)
+        for delta in deltas:
+            if head is None:
+                yield delta
+                continue
+            head += delta
+            stripped = head.lstrip()
+            if len(stripped) < longest_prefix and any(prefix.startswith(stripped) for prefix in RESPONSE_PREFIXES):
+                continue
+            for prefix in RESPONSE_PREFIXES:
+                if stripped.startswith(prefix):
+                    stripped = stripped[len(prefix):]
+                    break
+            head = None
+            if stripped:
+                yield stripped
+        if head:
+            yield head.lstrip()
+    
+    def _stream_ollama_request(self, prompt: str) -> Iterator[str]:
+        """Stream response deltas with the Ollama client."""
+        chunks = self.ollama_client.chat(
+            model=self.model,
+            messages=[{'role': 'user', 'content': prompt}],
+            stream=True
+        )
+        for chunk in chunks:
+            content = chunk['message']['content']
+            if content:
+                yield content
+    
+    def _stream_requests_api_call(self, prompt: str) -> Iterator[str]:
+        """Stream response deltas from the Ollama chat API (newline-delimited JSON)."""
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        }
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "stream": True
+        }
+        
+        session = connection_pool.get_session(self.api_base)
+        response = session.post(
+            f"{self.api_base}/api/chat",
+            headers=headers,
+            json=payload,
+            timeout=self.timeout,
+            stream=True
+        )
+        try:
+            if response.status_code != 200:
+                raise Exception(f"API request failed: HTTP {response.status_code}: {response.text[:200]}")
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                if data.get('error'):
+                    raise Exception(f"API stream error: {data['error']}")
+                content = data.get('message', {}).get('content', '')
+                if content:
+                    yield content
+                if data.get('done'):
+                    break
+        finally:
+            response.close()
+    
     def _get_prompt_template(self, template_name: str) -> str:
         """
         Get the prompt template from config.
@@ -901,14 +1011,7 @@ Please provide a natural, conversational response."""
                 content = content[:-3]
             
             # Remove common prefixes that might be added by the model
-            prefixes_to_remove = [
-                "AURA: ",
-                "Assistant: ",
-                "AI: ",
-                "Response: "
-            ]
-            
-            for prefix in prefixes_to_remove:
+            for prefix in RESPONSE_PREFIXES:
                 if content.startswith(prefix):
                     content = content[len(prefix):].strip()
                     break
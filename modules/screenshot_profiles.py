@@ -0,0 +1,363 @@
+# modules/screenshot_profiles.py
+"""
+Screenshot Encoding Profiles for AURA
+
+Chooses screenshot resolution, JPEG quality and color mode per vision
+analysis type. A "simple" description does not need the multi-hundred-KB
+payload that coordinate-heavy "clickable" analysis does, so smaller
+payloads are sent whenever full fidelity isn't needed.
+
+Profiles start from SCREENSHOT_ENCODING_PROFILES and can be auto-tuned from
+recorded (accuracy, latency) observations produced by the calibration tool
+(tests/run_screenshot_calibration.py). Analysis types that return click
+coordinates (SCREENSHOT_COORDINATE_ANALYSIS_TYPES) are never downscaled below
+MAX_SCREENSHOT_SIZE, since their coordinates are in the screenshot's space.
+"""
+
+import base64
+import io
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, List, Callable, Iterable
+
+from PIL import Image
+
+from config import (
+    SCREENSHOT_QUALITY,
+    MAX_SCREENSHOT_SIZE,
+    SCREENSHOT_ENCODING_PROFILES,
+    SCREENSHOT_COORDINATE_ANALYSIS_TYPES,
+    SCREENSHOT_PROFILE_AUTOTUNE,
+    SCREENSHOT_PROFILE_CALIBRATION_FILE,
+    SCREENSHOT_PROFILE_MIN_ACCURACY
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ScreenshotProfile:
+    """Encoding settings for a screenshot sent to the vision model."""
+    max_size: int = MAX_SCREENSHOT_SIZE
+    quality: int = SCREENSHOT_QUALITY
+    grayscale: bool = False
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used for caching and calibration records."""
+        return f"{self.max_size}px_q{self.quality}{'_gray' if self.grayscale else ''}"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ScreenshotProfile':
+        """Create a profile from a config or calibration dictionary."""
+        return cls(
+            max_size=int(data.get("max_size", MAX_SCREENSHOT_SIZE)),
+            quality=int(data.get("quality", SCREENSHOT_QUALITY)),
+            grayscale=bool(data.get("grayscale", False))
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the profile."""
+        return asdict(self)
+
+    def prepare(self, img: Image.Image) -> Image.Image:
+        """
+        Resize and convert an image according to this profile.
+
+        Args:
+            img: Source PIL image
+
+        Returns:
+            Image ready for JPEG encoding
+        """
+        if img.width > self.max_size or img.height > self.max_size:
+            ratio = min(self.max_size / img.width, self.max_size / img.height)
+            new_size = (max(1, int(img.width * ratio)), max(1, int(img.height * ratio)))
+            img = img.resize(new_size, Image.Resampling.LANCZOS)
+
+        target_mode = "L" if self.grayscale else "RGB"
+        if img.mode != target_mode:
+            img = img.convert(target_mode)
+        return img
+
+    def encode(self, img: Image.Image) -> str:
+        """
+        Encode an image as base64 JPEG using this profile.
+
+        Args:
+            img: Source PIL image
+
+        Returns:
+            Base64 encoded JPEG
+        """
+        buffer = io.BytesIO()
+        self.prepare(img).save(buffer, format="JPEG", quality=self.quality, optimize=True)
+        return base64.b64encode(buffer.getvalue()).decode('utf-8')
+
+
+# Candidate profiles tried by the calibration tool, from cheapest to full fidelity
+DEFAULT_CANDIDATE_PROFILES = [
+    ScreenshotProfile(max_size=768, quality=50, grayscale=True),
+    ScreenshotProfile(max_size=1024, quality=55, grayscale=False),
+    ScreenshotProfile(max_size=1280, quality=60, grayscale=False),
+    ScreenshotProfile(max_size=1600, quality=75, grayscale=False),
+    ScreenshotProfile(max_size=MAX_SCREENSHOT_SIZE, quality=SCREENSHOT_QUALITY, grayscale=False)
+]
+
+
+class ScreenshotProfileManager:
+    """
+    Selects and auto-tunes screenshot encoding profiles per analysis type.
+
+    Observations are (analysis_type, profile, accuracy, latency) records. For
+    each analysis type the tuned profile is the fastest one whose mean
+    accuracy stays at or above the configured minimum.
+    """
+
+    def __init__(self, profiles: Optional[Dict[str, Dict[str, Any]]] = None,
+                 calibration_file: Optional[str] = SCREENSHOT_PROFILE_CALIBRATION_FILE,
+                 min_accuracy: float = SCREENSHOT_PROFILE_MIN_ACCURACY,
+                 autotune: bool = SCREENSHOT_PROFILE_AUTOTUNE,
+                 coordinate_types: Optional[Iterable[str]] = None):
+        """
+        Initialize the profile manager.
+
+        Args:
+            profiles: Base profiles per analysis type (defaults to config)
+            calibration_file: JSON file holding recorded observations
+            min_accuracy: Minimum accuracy a tuned profile must achieve
+            autotune: Whether to apply tuned profiles from the calibration file
+            coordinate_types: Analysis types returning click coordinates,
+                kept at MAX_SCREENSHOT_SIZE (defaults to config)
+        """
+        self.default_profile = ScreenshotProfile(MAX_SCREENSHOT_SIZE, SCREENSHOT_QUALITY, False)
+        self.coordinate_types = frozenset(
+            SCREENSHOT_COORDINATE_ANALYSIS_TYPES if coordinate_types is None else coordinate_types
+        )
+        self.base_profiles = {
+            analysis_type: self._full_size_for_coordinates(analysis_type, ScreenshotProfile.from_dict(data))
+            for analysis_type, data in (profiles or SCREENSHOT_ENCODING_PROFILES).items()
+        }
+        self.calibration_file = calibration_file
+        self.min_accuracy = min_accuracy
+
+        self._lock = threading.Lock()
+        self._tuned_profiles: Dict[str, ScreenshotProfile] = {}
+        self._observations: List[Dict[str, Any]] = []
+
+        if autotune and calibration_file and os.path.exists(calibration_file):
+            self.load_calibration(calibration_file)
+
+    def get_profile(self, analysis_type: Optional[str] = None) -> ScreenshotProfile:
+        """
+        Get the encoding profile for an analysis type.
+
+        Args:
+            analysis_type: Vision analysis type, None for the full-fidelity default
+
+        Returns:
+            Tuned profile if available, otherwise the configured profile
+        """
+        if analysis_type is None:
+            return self.default_profile
+        with self._lock:
+            if analysis_type in self._tuned_profiles:
+                return self._tuned_profiles[analysis_type]
+        return self.base_profiles.get(analysis_type, self.default_profile)
+
+    def _full_size_for_coordinates(self, analysis_type: str, profile: ScreenshotProfile) -> ScreenshotProfile:
+        """Raise a coordinate-returning type's profile back to MAX_SCREENSHOT_SIZE."""
+        if analysis_type in self.coordinate_types and profile.max_size < MAX_SCREENSHOT_SIZE:
+            logger.warning(f"Screenshot profile for '{analysis_type}' would downscale coordinates; "
+                           f"using {MAX_SCREENSHOT_SIZE}px")
+            return ScreenshotProfile(MAX_SCREENSHOT_SIZE, profile.quality, profile.grayscale)
+        return profile
+
+    def record_observation(self, analysis_type: str, profile: ScreenshotProfile,
+                           accuracy: float, latency: float, payload_bytes: int = 0) -> None:
+        """
+        Record how a profile performed for an analysis type.
+
+        Args:
+            analysis_type: Vision analysis type
+            profile: Profile that was used
+            accuracy: Accuracy relative to a full-fidelity reference (0.0-1.0)
+            latency: End-to-end vision latency in seconds
+            payload_bytes: Size of the base64 payload sent
+        """
+        with self._lock:
+            self._observations.append({
+                "analysis_type": analysis_type,
+                "profile": profile.to_dict(),
+                "accuracy": float(accuracy),
+                "latency": float(latency),
+                "payload_bytes": int(payload_bytes),
+                "timestamp": time.time()
+            })
+
+    def tune(self) -> Dict[str, ScreenshotProfile]:
+        """
+        Pick the fastest sufficiently accurate profile per analysis type.
+
+        Returns:
+            Mapping of analysis type to tuned profile
+        """
+        with self._lock:
+            grouped: Dict[str, Dict[ScreenshotProfile, List[Dict[str, Any]]]] = {}
+            for observation in self._observations:
+                profile = ScreenshotProfile.from_dict(observation["profile"])
+                grouped.setdefault(observation["analysis_type"], {}).setdefault(profile, []).append(observation)
+
+            tuned = {}
+            for analysis_type, by_profile in grouped.items():
+                candidates = []
+                for profile, observations in by_profile.items():
+                    if analysis_type in self.coordinate_types and profile.max_size < MAX_SCREENSHOT_SIZE:
+                        continue
+                    accuracy = sum(o["accuracy"] for o in observations) / len(observations)
+                    latency = sum(o["latency"] for o in observations) / len(observations)
+                    if accuracy >= self.min_accuracy:
+                        candidates.append((latency, -accuracy, profile))
+                if candidates:
+                    tuned[analysis_type] = min(candidates, key=lambda c: (c[0], c[1]))[2]
+                else:
+                    logger.warning(f"No screenshot profile reached {self.min_accuracy:.0%} accuracy for '{analysis_type}'")
+
+            self._tuned_profiles.update(tuned)
+
+        for analysis_type, profile in tuned.items():
+            logger.info(f"Tuned screenshot profile for '{analysis_type}': {profile.key}")
+        return tuned
+
+    def load_calibration(self, path: str) -> int:
+        """
+        Load recorded observations from a calibration file and tune profiles.
+
+        Args:
+            path: Calibration JSON file
+
+        Returns:
+            Number of observations loaded
+        """
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            observations = data.get("observations", [])
+            with self._lock:
+                self._observations.extend(observations)
+            self.tune()
+            return len(observations)
+        except Exception as e:
+            logger.warning(f"Failed to load screenshot profile calibration from {path}: {e}")
+            return 0
+
+    def save_calibration(self, path: Optional[str] = None) -> str:
+        """
+        Save recorded observations and tuned profiles.
+
+        Args:
+            path: Output file (defaults to the configured calibration file)
+
+        Returns:
+            Path written
+        """
+        path = path or self.calibration_file
+        with self._lock:
+            data = {
+                "generated_at": time.time(),
+                "min_accuracy": self.min_accuracy,
+                "tuned_profiles": {t: p.to_dict() for t, p in self._tuned_profiles.items()},
+                "observations": list(self._observations)
+            }
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+        return path
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get active profiles and observation counts."""
+        with self._lock:
+            tuned = dict(self._tuned_profiles)
+            observation_count = len(self._observations)
+        return {
+            "profiles": {t: self.get_profile(t).key for t in set(self.base_profiles) | set(tuned)},
+            "tuned_types": sorted(tuned),
+            "observations": observation_count
+        }
+
+
+def calibrate_profiles(images: Iterable[Image.Image], analysis_types: Iterable[str],
+                       analyze: Callable[[str, str], Dict[str, Any]],
+                       score: Callable[[Dict[str, Any], Dict[str, Any]], float],
+                       manager: ScreenshotProfileManager,
+                       candidates: Optional[List[ScreenshotProfile]] = None) -> Dict[str, ScreenshotProfile]:
+    """
+    Run screenshots through a vision endpoint at different encoding settings.
+
+    Each image is first analyzed with the full-fidelity default profile to
+    get a reference result; every candidate profile is then scored against
+    that reference and its latency recorded.
+
+    Args:
+        images: Screenshots to calibrate on
+        analysis_types: Analysis types to calibrate
+        analyze: Callable (screenshot_b64, analysis_type) -> analysis result
+        score: Callable (reference_result, candidate_result) -> accuracy 0.0-1.0
+        manager: Profile manager receiving the observations
+        candidates: Profiles to evaluate (defaults to DEFAULT_CANDIDATE_PROFILES)
+
+    Returns:
+        Tuned profiles per analysis type
+    """
+    candidates = candidates or DEFAULT_CANDIDATE_PROFILES
+    images = list(images)
+
+    for analysis_type in analysis_types:
+        for image in images:
+            reference = analyze(manager.default_profile.encode(image), analysis_type)
+            for profile in candidates:
+                screenshot_b64 = profile.encode(image)
+                start_time = time.time()
+                try:
+                    result = analyze(screenshot_b64, analysis_type)
+                    accuracy = score(reference, result)
+                except Exception as e:
+                    logger.warning(f"Calibration request failed for {profile.key}: {e}")
+                    accuracy = 0.0
+                manager.record_observation(
+                    analysis_type, profile, accuracy, time.time() - start_time, len(screenshot_b64)
+                )
+
+    return manager.tune()
+
+
+def element_overlap_score(reference: Dict[str, Any], candidate: Dict[str, Any]) -> float:
+    """
+    Score a vision result by element overlap with a reference result.
+
+    Args:
+        reference: Full-fidelity analysis
+        candidate: Analysis produced with a cheaper profile
+
+    Returns:
+        Jaccard similarity of element descriptions/text (1.0 when both are empty)
+    """
+    def labels(result: Dict[str, Any]) -> set:
+        elements = (result or {}).get("elements", []) or []
+        return {
+            str(e.get("text") or e.get("description") or "").strip().lower()
+            for e in elements if isinstance(e, dict)
+        } - {""}
+
+    reference_labels = labels(reference)
+    candidate_labels = labels(candidate)
+    if not reference_labels and not candidate_labels:
+        return 1.0
+    return len(reference_labels & candidate_labels) / len(reference_labels | candidate_labels)
+
+
+# Global profile manager instance
+screenshot_profiles = ScreenshotProfileManager()
@@ -0,0 +1,212 @@
+# modules/selection_capture.py
+"""
+Hedged Selected-Text Capture for AURA
+
+Races the two selected-text capture methods instead of running them in
+sequence. The accessibility read (AXSelectedText) starts immediately; the
+clipboard method (Cmd+C) starts after a hedge delay, or as soon as the
+accessibility read comes back empty or fails. The first valid result wins.
+
+The hedge delay is learned per application: the accessibility read's
+success rate and latency are tracked for every capture, including reads that
+lost the race, so
+
+- apps that expose AXSelectedText get a delay just above their typical
+  accessibility latency and rarely pay for a clipboard round trip, and
+- apps that don't (most Electron apps, some PDF viewers) get no delay and
+  start the clipboard method right away.
+
+A losing method is left to finish on its worker thread. An accessibility
+read has no side effects, and a clipboard capture restores the original
+clipboard itself, so neither needs to be interrupted.
+"""
+
+import concurrent.futures
+import logging
+import threading
+import time
+from typing import Dict, Any, Optional, Callable
+
+from config import (
+    SELECTION_CAPTURE_HEDGE_DELAY,
+    SELECTION_CAPTURE_HEDGE_MIN_DELAY,
+    SELECTION_CAPTURE_HEDGE_MAX_DELAY
+)
+
+logger = logging.getLogger(__name__)
+
+ACCESSIBILITY_METHOD = "accessibility_api"
+CLIPBOARD_METHOD = "clipboard_fallback"
+
+# Hedge delay as a multiple of the app's typical accessibility latency
+LATENCY_FACTOR = 2.0
+
+# Below this accessibility success rate the clipboard method starts at once
+UNRELIABLE_SUCCESS_RATE = 0.2
+
+# Weight of the newest observation in the per-app moving averages
+SMOOTHING = 0.3
+
+
+class MethodResult:
+    """Outcome of one capture method run."""
+
+    def __init__(self, text: Optional[str], error: Optional[Exception], elapsed: float):
+        self.text = text
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def valid(self) -> bool:
+        return self.error is None and self.text is not None
+
+
+class CaptureOutcome:
+    """Result of a hedged capture."""
+
+    def __init__(self, app_id: str, hedge_delay: float):
+        self.app_id = app_id
+        self.hedge_delay = hedge_delay
+        self.text: Optional[str] = None
+        self.method: Optional[str] = None
+        self.accessibility: Optional[MethodResult] = None
+        self.clipboard: Optional[MethodResult] = None
+        self.clipboard_started = False
+        self.elapsed = 0.0
+
+
+class AppCaptureProfile:
+    """Accessibility read statistics for one application."""
+
+    def __init__(self):
+        self.samples = 0
+        self.success_rate = 1.0
+        self.latency: Optional[float] = None
+        self.wins = {ACCESSIBILITY_METHOD: 0, CLIPBOARD_METHOD: 0}
+
+    def observe(self, result: MethodResult) -> None:
+        self.samples += 1
+        self.success_rate += SMOOTHING * ((1.0 if result.valid else 0.0) - self.success_rate)
+        if result.valid:
+            if self.latency is None:
+                self.latency = result.elapsed
+            else:
+                self.latency += SMOOTHING * (result.elapsed - self.latency)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'samples': self.samples,
+            'accessibility_success_rate': self.success_rate,
+            'accessibility_latency': self.latency,
+            'wins': dict(self.wins)
+        }
+
+
+class HedgedSelectionCapture:
+    """
+    Races accessibility and clipboard selected-text capture per application.
+    """
+
+    def __init__(self, initial_delay: float = SELECTION_CAPTURE_HEDGE_DELAY,
+                 min_delay: float = SELECTION_CAPTURE_HEDGE_MIN_DELAY,
+                 max_delay: float = SELECTION_CAPTURE_HEDGE_MAX_DELAY):
+        """
+        Initialize hedged capture.
+
+        Args:
+            initial_delay: Hedge delay for applications without history
+            min_delay: Lower bound of the learned delay for apps where the
+                accessibility read usually succeeds
+            max_delay: Upper bound of the learned delay
+        """
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="SelectionCapture")
+        self._profiles: Dict[str, AppCaptureProfile] = {}
+        self._lock = threading.Lock()
+
+    def hedge_delay(self, app_id: str) -> float:
+        """Seconds to give the accessibility read before starting the clipboard method."""
+        with self._lock:
+            profile = self._profiles.get(app_id)
+            if profile is None or profile.samples == 0:
+                return self.initial_delay
+            if profile.success_rate < UNRELIABLE_SUCCESS_RATE:
+                return 0.0
+            if profile.latency is None:
+                return self.initial_delay
+            return min(self.max_delay, max(self.min_delay, profile.latency * LATENCY_FACTOR))
+
+    def capture(self, read_accessibility: Callable[[], Optional[str]],
+                read_clipboard: Callable[[], Optional[str]], app_id: str = "unknown") -> CaptureOutcome:
+        """
+        Capture the selection with whichever method returns valid text first.
+
+        Args:
+            read_accessibility: Accessibility read; returns text or None, may raise
+            read_clipboard: Clipboard capture; returns text or None, may raise
+            app_id: Frontmost application (bundle identifier), used for learning
+
+        Returns:
+            CaptureOutcome; method is None if neither method produced text,
+            in which case the method results tell whether they failed or
+            found nothing selected
+        """
+        start = time.perf_counter()
+        outcome = CaptureOutcome(app_id, self.hedge_delay(app_id))
+
+        accessibility = self._pool.submit(self._run, read_accessibility)
+        accessibility.add_done_callback(lambda future: self._observe(app_id, future.result()))
+
+        pending = {accessibility: ACCESSIBILITY_METHOD}
+        concurrent.futures.wait(pending, timeout=outcome.hedge_delay)
+        if not accessibility.done() or not accessibility.result().valid:
+            outcome.clipboard_started = True
+            pending[self._pool.submit(self._run, read_clipboard)] = CLIPBOARD_METHOD
+
+        while pending and outcome.method is None:
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                method = pending.pop(future)
+                result = future.result()
+                if method == ACCESSIBILITY_METHOD:
+                    outcome.accessibility = result
+                else:
+                    outcome.clipboard = result
+                if result.valid and outcome.method is None:
+                    outcome.text = result.text
+                    outcome.method = method
+
+        outcome.elapsed = time.perf_counter() - start
+        if outcome.method is not None:
+            with self._lock:
+                self._profiles.setdefault(app_id, AppCaptureProfile()).wins[outcome.method] += 1
+            if pending:
+                logger.debug(f"Selected text from {outcome.method} in {outcome.elapsed * 1000:.1f}ms, "
+                             f"leaving {', '.join(pending.values())} to finish in the background")
+        return outcome
+
+    @staticmethod
+    def _run(read: Callable[[], Optional[str]]) -> MethodResult:
+        start = time.perf_counter()
+        try:
+            return MethodResult(read(), None, time.perf_counter() - start)
+        except Exception as e:
+            return MethodResult(None, e, time.perf_counter() - start)
+
+    def _observe(self, app_id: str, result: MethodResult) -> None:
+        with self._lock:
+            self._profiles.setdefault(app_id, AppCaptureProfile()).observe(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-application profiles and current hedge delays."""
+        with self._lock:
+            profiles = {app_id: profile.to_dict() for app_id, profile in self._profiles.items()}
+        for app_id, profile in profiles.items():
+            profile['hedge_delay'] = self.hedge_delay(app_id)
+        return profiles
+
+    def shutdown(self) -> None:
+        """Stop the capture workers."""
+        self._pool.shutdown(wait=False)
@@ -0,0 +1,280 @@
+# modules/speculative_perception.py
+"""
+Speculative Screen Perception for AURA
+
+Starts capturing and analyzing the screen as soon as the wake word fires, in
+parallel with speech recording and transcription. The result is kept in a
+short-lived cache that VisionModule.describe_screen consults, so much of the
+vision latency is hidden behind the time the user spends speaking.
+
+Speculative results are discarded when the recognized intent does not need
+vision, when they expire, or when the screen has visibly changed since the
+speculative capture.
+"""
+
+import base64
+import io
+import logging
+import threading
+import time
+from typing import Dict, Any, Optional, List
+
+import numpy as np
+from PIL import Image
+
+from config import (
+    SPECULATIVE_PERCEPTION_ANALYSIS_TYPES,
+    SPECULATIVE_PERCEPTION_TTL,
+    SPECULATIVE_PERCEPTION_CHANGE_THRESHOLD,
+    SPECULATIVE_PERCEPTION_WAIT_TIMEOUT
+)
+from .vision_scheduler import VisionRequestPriority, vision_scheduler
+
+logger = logging.getLogger(__name__)
+
+# Thumbnail size used to decide whether the screen changed
+_FINGERPRINT_SIZE = (64, 40)
+
+
+def screen_fingerprint(screenshot_b64: str) -> Optional[np.ndarray]:
+    """
+    Compute a small grayscale thumbnail used to compare screen states.
+
+    Args:
+        screenshot_b64: Base64 encoded screenshot
+
+    Returns:
+        Float32 thumbnail array, or None if the screenshot can't be decoded
+    """
+    try:
+        img = Image.open(io.BytesIO(base64.b64decode(screenshot_b64)))
+        thumbnail = img.convert("L").resize(_FINGERPRINT_SIZE, Image.Resampling.BILINEAR)
+        return np.asarray(thumbnail, dtype=np.float32)
+    except Exception as e:
+        logger.debug(f"Could not fingerprint screenshot: {e}")
+        return None
+
+
+def screens_match(a: Optional[np.ndarray], b: Optional[np.ndarray],
+                  threshold: float = SPECULATIVE_PERCEPTION_CHANGE_THRESHOLD) -> bool:
+    """
+    Check whether two screen fingerprints show the same screen state.
+
+    Args:
+        a: First fingerprint
+        b: Second fingerprint
+        threshold: Maximum mean absolute pixel difference (0-255 scale)
+
+    Returns:
+        True if the fingerprints are close enough to reuse an analysis
+    """
+    if a is None or b is None or a.shape != b.shape:
+        return False
+    return float(np.abs(a - b).mean()) <= threshold
+
+
+class _SpeculativeEntry:
+    """Speculative analysis for one analysis type."""
+
+    def __init__(self, analysis_type: str):
+        self.analysis_type = analysis_type
+        self.started_at = time.time()
+        self.fingerprint: Optional[np.ndarray] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.captured = threading.Event()
+        self.ready = threading.Event()
+
+
+class SpeculativePerception:
+    """
+    Background screen analysis started on wake word detection.
+
+    Analyses run at background priority through the vision request
+    scheduler, so they never delay an interactive request.
+    """
+
+    def __init__(self, analysis_types: Optional[List[str]] = None,
+                 ttl: float = SPECULATIVE_PERCEPTION_TTL,
+                 wait_timeout: float = SPECULATIVE_PERCEPTION_WAIT_TIMEOUT):
+        """
+        Initialize speculative perception.
+
+        Args:
+            analysis_types: Analysis types to precompute
+            ttl: Seconds a speculative result stays usable
+            wait_timeout: Seconds describe_screen waits for an in-flight result
+        """
+        self.analysis_types = list(analysis_types or SPECULATIVE_PERCEPTION_ANALYSIS_TYPES)
+        self.ttl = ttl
+        self.wait_timeout = wait_timeout
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _SpeculativeEntry] = {}
+        self._generation = 0
+        self._stats = {
+            'started': 0,
+            'hits': 0,
+            'misses': 0,
+            'discarded_intent': 0,
+            'discarded_changed': 0,
+            'expired': 0,
+            'failed': 0
+        }
+
+    def start(self, vision_module) -> bool:
+        """
+        Start speculative analysis in the background.
+
+        Args:
+            vision_module: VisionModule used for capture and analysis
+
+        Returns:
+            True if a speculative analysis was started
+        """
+        if vision_module is None or not self.analysis_types:
+            return False
+
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            entries = {t: _SpeculativeEntry(t) for t in self.analysis_types}
+            self._entries = dict(entries)
+            self._stats['started'] += 1
+
+        thread = threading.Thread(
+            target=self._run,
+            args=(vision_module, generation, entries),
+            name="SpeculativePerception",
+            daemon=True
+        )
+        thread.start()
+        logger.debug(f"Speculative perception started for {self.analysis_types}")
+        return True
+
+    def _run(self, vision_module, generation: int, entries: Dict[str, _SpeculativeEntry]) -> None:
+        """Capture and analyze the screen for each speculative analysis type."""
+        for analysis_type, entry in entries.items():
+            try:
+                if not self._is_current(generation):
+                    break
+                screenshot_b64 = vision_module.capture_screen_as_base64(analysis_type=analysis_type)
+                entry.fingerprint = screen_fingerprint(screenshot_b64)
+                entry.captured.set()
+                if not self._is_current(generation):
+                    break
+                entry.result = vision_module.describe_screen(
+                    analysis_type=analysis_type,
+                    screenshot_b64=screenshot_b64,
+                    priority=VisionRequestPriority.BACKGROUND,
+                    use_speculative=False
+                )
+                logger.debug(f"Speculative {analysis_type} analysis ready in {time.time() - entry.started_at:.2f}s")
+            except Exception as e:
+                entry.error = str(e)
+                if not self._is_current(generation):
+                    logger.debug(f"Speculative {analysis_type} analysis cancelled")
+                    break
+                with self._lock:
+                    self._stats['failed'] += 1
+                logger.debug(f"Speculative {analysis_type} analysis failed: {e}")
+            finally:
+                entry.captured.set()
+                entry.ready.set()
+
+        for entry in entries.values():
+            entry.captured.set()
+            entry.ready.set()
+
+    def _is_current(self, generation: int) -> bool:
+        with self._lock:
+            return generation == self._generation
+
+    def lookup(self, analysis_type: str, screenshot_b64: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a speculative analysis if it still matches the current screen.
+
+        Waits up to wait_timeout for an in-flight analysis. The entry is
+        discarded if it expired, failed, or the screen changed.
+
+        Args:
+            analysis_type: Requested analysis type
+            screenshot_b64: Screenshot just captured by the caller
+
+        Returns:
+            Speculative analysis, or None if it can't be used
+        """
+        with self._lock:
+            entry = self._entries.get(analysis_type)
+        if entry is None:
+            return None
+
+        if time.time() - entry.started_at > self.ttl:
+            self._drop(analysis_type, entry, 'expired')
+            return None
+
+        # Compare screen states before waiting on the (slow) analysis itself
+        deadline = time.time() + self.wait_timeout
+        if not entry.captured.wait(self.wait_timeout):
+            self._count('misses')
+            return None
+
+        if entry.fingerprint is not None and not screens_match(entry.fingerprint, screen_fingerprint(screenshot_b64)):
+            self._drop(analysis_type, entry, 'discarded_changed')
+            logger.info(f"Discarding speculative {analysis_type} analysis: screen changed")
+            return None
+
+        if not entry.ready.wait(max(0.0, deadline - time.time())) or entry.result is None:
+            self._count('misses')
+            return None
+
+        self._count('hits')
+        logger.info(f"Using speculative {analysis_type} analysis "
+                    f"(started {time.time() - entry.started_at:.2f}s ago)")
+        return entry.result
+
+    def discard(self, reason: str = "manual") -> None:
+        """
+        Drop all speculative results.
+
+        Analysis types that haven't started yet are skipped, and the
+        background request already handed to the vision scheduler is
+        cancelled so it doesn't hold the concurrency slot an interactive
+        request is waiting for.
+
+        Args:
+            reason: Why the results were discarded (e.g. "intent:conversational_chat")
+        """
+        with self._lock:
+            had_entries = bool(self._entries)
+            self._entries = {}
+            self._generation += 1
+            if had_entries and reason.startswith("intent:"):
+                self._stats['discarded_intent'] += 1
+
+        if had_entries:
+            vision_scheduler.cancel_pending(VisionRequestPriority.BACKGROUND, include_running=True)
+            logger.debug(f"Speculative perception discarded ({reason})")
+
+    def _drop(self, analysis_type: str, entry: _SpeculativeEntry, stat: str) -> None:
+        with self._lock:
+            if self._entries.get(analysis_type) is entry:
+                del self._entries[analysis_type]
+            self._stats[stat] += 1
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get speculative perception statistics."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['pending_types'] = sorted(self._entries)
+        lookups = stats['hits'] + stats['misses'] + stats['discarded_changed'] + stats['expired']
+        stats['hit_rate_percent'] = (stats['hits'] / lookups * 100) if lookups > 0 else 0.0
+        return stats
+
+
+# Global speculative perception instance
+speculative_perception = SpeculativePerception()
@@ -0,0 +1,243 @@
+# modules/speech_preprocessing.py
+"""
+Speech Preprocessing for AURA
+
+In-memory path from a recorded numpy buffer to the float32 array Whisper
+consumes. Replaces the pydub AudioSegment -> temp WAV -> librosa reload ->
+file path round trip with vectorized operations on a single buffer:
+
+- int16 recordings are converted to float32 once; float32 recordings are
+  processed in place
+- a first-order high-pass filter (same response as pydub's
+  high_pass_filter) runs through scipy.signal.lfilter
+- peak normalization is applied in place on the filtered buffer
+
+Debug capture of utterances is opt-in and kept in a bounded in-memory ring
+buffer that can be written to disk on demand.
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+import wave
+from collections import deque
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+from scipy.signal import lfilter, resample_poly
+
+from config import (
+    AUDIO_SAMPLE_RATE,
+    AUDIO_HIGHPASS_CUTOFF_HZ,
+    AUDIO_NORMALIZE_HEADROOM_DB,
+    AUDIO_DEBUG_CAPTURE_SIZE,
+    AUDIO_DEBUG_CAPTURE_DIR
+)
+
+logger = logging.getLogger(__name__)
+
+# Sample rate expected by Whisper models
+WHISPER_SAMPLE_RATE = 16000
+
+
+def to_float32(audio: np.ndarray) -> np.ndarray:
+    """
+    Convert recorded samples to a flat float32 array in [-1.0, 1.0].
+
+    float32 input is returned without copying (flattened as a view), so later
+    in-place processing modifies the caller's buffer.
+
+    Args:
+        audio: Recorded samples (int16 or float)
+
+    Returns:
+        Flat float32 array
+    """
+    samples = audio.reshape(-1)
+    if samples.dtype == np.int16:
+        converted = samples.astype(np.float32)
+        converted *= 1.0 / 32768.0
+        return converted
+    if samples.dtype == np.float32:
+        return samples if samples.flags.writeable else samples.copy()
+    return samples.astype(np.float32)
+
+
+def high_pass_filter(samples: np.ndarray, cutoff_hz: float, sample_rate: int) -> np.ndarray:
+    """
+    First-order RC high-pass filter.
+
+    Matches pydub's high_pass_filter: y[i] = a * (y[i-1] + x[i] - x[i-1])
+    with y[0] = x[0], evaluated by lfilter instead of a Python loop.
+
+    Args:
+        samples: float32 samples
+        cutoff_hz: Cutoff frequency in Hz
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Filtered float32 samples (new buffer)
+    """
+    rc = 1.0 / (cutoff_hz * 2 * math.pi)
+    dt = 1.0 / sample_rate
+    alpha = rc / (rc + dt)
+    b = np.array([alpha, -alpha], dtype=np.float32)
+    a = np.array([1.0, -alpha], dtype=np.float32)
+    zi = np.array([(1.0 - alpha) * samples[0]], dtype=np.float32)
+    filtered, _ = lfilter(b, a, samples, zi=zi)
+    return filtered
+
+
+def normalize_peak(samples: np.ndarray, headroom_db: float) -> np.ndarray:
+    """
+    Scale samples in place so the peak sits headroom_db below full scale.
+
+    Args:
+        samples: float32 samples (modified in place)
+        headroom_db: Headroom in dB (pydub's normalize default is 0.1)
+
+    Returns:
+        The same array, normalized
+    """
+    peak = max(float(samples.max()), -float(samples.min()))
+    if peak > 0.0:
+        samples *= (10 ** (-headroom_db / 20.0)) / peak
+    return samples
+
+
+def prepare_whisper_input(audio: np.ndarray, sample_rate: int = AUDIO_SAMPLE_RATE,
+                          highpass_cutoff: float = AUDIO_HIGHPASS_CUTOFF_HZ,
+                          headroom_db: float = AUDIO_NORMALIZE_HEADROOM_DB) -> np.ndarray:
+    """
+    Turn a recorded buffer into Whisper's float32 16 kHz input array.
+
+    Args:
+        audio: Recorded samples (int16 or float32, mono)
+        sample_rate: Sample rate of the recording
+        highpass_cutoff: High-pass cutoff in Hz (0 disables filtering)
+        headroom_db: Normalization headroom in dB
+
+    Returns:
+        float32 samples ready for whisper_model.transcribe
+    """
+    samples = to_float32(audio)
+    if samples.size == 0:
+        return samples
+
+    if sample_rate != WHISPER_SAMPLE_RATE:
+        divisor = math.gcd(int(sample_rate), WHISPER_SAMPLE_RATE)
+        samples = resample_poly(samples, WHISPER_SAMPLE_RATE // divisor, int(sample_rate) // divisor).astype(np.float32)
+
+    # Filtering needs enough audio to settle (pydub only filtered > 1s)
+    if highpass_cutoff and samples.size > WHISPER_SAMPLE_RATE:
+        samples = high_pass_filter(samples, highpass_cutoff, WHISPER_SAMPLE_RATE)
+
+    return normalize_peak(samples, headroom_db)
+
+
+def audio_stats(samples: np.ndarray, sample_rate: int = WHISPER_SAMPLE_RATE) -> Dict[str, float]:
+    """
+    Compute level statistics without allocating a copy of the buffer.
+
+    Args:
+        samples: float32 samples
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Dictionary with duration, rms and peak
+    """
+    if samples.size == 0:
+        return {'duration': 0.0, 'rms': 0.0, 'peak': 0.0}
+    return {
+        'duration': samples.size / float(sample_rate),
+        'rms': float(np.sqrt(np.dot(samples, samples) / samples.size)),
+        'peak': max(float(samples.max()), -float(samples.min()))
+    }
+
+
+class DebugAudioRing:
+    """
+    Bounded in-memory store of recent utterances for debugging.
+
+    Replaces writing debug_audio.wav on every command: utterances are only
+    kept when debug capture is enabled, and only written to disk when dump()
+    is called.
+    """
+
+    def __init__(self, capacity: int = AUDIO_DEBUG_CAPTURE_SIZE):
+        """
+        Initialize the ring buffer.
+
+        Args:
+            capacity: Number of utterances to keep
+        """
+        self._entries = deque(maxlen=max(1, capacity))
+        self._lock = threading.Lock()
+
+    def add(self, samples: np.ndarray, sample_rate: int = WHISPER_SAMPLE_RATE,
+            metadata: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Keep an utterance (by reference; callers must not modify it afterwards).
+
+        Args:
+            samples: float32 samples
+            sample_rate: Sample rate in Hz
+            metadata: Optional details such as the transcription
+        """
+        with self._lock:
+            self._entries.append({
+                'timestamp': time.time(),
+                'samples': samples,
+                'sample_rate': sample_rate,
+                'metadata': dict(metadata or {})
+            })
+
+    def annotate_latest(self, **metadata) -> None:
+        """Attach metadata (e.g. the transcription) to the most recent utterance."""
+        with self._lock:
+            if self._entries:
+                self._entries[-1]['metadata'].update(metadata)
+
+    def get_recent(self) -> List[Dict[str, Any]]:
+        """Get the stored utterances, oldest first."""
+        with self._lock:
+            return list(self._entries)
+
+    def dump(self, directory: str = AUDIO_DEBUG_CAPTURE_DIR) -> List[str]:
+        """
+        Write stored utterances as 16-bit WAV files.
+
+        Args:
+            directory: Output directory (created if missing)
+
+        Returns:
+            Paths of the written files
+        """
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for entry in self.get_recent():
+            path = os.path.join(directory, f"utterance_{int(entry['timestamp'] * 1000)}.wav")
+            pcm = np.clip(entry['samples'] * 32767.0, -32768, 32767).astype(np.int16)
+            with wave.open(path, "wb") as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(entry['sample_rate'])
+                wav_file.writeframes(pcm.tobytes())
+            paths.append(path)
+        logger.info(f"Wrote {len(paths)} debug utterances to {directory}")
+        return paths
+
+    def clear(self) -> None:
+        """Drop all stored utterances."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Global debug capture ring buffer
+debug_audio_ring = DebugAudioRing()
@@ -0,0 +1,164 @@
+# modules/speech_stream.py
+"""
+Streaming LLM-to-Speech for AURA
+
+Connects a stream of LLM tokens to text-to-speech: tokens are buffered into
+sentences (SentenceChunker), each sentence is post-processed for speech as
+soon as it completes, and sentences are handed to a TTS consumer while the
+rest of the response is still being generated. Time-to-first-spoken-word
+therefore depends on the first sentence, not on the answer length.
+
+A SpeechStream is filled by feed() on the thread reading the LLM stream and
+iterated by the speaking thread (AudioModule.speak_sentences or the
+FeedbackModule queue).
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from .tts_pipeline import SentenceChunker
+
+logger = logging.getLogger(__name__)
+
+# Queue marker for the end of the stream
+_END = object()
+
+
+class SpeechStream:
+    """
+    Sentences of a response being generated, consumable while it streams.
+    """
+
+    def __init__(self, transform: Optional[Callable[[str], str]] = None,
+                 max_chars: Optional[int] = None,
+                 on_first_sentence: Optional[Callable[["SpeechStream"], None]] = None):
+        """
+        Initialize the stream.
+
+        Args:
+            transform: Post-processing applied to each sentence before it is spoken
+            max_chars: Spoken length budget; the LLM stream is closed once reached
+            on_first_sentence: Called (on the feeding thread) when the first
+                sentence is ready, typically to start the speaking consumer
+        """
+        self.transform = transform
+        self.max_chars = max_chars
+        self.on_first_sentence = on_first_sentence
+
+        self.sentences: List[str] = []
+        self.truncated = False
+        self.error: Optional[str] = None
+        self.time_to_first_sentence: Optional[float] = None
+
+        self._queue = queue.Queue()
+        self._first_sentence = threading.Event()
+        self._finished = threading.Event()
+        self._cancelled = threading.Event()
+        self._length = 0
+
+    @property
+    def text(self) -> str:
+        """Text emitted so far."""
+        return " ".join(self.sentences)
+
+    @property
+    def finished(self) -> bool:
+        """Whether feeding has ended."""
+        return self._finished.is_set()
+
+    def feed(self, tokens: Iterable[str]) -> str:
+        """
+        Read an LLM token stream to the end, emitting sentences as they complete.
+
+        Args:
+            tokens: Iterable of text deltas
+
+        Returns:
+            The emitted text
+
+        Raises:
+            Exception: Errors from the token stream if no sentence was emitted
+                (so the caller can fall back to a non-streaming request)
+        """
+        start = time.perf_counter()
+        chunker = SentenceChunker()
+        iterator = iter(tokens)
+        try:
+            for delta in iterator:
+                if self._cancelled.is_set() or not self._emit_all(chunker.feed(delta), start):
+                    break
+            else:
+                self._emit_all(chunker.flush(), start)
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+            if not self.sentences:
+                raise
+            logger.warning(f"LLM stream failed after {len(self.sentences)} sentences: {e}")
+        finally:
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                close()
+            self._finished.set()
+            self._first_sentence.set()
+            self._queue.put(_END)
+        return self.text
+
+    def _emit_all(self, sentences: List[str], start: float) -> bool:
+        """Emit sentences; returns False once the length budget is exhausted."""
+        for sentence in sentences:
+            if self.transform is not None:
+                sentence = self.transform(sentence)
+            sentence = sentence.strip() if sentence else ""
+            if not sentence:
+                continue
+
+            if self.max_chars is not None and self._length + len(sentence) > self.max_chars:
+                self.truncated = True
+                if self.sentences:
+                    return False
+                # A first sentence longer than the budget is cut at a word boundary
+                sentence = sentence[:self.max_chars].rsplit(" ", 1)[0].rstrip(",;:") + "..."
+
+            self.sentences.append(sentence)
+            self._length += len(sentence) + 1
+            self._queue.put(sentence)
+
+            if self.time_to_first_sentence is None:
+                self.time_to_first_sentence = time.perf_counter() - start
+                logger.info(f"First streamed sentence ready after {self.time_to_first_sentence * 1000:.0f}ms")
+                self._first_sentence.set()
+                if self.on_first_sentence is not None:
+                    self.on_first_sentence(self)
+            if self.truncated:
+                return False
+        return True
+
+    def wait_for_first_sentence(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the first sentence is ready.
+
+        Returns:
+            True if a sentence was emitted within the timeout
+        """
+        self._first_sentence.wait(timeout)
+        return bool(self.sentences)
+
+    def wait_until_finished(self, timeout: Optional[float] = None) -> bool:
+        """Wait until feeding has ended."""
+        return self._finished.wait(timeout)
+
+    def cancel(self) -> None:
+        """Stop reading the LLM stream (e.g. after barge-in)."""
+        self._cancelled.set()
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield sentences as they are emitted until the stream ends."""
+        while True:
+            sentence = self._queue.get()
+            if sentence is _END:
+                self._queue.put(_END)  # later iterations end too
+                return
+            yield sentence
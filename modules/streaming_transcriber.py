@@ -0,0 +1,272 @@
+# modules/streaming_transcriber.py
+"""
+Streaming Transcription for AURA
+
+Transcribes speech incrementally while the user is still talking, so that
+once trailing silence ends the recording only the last, not yet committed,
+part of the utterance has to be transcribed.
+
+A background worker re-transcribes the uncommitted audio every
+STREAMING_STT_STEP seconds. Stability is decided by agreement between
+consecutive passes:
+
+- words both passes agree on form the stable prefix reported in partial
+  transcripts
+- whole Whisper segments both passes agree on (and that are followed by
+  another segment) are committed: their text is fixed and the audio buffer
+  start moves past them, so later passes and the final pass get shorter
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, List, Optional
+
+import numpy as np
+
+from config import (
+    AUDIO_SAMPLE_RATE,
+    STREAMING_STT_STEP,
+    STREAMING_STT_MIN_AUDIO
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PartialTranscript:
+    """Incremental transcription state exposed while recording."""
+    stable_text: str
+    unstable_text: str = ""
+    is_final: bool = False
+    audio_seconds: float = 0.0
+
+    @property
+    def text(self) -> str:
+        """Full current hypothesis (stable followed by unstable text)."""
+        return " ".join(part for part in (self.stable_text, self.unstable_text) if part)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for logging."""
+        return {
+            'stable_text': self.stable_text,
+            'unstable_text': self.unstable_text,
+            'is_final': self.is_final,
+            'audio_seconds': round(self.audio_seconds, 2)
+        }
+
+
+def _common_prefix_length(a: List[str], b: List[str]) -> int:
+    count = 0
+    for left, right in zip(a, b):
+        if left != right:
+            break
+        count += 1
+    return count
+
+
+class StreamingTranscriber:
+    """
+    Incremental transcription of a recording in progress.
+
+    Audio chunks are passed to feed() from the recording loop; transcription
+    passes run on a background thread so recording is never blocked.
+    finalize() is called once silence is detected and transcribes only the
+    uncommitted tail of the utterance.
+    """
+
+    def __init__(self, transcribe_fn: Callable[[np.ndarray, Optional[str]], Dict[str, Any]],
+                 sample_rate: int = AUDIO_SAMPLE_RATE,
+                 step_seconds: float = STREAMING_STT_STEP,
+                 min_audio_seconds: float = STREAMING_STT_MIN_AUDIO,
+                 on_partial: Optional[Callable[[PartialTranscript], None]] = None):
+        """
+        Initialize the streaming transcriber.
+
+        Args:
+            transcribe_fn: Callable(samples, initial_prompt) returning a Whisper
+                result dictionary with 'text' and optional 'segments'
+            sample_rate: Sample rate of fed audio
+            step_seconds: New audio required between incremental passes
+            min_audio_seconds: Uncommitted audio required before a pass
+            on_partial: Callback receiving PartialTranscript updates
+        """
+        self.transcribe_fn = transcribe_fn
+        self.sample_rate = sample_rate
+        self.step_samples = max(1, int(step_seconds * sample_rate))
+        self.min_samples = max(1, int(min_audio_seconds * sample_rate))
+        self.on_partial = on_partial
+
+        self._buffer = np.zeros(sample_rate * 10, dtype=np.float32)
+        self._length = 0
+        self._committed_offset = 0
+        self._committed_words: List[str] = []
+        self._prev_words: List[str] = []
+        self._prev_segment_texts: List[str] = []
+        self._last_pass_end = 0
+
+        self._condition = threading.Condition()
+        self._stopping = False
+        self._worker: Optional[threading.Thread] = None
+        self._latest: Optional[PartialTranscript] = None
+        self._stats = {'passes': 0, 'failed_passes': 0, 'committed_seconds': 0.0, 'final_window_seconds': 0.0}
+
+    @property
+    def samples_received(self) -> int:
+        """Number of samples fed so far."""
+        with self._condition:
+            return self._length
+
+    def feed(self, chunk: np.ndarray) -> None:
+        """
+        Append recorded audio; starts the worker on first use.
+
+        Args:
+            chunk: Mono float32 audio chunk
+        """
+        samples = np.asarray(chunk, dtype=np.float32).reshape(-1)
+        with self._condition:
+            if self._stopping:
+                return
+            needed = self._length + samples.size
+            if needed > self._buffer.size:
+                grown = np.zeros(max(needed, self._buffer.size * 2), dtype=np.float32)
+                grown[:self._length] = self._buffer[:self._length]
+                self._buffer = grown
+            self._buffer[self._length:needed] = samples
+            self._length = needed
+            self._condition.notify()
+
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="StreamingTranscriber", daemon=True)
+                self._worker.start()
+
+    def _ready_for_pass(self) -> bool:
+        return (self._length - self._last_pass_end >= self.step_samples and
+                self._length - self._committed_offset >= self.min_samples)
+
+    def _run(self) -> None:
+        """Worker loop running incremental passes until finalize/cancel."""
+        while True:
+            with self._condition:
+                while not self._stopping and not self._ready_for_pass():
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                start, end = self._committed_offset, self._length
+                window = self._buffer[start:end].copy()
+                prompt = " ".join(self._committed_words) or None
+                self._last_pass_end = end
+
+            try:
+                result = self.transcribe_fn(window, prompt)
+            except Exception as e:
+                self._stats['failed_passes'] += 1
+                logger.debug(f"Incremental transcription pass failed: {e}")
+                continue
+
+            self._apply_pass(result, start, end)
+
+    def _apply_pass(self, result: Dict[str, Any], start: int, end: int) -> None:
+        """Commit agreed segments and publish the partial transcript."""
+        words = str(result.get('text', '')).split()
+        segments = result.get('segments') or []
+        segment_texts = [str(segment.get('text', '')).strip() for segment in segments]
+
+        with self._condition:
+            self._stats['passes'] += 1
+            stable_count = _common_prefix_length(self._prev_words, words)
+
+            # Commit leading segments both passes agree on, keeping the last open
+            commit_count = min(_common_prefix_length(self._prev_segment_texts, segment_texts), len(segments) - 1)
+            if commit_count > 0:
+                commit_words = " ".join(segment_texts[:commit_count]).split()
+                commit_end = min(end - start, int(round(float(segments[commit_count - 1].get('end', 0.0)) * self.sample_rate)))
+                if commit_end > 0 and words[:len(commit_words)] == commit_words:
+                    self._committed_words.extend(commit_words)
+                    self._committed_offset = start + commit_end
+                    self._stats['committed_seconds'] = self._committed_offset / self.sample_rate
+                    words = words[len(commit_words):]
+                    segment_texts = segment_texts[commit_count:]
+                    stable_count = max(0, stable_count - len(commit_words))
+                    logger.debug(f"Committed {len(commit_words)} words up to {self._stats['committed_seconds']:.2f}s")
+
+            self._prev_words = words
+            self._prev_segment_texts = segment_texts
+            partial = PartialTranscript(
+                stable_text=" ".join(self._committed_words + words[:stable_count]),
+                unstable_text=" ".join(words[stable_count:]),
+                audio_seconds=end / self.sample_rate
+            )
+            self._latest = partial
+
+        self._publish(partial)
+
+    def _publish(self, partial: PartialTranscript) -> None:
+        if self.on_partial:
+            try:
+                self.on_partial(partial)
+            except Exception as e:
+                logger.debug(f"Partial transcript listener failed: {e}")
+
+    def get_partial(self) -> Optional[PartialTranscript]:
+        """Get the most recent partial transcript."""
+        with self._condition:
+            return self._latest
+
+    def finalize(self, timeout: Optional[float] = None) -> str:
+        """
+        Stop incremental passes and transcribe the uncommitted tail.
+
+        Args:
+            timeout: Seconds to wait for an in-flight incremental pass
+
+        Returns:
+            Full transcription (committed text plus the final window)
+
+        Raises:
+            TimeoutError: If the in-flight pass doesn't finish in time
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+            worker = self._worker
+
+        if worker is not None:
+            worker.join(timeout)
+            if worker.is_alive():
+                raise TimeoutError("Incremental transcription pass did not finish in time")
+
+        with self._condition:
+            window = self._buffer[self._committed_offset:self._length].copy()
+            committed = list(self._committed_words)
+            total_seconds = self._length / self.sample_rate
+
+        final_words: List[str] = []
+        if window.size >= self.sample_rate * 0.1:
+            result = self.transcribe_fn(window, " ".join(committed) or None)
+            final_words = str(result.get('text', '')).split()
+
+        self._stats['final_window_seconds'] = window.size / self.sample_rate
+        text = " ".join(committed + final_words)
+        logger.info(f"Streaming transcription finalized: {self._stats['passes']} incremental passes, "
+                    f"final window {self._stats['final_window_seconds']:.2f}s of {total_seconds:.2f}s")
+
+        partial = PartialTranscript(stable_text=text, is_final=True, audio_seconds=total_seconds)
+        with self._condition:
+            self._latest = partial
+        self._publish(partial)
+        return text
+
+    def cancel(self) -> None:
+        """Stop incremental passes without a final transcription."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get streaming transcription statistics."""
+        with self._condition:
+            stats = dict(self._stats)
+            stats['audio_seconds'] = self._length / self.sample_rate
+        return stats
@@ -0,0 +1,176 @@
+# modules/stt_engines.py
+"""
+Speech-to-Text Engines for AURA
+
+Pluggable engine interface used by the audio module and the STT worker
+process. Every engine returns Whisper-style result dictionaries
+({'text', 'segments', 'language'}), so callers don't depend on the backend:
+
+- "whisper": openai-whisper (PyTorch)
+- "faster-whisper": CTranslate2 backend with int8 quantization, several
+  times faster than PyTorch Whisper on CPUs without a GPU
+
+Engines are created by registered name, or from a "package.module:ClassName"
+import path for custom engines.
+"""
+
+import importlib
+import logging
+from typing import Dict, Any, Type
+
+import numpy as np
+
+from config import (
+    STT_MODEL,
+    STT_COMPUTE_TYPE,
+    STT_CPU_THREADS
+)
+
+logger = logging.getLogger(__name__)
+
+
+class STTEngine:
+    """
+    Base class for speech-to-text engines.
+
+    Subclasses load their model in load() (so construction stays cheap and
+    can happen in another process) and implement transcribe().
+    """
+
+    name = "base"
+
+    def __init__(self, model_name: str = STT_MODEL, **options):
+        """
+        Initialize the engine.
+
+        Args:
+            model_name: Model size or path
+            **options: Engine-specific options
+        """
+        self.model_name = model_name
+        self.options = options
+
+    def load(self) -> None:
+        """Load the model."""
+        raise NotImplementedError
+
+    def transcribe(self, audio: np.ndarray, **options) -> Dict[str, Any]:
+        """
+        Transcribe 16 kHz float32 audio.
+
+        Args:
+            audio: Mono float32 samples at 16 kHz
+            **options: Whisper decoding options (language, temperature,
+                initial_prompt, no_speech_threshold, ...)
+
+        Returns:
+            Dictionary with 'text', 'segments' and 'language'
+        """
+        raise NotImplementedError
+
+    def describe(self) -> Dict[str, Any]:
+        """Describe the engine for logging and benchmarks."""
+        return {'engine': self.name, 'model': self.model_name, **self.options}
+
+
+class WhisperEngine(STTEngine):
+    """openai-whisper (PyTorch) engine."""
+
+    name = "whisper"
+
+    def __init__(self, model_name: str = STT_MODEL, **options):
+        super().__init__(model_name, **options)
+        self.model = None
+
+    def load(self) -> None:
+        import whisper
+        self.model = whisper.load_model(self.model_name)
+
+    def transcribe(self, audio: np.ndarray, **options) -> Dict[str, Any]:
+        return self.model.transcribe(audio, **options)
+
+
+class FasterWhisperEngine(STTEngine):
+    """CTranslate2 Whisper engine (faster-whisper), int8 quantized on CPU by default."""
+
+    name = "faster-whisper"
+
+    # Decoding options understood by faster-whisper's transcribe()
+    _SUPPORTED_OPTIONS = ("language", "temperature", "initial_prompt", "no_speech_threshold",
+                          "beam_size", "condition_on_previous_text", "vad_filter")
+
+    def __init__(self, model_name: str = STT_MODEL, compute_type: str = STT_COMPUTE_TYPE,
+                 cpu_threads: int = STT_CPU_THREADS, **options):
+        super().__init__(model_name, compute_type=compute_type, cpu_threads=cpu_threads, **options)
+        self.model = None
+
+    def load(self) -> None:
+        from faster_whisper import WhisperModel
+        self.model = WhisperModel(
+            self.model_name,
+            device=self.options.get('device', "cpu"),
+            compute_type=self.options['compute_type'],
+            cpu_threads=self.options['cpu_threads']
+        )
+
+    def transcribe(self, audio: np.ndarray, **options) -> Dict[str, Any]:
+        kwargs = {key: value for key, value in options.items() if key in self._SUPPORTED_OPTIONS}
+        kwargs.setdefault('beam_size', 1)
+        segments, info = self.model.transcribe(audio, **kwargs)
+        segment_dicts = [{
+            'id': index,
+            'start': segment.start,
+            'end': segment.end,
+            'text': segment.text,
+            'avg_logprob': segment.avg_logprob,
+            'no_speech_prob': segment.no_speech_prob
+        } for index, segment in enumerate(segments)]
+        return {
+            'text': "".join(segment['text'] for segment in segment_dicts),
+            'segments': segment_dicts,
+            'language': info.language
+        }
+
+
+# Registered engines by name
+STT_ENGINES: Dict[str, Type[STTEngine]] = {
+    WhisperEngine.name: WhisperEngine,
+    FasterWhisperEngine.name: FasterWhisperEngine
+}
+
+
+def register_stt_engine(name: str, engine_class: Type[STTEngine]) -> None:
+    """
+    Register a custom engine under a name.
+
+    Args:
+        name: Engine name used in STT_ENGINE
+        engine_class: STTEngine subclass
+    """
+    STT_ENGINES[name] = engine_class
+
+
+def create_stt_engine(name: str, model_name: str = STT_MODEL, **options) -> STTEngine:
+    """
+    Create an engine (without loading its model).
+
+    Args:
+        name: Registered engine name or "package.module:ClassName"
+        model_name: Model size or path
+        **options: Engine-specific options
+
+    Returns:
+        STTEngine instance
+
+    Raises:
+        ValueError: If the engine is unknown
+    """
+    if name in STT_ENGINES:
+        return STT_ENGINES[name](model_name, **options)
+
+    if ":" in name:
+        module_name, class_name = name.split(":", 1)
+        engine_class = getattr(importlib.import_module(module_name), class_name)
+        return engine_class(model_name, **options)
+
+    raise ValueError(f"Unknown STT engine '{name}'. Available: {', '.join(sorted(STT_ENGINES))}")
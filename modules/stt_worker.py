@@ -0,0 +1,276 @@
+# modules/stt_worker.py
+"""
+Speech-to-Text Worker Process for AURA
+
+Runs the STT engine in a dedicated long-lived process so that inference
+doesn't compete with the orchestrator for the GIL, and the model stays
+loaded (and warmed up) between commands.
+
+Audio is passed through a shared memory buffer: the client copies the
+float32 samples into it and sends only the sample count and decoding
+options over a pipe; the worker reads the samples in place and returns the
+Whisper-style result dictionary.
+
+SpeechWorkerClient exposes transcribe(audio, **options) like a Whisper
+model, so it can be used wherever the in-process model was.
+"""
+
+import logging
+import multiprocessing
+import signal
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+from config import (
+    STT_ENGINE,
+    STT_MODEL,
+    STT_WORKER_START_TIMEOUT,
+    STT_WORKER_MAX_AUDIO,
+    AUDIO_API_TIMEOUT
+)
+
+logger = logging.getLogger(__name__)
+
+# Whisper's sample rate; the shared buffer is sized in these samples
+_SAMPLE_RATE = 16000
+
+# Result keys kept when sending segments back to the client
+_SEGMENT_KEYS = ('id', 'start', 'end', 'text', 'avg_logprob', 'no_speech_prob')
+
+
+def _plain_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce an engine result to picklable built-in types."""
+    return {
+        'text': str(result.get('text', '')),
+        'language': result.get('language'),
+        'segments': [
+            {key: (float(segment[key]) if key not in ('id', 'text') else segment[key])
+             for key in _SEGMENT_KEYS if key in segment}
+            for segment in result.get('segments') or []
+        ]
+    }
+
+
+def _worker_main(conn, shm_name: str, capacity: int, engine_name: str, model_name: str,
+                 engine_options: Dict[str, Any]) -> None:
+    """Worker process entry point: load and warm the engine, then serve requests."""
+    # The parent handles Ctrl+C and stops the worker during cleanup
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    from .stt_engines import create_stt_engine
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        try:
+            load_start = time.time()
+            engine = create_stt_engine(engine_name, model_name, **engine_options)
+            engine.load()
+            load_time = time.time() - load_start
+
+            # Warm-up pass so the first command doesn't pay one-time setup costs
+            warm_start = time.time()
+            engine.transcribe(np.zeros(_SAMPLE_RATE, dtype=np.float32), language="en", temperature=0.0)
+            conn.send(('ready', {
+                **engine.describe(),
+                'load_time': load_time,
+                'warmup_time': time.time() - warm_start
+            }))
+        except Exception as e:
+            conn.send(('error', f"{type(e).__name__}: {e}"))
+            return
+
+        buffer = np.ndarray((capacity,), dtype=np.float32, buffer=shm.buf)
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+            if message[0] == 'stop':
+                break
+
+            _, sample_count, options = message
+            try:
+                start = time.time()
+                result = engine.transcribe(buffer[:sample_count], **options)
+                conn.send(('result', _plain_result(result), time.time() - start))
+            except Exception as e:
+                conn.send(('error', f"{type(e).__name__}: {e}"))
+        del buffer
+    finally:
+        shm.close()
+
+
+class SpeechWorkerClient:
+    """
+    Client for the STT worker process, usable like an in-process Whisper model.
+    """
+
+    def __init__(self, engine_name: str = STT_ENGINE, model_name: str = STT_MODEL,
+                 max_audio_seconds: float = STT_WORKER_MAX_AUDIO,
+                 request_timeout: float = AUDIO_API_TIMEOUT, **engine_options):
+        """
+        Initialize the client (the process is started by start()).
+
+        Args:
+            engine_name: Registered engine name or "package.module:ClassName"
+            model_name: Model size or path
+            max_audio_seconds: Longest audio accepted per request
+            request_timeout: Seconds to wait for a transcription before the
+                worker is considered hung and restarted
+            **engine_options: Options passed to the engine
+        """
+        self.engine_name = engine_name
+        self.model_name = model_name
+        self.engine_options = engine_options
+        self.capacity = int(max_audio_seconds * _SAMPLE_RATE)
+        self.request_timeout = request_timeout
+        self.engine_info: Dict[str, Any] = {}
+
+        self._process = None
+        self._conn = None
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._buffer: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+        self._stats = {'requests': 0, 'failures': 0, 'restarts': 0, 'audio_seconds': 0.0, 'inference_seconds': 0.0}
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the worker process is running."""
+        return self._process is not None and self._process.is_alive()
+
+    def start(self, timeout: float = STT_WORKER_START_TIMEOUT) -> Dict[str, Any]:
+        """
+        Start the worker and wait until its model is loaded and warmed up.
+
+        Args:
+            timeout: Seconds to wait for the model to load
+
+        Returns:
+            Engine description including load and warm-up times
+
+        Raises:
+            RuntimeError: If the worker fails to start or load the model
+        """
+        context = multiprocessing.get_context("spawn")
+        self._shm = shared_memory.SharedMemory(create=True, size=self.capacity * 4)
+        self._buffer = np.ndarray((self.capacity,), dtype=np.float32, buffer=self._shm.buf)
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=_worker_main,
+            args=(child_conn, self._shm.name, self.capacity, self.engine_name, self.model_name, self.engine_options),
+            name="STTWorker",
+            daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+
+        try:
+            if not self._conn.poll(timeout):
+                raise RuntimeError(f"STT worker did not load '{self.engine_name}' within {timeout:.0f}s")
+            status, payload = self._conn.recv()
+        except EOFError:
+            status, payload = 'error', "worker exited during startup"
+        except Exception:
+            self.stop()
+            raise
+
+        if status != 'ready':
+            self.stop()
+            raise RuntimeError(f"STT worker failed to start: {payload}")
+
+        self.engine_info = payload
+        logger.info(f"STT worker ready: {payload.get('engine')} '{payload.get('model')}' "
+                    f"(load {payload.get('load_time', 0):.1f}s, warm-up {payload.get('warmup_time', 0):.2f}s)")
+        return payload
+
+    def transcribe(self, audio: np.ndarray, **options) -> Dict[str, Any]:
+        """
+        Transcribe 16 kHz float32 audio in the worker process.
+
+        Args:
+            audio: Mono float32 samples at 16 kHz
+            **options: Decoding options passed to the engine
+
+        Returns:
+            Whisper-style result dictionary
+
+        Raises:
+            RuntimeError: If the worker fails, dies or times out
+        """
+        samples = np.asarray(audio, dtype=np.float32).reshape(-1)
+        if samples.size > self.capacity:
+            logger.warning(f"Audio longer than the STT worker buffer, keeping the last "
+                           f"{self.capacity / _SAMPLE_RATE:.0f}s")
+            samples = samples[-self.capacity:]
+
+        with self._lock:
+            if not self.is_alive:
+                self._restart("worker not running")
+
+            self._buffer[:samples.size] = samples
+            self._conn.send(('transcribe', samples.size, options))
+            self._stats['requests'] += 1
+
+            try:
+                ready = self._conn.poll(self.request_timeout)
+                response = self._conn.recv() if ready else None
+            except (EOFError, OSError):
+                response = None
+
+            if response is None:
+                self._stats['failures'] += 1
+                self._restart("no response" if self.is_alive else "worker exited")
+                raise RuntimeError("STT worker did not return a transcription")
+
+            if response[0] == 'error':
+                self._stats['failures'] += 1
+                raise RuntimeError(f"STT worker transcription failed: {response[1]}")
+
+            _, result, inference_seconds = response
+            self._stats['audio_seconds'] += samples.size / _SAMPLE_RATE
+            self._stats['inference_seconds'] += inference_seconds
+            return result
+
+    def _restart(self, reason: str) -> None:
+        """Replace a dead or hung worker (called with the lock held)."""
+        logger.warning(f"Restarting STT worker: {reason}")
+        self._stats['restarts'] += 1
+        self.stop()
+        self.start()
+
+    def stop(self) -> None:
+        """Stop the worker process and release the shared memory."""
+        if self._conn is not None:
+            try:
+                self._conn.send(('stop',))
+            except Exception:
+                pass
+        if self._process is not None:
+            self._process.join(timeout=2.0)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join(timeout=1.0)
+            self._process = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._shm is not None:
+            self._buffer = None
+            self._shm.close()
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+            self._shm = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request counts and the real-time factor of worker inference."""
+        stats = dict(self._stats)
+        stats['real_time_factor'] = (stats['inference_seconds'] / stats['audio_seconds']
+                                     if stats['audio_seconds'] else None)
+        stats['alive'] = self.is_alive
+        return stats
@@ -0,0 +1,218 @@
+# modules/tts_phrase_cache.py
+"""
+TTS Phrase Audio Cache for AURA
+
+Fixed feedback utterances ("Yes?", timeouts, deferred-action instructions)
+are rendered to audio files once and played from memory through the pygame
+mixer afterwards, instead of starting a `say` process or a pyttsx3 run loop
+every time.
+
+Rendered files are stored on disk keyed by (text, voice, rate), so they
+survive restarts and are re-rendered automatically when the voice or rate
+changes. Configured phrases are rendered at startup; utterances matching a
+configured template are spoken live the first time and rendered in the
+background for the next use.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Dict, Any
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+
+class PhraseAudioCache:
+    """
+    Renders utterances to audio files once and plays them from memory.
+    """
+
+    def __init__(self, renderer: Callable[[str, str], None], cache_dir: str,
+                 voice: str = "default", rate: int = 200,
+                 templates: Iterable[str] = (), max_chars: int = 120,
+                 max_loaded: int = 64):
+        """
+        Initialize the cache.
+
+        Args:
+            renderer: Callable rendering text to an audio file path; raises on failure
+            cache_dir: Directory for rendered files
+            voice: Voice identifier (part of the cache key)
+            rate: Speech rate in words per minute (part of the cache key)
+            templates: Regular expressions of utterances cached on first use
+            max_chars: Longest utterance that is cached
+            max_loaded: Number of decoded sounds kept in memory
+        """
+        self.renderer = renderer
+        self.cache_dir = Path(cache_dir)
+        self.voice = voice
+        self.rate = rate
+        self.templates = [re.compile(pattern) for pattern in templates]
+        self.max_chars = max_chars
+        self.max_loaded = max_loaded
+
+        self._phrases = set()
+        self._sounds: "OrderedDict[str, Any]" = OrderedDict()
+        self._pending = set()
+        self._channel = None
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'renders': 0, 'render_failures': 0, 'render_time': 0.0}
+
+    def cache_path(self, text: str) -> Path:
+        """Path of the rendered file for an utterance with the current voice and rate."""
+        key = hashlib.sha1(f"{text}\x00{self.voice}\x00{self.rate}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.wav"
+
+    def is_cacheable(self, text: str) -> bool:
+        """Whether an utterance is a configured phrase or matches a template."""
+        if not text or len(text) > self.max_chars:
+            return False
+        return text in self._phrases or any(pattern.fullmatch(text) for pattern in self.templates)
+
+    def prerender(self, phrases: Iterable[str]) -> int:
+        """
+        Render phrases that aren't on disk yet and load them into memory.
+
+        Args:
+            phrases: Fixed utterances
+
+        Returns:
+            Number of phrases available from the cache
+        """
+        ready = 0
+        for text in phrases:
+            self._phrases.add(text)
+            if self._load(text, render=True) is not None:
+                ready += 1
+        logger.info(f"TTS phrase cache ready: {ready} phrases ({self._stats['renders']} rendered)")
+        return ready
+
+    def play(self, text: str, wait: bool = True) -> bool:
+        """
+        Play an utterance from the cache.
+
+        Cacheable utterances that haven't been rendered yet are rendered in the
+        background, and False is returned so the caller speaks them live.
+
+        Args:
+            text: Utterance to play
+            wait: Block until playback has finished
+
+        Returns:
+            True if the utterance was played from the cache
+        """
+        if not self.is_cacheable(text):
+            return False
+
+        sound = self._load(text, render=False)
+        if sound is None:
+            self._stats['misses'] += 1
+            self._render_in_background(text)
+            return False
+
+        try:
+            channel = sound.play()
+        except pygame.error as e:
+            logger.debug(f"Cached phrase playback failed: {e}")
+            return False
+        self._channel = channel
+        self._stats['hits'] += 1
+
+        if wait and channel is not None:
+            deadline = time.monotonic() + sound.get_length() + 1.0
+            while channel.get_busy() and time.monotonic() < deadline:
+                time.sleep(0.01)
+        return True
+
+    def stop(self) -> bool:
+        """
+        Stop the cached phrase currently playing (barge-in).
+
+        Returns:
+            True if a phrase was playing
+        """
+        channel, self._channel = self._channel, None
+        if channel is None or not channel.get_busy():
+            return False
+        channel.stop()
+        return True
+
+    def _load(self, text: str, render: bool) -> Optional[Any]:
+        """Get the decoded sound from memory or disk, optionally rendering it first."""
+        with self._lock:
+            sound = self._sounds.get(text)
+            if sound is not None:
+                self._sounds.move_to_end(text)
+                return sound
+
+        path = self.cache_path(text)
+        if not path.exists():
+            if not render or not self._render(text, path):
+                return None
+
+        try:
+            sound = pygame.mixer.Sound(str(path))
+        except pygame.error as e:
+            logger.debug(f"Could not load cached phrase {path.name}: {e}")
+            return None
+
+        with self._lock:
+            self._sounds[text] = sound
+            while len(self._sounds) > self.max_loaded:
+                self._sounds.popitem(last=False)
+        return sound
+
+    def _render(self, text: str, path: Path) -> bool:
+        """Render an utterance to its cache file (written atomically)."""
+        start = time.time()
+        temp_path = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp.wav")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.renderer(text, str(temp_path))
+            if not temp_path.exists() or temp_path.stat().st_size == 0:
+                raise RuntimeError("renderer produced no audio")
+            os.replace(temp_path, path)
+        except Exception as e:
+            self._stats['render_failures'] += 1
+            logger.warning(f"Could not render TTS phrase '{text[:40]}': {e}")
+            temp_path.unlink(missing_ok=True)
+            return False
+
+        self._stats['renders'] += 1
+        self._stats['render_time'] += time.time() - start
+        return True
+
+    def _render_in_background(self, text: str) -> None:
+        """Render an utterance for next time without delaying the live speech."""
+        with self._lock:
+            if text in self._pending:
+                return
+            self._pending.add(text)
+
+        def render():
+            try:
+                self._load(text, render=True)
+            finally:
+                with self._lock:
+                    self._pending.discard(text)
+
+        threading.Thread(target=render, daemon=True, name="TTSPhraseRender").start()
+
+    def clear_memory(self) -> None:
+        """Release the decoded sounds (the files on disk are kept)."""
+        with self._lock:
+            self._sounds.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit, miss and render counts."""
+        stats = dict(self._stats)
+        stats['loaded'] = len(self._sounds)
+        stats['phrases'] = len(self._phrases)
+        return stats
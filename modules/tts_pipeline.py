@@ -0,0 +1,405 @@
+# modules/tts_pipeline.py
+"""
+Sentence-Pipelined Text-to-Speech for AURA
+
+Long responses (question answers, explanations) are split into sentences.
+A background thread synthesizes sentence N+1 while sentence N plays, so
+audio starts after the first sentence is rendered instead of after the
+whole response, and playback can be cancelled between or during sentences
+(barge-in when a new wake word arrives).
+
+Sentences can also be supplied incrementally (speak_sentences() with a
+generator), e.g. from SentenceChunker fed with streamed LLM tokens.
+
+Backends implement synthesize() (text -> playable clip) and play() (blocking
+playback that honours a cancel event), which keeps the pipeline testable
+with a fake backend.
+"""
+
+import logging
+import os
+import queue
+import re
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, List, Optional, Dict
+
+import pygame
+
+from config import (
+    TTS_PIPELINE_LOOKAHEAD,
+    TTS_PIPELINE_MAX_SENTENCE_CHARS
+)
+
+logger = logging.getLogger(__name__)
+
+# Sentence ends: terminal punctuation followed by whitespace and a likely sentence start
+_SENTENCE_END = re.compile(r'(?<=[.!?…])["\')\]]?\s+(?=["\'(\[]?[A-Z0-9])')
+
+# Sentence or line ends in streamed text (group 1 is closing punctuation kept with the sentence)
+_STREAM_BOUNDARY = re.compile(r'(?<=[.!?…])(["\')\]]?)\s+(?=["\'(\[]?[A-Z0-9])|\s*\n\s*')
+
+# List markers ("1.", "a)") that belong to the following sentence
+_LIST_MARKER = re.compile(r'^(\d+|[A-Za-z])[.)]$')
+
+# Places a long sentence may be split, in order of preference
+_CLAUSE_BREAKS = (re.compile(r'(?<=[;:])\s+'), re.compile(r'(?<=,)\s+'), re.compile(r'\s+'))
+
+# Queue marker for the end of the synthesized sentences
+_DONE = object()
+
+
+def _split_long(sentence: str, max_chars: int, breaks=_CLAUSE_BREAKS) -> List[str]:
+    """Split a sentence longer than max_chars at clause breaks, then words."""
+    if len(sentence) <= max_chars or not breaks:
+        return [sentence]
+
+    pieces, current = [], ""
+    for part in breaks[0].split(sentence):
+        candidate = f"{current} {part}" if current else part
+        if len(candidate) <= max_chars or not current:
+            current = candidate
+        else:
+            pieces.append(current)
+            current = part
+    pieces.append(current)
+
+    result = []
+    for piece in pieces:
+        result.extend(_split_long(piece, max_chars, breaks[1:]))
+    return result
+
+
+def split_sentences(text: str, max_chars: int = TTS_PIPELINE_MAX_SENTENCE_CHARS) -> List[str]:
+    """
+    Split text into sentences for pipelined synthesis.
+
+    Lines (paragraphs, list items) are split separately; sentences longer
+    than max_chars are split at clause boundaries.
+
+    Args:
+        text: Text to split
+        max_chars: Longest piece synthesized at once
+
+    Returns:
+        List of non-empty sentences
+    """
+    sentences = []
+    for line in text.splitlines():
+        marker = ""
+        for sentence in _SENTENCE_END.split(line.strip()):
+            sentence = sentence.strip()
+            if _LIST_MARKER.match(sentence):
+                marker = f"{marker}{sentence} "
+            elif sentence:
+                sentences.extend(_split_long(marker + sentence, max_chars))
+                marker = ""
+        if marker:
+            sentences.append(marker.strip())
+    return sentences
+
+
+class SentenceChunker:
+    """
+    Buffers streamed text and returns sentences as soon as they are complete.
+
+    A sentence is complete once the start of the next one (or a line break)
+    has arrived; text without a boundary is split at clause breaks once it
+    exceeds max_chars, and flush() returns whatever remains at the end.
+    """
+
+    def __init__(self, max_chars: int = TTS_PIPELINE_MAX_SENTENCE_CHARS):
+        """
+        Initialize the chunker.
+
+        Args:
+            max_chars: Longest sentence held back waiting for a boundary
+        """
+        self.max_chars = max_chars
+        self._buffer = ""
+        self._marker = ""
+
+    def feed(self, text: str) -> List[str]:
+        """
+        Add streamed text.
+
+        Args:
+            text: Next piece of the stream (any length)
+
+        Returns:
+            Sentences completed by this piece
+        """
+        self._buffer += text
+        sentences = []
+        while True:
+            match = _STREAM_BOUNDARY.search(self._buffer)
+            if not match:
+                break
+            end = match.start() + len(match.group(1) or "")
+            sentences.extend(self._complete(self._buffer[:end]))
+            self._buffer = self._buffer[match.end():]
+
+        if len(self._buffer) > self.max_chars:
+            pieces = _split_long(self._buffer.strip(), self.max_chars)
+            for piece in pieces[:-1]:
+                sentences.extend(self._complete(piece))
+            self._buffer = pieces[-1]
+        return sentences
+
+    def flush(self) -> List[str]:
+        """Return the remaining text as the last sentence."""
+        sentences = self._complete(self._buffer)
+        if self._marker:
+            sentences.append(self._marker.strip())
+        self._buffer = self._marker = ""
+        return sentences
+
+    def _complete(self, sentence: str) -> List[str]:
+        sentence = sentence.strip()
+        if _LIST_MARKER.match(sentence):
+            self._marker = f"{self._marker}{sentence} "
+            return []
+        if not sentence:
+            return []
+        sentence, self._marker = self._marker + sentence, ""
+        return [sentence]
+
+
+@dataclass
+class SpeechResult:
+    """Outcome of one pipelined utterance."""
+    sentences: int
+    spoken: int = 0
+    cancelled: bool = False
+    time_to_first_audio: Optional[float] = None
+    duration: float = 0.0
+    error: Optional[str] = None
+    remaining: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for logging."""
+        return {
+            'sentences': self.sentences,
+            'spoken': self.spoken,
+            'cancelled': self.cancelled,
+            'time_to_first_audio': None if self.time_to_first_audio is None else round(self.time_to_first_audio, 3),
+            'duration': round(self.duration, 3),
+            'error': self.error
+        }
+
+
+class SpeechBackend:
+    """
+    Synthesis and playback used by PipelinedSpeaker.
+    """
+
+    def synthesize(self, text: str) -> Any:
+        """Render text to a clip that play() accepts."""
+        raise NotImplementedError
+
+    def play(self, clip: Any, cancel_event: threading.Event) -> None:
+        """Play a clip, returning when it finishes or cancel_event is set."""
+        raise NotImplementedError
+
+    def stop(self) -> None:
+        """Stop the clip currently playing."""
+
+
+class MixerSpeechBackend(SpeechBackend):
+    """
+    Renders sentences to temporary WAV files with the system TTS and plays
+    them from memory through the pygame mixer.
+    """
+
+    def __init__(self, renderer: Callable[[str, str], None]):
+        """
+        Initialize the backend.
+
+        Args:
+            renderer: Callable rendering text to an audio file path
+        """
+        self.renderer = renderer
+        self._channel = None
+
+    def synthesize(self, text: str) -> Any:
+        handle, path = tempfile.mkstemp(prefix="aura_tts_", suffix=".wav")
+        os.close(handle)
+        try:
+            self.renderer(text, path)
+            return pygame.mixer.Sound(path)
+        finally:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def play(self, clip: Any, cancel_event: threading.Event) -> None:
+        channel = self._channel = clip.play()
+        if channel is None:
+            return
+        deadline = time.monotonic() + clip.get_length() + 1.0
+        while channel.get_busy() and time.monotonic() < deadline:
+            if cancel_event.wait(0.01):
+                channel.stop()
+                break
+
+    def stop(self) -> None:
+        if self._channel is not None:
+            self._channel.stop()
+
+
+class PipelinedSpeaker:
+    """
+    Speaks text sentence by sentence, synthesizing ahead of playback.
+    """
+
+    def __init__(self, backend: SpeechBackend, lookahead: int = TTS_PIPELINE_LOOKAHEAD,
+                 max_sentence_chars: int = TTS_PIPELINE_MAX_SENTENCE_CHARS):
+        """
+        Initialize the speaker.
+
+        Args:
+            backend: Synthesis and playback backend
+            lookahead: Sentences synthesized ahead of the one playing
+            max_sentence_chars: Longest piece synthesized at once
+        """
+        self.backend = backend
+        self.lookahead = max(1, lookahead)
+        self.max_sentence_chars = max_sentence_chars
+
+        self._speak_lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self._speaking = False
+        self._stats = {'utterances': 0, 'cancelled': 0, 'failures': 0, 'first_audio_times': []}
+
+    @property
+    def is_speaking(self) -> bool:
+        """Whether an utterance is in progress."""
+        return self._speaking
+
+    def should_pipeline(self, text: str) -> bool:
+        """Whether text has more than one sentence (short text gains nothing)."""
+        return len(split_sentences(text, self.max_sentence_chars)) > 1
+
+    def cancel(self) -> bool:
+        """
+        Stop the current utterance (barge-in).
+
+        Returns:
+            True if an utterance was in progress
+        """
+        if not self._speaking:
+            return False
+        self._cancel_event.set()
+        self.backend.stop()
+        return True
+
+    def speak(self, text: str) -> SpeechResult:
+        """
+        Speak text, blocking until it has been played or cancelled.
+
+        Args:
+            text: Text to speak
+
+        Returns:
+            SpeechResult with time-to-first-audio and sentences spoken
+        """
+        return self.speak_sentences(split_sentences(text, self.max_sentence_chars))
+
+    def speak_sentences(self, sentences: Iterable[str]) -> SpeechResult:
+        """
+        Speak sentences as they become available, blocking until done.
+
+        Args:
+            sentences: List or iterator of sentences; iterators are consumed
+                lazily by the synthesis thread (unconsumed items are left in
+                the iterator when speech is cancelled or fails)
+
+        Returns:
+            SpeechResult with time-to-first-audio and sentences spoken
+        """
+        with self._speak_lock:
+            cancel_event = self._cancel_event = threading.Event()
+            self._speaking = True
+            try:
+                result = self._run(sentences, cancel_event)
+            finally:
+                self._speaking = False
+
+        self._stats['utterances'] += 1
+        self._stats['cancelled'] += int(result.cancelled)
+        self._stats['failures'] += int(result.error is not None)
+        if result.time_to_first_audio is not None:
+            self._stats['first_audio_times'] = (self._stats['first_audio_times'] + [result.time_to_first_audio])[-50:]
+            logger.info(f"TTS first audio after {result.time_to_first_audio * 1000:.0f}ms "
+                        f"({result.spoken}/{result.sentences} sentences spoken"
+                        f"{', cancelled' if result.cancelled else ''})")
+        return result
+
+    def _run(self, sentences: Iterable[str], cancel_event: threading.Event) -> SpeechResult:
+        result = SpeechResult(sentences=0)
+        source = iter(sentences)
+        pulled = []
+        clips = queue.Queue(maxsize=self.lookahead)
+        errors = []
+        start = time.perf_counter()
+
+        def put(item) -> bool:
+            while not cancel_event.is_set():
+                try:
+                    clips.put(item, timeout=0.05)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for sentence in source:
+                    pulled.append(sentence)
+                    if cancel_event.is_set() or not put((sentence, self.backend.synthesize(sentence))):
+                        return
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+            finally:
+                put(_DONE)
+
+        producer = threading.Thread(target=produce, daemon=True, name="TTSSynthesis")
+        producer.start()
+
+        while not cancel_event.is_set():
+            try:
+                item = clips.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            if item is _DONE:
+                break
+            _, clip = item
+            if result.time_to_first_audio is None:
+                result.time_to_first_audio = time.perf_counter() - start
+            self.backend.play(clip, cancel_event)
+            if not cancel_event.is_set():
+                result.spoken += 1
+
+        result.cancelled = cancel_event.is_set()
+        producer.join(timeout=1.0)
+        result.duration = time.perf_counter() - start
+        is_list = isinstance(sentences, list)
+        result.sentences = len(sentences) if is_list else len(pulled)
+        if errors and not result.cancelled:
+            result.error = errors[0]
+            result.remaining = pulled[result.spoken:] + (sentences[len(pulled):] if is_list else [])
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get utterance counts and time-to-first-audio statistics."""
+        times = sorted(self._stats['first_audio_times'])
+        return {
+            'utterances': self._stats['utterances'],
+            'cancelled': self._stats['cancelled'],
+            'failures': self._stats['failures'],
+            'median_time_to_first_audio': times[len(times) // 2] if times else None,
+            'last_time_to_first_audio': self._stats['first_audio_times'][-1] if times else None
+        }
@@ -0,0 +1,398 @@
+# modules/ui_element_detector.py
+"""
+Local UI Element Detector for AURA
+
+CPU-only detection of clickable-looking UI elements (buttons, text fields,
+text labels/links) in a screenshot using OpenCV edges, contours and
+morphological text-region detection. Runs in tens of milliseconds, so it can
+be tried before a multi-second vision model call:
+
+- Candidates are matched against elements the accessibility layer already
+  knows (label plus frame) to confirm a click target without vision
+- Otherwise candidates are passed to the vision model as hints, with a few
+  cropped regions, to narrow down its search
+"""
+
+import base64
+import logging
+import time
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Dict, Any, Optional, List, Tuple
+
+import cv2
+import numpy as np
+
+from config import (
+    UI_DETECTOR_MAX_CANDIDATES,
+    UI_DETECTOR_MIN_MATCH_CONFIDENCE,
+    UI_DETECTOR_MAX_HINT_CROPS
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DetectedElement:
+    """A candidate UI element proposed by the local detector."""
+    bbox: Tuple[int, int, int, int]  # x, y, width, height in screenshot pixels
+    kind: str  # button, field, text, control
+    confidence: float
+    has_text: bool = False
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def center(self) -> Tuple[int, int]:
+        """Center point of the bounding box."""
+        x, y, w, h = self.bbox
+        return (x + w // 2, y + h // 2)
+
+    def scaled(self, scale_x: float, scale_y: float) -> 'DetectedElement':
+        """Return a copy with the bounding box scaled to screen coordinates."""
+        x, y, w, h = self.bbox
+        return DetectedElement(
+            bbox=(int(round(x * scale_x)), int(round(y * scale_y)),
+                  int(round(w * scale_x)), int(round(h * scale_y))),
+            kind=self.kind,
+            confidence=self.confidence,
+            has_text=self.has_text,
+            metadata=dict(self.metadata)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for logging and vision hints."""
+        return {
+            'bbox': list(self.bbox),
+            'center': list(self.center),
+            'kind': self.kind,
+            'confidence': round(self.confidence, 3),
+            'has_text': self.has_text
+        }
+
+
+def bbox_iou(a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]) -> float:
+    """Intersection over union of two (x, y, w, h) boxes."""
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    ix = max(0, min(ax + aw, bx + bw) - max(ax, bx))
+    iy = max(0, min(ay + ah, by + bh) - max(ay, by))
+    intersection = ix * iy
+    union = aw * ah + bw * bh - intersection
+    return intersection / union if union > 0 else 0.0
+
+
+def _contains(outer: Tuple[int, int, int, int], inner: Tuple[int, int, int, int], margin: int = 2) -> bool:
+    ox, oy, ow, oh = outer
+    ix, iy, iw, ih = inner
+    return (ix >= ox - margin and iy >= oy - margin and
+            ix + iw <= ox + ow + margin and iy + ih <= oy + oh + margin)
+
+
+class UIElementDetector:
+    """
+    Proposes button and field rectangles from a screenshot.
+
+    Detection is purely geometric: rectangular contours from a Canny edge map
+    become control candidates, and horizontally-merged high-gradient blobs
+    become text regions. Rectangles are classified by aspect ratio, interior
+    uniformity and the position of text inside them.
+    """
+
+    def __init__(self, max_candidates: int = UI_DETECTOR_MAX_CANDIDATES,
+                 min_control_size: Tuple[int, int] = (24, 14),
+                 max_control_height: int = 120):
+        """
+        Initialize the detector.
+
+        Args:
+            max_candidates: Maximum number of candidates returned
+            min_control_size: Minimum (width, height) of a control rectangle
+            max_control_height: Maximum height of a control rectangle
+        """
+        self.max_candidates = max_candidates
+        self.min_control_size = min_control_size
+        self.max_control_height = max_control_height
+        self.last_detection_ms = 0.0
+
+    @staticmethod
+    def decode_screenshot(screenshot_b64: str) -> Optional[np.ndarray]:
+        """
+        Decode a base64 screenshot into a BGR or grayscale OpenCV image.
+
+        Args:
+            screenshot_b64: Base64 encoded JPEG/PNG
+
+        Returns:
+            Image array or None if decoding fails
+        """
+        try:
+            data = np.frombuffer(base64.b64decode(screenshot_b64), dtype=np.uint8)
+            return cv2.imdecode(data, cv2.IMREAD_UNCHANGED)
+        except Exception as e:
+            logger.debug(f"Failed to decode screenshot for local detection: {e}")
+            return None
+
+    def detect(self, image: np.ndarray) -> List[DetectedElement]:
+        """
+        Detect candidate UI elements.
+
+        Args:
+            image: BGR, BGRA or grayscale image
+
+        Returns:
+            Candidates sorted by confidence (highest first)
+        """
+        start_time = time.time()
+        gray = self._to_gray(image)
+        height, width = gray.shape[:2]
+
+        text_boxes = self._detect_text_regions(gray)
+        control_boxes = self._detect_control_rectangles(gray, width, height)
+
+        candidates = []
+        for box in control_boxes:
+            inner_text = [t for t in text_boxes if _contains(box, t)]
+            kind, confidence = self._classify_control(gray, box, inner_text)
+            candidates.append(DetectedElement(box, kind, confidence, has_text=bool(inner_text)))
+
+        # Text outside any control is a label or link candidate
+        for box in text_boxes:
+            if not any(_contains(c.bbox, box) for c in candidates):
+                candidates.append(DetectedElement(box, 'text', 0.4, has_text=True))
+
+        candidates = self._suppress_duplicates(candidates)
+        candidates.sort(key=lambda c: c.confidence, reverse=True)
+        candidates = candidates[:self.max_candidates]
+
+        self.last_detection_ms = (time.time() - start_time) * 1000
+        logger.debug(f"Local UI detection found {len(candidates)} candidates in {self.last_detection_ms:.1f}ms")
+        return candidates
+
+    @staticmethod
+    def _to_gray(image: np.ndarray) -> np.ndarray:
+        if image.ndim == 2:
+            return image
+        if image.shape[2] == 4:
+            return cv2.cvtColor(image, cv2.COLOR_BGRA2GRAY)
+        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+    def _detect_control_rectangles(self, gray: np.ndarray, width: int, height: int) -> List[Tuple[int, int, int, int]]:
+        """Find rectangular contours that look like buttons or fields."""
+        edges = cv2.Canny(gray, 40, 120)
+        edges = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, np.ones((3, 3), np.uint8))
+        contours, _ = cv2.findContours(edges, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
+
+        min_w, min_h = self.min_control_size
+        boxes = []
+        for contour in contours:
+            x, y, w, h = cv2.boundingRect(contour)
+            if w < min_w or h < min_h or h > self.max_control_height or w > width * 0.6:
+                continue
+            # Rectangular contours fill most of their bounding box
+            if cv2.contourArea(cv2.convexHull(contour)) < 0.75 * w * h:
+                continue
+            boxes.append((x, y, w, h))
+        return boxes
+
+    def _detect_text_regions(self, gray: np.ndarray) -> List[Tuple[int, int, int, int]]:
+        """Find text lines using morphological gradient and horizontal closing."""
+        gradient = cv2.morphologyEx(gray, cv2.MORPH_GRADIENT, cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3)))
+        _, binary = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+        # Remove long horizontal/vertical strokes (control borders, separators)
+        lines = cv2.morphologyEx(binary, cv2.MORPH_OPEN, cv2.getStructuringElement(cv2.MORPH_RECT, (30, 1)))
+        lines |= cv2.morphologyEx(binary, cv2.MORPH_OPEN, cv2.getStructuringElement(cv2.MORPH_RECT, (1, 20)))
+        binary = cv2.subtract(binary, cv2.dilate(lines, np.ones((3, 3), np.uint8)))
+        connected = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_RECT, (9, 1)))
+        contours, _ = cv2.findContours(connected, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+        boxes = []
+        for contour in contours:
+            x, y, w, h = cv2.boundingRect(contour)
+            if h < 6 or h > 48 or w < 8 or w < h:
+                continue
+            # Text blobs are only partially filled with gradient pixels
+            fill_ratio = cv2.countNonZero(binary[y:y + h, x:x + w]) / float(w * h)
+            if 0.15 <= fill_ratio <= 0.9:
+                boxes.append((x, y, w, h))
+        return boxes
+
+    @staticmethod
+    def _classify_control(gray: np.ndarray, box: Tuple[int, int, int, int],
+                          inner_text: List[Tuple[int, int, int, int]]) -> Tuple[str, float]:
+        """Classify a control rectangle as button, field or generic control."""
+        x, y, w, h = box
+        inset = max(2, min(w, h) // 6)
+        interior = gray[y + inset:y + h - inset, x + inset:x + w - inset]
+        if interior.size == 0:
+            return 'control', 0.3
+
+        aspect = w / float(h)
+        interior_mean = float(interior.mean())
+        centered = False
+        if inner_text:
+            text_center = sum(t[0] + t[2] / 2 for t in inner_text) / len(inner_text)
+            centered = abs(text_center - (x + w / 2)) < w * 0.15
+
+        # Fields: wide, light interior, placeholder/value text (if any) not centered
+        if aspect >= 3.5 and interior_mean >= 200 and not centered:
+            return 'field', 0.75 if inner_text else 0.7
+
+        if inner_text:
+            return 'button', 0.85 if centered else 0.65
+
+        return 'control', 0.35
+
+    @staticmethod
+    def _suppress_duplicates(candidates: List[DetectedElement], iou_threshold: float = 0.7) -> List[DetectedElement]:
+        """Drop near-identical boxes (e.g. inner and outer edge of one border)."""
+        kept: List[DetectedElement] = []
+        for candidate in sorted(candidates, key=lambda c: (c.confidence, c.bbox[2] * c.bbox[3]), reverse=True):
+            if all(bbox_iou(candidate.bbox, k.bbox) < iou_threshold for k in kept):
+                kept.append(candidate)
+        return kept
+
+    @staticmethod
+    def crop_b64(image: np.ndarray, bbox: Tuple[int, int, int, int], padding: int = 6) -> Optional[str]:
+        """
+        Crop a candidate region and encode it as base64 JPEG.
+
+        Args:
+            image: Source image
+            bbox: Region to crop
+            padding: Extra pixels around the region
+
+        Returns:
+            Base64 encoded crop or None on failure
+        """
+        x, y, w, h = bbox
+        height, width = image.shape[:2]
+        crop = image[max(0, y - padding):min(height, y + h + padding), max(0, x - padding):min(width, x + w + padding)]
+        ok, encoded = cv2.imencode(".jpg", crop, [cv2.IMWRITE_JPEG_QUALITY, 80])
+        return base64.b64encode(encoded.tobytes()).decode('utf-8') if ok else None
+
+
+def _element_frame(element: Dict[str, Any]) -> Optional[Tuple[int, int, int, int]]:
+    """Read an (x, y, w, h) frame from an accessibility element dictionary."""
+    coordinates = element.get('coordinates')
+    if isinstance(coordinates, (list, tuple)) and len(coordinates) == 4:
+        return tuple(int(v) for v in coordinates)
+    position, size = element.get('position'), element.get('size')
+    if isinstance(position, (list, tuple)) and isinstance(size, (list, tuple)) and len(position) == 2 and len(size) == 2:
+        return (int(position[0]), int(position[1]), int(size[0]), int(size[1]))
+    return None
+
+
+def _element_label(element: Dict[str, Any]) -> str:
+    for key in ('title', 'matched_text', 'description', 'value', 'label'):
+        value = element.get(key)
+        if value:
+            return str(value)
+    return ""
+
+
+def match_known_elements(candidates: List[DetectedElement], known_elements: List[Dict[str, Any]],
+                         target_label: str,
+                         min_confidence: float = UI_DETECTOR_MIN_MATCH_CONFIDENCE) -> Optional[Dict[str, Any]]:
+    """
+    Match detected candidates against elements the accessibility layer knows.
+
+    A known element whose label resembles the target and whose frame overlaps
+    a detected control confirms that control as the click target.
+
+    Args:
+        candidates: Detected elements in screen coordinates
+        known_elements: Accessibility element dictionaries with labels and frames
+        target_label: Label the user asked for
+        min_confidence: Minimum combined label/geometry score
+
+    Returns:
+        Match dictionary with candidate, element and confidence, or None
+    """
+    target = target_label.strip().lower()
+    if not target or not candidates:
+        return None
+
+    best = None
+    for element in known_elements or []:
+        frame = _element_frame(element)
+        label = _element_label(element).strip().lower()
+        if frame is None or not label:
+            continue
+
+        label_score = SequenceMatcher(None, target, label).ratio()
+        if target in label or label in target:
+            label_score = max(label_score, 0.9)
+
+        for candidate in candidates:
+            overlap = bbox_iou(candidate.bbox, frame)
+            if overlap == 0.0 and _contains(frame, candidate.bbox, margin=4):
+                overlap = 0.5
+            if overlap == 0.0:
+                continue
+            score = label_score * (0.5 + 0.5 * min(1.0, overlap)) * (0.7 + 0.3 * candidate.confidence)
+            if best is None or score > best['confidence']:
+                best = {'candidate': candidate, 'element': element, 'confidence': score}
+
+    if best and best['confidence'] >= min_confidence:
+        return best
+    return None
+
+
+def build_vision_hints(image: np.ndarray, candidates: List[DetectedElement],
+                       max_crops: int = UI_DETECTOR_MAX_HINT_CROPS) -> List[Dict[str, Any]]:
+    """
+    Build vision model hints from detected candidates.
+
+    Boxes stay in the pixel space of the screenshot the candidates were
+    detected in, so the hints must be sent along with that same screenshot.
+
+    Args:
+        image: Screenshot the candidates were detected in
+        candidates: Detected elements in screenshot coordinates
+        max_crops: Number of highest-confidence candidates that get a cropped image
+
+    Returns:
+        Hint dictionaries with screenshot pixel boxes and optional crops
+    """
+    hints = []
+    for index, candidate in enumerate(candidates):
+        hint = candidate.to_dict()
+        if index < max_crops and candidate.kind in ('button', 'field'):
+            crop = UIElementDetector.crop_b64(image, candidate.bbox)
+            if crop:
+                hint['crop_b64'] = crop
+        hints.append(hint)
+    return hints
+
+
+def format_vision_hints(hints: List[Dict[str, Any]]) -> str:
+    """
+    Describe detector candidates as prompt text for the vision model.
+
+    Args:
+        hints: Hint dictionaries from build_vision_hints
+
+    Returns:
+        Prompt text listing candidate boxes in screenshot pixel coordinates
+    """
+    lines = ["A local detector proposed these candidate UI elements "
+             "(x, y, width, height in pixels of the attached screenshot). Use them to locate elements, "
+             "but report only elements you can actually see:"]
+    crop_index = 0
+    for index, hint in enumerate(hints, 1):
+        x, y, w, h = hint['bbox']
+        line = f"{index}. {hint['kind']} at ({x}, {y}, {w}, {h})"
+        if hint.get('crop_b64'):
+            crop_index += 1
+            line += f" - shown in cropped image {crop_index}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def hints_signature(hints: Optional[List[Dict[str, Any]]]) -> Tuple:
+    """Hashable signature of a hint list, used in request cache keys."""
+    return tuple((tuple(h['bbox']), h['kind']) for h in hints or [])
+
+
+# Global detector instance
+ui_element_detector = UIElementDetector()
@@ -0,0 +1,437 @@
+# modules/ui_settle.py
+"""
+UI Settle Waits for AURA
+
+Replaces fixed time.sleep() pauses in automation with waits that poll a
+cheap condition with exponential micro-backoff (2 ms, 4 ms, ... capped)
+until it holds or a deadline passes, so actions continue as soon as the UI
+is ready on fast apps and still get enough time on slow ones.
+
+Conditions (each captures its baseline when created, i.e. before the
+action it waits on):
+- PasteboardChanged: NSPasteboard changeCount moved
+- FocusedElementChanged / FocusAt: keyboard focus moved, or is on the
+  element under a point
+- FocusedValueChanged / SelectionChanged: the focused element's value or
+  selected text range changed (typed text landed, Cmd+A took effect)
+- ScreenRegionChanged: a hash of a small screen tile changed
+- AXNotificationReceived: an accessibility notification (e.g. a menu
+  opened) arrived; the wait pumps the run loop instead of sleeping
+- AppResponsive: the frontmost application answers accessibility queries
+
+A condition that can't be evaluated on this machine (no PyObjC, no
+accessibility permission, element without the attribute) is unavailable,
+and wait_for() falls back to the fixed delay the call site used before.
+"""
+
+import hashlib
+import logging
+import time
+from typing import Callable, Optional, Tuple, Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    from AppKit import NSPasteboard
+    PASTEBOARD_AVAILABLE = True
+except ImportError:
+    PASTEBOARD_AVAILABLE = False
+
+try:
+    from ApplicationServices import (
+        AXUIElementCreateSystemWide,
+        AXUIElementCopyAttributeValue,
+        AXObserverCreate,
+        AXObserverAddNotification,
+        AXObserverGetRunLoopSource,
+        AXUIElementCreateApplication,
+        kAXFocusedApplicationAttribute,
+        kAXFocusedUIElementAttribute,
+        kAXValueAttribute,
+        kAXSelectedTextRangeAttribute,
+        kAXPositionAttribute,
+        kAXSizeAttribute
+    )
+    from CoreFoundation import (
+        CFRunLoopGetCurrent,
+        CFRunLoopAddSource,
+        CFRunLoopRemoveSource,
+        CFRunLoopRunInMode,
+        kCFRunLoopDefaultMode
+    )
+    AX_AVAILABLE = True
+except ImportError:
+    AX_AVAILABLE = False
+
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
+# Backoff between condition checks
+INITIAL_POLL_INTERVAL = 0.002
+MAX_POLL_INTERVAL = 0.05
+
+
+class SettleCondition:
+    """
+    Base class for settle conditions.
+
+    Subclasses set self.available in __init__ and implement check().
+    """
+
+    name = "condition"
+
+    def __init__(self):
+        self.available = True
+
+    def check(self) -> bool:
+        """Whether the UI has settled."""
+        raise NotImplementedError
+
+    def pause(self, seconds: float) -> None:
+        """Wait between checks (conditions fed by callbacks pump the run loop instead)."""
+        time.sleep(seconds)
+
+    def close(self) -> None:
+        """Release resources held for the wait."""
+
+
+class Predicate(SettleCondition):
+    """Wraps a plain callable."""
+
+    name = "predicate"
+
+    def __init__(self, predicate: Callable[[], bool], name: str = "predicate"):
+        super().__init__()
+        self.predicate = predicate
+        self.name = name
+
+    def check(self) -> bool:
+        return bool(self.predicate())
+
+
+class AnyOf(SettleCondition):
+    """Holds when any available condition holds."""
+
+    name = "any_of"
+
+    def __init__(self, *conditions: SettleCondition):
+        super().__init__()
+        self.conditions = [c for c in conditions if c.available]
+        self.available = bool(self.conditions)
+        self.name = "|".join(c.name for c in self.conditions) or "any_of"
+
+    def check(self) -> bool:
+        return any(c.check() for c in self.conditions)
+
+    def pause(self, seconds: float) -> None:
+        # Pump the run loop if any condition needs it
+        for condition in self.conditions:
+            if type(condition).pause is not SettleCondition.pause:
+                condition.pause(seconds)
+                return
+        time.sleep(seconds)
+
+    def close(self) -> None:
+        for condition in self.conditions:
+            condition.close()
+
+
+def _ax_attribute(element, attribute) -> Optional[Any]:
+    """Read an accessibility attribute, None on error."""
+    try:
+        error, value = AXUIElementCopyAttributeValue(element, attribute, None)
+        return value if error == 0 else None
+    except Exception:
+        return None
+
+
+def _focused_element() -> Optional[Any]:
+    """The system-wide focused UI element."""
+    if not AX_AVAILABLE:
+        return None
+    return _ax_attribute(AXUIElementCreateSystemWide(), kAXFocusedUIElementAttribute)
+
+
+def _element_frame(element) -> Optional[Tuple[float, float, float, float]]:
+    """(x, y, width, height) of an element."""
+    position = _ax_attribute(element, kAXPositionAttribute)
+    size = _ax_attribute(element, kAXSizeAttribute)
+    if position is None or size is None:
+        return None
+    try:
+        return position.x, position.y, size.width, size.height
+    except AttributeError:
+        return None
+
+
+class PasteboardChanged(SettleCondition):
+    """The general pasteboard's changeCount moved since creation."""
+
+    name = "pasteboard_changed"
+
+    def __init__(self):
+        super().__init__()
+        self.available = PASTEBOARD_AVAILABLE
+        self.baseline = self._change_count() if self.available else None
+        self.available = self.baseline is not None
+
+    @staticmethod
+    def _change_count() -> Optional[int]:
+        try:
+            return NSPasteboard.generalPasteboard().changeCount()
+        except Exception:
+            return None
+
+    def check(self) -> bool:
+        return self._change_count() != self.baseline
+
+
+class FocusedElementChanged(SettleCondition):
+    """Keyboard focus moved to a different element."""
+
+    name = "focus_changed"
+
+    def __init__(self):
+        super().__init__()
+        self.available = AX_AVAILABLE
+        self.baseline = _focused_element() if self.available else None
+
+    def check(self) -> bool:
+        focused = _focused_element()
+        return focused is not None and focused != self.baseline
+
+
+class FocusAt(SettleCondition):
+    """The focused element contains a screen point (e.g. the field just clicked)."""
+
+    name = "focus_at"
+
+    def __init__(self, x: int, y: int):
+        super().__init__()
+        self.x, self.y = x, y
+        self.available = AX_AVAILABLE and _focused_element() is not None
+
+    def check(self) -> bool:
+        focused = _focused_element()
+        frame = _element_frame(focused) if focused is not None else None
+        if frame is None:
+            return False
+        left, top, width, height = frame
+        return left <= self.x <= left + width and top <= self.y <= top + height
+
+
+class _FocusedAttributeChanged(SettleCondition):
+    """An attribute of the focused element changed."""
+
+    attribute = None
+
+    def __init__(self):
+        super().__init__()
+        self.available = False
+        self.baseline = None
+        if AX_AVAILABLE:
+            focused = _focused_element()
+            if focused is not None:
+                self.baseline = _ax_attribute(focused, self.attribute)
+                # Elements without the attribute can't signal completion
+                self.available = self.baseline is not None
+
+    def check(self) -> bool:
+        focused = _focused_element()
+        if focused is None:
+            return False
+        value = _ax_attribute(focused, self.attribute)
+        return value is not None and value != self.baseline
+
+
+class FocusedValueChanged(_FocusedAttributeChanged):
+    """The focused element's value changed (typed or pasted text landed)."""
+
+    name = "value_changed"
+    attribute = kAXValueAttribute if AX_AVAILABLE else None
+
+
+class SelectionChanged(_FocusedAttributeChanged):
+    """The focused element's selected text range changed."""
+
+    name = "selection_changed"
+    attribute = kAXSelectedTextRangeAttribute if AX_AVAILABLE else None
+
+
+class ScreenRegionChanged(SettleCondition):
+    """A hash of a small screen tile changed."""
+
+    name = "screen_changed"
+
+    def __init__(self, left: int, top: int, width: int = 320, height: int = 240):
+        super().__init__()
+        self.region = {'left': max(0, int(left)), 'top': max(0, int(top)),
+                       'width': int(width), 'height': int(height)}
+        self._grabber = None
+        self.baseline = None
+        if MSS_AVAILABLE:
+            try:
+                self._grabber = mss.mss()
+                self.baseline = self._tile_hash()
+            except Exception as e:
+                logger.debug(f"Screen tile capture unavailable: {e}")
+        self.available = self.baseline is not None
+
+    def _tile_hash(self) -> Optional[bytes]:
+        try:
+            return hashlib.blake2b(self._grabber.grab(self.region).raw, digest_size=16).digest()
+        except Exception:
+            return None
+
+    def check(self) -> bool:
+        current = self._tile_hash()
+        return current is not None and current != self.baseline
+
+    def close(self) -> None:
+        if self._grabber is not None:
+            self._grabber.close()
+            self._grabber = None
+
+
+class AXNotificationReceived(SettleCondition):
+    """
+    An accessibility notification arrived from an application.
+
+    The observer is attached to the calling thread's run loop, and the
+    wait runs that run loop between checks so the callback can fire.
+    """
+
+    name = "ax_notification"
+
+    def __init__(self, notification: str, pid: Optional[int] = None):
+        super().__init__()
+        self.notification = notification
+        self.received = False
+        self._source = None
+        self._observer = None
+        self.available = False
+        if not AX_AVAILABLE:
+            return
+        try:
+            pid = pid if pid is not None else self._frontmost_pid()
+            if pid is None:
+                return
+            error, observer = AXObserverCreate(pid, self._callback, None)
+            if error != 0:
+                return
+            error = AXObserverAddNotification(observer, AXUIElementCreateApplication(pid), notification, None)
+            if error != 0:
+                return
+            self._observer = observer
+            self._source = AXObserverGetRunLoopSource(observer)
+            CFRunLoopAddSource(CFRunLoopGetCurrent(), self._source, kCFRunLoopDefaultMode)
+            self.available = True
+        except Exception as e:
+            logger.debug(f"Could not observe {notification}: {e}")
+
+    @staticmethod
+    def _frontmost_pid() -> Optional[int]:
+        from AppKit import NSWorkspace
+        app = NSWorkspace.sharedWorkspace().frontmostApplication()
+        return app.processIdentifier() if app is not None else None
+
+    def _callback(self, observer, element, notification, refcon) -> None:
+        self.received = True
+
+    def check(self) -> bool:
+        return self.received
+
+    def pause(self, seconds: float) -> None:
+        CFRunLoopRunInMode(kCFRunLoopDefaultMode, seconds, True)
+
+    def close(self) -> None:
+        if self._source is not None:
+            CFRunLoopRemoveSource(CFRunLoopGetCurrent(), self._source, kCFRunLoopDefaultMode)
+            self._source = None
+        self._observer = None
+
+
+class AppResponsive(SettleCondition):
+    """The frontmost application answers accessibility queries again."""
+
+    name = "app_responsive"
+
+    def __init__(self):
+        super().__init__()
+        self.available = AX_AVAILABLE
+
+    def check(self) -> bool:
+        application = _ax_attribute(AXUIElementCreateSystemWide(), kAXFocusedApplicationAttribute)
+        return application is not None and _ax_attribute(application, kAXFocusedUIElementAttribute) is not None
+
+
+class SettleStats:
+    """Counts of settle waits, for performance reporting."""
+
+    def __init__(self):
+        self.waits = 0
+        self.satisfied = 0
+        self.timed_out = 0
+        self.fallbacks = 0
+        self.total_wait_time = 0.0
+
+    def get_stats(self) -> dict:
+        return {
+            'waits': self.waits,
+            'satisfied': self.satisfied,
+            'timed_out': self.timed_out,
+            'fallbacks': self.fallbacks,
+            'avg_wait_time': self.total_wait_time / self.waits if self.waits else 0.0
+        }
+
+
+settle_stats = SettleStats()
+
+
+def wait_for(condition: Optional[SettleCondition], timeout: float, fallback: Optional[float] = None,
+             initial_interval: float = INITIAL_POLL_INTERVAL,
+             max_interval: float = MAX_POLL_INTERVAL) -> bool:
+    """
+    Wait until a condition holds, polling with exponential backoff.
+
+    Args:
+        condition: Condition created before the action being waited on, or
+            None when there is nothing to check
+        timeout: Deadline in seconds
+        fallback: Fixed delay used when the condition is unavailable
+            (defaults to timeout)
+        initial_interval: First delay between checks
+        max_interval: Longest delay between checks
+
+    Returns:
+        bool: True if the condition held before the deadline
+    """
+    start = time.perf_counter()
+    settle_stats.waits += 1
+    try:
+        if condition is None or not condition.available:
+            settle_stats.fallbacks += 1
+            time.sleep(timeout if fallback is None else fallback)
+            return False
+
+        deadline = start + timeout
+        interval = initial_interval
+        while True:
+            if condition.check():
+                settle_stats.satisfied += 1
+                logger.debug(f"UI settled ({condition.name}) after {(time.perf_counter() - start) * 1000:.1f}ms")
+                return True
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                settle_stats.timed_out += 1
+                logger.debug(f"UI settle wait ({condition.name}) timed out after {timeout:.2f}s")
+                return False
+            condition.pause(min(interval, remaining))
+            interval = min(interval * 2, max_interval)
+    finally:
+        settle_stats.total_wait_time += time.perf_counter() - start
+        if condition is not None:
+            condition.close()
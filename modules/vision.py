@@ -7,10 +7,10 @@ Provides structured analysis of desktop content for action planning.
 """
 
 import base64
+import hashlib
 import io
 import json
 import logging
-import threading
 import time
 from typing import Dict, List, Optional, Tuple, Any
 import requests
@@ -26,8 +26,6 @@ from config import (
     VISION_PROMPT_CLICKABLE,
     FORM_VISION_PROMPT,
     VISION_API_TIMEOUT,
-    SCREENSHOT_QUALITY,
-    MAX_SCREENSHOT_SIZE,
     get_current_model_name
 )
 from .error_handler import (
@@ -43,6 +41,11 @@ from .performance import (
     PerformanceMetrics,
     performance_monitor
 )
+from .display_geometry import display_geometry
+from .vision_scheduler import vision_scheduler, VisionRequestPriority, VisionRequestCancelledError
+from .screenshot_profiles import screenshot_profiles
+from .speculative_perception import speculative_perception
+from .ui_element_detector import format_vision_hints, hints_signature
 
 logger = logging.getLogger(__name__)
 
@@ -58,7 +61,8 @@ class VisionModule:
     def __init__(self):
         """Initialize the VisionModule."""
         self.sct = mss.mss()
-        self._request_lock = threading.Lock()  # Prevent concurrent vision requests
+        self._scheduler = vision_scheduler  # Shared priority scheduler for vision requests
+        self.display_geometry = display_geometry if display_geometry.available else None  # Cached display bounds
         
         # Get screen dimensions
         self.screen_width, self.screen_height = self.get_screen_resolution()
@@ -72,12 +76,15 @@ class VisionModule:
         max_retries=2,
         user_message="I'm having trouble capturing your screen. Please check your display settings."
     )
-    def capture_screen_as_base64(self, monitor_number: int = 1) -> str:
+    def capture_screen_as_base64(self, monitor_number: int = 1, analysis_type: Optional[str] = None) -> str:
         """
         Capture a screenshot and encode it as base64 for API transmission.
         
         Args:
             monitor_number: Monitor to capture (1 for primary monitor)
+            analysis_type: Vision analysis type whose encoding profile
+                (resolution, quality, grayscale) should be used; None keeps
+                full fidelity
             
         Returns:
             Base64 encoded screenshot string
@@ -128,28 +135,21 @@ class VisionModule:
                 )
                 raise Exception(f"Image conversion failed: {error_info.user_message}")
             
-            # Resize if too large
+            # Resize and convert according to the analysis type's encoding profile
+            profile = screenshot_profiles.get_profile(analysis_type)
             original_size = (img.width, img.height)
-            if img.width > MAX_SCREENSHOT_SIZE or img.height > MAX_SCREENSHOT_SIZE:
-                try:
-                    # Calculate new size maintaining aspect ratio
-                    ratio = min(MAX_SCREENSHOT_SIZE / img.width, MAX_SCREENSHOT_SIZE / img.height)
-                    new_size = (int(img.width * ratio), int(img.height * ratio))
-                    
-                    # Validate new size
-                    if new_size[0] <= 0 or new_size[1] <= 0:
-                        raise ValueError(f"Invalid resize dimensions: {new_size}")
-                    
-                    img = img.resize(new_size, Image.Resampling.LANCZOS)
-                    logger.debug(f"Resized screenshot from {original_size} to {new_size}")
-                except Exception as e:
-                    logger.warning(f"Failed to resize image: {e}. Using original size.")
-                    # Continue with original size if resize fails
+            try:
+                img = profile.prepare(img)
+                if (img.width, img.height) != original_size:
+                    logger.debug(f"Resized screenshot from {original_size} to {(img.width, img.height)} (profile: {profile.key})")
+            except Exception as e:
+                logger.warning(f"Failed to apply screenshot profile {profile.key}: {e}. Using original image.")
+                # Continue with original image if resize fails
             
             # Convert to base64 with caching and optimization
             try:
                 buffer = io.BytesIO()
-                img.save(buffer, format="JPEG", quality=SCREENSHOT_QUALITY)
+                img.save(buffer, format="JPEG", quality=profile.quality)
                 img_bytes = buffer.getvalue()
                 
                 # Validate image data
@@ -157,7 +157,7 @@ class VisionModule:
                     raise ValueError("Empty image data generated")
                 
                 # Use image cache for compression optimization
-                base64_string = image_cache.get_compressed_image(img_bytes, SCREENSHOT_QUALITY)
+                base64_string = image_cache.get_compressed_image(img_bytes, profile.quality, profile.grayscale)
                 
                 if not base64_string:
                     # Fallback to direct encoding if cache fails
@@ -220,9 +220,12 @@ class VisionModule:
         severity=ErrorSeverity.MEDIUM,
         max_retries=1,
         retry_delay=10.0,
-        user_message="I'm having trouble analyzing your screen. Please try again."
+        user_message="I'm having trouble analyzing your screen. Please try again.",
+        no_retry=(VisionRequestCancelledError,)
     )
-    def describe_screen(self, analysis_type: str = "simple") -> Dict:
+    def describe_screen(self, analysis_type: str = "simple", screenshot_b64: Optional[str] = None,
+                        priority=VisionRequestPriority.INTERACTIVE, use_speculative: bool = True,
+                        hints: Optional[List[Dict[str, Any]]] = None) -> Dict:
         """
         Capture screen and get structured description from vision model.
         
@@ -231,261 +234,369 @@ class VisionModule:
                 - "simple": Fast, basic description (default)
                 - "detailed": Comprehensive analysis with coordinates
                 - "form": Form-specific analysis
+            screenshot_b64: Optional pre-captured base64 screenshot to analyze
+                instead of capturing a new one (used by PerceptionContext)
+            priority: VisionRequestPriority (or its name) used by the request
+                scheduler; interactive requests run before fallback and
+                background analysis
+            use_speculative: Reuse a speculative analysis started on wake word
+                if it still matches the current screen
+            hints: Optional candidate elements from the local UI detector,
+                included in the prompt (with cropped regions) to narrow the search
         
         Returns:
             Dictionary containing structured screen analysis
             
         Raises:
+            VisionRequestCancelledError: If the request was cancelled or
+                superseded (never retried)
             Exception: If screen analysis fails after retries
         """
-        # Use lock to prevent concurrent vision requests that can overwhelm LM Studio
-        with self._request_lock:
+        try:
+            # Validate analysis type
+            valid_types = ["simple", "detailed", "form", "clickable"]
+            if analysis_type not in valid_types:
+                raise ValueError(f"Invalid analysis type: {analysis_type}. Must be one of {valid_types}")
+            
+            logger.info(f"Starting screen analysis (type: {analysis_type})")
+        
+            # Capture screenshot with error handling (reuse a provided one if available)
             try:
-                # Validate analysis type
-                valid_types = ["simple", "detailed", "form", "clickable"]
-                if analysis_type not in valid_types:
-                    raise ValueError(f"Invalid analysis type: {analysis_type}. Must be one of {valid_types}")
-                
-                logger.info(f"Starting screen analysis (type: {analysis_type})")
+                if not screenshot_b64:
+                    screenshot_b64 = self.capture_screen_as_base64(analysis_type=analysis_type)
+            except Exception as e:
+                error_info = global_error_handler.handle_error(
+                    error=e,
+                    module="vision",
+                    function="describe_screen",
+                    category=ErrorCategory.HARDWARE_ERROR,
+                    context={"analysis_type": analysis_type}
+                )
+                raise Exception(f"Screenshot capture failed: {error_info.user_message}")
+            
+            # Reuse the analysis started on wake word if the screen hasn't changed
+            if use_speculative:
+                speculative_result = speculative_perception.lookup(analysis_type, screenshot_b64)
+                if speculative_result is not None:
+                    return speculative_result
+            
+            # Schedule the request so interactive callers aren't stuck behind
+            # background analysis; identical screenshots share one API call
+            screen_state = hashlib.md5(str(screenshot_b64).encode('utf-8')).hexdigest()
+            request_key = (analysis_type, screen_state, hints_signature(hints)) if hints else (analysis_type, screen_state)
+            return self._scheduler.run(
+                lambda: self._request_screen_analysis(analysis_type, screenshot_b64, hints),
+                priority=priority,
+                key=request_key,
+                group=analysis_type,
+                screen_state=screen_state
+            )
+        
+        except VisionRequestCancelledError:
+            # Cancelled or superseded on purpose; retrying would analyze a stale screenshot
+            raise
+        
+        except Exception as e:
+            # Re-raise with additional context if not already handled
+            if "Screen analysis failed" not in str(e):
+                error_info = global_error_handler.handle_error(
+                    error=e,
+                    module="vision",
+                    function="describe_screen",
+                    category=ErrorCategory.PROCESSING_ERROR,
+                    context={"analysis_type": analysis_type}
+                )
+                raise Exception(f"Screen analysis failed: {error_info.user_message}")
+            raise
+    
+    def _request_screen_analysis(self, analysis_type: str, screenshot_b64: str,
+                                 hints: Optional[List[Dict[str, Any]]] = None) -> Dict:
+        """
+        Send a screenshot to the vision model and parse its analysis.
+        
+        Called by the vision request scheduler once the request holds a
+        concurrency slot.
+        
+        Args:
+            analysis_type: Validated analysis type
+            screenshot_b64: Base64 encoded screenshot
+            hints: Optional local detector candidates to include in the prompt
             
-                # Capture screenshot with error handling
-                try:
-                    screenshot_b64 = self.capture_screen_as_base64()
-                except Exception as e:
-                    error_info = global_error_handler.handle_error(
-                        error=e,
-                        module="vision",
-                        function="describe_screen",
-                        category=ErrorCategory.HARDWARE_ERROR,
-                        context={"analysis_type": analysis_type}
-                    )
-                    raise Exception(f"Screenshot capture failed: {error_info.user_message}")
-                
-                # Get screen resolution for metadata
-                width, height = self.get_screen_resolution()
-                
-                # Select appropriate prompt based on analysis type
-                if analysis_type == "form":
-                    prompt = FORM_VISION_PROMPT
-                elif analysis_type == "detailed":
-                    prompt = VISION_PROMPT_DETAILED
-                elif analysis_type == "clickable":
-                    prompt = VISION_PROMPT_CLICKABLE
-                else:  # simple (default)
-                    prompt = VISION_PROMPT_SIMPLE
-                
-                # Validate configuration
-                if not VISION_API_BASE:
-                    raise ValueError("Vision API base URL not configured")
-                if not prompt:
-                    raise ValueError(f"Prompt not configured for analysis type: {analysis_type}")
-                
-                # Get the current model dynamically from LM Studio
-                current_model = get_current_model_name()
-                if not current_model:
-                    raise ValueError("No model detected in LM Studio. Please ensure LM Studio is running with a model loaded.")
-            
-                # Prepare API request
-                headers = {
-                    "Content-Type": "application/json"
-                }
-                
-                payload = {
-                    "model": current_model,
-                    "messages": [
+        Returns:
+            Dictionary containing structured screen analysis
+        """
+        # Get screen resolution for metadata
+        width, height = self.get_screen_resolution()
+        
+        # Select appropriate prompt based on analysis type
+        if analysis_type == "form":
+            prompt = FORM_VISION_PROMPT
+        elif analysis_type == "detailed":
+            prompt = VISION_PROMPT_DETAILED
+        elif analysis_type == "clickable":
+            prompt = VISION_PROMPT_CLICKABLE
+        else:  # simple (default)
+            prompt = VISION_PROMPT_SIMPLE
+        
+        # Validate configuration
+        if not VISION_API_BASE:
+            raise ValueError("Vision API base URL not configured")
+        if not prompt:
+            raise ValueError(f"Prompt not configured for analysis type: {analysis_type}")
+        
+        # Get the current model dynamically from LM Studio
+        current_model = get_current_model_name()
+        if not current_model:
+            raise ValueError("No model detected in LM Studio. Please ensure LM Studio is running with a model loaded.")
+    
+        # Prepare API request
+        headers = {
+            "Content-Type": "application/json"
+        }
+        
+        payload = {
+            "model": current_model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
                         {
-                            "role": "user",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": prompt
-                                },
-                                {
-                                    "type": "image_url",
-                                    "image_url": {
-                                        "url": f"data:image/jpeg;base64,{screenshot_b64}"
-                                    }
-                                }
-                            ]
+                            "type": "text",
+                            "text": prompt
+                        },
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": f"data:image/jpeg;base64,{screenshot_b64}"
+                            }
                         }
-                    ],
-                    "max_tokens": 3000,  # Increased for form analysis
-                    "temperature": 0.1
+                    ]
                 }
+            ],
+            "max_tokens": 3000,  # Increased for form analysis
+            "temperature": 0.1
+        }
+        
+        # Add local detector candidates and their crops after the screenshot
+        if hints:
+            content = payload["messages"][0]["content"]
+            content.append({"type": "text", "text": format_vision_hints(hints)})
+            for hint in hints:
+                if hint.get("crop_b64"):
+                    content.append({
+                        "type": "image_url",
+                        "image_url": {"url": f"data:image/jpeg;base64,{hint['crop_b64']}"}
+                    })
+        
+        # Make API request with connection pooling and comprehensive error handling
+        response = None
+        last_error = None
+        
+        # Use connection pool for better performance
+        session = connection_pool.get_session(VISION_API_BASE)
+    
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                logger.info(f"Sending vision request to LM Studio (attempt {attempt + 1}, timeout: {VISION_API_TIMEOUT}s)")
+                request_start_time = time.time()
                 
-                # Make API request with connection pooling and comprehensive error handling
-                response = None
-                last_error = None
-                
-                # Use connection pool for better performance
-                session = connection_pool.get_session(VISION_API_BASE)
-            
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        logger.info(f"Sending vision request to LM Studio (attempt {attempt + 1}, timeout: {VISION_API_TIMEOUT}s)")
-                        request_start_time = time.time()
-                        
-                        response = session.post(
-                            f"{VISION_API_BASE}/chat/completions",
-                            headers=headers,
-                            json=payload,
-                            timeout=VISION_API_TIMEOUT
-                        )
-                        
-                        request_duration = time.time() - request_start_time
-                        logger.info(f"Vision API response received in {request_duration:.2f}s (status: {response.status_code})")
-                        
-                        # Check response status
-                        if response.status_code == 200:
-                            break
-                        elif response.status_code == 429:
-                            # Rate limited
-                            wait_time = min(5 * (attempt + 1), 30)
-                            logger.warning(f"Rate limited, waiting {wait_time}s before retry")
-                            time.sleep(wait_time)
-                            continue
-                        elif response.status_code >= 500:
-                            # Server error, retry
-                            logger.warning(f"Server error {response.status_code}, retrying...")
-                            time.sleep(2 ** attempt)
-                            continue
-                        else:
-                            # Client error, don't retry
-                            error_info = global_error_handler.handle_error(
-                                error=Exception(f"API error: {response.status_code} - {response.text}"),
-                                module="vision",
-                                function="describe_screen",
-                                category=ErrorCategory.API_ERROR,
-                                context={"status_code": response.status_code, "response": response.text[:500]}
-                            )
-                            raise Exception(f"Vision API error: {error_info.user_message}")
-                            
-                    except requests.exceptions.Timeout as e:
-                        last_error = e
-                        logger.warning(f"API request timed out (attempt {attempt + 1})")
-                        if attempt < max_retries - 1:
-                            time.sleep(2 ** attempt)
-                            continue
-                            
-                    except requests.exceptions.ConnectionError as e:
-                        last_error = e
-                        logger.warning(f"Connection error to vision API (attempt {attempt + 1})")
-                        if attempt < max_retries - 1:
-                            time.sleep(2 ** attempt)
-                            continue
-                            
-                    except requests.exceptions.RequestException as e:
-                        last_error = e
-                        logger.warning(f"Request error (attempt {attempt + 1}): {e}")
-                        if attempt < max_retries - 1:
-                            time.sleep(2 ** attempt)
-                            continue
-            
-                # Check if we got a successful response
-                if not response or response.status_code != 200:
-                    error_info = global_error_handler.handle_error(
-                        error=last_error or Exception("Vision API request failed"),
-                        module="vision",
-                        function="describe_screen",
-                        category=ErrorCategory.API_ERROR,
-                        context={"max_retries": max_retries, "analysis_type": analysis_type}
-                    )
-                    raise Exception(f"Vision API unavailable: {error_info.user_message}")
+                response = session.post(
+                    f"{VISION_API_BASE}/chat/completions",
+                    headers=headers,
+                    json=payload,
+                    timeout=VISION_API_TIMEOUT
+                )
                 
-                # Parse response with error handling
-                try:
-                    response_data = response.json()
-                except json.JSONDecodeError as e:
-                    error_info = global_error_handler.handle_error(
-                        error=e,
-                        module="vision",
-                        function="describe_screen",
-                        category=ErrorCategory.PROCESSING_ERROR,
-                        context={"response_text": response.text[:500]}
-                    )
-                    raise Exception(f"Invalid JSON response: {error_info.user_message}")
+                request_duration = time.time() - request_start_time
+                logger.info(f"Vision API response received in {request_duration:.2f}s (status: {response.status_code})")
                 
-                # Validate response structure
-                if "choices" not in response_data or not response_data["choices"]:
+                # Check response status
+                if response.status_code == 200:
+                    break
+                elif response.status_code == 429:
+                    # Rate limited
+                    wait_time = min(5 * (attempt + 1), 30)
+                    logger.warning(f"Rate limited, waiting {wait_time}s before retry")
+                    time.sleep(wait_time)
+                    continue
+                elif response.status_code >= 500:
+                    # Server error, retry
+                    logger.warning(f"Server error {response.status_code}, retrying...")
+                    time.sleep(2 ** attempt)
+                    continue
+                else:
+                    # Client error, don't retry
                     error_info = global_error_handler.handle_error(
-                        error=Exception("Invalid API response format"),
+                        error=Exception(f"API error: {response.status_code} - {response.text}"),
                         module="vision",
                         function="describe_screen",
-                        category=ErrorCategory.VALIDATION_ERROR,
-                        context={"response_data": str(response_data)[:500]}
+                        category=ErrorCategory.API_ERROR,
+                        context={"status_code": response.status_code, "response": response.text[:500]}
                     )
-                    raise Exception(f"Invalid response format: {error_info.user_message}")
-                
-                content = response_data["choices"][0]["message"]["content"]
-            
-                # Parse JSON response from model with error handling and fallback
-                screen_analysis = None
+                    raise Exception(f"Vision API error: {error_info.user_message}")
+                    
+            except requests.exceptions.Timeout as e:
+                last_error = e
+                logger.warning(f"API request timed out (attempt {attempt + 1})")
+                if attempt < max_retries - 1:
+                    time.sleep(2 ** attempt)
+                    continue
+                    
+            except requests.exceptions.ConnectionError as e:
+                last_error = e
+                logger.warning(f"Connection error to vision API (attempt {attempt + 1})")
+                if attempt < max_retries - 1:
+                    time.sleep(2 ** attempt)
+                    continue
+                    
+            except requests.exceptions.RequestException as e:
+                last_error = e
+                logger.warning(f"Request error (attempt {attempt + 1}): {e}")
+                if attempt < max_retries - 1:
+                    time.sleep(2 ** attempt)
+                    continue
+    
+        # Check if we got a successful response
+        if not response or response.status_code != 200:
+            error_info = global_error_handler.handle_error(
+                error=last_error or Exception("Vision API request failed"),
+                module="vision",
+                function="describe_screen",
+                category=ErrorCategory.API_ERROR,
+                context={"max_retries": max_retries, "analysis_type": analysis_type}
+            )
+            raise Exception(f"Vision API unavailable: {error_info.user_message}")
+        
+        # Parse response with error handling
+        try:
+            response_data = response.json()
+        except json.JSONDecodeError as e:
+            error_info = global_error_handler.handle_error(
+                error=e,
+                module="vision",
+                function="describe_screen",
+                category=ErrorCategory.PROCESSING_ERROR,
+                context={"response_text": response.text[:500]}
+            )
+            raise Exception(f"Invalid JSON response: {error_info.user_message}")
+        
+        # Validate response structure
+        if "choices" not in response_data or not response_data["choices"]:
+            error_info = global_error_handler.handle_error(
+                error=Exception("Invalid API response format"),
+                module="vision",
+                function="describe_screen",
+                category=ErrorCategory.VALIDATION_ERROR,
+                context={"response_data": str(response_data)[:500]}
+            )
+            raise Exception(f"Invalid response format: {error_info.user_message}")
+        
+        content = response_data["choices"][0]["message"]["content"]
+    
+        # Parse JSON response from model with error handling and fallback
+        screen_analysis = None
+        try:
+            screen_analysis = json.loads(content)
+            logger.info("Successfully parsed JSON response from vision model")
+        except json.JSONDecodeError:
+            # Try to extract JSON from response if it's wrapped in text
+            import re
+            json_match = re.search(r'\{.*\}', content, re.DOTALL)
+            if json_match:
                 try:
-                    screen_analysis = json.loads(content)
-                    logger.info("Successfully parsed JSON response from vision model")
+                    screen_analysis = json.loads(json_match.group())
+                    logger.info("Successfully extracted JSON from wrapped response")
                 except json.JSONDecodeError:
-                    # Try to extract JSON from response if it's wrapped in text
-                    import re
-                    json_match = re.search(r'\{.*\}', content, re.DOTALL)
-                    if json_match:
-                        try:
-                            screen_analysis = json.loads(json_match.group())
-                            logger.info("Successfully extracted JSON from wrapped response")
-                        except json.JSONDecodeError:
-                            # JSON extraction failed, create fallback structure
-                            screen_analysis = self._create_fallback_response(content, analysis_type)
-                            logger.warning("JSON parsing failed, created fallback response from plain text")
+                    # JSON extraction failed, create fallback structure
+                    screen_analysis = self._create_fallback_response(content, analysis_type)
+                    logger.warning("JSON parsing failed, created fallback response from plain text")
+            else:
+                # No JSON found, create fallback structure from plain text
+                screen_analysis = self._create_fallback_response(content, analysis_type)
+                logger.warning("No JSON found in response, created fallback response from plain text")
+        
+        # Validate screen analysis structure
+        if not isinstance(screen_analysis, dict):
+            error_info = global_error_handler.handle_error(
+                error=Exception("Screen analysis is not a dictionary"),
+                module="vision",
+                function="describe_screen",
+                category=ErrorCategory.VALIDATION_ERROR,
+                context={"analysis_type": type(screen_analysis).__name__}
+            )
+            raise Exception(f"Invalid analysis format: {error_info.user_message}")
+        
+        # Add metadata if not present
+        if "metadata" not in screen_analysis:
+            screen_analysis["metadata"] = {}
+        
+        # Clicks use global points, the model answers in screenshot pixels
+        self._map_coordinates_to_points(screen_analysis, screenshot_b64)
+        
+        screen_analysis["metadata"].update({
+            "timestamp": time.time(),
+            "screen_resolution": [width, height],
+            "analysis_type": analysis_type,
+            "api_response_time": response.elapsed.total_seconds() if response else 0
+        })
+        
+        # Log results
+        if analysis_type == "form":
+            form_count = len(screen_analysis.get('forms', []))
+            total_fields = sum(len(form.get('fields', [])) for form in screen_analysis.get('forms', []))
+            logger.info(f"Form analysis completed: {form_count} forms, {total_fields} fields found")
+        else:
+            element_count = len(screen_analysis.get('elements', []))
+            logger.info(f"Screen analysis completed: {element_count} elements found")
+        
+        return screen_analysis
+    
+
+    def _map_coordinates_to_points(self, screen_analysis: Dict, screenshot_b64: str) -> None:
+        """
+        Convert the analysis' coordinates from screenshot pixels to global points.
+        
+        The model reports positions in the image it was sent, which is in
+        pixels (twice the point size on Retina displays) and may have been
+        downscaled by the encoding profile. Every "coordinates" list of one
+        or two [x, y] pairs is mapped in place onto the main display.
+        
+        Args:
+            screen_analysis: Parsed analysis from the vision model
+            screenshot_b64: Base64 encoded screenshot the analysis describes
+        """
+        layout = self.display_geometry.layout() if self.display_geometry else None
+        if layout is None:
+            return
+        try:
+            image_width, image_height = Image.open(io.BytesIO(base64.b64decode(screenshot_b64))).size
+        except Exception as e:
+            logger.debug(f"Could not read screenshot size, keeping image coordinates: {e}")
+            return
+        display = layout.display(0)
+        
+        def is_number(value) -> bool:
+            return isinstance(value, (int, float)) and not isinstance(value, bool)
+        
+        def convert(node) -> None:
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if (key == "coordinates" and isinstance(value, list) and len(value) in (2, 4)
+                            and all(is_number(v) for v in value)):
+                        points = []
+                        for i in range(0, len(value), 2):
+                            points.extend(layout.image_to_points(value[i], value[i + 1],
+                                                                 image_width, image_height, display))
+                        node[key] = points
                     else:
-                        # No JSON found, create fallback structure from plain text
-                        screen_analysis = self._create_fallback_response(content, analysis_type)
-                        logger.warning("No JSON found in response, created fallback response from plain text")
-                
-                # Validate screen analysis structure
-                if not isinstance(screen_analysis, dict):
-                    error_info = global_error_handler.handle_error(
-                        error=Exception("Screen analysis is not a dictionary"),
-                        module="vision",
-                        function="describe_screen",
-                        category=ErrorCategory.VALIDATION_ERROR,
-                        context={"analysis_type": type(screen_analysis).__name__}
-                    )
-                    raise Exception(f"Invalid analysis format: {error_info.user_message}")
-                
-                # Add metadata if not present
-                if "metadata" not in screen_analysis:
-                    screen_analysis["metadata"] = {}
-                
-                screen_analysis["metadata"].update({
-                    "timestamp": time.time(),
-                    "screen_resolution": [width, height],
-                    "analysis_type": analysis_type,
-                    "api_response_time": response.elapsed.total_seconds() if response else 0
-                })
-                
-                # Log results
-                if analysis_type == "form":
-                    form_count = len(screen_analysis.get('forms', []))
-                    total_fields = sum(len(form.get('fields', [])) for form in screen_analysis.get('forms', []))
-                    logger.info(f"Form analysis completed: {form_count} forms, {total_fields} fields found")
-                else:
-                    element_count = len(screen_analysis.get('elements', []))
-                    logger.info(f"Screen analysis completed: {element_count} elements found")
-                
-                return screen_analysis
-            
-            except Exception as e:
-                # Re-raise with additional context if not already handled
-                if "Screen analysis failed" not in str(e):
-                    error_info = global_error_handler.handle_error(
-                        error=e,
-                        module="vision",
-                        function="describe_screen",
-                        category=ErrorCategory.PROCESSING_ERROR,
-                        context={"analysis_type": analysis_type}
-                    )
-                    raise Exception(f"Screen analysis failed: {error_info.user_message}")
-                raise
+                        convert(value)
+            elif isinstance(node, list):
+                for item in node:
+                    convert(item)
+        
+        convert(screen_analysis)
+        screen_analysis.setdefault("metadata", {})["image_size"] = [image_width, image_height]
     
     def analyze_forms(self) -> Dict:
         """
@@ -598,8 +709,12 @@ class VisionModule:
             monitor_number: Monitor to get resolution for (1 for primary)
             
         Returns:
-            List of [width, height]
+            List of [width, height] in points
         """
+        layout = self.display_geometry.layout() if self.display_geometry else None
+        if layout is not None and 1 <= monitor_number <= len(layout.displays):
+            display = layout.display(monitor_number - 1)
+            return [int(display.width), int(display.height)]
         try:
             monitor = self.sct.monitors[monitor_number]
             width = monitor["width"]
@@ -801,13 +916,15 @@ class VisionModule:
                 }
             }
     
-    def find_clickable_element(self, description: str, monitor_number: int = 1) -> Dict[str, Any]:
+    def find_clickable_element(self, description: str, monitor_number: int = 1,
+                               perception_context=None) -> Dict[str, Any]:
         """
         Find a clickable element on screen based on user description.
         
         Args:
             description: Natural language description of element to find (e.g., "sign in button", "submit")
             monitor_number: Monitor to analyze
+            perception_context: Optional PerceptionContext to reuse this command's screen analysis
             
         Returns:
             Dictionary with element information and click coordinates
@@ -816,7 +933,10 @@ class VisionModule:
             logger.info(f"Searching for clickable element: '{description}'")
             
             # Get detailed analysis of screen elements
-            screen_analysis = self.describe_screen(analysis_type="detailed")
+            if perception_context is not None:
+                screen_analysis = perception_context.describe_screen(analysis_type="detailed")
+            else:
+                screen_analysis = self.describe_screen(analysis_type="detailed")
             
             # Extract text content from the analysis
             screen_text = ""
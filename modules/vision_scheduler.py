@@ -0,0 +1,372 @@
+# modules/vision_scheduler.py
+"""
+Vision Request Scheduler for AURA
+
+Replaces the single global vision request lock with a priority scheduler:
+- Interactive requests run before fallback requests, which run before
+  background analysis
+- Identical pending requests are deduplicated and share one API call
+- Pending requests superseded by a newer screen state follow the newer
+  request instead of analyzing an outdated screenshot
+- A configurable concurrency limit protects the LM Studio server
+- Queue depth and wait-time metrics are exposed for monitoring
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Dict, Any, Optional, Callable, Hashable, List
+
+from config import VISION_MAX_CONCURRENT_REQUESTS, VISION_QUEUE_WAIT_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+class VisionRequestPriority(Enum):
+    """Priority levels for vision requests (lower value runs first)."""
+    INTERACTIVE = 1
+    FALLBACK = 2
+    BACKGROUND = 3
+
+    @classmethod
+    def coerce(cls, value) -> 'VisionRequestPriority':
+        """
+        Convert a priority name or enum member to a VisionRequestPriority.
+
+        Args:
+            value: VisionRequestPriority, name string (e.g. "background") or None
+
+        Returns:
+            Matching priority, INTERACTIVE when value is None
+        """
+        if value is None:
+            return cls.INTERACTIVE
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls[str(value).upper()]
+        except KeyError:
+            raise ValueError(f"Invalid vision request priority: {value}")
+
+
+class VisionRequestCancelledError(Exception):
+    """Raised to callers waiting on a vision request that was cancelled."""
+    pass
+
+
+class VisionRequest:
+    """A scheduled vision request shared by every caller that joined it."""
+
+    _PENDING = "pending"
+    _RUNNING = "running"
+    _DONE = "done"
+    _CANCELLED = "cancelled"
+    _SUPERSEDED = "superseded"
+
+    def __init__(self, sequence: int, priority: VisionRequestPriority,
+                 key: Optional[Hashable] = None, group: Optional[Hashable] = None,
+                 screen_state: Optional[Hashable] = None):
+        self.sequence = sequence
+        self.priority = priority
+        self.key = key
+        self.group = group
+        self.screen_state = screen_state
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.waiters = 1
+
+        self.state = self._PENDING
+        self.superseded_by: Optional['VisionRequest'] = None
+        self._result = None
+        self._error: Optional[BaseException] = None
+        self._done_event = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        """Whether the request has a final outcome."""
+        return self._done_event.is_set()
+
+    def _finish(self, state: str, result=None, error: Optional[BaseException] = None) -> None:
+        self.state = state
+        self._result = result
+        self._error = error
+        self.finished_at = time.time()
+        self._done_event.set()
+
+    def wait(self, timeout: Optional[float] = None):
+        """
+        Wait for the request outcome, following supersession chains.
+
+        Args:
+            timeout: Maximum seconds to wait, None to wait indefinitely
+
+        Returns:
+            Result of the (possibly superseding) request
+
+        Raises:
+            TimeoutError: If the outcome is not available in time
+            VisionRequestCancelledError: If the request was cancelled
+            Exception: Whatever the underlying vision call raised
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        request = self
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.time())
+            if not request._done_event.wait(remaining):
+                raise TimeoutError(f"Vision request {request.sequence} did not complete within {timeout}s")
+            if request.state == self._SUPERSEDED and request.superseded_by is not None:
+                request = request.superseded_by
+                continue
+            if request.state == self._CANCELLED:
+                raise VisionRequestCancelledError(f"Vision request {request.sequence} was cancelled")
+            if request._error is not None:
+                raise request._error
+            return request._result
+
+
+class VisionRequestScheduler:
+    """
+    Priority scheduler for vision model requests.
+
+    Requests execute on the calling thread once they reach the head of the
+    queue and a concurrency slot is free, so existing error handling and
+    performance decorators around the vision call keep working unchanged.
+    """
+
+    def __init__(self, max_concurrent: int = VISION_MAX_CONCURRENT_REQUESTS,
+                 queue_wait_timeout: Optional[float] = VISION_QUEUE_WAIT_TIMEOUT,
+                 metrics_window: int = 200):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrent: Maximum number of vision requests running at once
+            queue_wait_timeout: Maximum seconds a caller waits for its result
+            metrics_window: Number of recent wait times kept for metrics
+        """
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.queue_wait_timeout = queue_wait_timeout
+
+        self._condition = threading.Condition()
+        self._sequence = itertools.count()
+        self._pending: List[VisionRequest] = []
+        self._running: List[VisionRequest] = []
+        self._by_key: Dict[Hashable, VisionRequest] = {}
+
+        self._wait_times = deque(maxlen=metrics_window)
+        self._stats = {
+            'submitted': 0,
+            'executed': 0,
+            'deduplicated': 0,
+            'superseded': 0,
+            'cancelled': 0,
+            'failed': 0,
+            'max_queue_depth': 0
+        }
+
+    def run(self, func: Callable[[], Any], priority=VisionRequestPriority.INTERACTIVE,
+            key: Optional[Hashable] = None, group: Optional[Hashable] = None,
+            screen_state: Optional[Hashable] = None):
+        """
+        Schedule a vision call and block until its result is available.
+
+        Args:
+            func: Zero-argument callable performing the vision request
+            priority: VisionRequestPriority or its name
+            key: Deduplication key; callers with an equal key share one call
+            group: Supersession group (e.g. analysis type)
+            screen_state: Screen state token; a newer state in the same group
+                supersedes pending requests for older states
+
+        Returns:
+            Result of the vision call
+
+        Raises:
+            VisionRequestCancelledError: If the request was cancelled
+            TimeoutError: If the result is not available within queue_wait_timeout
+            Exception: Whatever func raised
+        """
+        priority = VisionRequestPriority.coerce(priority)
+
+        with self._condition:
+            existing = self._by_key.get(key) if key is not None else None
+            if existing is not None and not existing.done:
+                existing.waiters += 1
+                self._stats['deduplicated'] += 1
+                if priority.value < existing.priority.value and existing.state == VisionRequest._PENDING:
+                    existing.priority = priority
+                logger.debug(f"Joined pending vision request {existing.sequence} (key: {key})")
+                joined = existing
+            else:
+                joined = None
+                request = self._enqueue(priority, key, group, screen_state)
+
+        if joined is not None:
+            return joined.wait(self.queue_wait_timeout)
+
+        if not self._acquire_slot(request):
+            return request.wait(self.queue_wait_timeout)
+
+        try:
+            result = func()
+        except BaseException as e:
+            self._complete(request, error=e)
+            raise
+        self._complete(request, result=result)
+        if request.state == VisionRequest._CANCELLED:
+            raise VisionRequestCancelledError(f"Vision request {request.sequence} was cancelled while running")
+        return result
+
+    def _enqueue(self, priority: VisionRequestPriority, key, group, screen_state) -> VisionRequest:
+        """Create and queue a request, superseding stale ones. Caller holds the lock."""
+        request = VisionRequest(next(self._sequence), priority, key, group, screen_state)
+        self._stats['submitted'] += 1
+
+        if group is not None and screen_state is not None:
+            for stale in [r for r in self._pending if r.group == group and r.screen_state != screen_state]:
+                self._pending.remove(stale)
+                self._forget_key(stale)
+                stale.superseded_by = request
+                request.waiters += stale.waiters
+                if stale.priority.value < request.priority.value:
+                    request.priority = stale.priority
+                stale._finish(VisionRequest._SUPERSEDED)
+                self._stats['superseded'] += 1
+                logger.debug(f"Vision request {stale.sequence} superseded by {request.sequence}")
+
+        self._pending.append(request)
+        if key is not None:
+            self._by_key[key] = request
+        self._stats['max_queue_depth'] = max(self._stats['max_queue_depth'], len(self._pending))
+        self._condition.notify_all()
+        return request
+
+    def _next_request(self) -> Optional[VisionRequest]:
+        """Highest priority, oldest pending request. Caller holds the lock."""
+        if not self._pending:
+            return None
+        return min(self._pending, key=lambda r: (r.priority.value, r.sequence))
+
+    def _acquire_slot(self, request: VisionRequest) -> bool:
+        """
+        Block until the request may run.
+
+        Returns:
+            True if the caller should execute the request, False if it was
+            cancelled or superseded while waiting
+
+        Raises:
+            TimeoutError: If no slot became free within queue_wait_timeout
+        """
+        deadline = None if self.queue_wait_timeout is None else request.submitted_at + self.queue_wait_timeout
+        with self._condition:
+            while True:
+                if request.state != VisionRequest._PENDING:
+                    return False
+                if len(self._running) < self.max_concurrent and self._next_request() is request:
+                    self._pending.remove(request)
+                    self._running.append(request)
+                    request.state = VisionRequest._RUNNING
+                    request.started_at = time.time()
+                    self._wait_times.append(request.started_at - request.submitted_at)
+                    return True
+
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    error = TimeoutError(f"Vision request {request.sequence} waited more than "
+                                         f"{self.queue_wait_timeout}s for a free slot")
+                    self._pending.remove(request)
+                    self._forget_key(request)
+                    self._stats['failed'] += 1
+                    request._finish(VisionRequest._DONE, error=error)
+                    self._condition.notify_all()
+                    raise error
+                self._condition.wait(remaining)
+
+    def _complete(self, request: VisionRequest, result=None, error: Optional[BaseException] = None) -> None:
+        """Record the outcome of a running request and wake waiting callers."""
+        with self._condition:
+            if request in self._running:
+                self._running.remove(request)
+            self._forget_key(request)
+            self._stats['executed'] += 1
+            if request.state == VisionRequest._CANCELLED:
+                # Abandoned while running: drop the result, the slot is free now
+                self._condition.notify_all()
+                return
+            if error is not None:
+                self._stats['failed'] += 1
+            request._finish(VisionRequest._DONE, result=result, error=error)
+            self._condition.notify_all()
+
+    def _forget_key(self, request: VisionRequest) -> None:
+        if request.key is not None and self._by_key.get(request.key) is request:
+            del self._by_key[request.key]
+
+    def cancel_pending(self, priority=None, include_running: bool = False) -> int:
+        """
+        Cancel pending requests that have not started yet.
+
+        Args:
+            priority: Only cancel requests with this priority (all when None)
+            include_running: Also abandon running requests of that priority
+                that no other caller joined. The underlying call can't be
+                interrupted, so it keeps its concurrency slot until it
+                returns; its result is then dropped and the caller gets
+                VisionRequestCancelledError.
+
+        Returns:
+            Number of cancelled requests
+        """
+        priority = VisionRequestPriority.coerce(priority) if priority is not None else None
+        with self._condition:
+            cancelled = [r for r in self._pending if priority is None or r.priority == priority]
+            for request in cancelled:
+                self._pending.remove(request)
+                self._forget_key(request)
+                request._finish(VisionRequest._CANCELLED)
+            if include_running:
+                abandoned = [r for r in self._running
+                             if (priority is None or r.priority == priority) and r.waiters == 1]
+                for request in abandoned:
+                    self._forget_key(request)
+                    request._finish(VisionRequest._CANCELLED)
+                cancelled.extend(abandoned)
+            self._stats['cancelled'] += len(cancelled)
+            self._condition.notify_all()
+
+        if cancelled:
+            logger.info(f"Cancelled {len(cancelled)} pending vision requests")
+        return len(cancelled)
+
+    def get_queue_depth(self) -> int:
+        """Number of requests waiting for a concurrency slot."""
+        with self._condition:
+            return len(self._pending)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get queue depth, wait-time and throughput metrics."""
+        with self._condition:
+            wait_times = list(self._wait_times)
+            pending_by_priority = {p.name.lower(): 0 for p in VisionRequestPriority}
+            for request in self._pending:
+                pending_by_priority[request.priority.name.lower()] += 1
+
+            metrics = dict(self._stats)
+            metrics.update({
+                'queue_depth': len(self._pending),
+                'running': len(self._running),
+                'max_concurrent': self.max_concurrent,
+                'pending_by_priority': pending_by_priority,
+                'avg_wait_time': sum(wait_times) / len(wait_times) if wait_times else 0.0,
+                'max_wait_time': max(wait_times) if wait_times else 0.0
+            })
+            return metrics
+
+
+# Shared scheduler so every VisionModule instance respects one server-wide limit
+vision_scheduler = VisionRequestScheduler()
@@ -0,0 +1,304 @@
+# modules/voice_activity.py
+"""
+Voice Activity Detection and Endpointing for AURA
+
+Decides when the user has finished speaking. Audio is split into short
+frames and classified in one vectorized pass per chunk:
+
+- FeatureVAD: frame energy against a tracked noise floor, combined with
+  zero-crossing rate and spectral flatness so steady noise (fans, hum,
+  hiss) is not mistaken for speech
+- WebRTCVAD: the WebRTC GMM voice activity model, used when the optional
+  webrtcvad package is installed
+
+The Endpointer turns frame decisions into an utterance: speech must last
+VAD_MIN_SPEECH_DURATION before the utterance starts, and it ends once
+SILENCE_DETECTION_DURATION of non-speech (the hangover, i.e. the endpoint
+latency) follows it.
+"""
+
+import logging
+from typing import Optional, Dict, Any
+
+import numpy as np
+
+from config import (
+    AUDIO_SAMPLE_RATE,
+    SILENCE_DETECTION_DURATION,
+    VAD_ENGINE,
+    VAD_FRAME_DURATION,
+    VAD_ENERGY_RATIO,
+    VAD_MIN_ENERGY,
+    VAD_SPECTRAL_FLATNESS_MAX,
+    VAD_MIN_SPEECH_DURATION,
+    VAD_WEBRTC_AGGRESSIVENESS
+)
+
+logger = logging.getLogger(__name__)
+
+# Optional WebRTC VAD model
+try:
+    import webrtcvad
+    WEBRTC_VAD_AVAILABLE = True
+except ImportError:
+    webrtcvad = None
+    WEBRTC_VAD_AVAILABLE = False
+
+# Frames with a zero-crossing rate above this may be unvoiced speech (fricatives)
+_FRICATIVE_ZCR = 0.3
+
+# Frequency band (Hz) used for energy and flatness; excludes hum and rumble
+_SPEECH_BAND = (200.0, 4000.0)
+
+# Per-frame noise floor adaptation rates (fall towards quieter frames fast, rise slowly)
+_NOISE_FALL_RATE = 0.07
+_NOISE_RISE_RATE = 0.004
+
+
+def frame_features(frames: np.ndarray, sample_rate: int = AUDIO_SAMPLE_RATE) -> Dict[str, np.ndarray]:
+    """
+    Compute per-frame features for a 2-D array of frames.
+
+    Args:
+        frames: Array of shape (frame_count, frame_length)
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Dictionary of 'energy' (RMS within the speech band), 'zcr' (crossings
+        per sample) and 'flatness' (spectral flatness of the speech band,
+        0 = tonal, 1 = white noise)
+    """
+    frame_length = frames.shape[1]
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (frame_length - 1)
+
+    window = np.hanning(frame_length)
+    power = np.abs(np.fft.rfft(frames * window, axis=1)) ** 2
+    frequencies = np.fft.rfftfreq(frame_length, 1.0 / sample_rate)
+    band = power[:, (frequencies >= _SPEECH_BAND[0]) & (frequencies <= _SPEECH_BAND[1])] + 1e-12
+
+    # Parseval: one-sided band power back to an RMS level of the windowed frame
+    energy = np.sqrt(2.0 * band.sum(axis=1) / (frame_length * np.dot(window, window)))
+    flatness = np.exp(np.mean(np.log(band), axis=1)) / np.mean(band, axis=1)
+
+    return {'energy': energy, 'zcr': zcr, 'flatness': flatness}
+
+
+class FeatureVAD:
+    """
+    Energy, zero-crossing and spectral flatness voice activity detector.
+
+    A frame is speech when its speech-band energy exceeds the noise floor
+    by VAD_ENERGY_RATIO and it is either tonal (voiced speech) or has the
+    high zero-crossing rate of a fricative. The noise floor follows the
+    quietest frames of each call (minimum statistics), falling quickly and
+    rising slowly, so it adapts to louder background noise within seconds
+    without following speech.
+    """
+
+    def __init__(self, sample_rate: int = AUDIO_SAMPLE_RATE,
+                 energy_ratio: float = VAD_ENERGY_RATIO,
+                 min_energy: float = VAD_MIN_ENERGY,
+                 flatness_max: float = VAD_SPECTRAL_FLATNESS_MAX,
+                 noise_floor: Optional[float] = None):
+        """
+        Initialize the detector.
+
+        Args:
+            sample_rate: Sample rate in Hz
+            energy_ratio: Required energy relative to the noise floor
+            min_energy: Absolute RMS floor for speech frames
+            flatness_max: Maximum spectral flatness of voiced frames
+            noise_floor: Initial noise floor (estimated from the first frames if None)
+        """
+        self.sample_rate = sample_rate
+        self.energy_ratio = energy_ratio
+        self.min_energy = min_energy
+        self.flatness_max = flatness_max
+        self.noise_floor = noise_floor
+
+    def is_speech(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Classify frames.
+
+        Args:
+            frames: Float32 array of shape (frame_count, frame_length)
+
+        Returns:
+            Boolean array with one decision per frame
+        """
+        features = frame_features(frames, self.sample_rate)
+        energy = features['energy']
+        if self.noise_floor is None:
+            self.noise_floor = float(np.percentile(energy, 10))
+
+        loud = energy > max(self.noise_floor * self.energy_ratio, self.min_energy)
+        speech = loud & ((features['flatness'] < self.flatness_max) | (features['zcr'] > _FRICATIVE_ZCR))
+
+        level = float(np.percentile(energy, 10))
+        per_frame = _NOISE_FALL_RATE if level < self.noise_floor else _NOISE_RISE_RATE
+        rate = 1.0 - (1.0 - per_frame) ** len(energy)
+        self.noise_floor += rate * (level - self.noise_floor)
+        return speech
+
+
+class WebRTCVAD:
+    """Voice activity detection with the WebRTC model (requires webrtcvad)."""
+
+    def __init__(self, sample_rate: int = AUDIO_SAMPLE_RATE,
+                 aggressiveness: int = VAD_WEBRTC_AGGRESSIVENESS):
+        """
+        Initialize the detector.
+
+        Args:
+            sample_rate: 8000, 16000, 32000 or 48000 Hz
+            aggressiveness: 0 (least) to 3 (most) aggressive non-speech filtering
+
+        Raises:
+            RuntimeError: If webrtcvad is not installed
+        """
+        if not WEBRTC_VAD_AVAILABLE:
+            raise RuntimeError("webrtcvad is not installed. Install with: pip install webrtcvad")
+        self.sample_rate = sample_rate
+        self._vad = webrtcvad.Vad(aggressiveness)
+
+    def is_speech(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Classify 10, 20 or 30 ms frames.
+
+        Args:
+            frames: Float32 array of shape (frame_count, frame_length)
+
+        Returns:
+            Boolean array with one decision per frame
+        """
+        pcm = np.clip(frames * 32767.0, -32768, 32767).astype(np.int16)
+        return np.fromiter((self._vad.is_speech(frame.tobytes(), self.sample_rate) for frame in pcm),
+                           dtype=bool, count=len(pcm))
+
+
+def create_vad(engine: str = VAD_ENGINE, sample_rate: int = AUDIO_SAMPLE_RATE,
+               noise_floor: Optional[float] = None):
+    """
+    Create the configured voice activity detector.
+
+    Args:
+        engine: "features" or "webrtc"
+        sample_rate: Sample rate in Hz
+        noise_floor: Initial noise floor for the feature detector
+
+    Returns:
+        Detector with an is_speech(frames) method
+    """
+    if engine == "webrtc":
+        if WEBRTC_VAD_AVAILABLE:
+            return WebRTCVAD(sample_rate)
+        logger.warning("webrtcvad not installed, using feature-based voice activity detection")
+    return FeatureVAD(sample_rate, noise_floor=noise_floor)
+
+
+class Endpointer:
+    """
+    End-of-utterance detection over streamed audio chunks.
+
+    Chunks of any size are passed to process(); complete frames are
+    classified together and a small state machine applies minimum-speech
+    and hangover logic. Nothing is logged per chunk.
+    """
+
+    def __init__(self, vad=None, sample_rate: int = AUDIO_SAMPLE_RATE,
+                 frame_duration: float = VAD_FRAME_DURATION,
+                 endpoint_silence: float = SILENCE_DETECTION_DURATION,
+                 min_speech: float = VAD_MIN_SPEECH_DURATION,
+                 noise_floor: Optional[float] = None):
+        """
+        Initialize the endpointer.
+
+        Args:
+            vad: Voice activity detector (create_vad() if None)
+            sample_rate: Sample rate in Hz
+            frame_duration: Analysis frame length in seconds
+            endpoint_silence: Non-speech after the utterance that ends it (endpoint latency)
+            min_speech: Consecutive speech required before an utterance starts
+            noise_floor: Initial noise floor passed to create_vad()
+        """
+        self.vad = vad if vad is not None else create_vad(sample_rate=sample_rate, noise_floor=noise_floor)
+        self.sample_rate = sample_rate
+        self.frame_length = max(1, int(frame_duration * sample_rate))
+        self.hangover_frames = max(1, int(round(endpoint_silence / frame_duration)))
+        self.min_speech_frames = max(1, int(round(min_speech / frame_duration)))
+
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._frames_seen = 0
+        self._speech_run = 0
+        self._silence_run = 0
+        self.speech_started = False
+        self.ended = False
+        self.speech_start_frame: Optional[int] = None
+        self.speech_end_frame: Optional[int] = None
+        self.speech_frames = 0
+
+    def process(self, chunk: np.ndarray) -> bool:
+        """
+        Add audio and update the endpoint decision.
+
+        Args:
+            chunk: Mono float32 samples
+
+        Returns:
+            True once the utterance has ended
+        """
+        if self.ended:
+            return True
+
+        samples = np.concatenate((self._pending, np.asarray(chunk, dtype=np.float32).reshape(-1)))
+        frame_count = samples.size // self.frame_length
+        self._pending = samples[frame_count * self.frame_length:]
+        if frame_count == 0:
+            return False
+
+        decisions = self.vad.is_speech(samples[:frame_count * self.frame_length].reshape(frame_count, self.frame_length))
+        self.speech_frames += int(np.count_nonzero(decisions))
+
+        for offset, is_speech in enumerate(decisions):
+            frame_index = self._frames_seen + offset
+            self._speech_run = self._speech_run + 1 if is_speech else 0
+
+            if not self.speech_started:
+                if self._speech_run >= self.min_speech_frames:
+                    self.speech_started = True
+                    self.speech_start_frame = frame_index - self._speech_run + 1
+                    self.speech_end_frame = frame_index + 1
+                continue
+
+            # During the hangover, only sustained speech resumes the utterance,
+            # so clicks and other short bursts don't hold the endpoint open
+            if is_speech and (self._silence_run == 0 or self._speech_run >= self.min_speech_frames):
+                self._silence_run = 0
+                self.speech_end_frame = frame_index + 1
+            else:
+                self._silence_run += 1
+                if self._silence_run >= self.hangover_frames:
+                    self.ended = True
+                    break
+
+        self._frames_seen += frame_count
+        return self.ended
+
+    @property
+    def processed_seconds(self) -> float:
+        """Seconds of audio classified so far."""
+        return self._frames_seen * self.frame_length / self.sample_rate
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get the utterance boundaries and frame statistics."""
+        frame_seconds = self.frame_length / self.sample_rate
+        return {
+            'speech_detected': self.speech_started,
+            'ended': self.ended,
+            'speech_start': self.speech_start_frame * frame_seconds if self.speech_start_frame is not None else None,
+            'speech_end': self.speech_end_frame * frame_seconds if self.speech_end_frame is not None else None,
+            'speech_seconds': self.speech_frames * frame_seconds,
+            'processed_seconds': self.processed_seconds,
+            'noise_floor': getattr(self.vad, 'noise_floor', None)
+        }
@@ -0,0 +1,152 @@
+# modules/wake_word_gate.py
+"""
+Wake Word Energy Gate for AURA
+
+A cheap, vectorized energy pre-filter in front of Porcupine. Audio is
+handled in batches of frames; Porcupine only runs while the input is louder
+than the tracked noise floor, plus a pre-roll of the frames before the gate
+opened and a hangover after the last loud frame. Silence therefore costs
+one RMS computation per batch instead of a Porcupine call per frame.
+"""
+
+import logging
+from collections import deque
+from typing import Callable, Optional, Dict, Any
+
+import numpy as np
+
+from config import (
+    WAKE_WORD_ENERGY_RATIO,
+    WAKE_WORD_MIN_ENERGY,
+    WAKE_WORD_GATE_PREROLL,
+    WAKE_WORD_GATE_HANGOVER
+)
+from .audio_capture import NoiseFloorTracker
+
+logger = logging.getLogger(__name__)
+
+
+class WakeWordGate:
+    """
+    Energy pre-filter that decides which frames reach the wake word engine.
+    """
+
+    def __init__(self, detector: Callable[[np.ndarray], int], frame_length: int, sample_rate: int,
+                 energy_ratio: float = WAKE_WORD_ENERGY_RATIO,
+                 min_energy: float = WAKE_WORD_MIN_ENERGY,
+                 preroll: float = WAKE_WORD_GATE_PREROLL,
+                 hangover: float = WAKE_WORD_GATE_HANGOVER,
+                 enabled: bool = True):
+        """
+        Initialize the gate.
+
+        Args:
+            detector: Wake word engine call taking one int16 frame and
+                returning the keyword index (>= 0) or -1 (e.g. porcupine.process)
+            frame_length: Samples per detector frame
+            sample_rate: Sample rate in Hz
+            energy_ratio: Frames louder than noise floor * ratio open the gate
+            min_energy: Absolute RMS level below which frames never open the gate
+            preroll: Seconds of audio before the gate opened passed to the detector
+            hangover: Seconds the gate stays open after the last loud frame
+            enabled: If False every frame is passed to the detector
+        """
+        self.detector = detector
+        self.frame_length = frame_length
+        self.sample_rate = sample_rate
+        self.energy_ratio = energy_ratio
+        self.min_energy = min_energy
+        self.enabled = enabled
+
+        frame_duration = frame_length / sample_rate
+        self._preroll = deque(maxlen=max(0, int(round(preroll / frame_duration))))
+        self._hangover_frames = max(1, int(round(hangover / frame_duration)))
+        self._open_frames = 0
+        self.noise_floor = NoiseFloorTracker()
+
+        self.frames_total = 0
+        self.frames_processed = 0
+        self.gate_openings = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Whether frames are currently passed to the detector."""
+        return self._open_frames > 0
+
+    def process(self, samples: np.ndarray) -> Optional[int]:
+        """
+        Process a batch of whole frames.
+
+        Args:
+            samples: float32 samples in [-1, 1]; the length must be a
+                multiple of frame_length
+
+        Returns:
+            Index of the frame (within the batch) at which the wake word was
+            detected, or None
+        """
+        frames = samples.reshape(-1, self.frame_length)
+        self.frames_total += len(frames)
+        if not self.enabled:
+            return self._detect(frames, range(len(frames)))
+
+        rms = np.sqrt(np.einsum('ij,ij->i', frames, frames) / self.frame_length)
+        threshold = max(self.min_energy, (self.noise_floor.level or self.min_energy) * self.energy_ratio)
+        loud = rms > threshold
+        self.noise_floor.update(float(rms.min()))
+
+        if not self.is_open and not loud.any():
+            self._preroll.extend(frames)
+            return None
+
+        selected = []
+        for index in range(len(frames)):
+            if loud[index]:
+                if not self.is_open:
+                    self.gate_openings += 1
+                    logger.debug(f"Wake word gate opened (rms {rms[index]:.4f} > {threshold:.4f})")
+                    if self._flush_preroll():
+                        return index
+                self._open_frames = self._hangover_frames
+            if self.is_open:
+                selected.append(index)
+                self._open_frames -= 1
+            else:
+                self._preroll.append(frames[index])
+        return self._detect(frames, selected)
+
+    def _flush_preroll(self) -> bool:
+        """Pass the frames buffered before the gate opened to the detector."""
+        preroll = list(self._preroll)
+        self._preroll.clear()
+        for frame in preroll:
+            self.frames_processed += 1
+            if self.detector((frame * 32767).astype(np.int16)) >= 0:
+                return True
+        return False
+
+    def _detect(self, frames: np.ndarray, indices) -> Optional[int]:
+        if len(indices) == 0:
+            return None
+        pcm = (frames * 32767).astype(np.int16)
+        for index in indices:
+            self.frames_processed += 1
+            if self.detector(pcm[index]) >= 0:
+                return index
+        return None
+
+    def reset(self) -> None:
+        """Close the gate and forget buffered frames (the noise floor is kept)."""
+        self._preroll.clear()
+        self._open_frames = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get gate statistics."""
+        return {
+            'enabled': self.enabled,
+            'frames_total': self.frames_total,
+            'frames_processed': self.frames_processed,
+            'duty_cycle': self.frames_processed / self.frames_total if self.frames_total else 0.0,
+            'gate_openings': self.gate_openings,
+            'noise_floor': self.noise_floor.level
+        }
@@ -23,6 +23,11 @@ from modules.automation import AutomationModule
 from modules.audio import AudioModule
 from modules.feedback import FeedbackModule, FeedbackPriority
 from modules.accessibility import AccessibilityModule
+from modules.perception_context import PerceptionContext
+from modules.vision_scheduler import VisionRequestPriority
+from modules.speculative_perception import speculative_perception
+from modules.action_pipeline import action_pipeline
+from modules.command_router import command_router
 from modules.error_handler import (
     global_error_handler,
     with_error_handling,
@@ -48,6 +53,8 @@ from modules.application_detector import ApplicationType
 
 # Import enhanced fallback configuration
 from config import (
+    PERCEPTION_CONTEXT_ENABLED,
+    SPECULATIVE_PERCEPTION_INTENTS,
     ENHANCED_FALLBACK_ENABLED,
     FALLBACK_PERFORMANCE_LOGGING,
     FALLBACK_RETRY_DELAY,
@@ -166,6 +173,8 @@ class Orchestrator:
         # Intent recognition and routing state
         self.intent_recognition_enabled = True
         self.last_recognized_intent = None
+        # Pre-intent router for commands with unambiguous grammar (None: always use intent recognition)
+        self.command_router = command_router if command_router.enabled else None
         
         # Deferred action state management
         self.is_waiting_for_user_action = False
@@ -382,6 +391,7 @@ class Orchestrator:
                 processing_time = time.time() - start_time
                 logger.info(f"Intent recognized: {intent_result['intent']} (confidence: {confidence:.2f}, time: {processing_time:.2f}s)")
                 
+                intent_result["source"] = "llm"
                 return intent_result
                 
             except (json.JSONDecodeError, ValueError, KeyError) as e:
@@ -4075,7 +4085,8 @@ class Orchestrator:
         Internal command execution with intent-based routing and comprehensive error handling.
         
         Acts as an intelligent router that:
-        1. Recognizes user intent using LLM-based classification
+        1. Recognizes user intent using LLM-based classification (or the fast
+           command router for commands with unambiguous grammar)
         2. Checks for deferred action interruptions
         3. Routes commands to appropriate handlers based on intent
         4. Preserves existing GUI interaction functionality
@@ -4095,7 +4106,8 @@ class Orchestrator:
             "validation_result": None,
             "screen_context": None,
             "action_plan": None,
-            "execution_results": None
+            "execution_results": None,
+            "perception": self._create_perception_context(execution_id)
         }
         
         self.current_command = execution_context
@@ -4136,7 +4148,7 @@ class Orchestrator:
             logger.info(f"[{execution_id}] Step 1: Intent recognition and routing")
             self._update_progress(execution_id, CommandStatus.VALIDATING, ExecutionStep.VALIDATION, 10)
             
-            intent_result = self._recognize_intent(command)
+            intent_result = self._route_or_recognize_intent(execution_id, command)
             execution_context["intent_result"] = intent_result
             
             intent_type = intent_result.get('intent', 'gui_interaction')
@@ -4144,6 +4156,13 @@ class Orchestrator:
             
             logger.info(f"[{execution_id}] Intent recognized: {intent_type} (confidence: {confidence:.2f})")
             
+            # Speculative screen analysis started on wake word is only useful for vision intents
+            routed_grammar = (intent_result.get('fast_route') or {}).get('grammar')
+            if intent_type not in SPECULATIVE_PERCEPTION_INTENTS:
+                speculative_perception.discard(f"intent:{intent_type}")
+            elif routed_grammar in ('type', 'key', 'scroll'):
+                speculative_perception.discard(f"fast_route:{routed_grammar}")
+            
             # Route to appropriate handler based on intent type
             return self._route_command_by_intent(execution_id, command, intent_result, execution_context)
             
@@ -4173,12 +4192,96 @@ class Orchestrator:
             return self._format_execution_result(execution_context)
         
         finally:
+            perception = execution_context.get("perception")
+            if perception is not None:
+                logger.debug(f"[{execution_id}] Perception context stats: {perception.get_stats()}")
+                perception.detach()
             self.current_command = None
             self.command_status = CommandStatus.PENDING
             # Clear progress tracking
             with self.progress_lock:
                 self.current_progress = None
     
+    def _route_or_recognize_intent(self, execution_id: str, command: str) -> Dict[str, Any]:
+        """
+        Get the intent of a command from the fast command router or the LLM.
+        
+        Commands matching a router grammar skip LLM intent recognition once
+        the router enforces that grammar; until then (shadow mode) the LLM
+        label is recorded against the router's prediction.
+        
+        Args:
+            execution_id: Unique execution identifier
+            command: The user command
+            
+        Returns:
+            Intent result dictionary
+        """
+        routed = self.command_router.match(command) if self.command_router else None
+        if routed is not None and self.command_router.should_enforce(routed):
+            self.command_router.record_enforced(routed)
+            logger.info(f"[{execution_id}] Fast command router matched '{routed.grammar}', skipping intent recognition")
+            return routed.to_intent()
+        
+        intent_result = self._recognize_intent(command)
+        if routed is not None and intent_result.get("source") == "llm":
+            self.command_router.record_llm_label(command, routed, intent_result)
+        return intent_result
+    
+    def _create_perception_context(self, execution_id: str) -> Optional[PerceptionContext]:
+        """
+        Create the shared perception context for a command execution.
+        
+        The context memoizes screenshot, vision, accessibility and active-app
+        lookups for the life of the command and is invalidated by the
+        automation module after every UI-mutating action.
+        
+        Args:
+            execution_id: Unique execution identifier
+            
+        Returns:
+            PerceptionContext or None if disabled
+        """
+        if not PERCEPTION_CONTEXT_ENABLED:
+            return None
+        
+        try:
+            perception = PerceptionContext(
+                execution_id,
+                vision_module=self.vision_module,
+                accessibility_module=self.accessibility_module,
+                application_detector=getattr(self, 'application_detector', None)
+            )
+            perception.attach(self.automation_module)
+            return perception
+        except Exception as e:
+            logger.warning(f"[{execution_id}] Failed to create perception context: {e}")
+            return None
+    
+    def _get_active_perception_context(self) -> Optional[PerceptionContext]:
+        """Get the perception context of the command currently executing, if any."""
+        current_command = self.current_command
+        if isinstance(current_command, dict):
+            return current_command.get("perception")
+        return None
+    
+    def _describe_screen_for_command(self, analysis_type: str = "simple",
+                                     priority=VisionRequestPriority.INTERACTIVE) -> Dict[str, Any]:
+        """
+        Describe the screen, reusing the current command's perception context when available.
+        
+        Args:
+            analysis_type: Vision analysis type
+            priority: Vision request priority for the scheduler
+            
+        Returns:
+            Screen analysis results
+        """
+        perception = self._get_active_perception_context()
+        if perception is not None:
+            return perception.describe_screen(analysis_type=analysis_type, priority=priority)
+        return self.vision_module.describe_screen(analysis_type=analysis_type, priority=priority)
+    
     def _route_command_by_intent(self, execution_id: str, command: str, intent_result: Dict[str, Any], execution_context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Route command to appropriate handler based on recognized intent.
@@ -4209,7 +4312,8 @@ class Orchestrator:
                     'system_state': {
                         'mode': self.system_mode,
                         'is_waiting_for_user_action': self.is_waiting_for_user_action
-                    }
+                    },
+                    'perception': execution_context.get('perception')
                 }
                 
                 # Call the handler's handle method
@@ -4538,7 +4642,11 @@ class Orchestrator:
                 logger.debug(f"[{execution_id}] Screen perception attempt {attempt + 1}")
                 
                 # Capture and analyze screen using simple analysis for GUI commands
-                screen_context = self.vision_module.describe_screen(analysis_type="simple")
+                perception = execution_context.get("perception")
+                if perception is not None:
+                    screen_context = perception.describe_screen(analysis_type="simple")
+                else:
+                    screen_context = self.vision_module.describe_screen(analysis_type="simple")
                 
                 # Validate screen context
                 if not screen_context or not screen_context.get("description"):
@@ -4686,96 +4794,54 @@ class Orchestrator:
         
         logger.info(f"[{execution_id}] Executing {len(actions)} actions")
         
-        execution_results = {
-            "total_actions": len(actions),
-            "successful_actions": 0,
-            "failed_actions": 0,
-            "action_details": [],
-            "errors": []
-        }
-        
-        for i, action in enumerate(actions):
-            action_start_time = time.time()
-            action_result = {
-                "index": i,
-                "action": action.copy(),
-                "start_time": action_start_time,
-                "status": "pending"
-            }
+        def execute_step(action: Dict[str, Any]) -> Optional[str]:
+            action_type = action.get("action")
+            logger.debug(f"[{execution_id}] Executing action: {action_type or 'unknown'}")
             
-            try:
-                logger.debug(f"[{execution_id}] Executing action {i + 1}/{len(actions)}: {action.get('action', 'unknown')}")
-                
-                # Handle different action types
-                action_type = action.get("action")
-                
-                if action_type in ["click", "double_click", "type"]:
-                    # GUI automation actions
-                    self.automation_module.execute_action(action)
-                    action_result["status"] = "success"
-                    execution_results["successful_actions"] += 1
-                    
-                elif action_type == "scroll":
-                    # Enhanced scroll handling with context awareness
-                    scroll_success = self._execute_enhanced_scroll(action, execution_id)
-                    if scroll_success:
-                        action_result["status"] = "success"
-                        execution_results["successful_actions"] += 1
-                    else:
-                        action_result["status"] = "failed"
-                        action_result["error"] = "Enhanced scroll execution failed"
-                        execution_results["failed_actions"] += 1
-                        execution_results["errors"].append("Enhanced scroll execution failed")
-                    
-                elif action_type == "speak":
-                    # TTS feedback action
-                    message = action.get("message", "")
-                    if message:
-                        self.feedback_module.speak(message, FeedbackPriority.NORMAL)
-                    action_result["status"] = "success"
-                    execution_results["successful_actions"] += 1
-                    
-                elif action_type == "finish":
-                    # Task completion marker
-                    action_result["status"] = "success"
-                    execution_results["successful_actions"] += 1
-                    logger.info(f"[{execution_id}] Task completion marker reached")
-                    
-                else:
-                    # Unknown action type
-                    error_msg = f"Unknown action type: {action_type}"
-                    action_result["status"] = "failed"
-                    action_result["error"] = error_msg
-                    execution_results["failed_actions"] += 1
-                    execution_results["errors"].append(error_msg)
-                    logger.warning(f"[{execution_id}] {error_msg}")
-                
-                action_result["end_time"] = time.time()
-                action_result["duration"] = action_result["end_time"] - action_start_time
-                
-                logger.debug(f"[{execution_id}] Action {i + 1} completed: {action_result['status']}")
+            if action_type in ["click", "double_click", "type"]:
+                # GUI automation actions
+                self.automation_module.execute_action(action)
                 
-            except Exception as e:
-                # Action execution failed
-                action_result["status"] = "failed"
-                action_result["error"] = str(e)
-                action_result["end_time"] = time.time()
-                action_result["duration"] = action_result["end_time"] - action_start_time
+            elif action_type == "scroll":
+                # Enhanced scroll handling with context awareness
+                if not self._execute_enhanced_scroll(action, execution_id):
+                    return "Enhanced scroll execution failed"
                 
-                execution_results["failed_actions"] += 1
-                execution_results["errors"].append(f"Action {i + 1} failed: {str(e)}")
+            elif action_type == "speak":
+                # TTS feedback action
+                message = action.get("message", "")
+                if message:
+                    self.feedback_module.speak(message, FeedbackPriority.NORMAL)
                 
-                logger.error(f"[{execution_id}] Action {i + 1} failed: {e}")
+            elif action_type == "finish":
+                # Task completion marker
+                logger.info(f"[{execution_id}] Task completion marker reached")
                 
-                # Decide whether to continue or stop
-                if self._is_critical_action_failure(action, e):
-                    logger.error(f"[{execution_id}] Critical action failure, stopping execution")
-                    execution_context["warnings"].append("Execution stopped due to critical action failure")
-                    break
-                else:
-                    logger.info(f"[{execution_id}] Non-critical action failure, continuing execution")
+            else:
+                # Unknown action type
+                error_msg = f"Unknown action type: {action_type}"
+                logger.warning(f"[{execution_id}] {error_msg}")
+                return error_msg
             
-            execution_results["action_details"].append(action_result)
+            return None
+        
+        def should_stop(action: Dict[str, Any], error: Exception) -> bool:
+            # Decide whether to continue or stop
+            if self._is_critical_action_failure(action, error):
+                execution_context["warnings"].append("Execution stopped due to critical action failure")
+                return True
+            logger.info(f"[{execution_id}] Non-critical action failure, continuing execution")
+            return False
+        
+        # Step N+1 is validated (and its target element looked up) while step N runs
+        execution_results = action_pipeline.execute(
+            actions,
+            execute_step,
+            automation_module=self.automation_module,
+            accessibility_module=self.accessibility_module,
+            should_stop=should_stop,
+            log_prefix=f"[{execution_id}] "
+        )
         
         logger.info(f"[{execution_id}] Action execution completed: {execution_results['successful_actions']}/{execution_results['total_actions']} successful")
         
@@ -5090,7 +5156,9 @@ class Orchestrator:
                 return None
             
             # Simple screen description
-            screen_description = self.vision_module.describe_screen(analysis_type="simple")
+            screen_description = self._describe_screen_for_command(
+                analysis_type="simple", priority=VisionRequestPriority.FALLBACK
+            )
             
             if not screen_description:
                 logger.warning(f"[{execution_id}] Failed to get screen description")
@@ -5431,7 +5499,9 @@ Please provide a direct, helpful answer based on the content above. If the answe
         try:
             # Capture screen with appropriate analysis type
             logger.info(f"[{execution_id}] Using {analysis_type} analysis for screen capture")
-            screen_context = self.vision_module.describe_screen(analysis_type=analysis_type)
+            screen_context = self._describe_screen_for_command(
+                analysis_type=analysis_type, priority=VisionRequestPriority.FALLBACK
+            )
             
             # Enhance context for information extraction
             if "elements" in screen_context:
@@ -6034,6 +6104,10 @@ Focus on being helpful while being honest about what information is actually vis
             self.current_command = None
             self.command_status = CommandStatus.PENDING
             
+            # Keep the fast command router's shadow counts for the next session
+            if self.command_router:
+                self.command_router.flush()
+            
             # Clean up modules in reverse order
             modules_to_cleanup = [
                 ("feedback", self.feedback_module),
@@ -7360,9 +7434,13 @@ Focus on being helpful while being honest about what information is actually vis
             }
             
             # Get active application information
+            perception = self._get_active_perception_context()
             if hasattr(self, 'application_detector') and self.application_detector:
                 try:
-                    app_info = self.application_detector.get_active_application_info()
+                    if perception is not None:
+                        app_info = perception.get_application_info()
+                    else:
+                        app_info = self.application_detector.get_active_application_info()
                     if app_info:
                         scroll_context["active_application"] = app_info.to_dict()
                         logger.debug(f"[{execution_id}] Active application: {app_info.name}")
@@ -7423,10 +7501,18 @@ Focus on being helpful while being honest about what information is actually vis
                 "AXWebArea", "AXTextArea", "AXGroup"
             ]
             
+            perception = self._get_active_perception_context()
+            
             # Try to find elements with scrollable roles
             for role in scrollable_roles:
                 try:
-                    elements = self.accessibility_module.find_elements_by_role(role)
+                    if perception is not None:
+                        elements = perception.get_accessibility_snapshot(
+                            ("role", role),
+                            lambda role=role: self.accessibility_module.find_elements_by_role(role)
+                        )
+                    else:
+                        elements = self.accessibility_module.find_elements_by_role(role)
                     for element in elements[:3]:  # Limit to first 3 for performance
                         if self._is_element_scrollable(element):
                             area_info = {
@@ -7462,7 +7548,7 @@ Focus on being helpful while being honest about what information is actually vis
             scrollable_areas = []
             
             # Use vision module to analyze screen for scrollable content
-            screen_analysis = self.vision_module.describe_screen(analysis_type="detailed")
+            screen_analysis = self._describe_screen_for_command(analysis_type="detailed")
             
             if screen_analysis and "elements" in screen_analysis:
                 for element in screen_analysis["elements"]:
@@ -80,6 +80,24 @@ def sample_sound_files(temp_directory):
     yield sound_files
 
 
+@pytest.fixture
+def temp_sound_files():
+    """Create dummy sound files in their own temporary directory."""
+    temp_dir = tempfile.mkdtemp()
+    sound_files = {}
+    
+    for sound_name in ['success', 'failure', 'thinking']:
+        sound_path = os.path.join(temp_dir, f"{sound_name}.wav")
+        with open(sound_path, 'wb') as f:
+            # Write minimal WAV header (44 bytes) + some data
+            f.write(b'RIFF' + b'\x00' * 40 + b'data' + b'\x00' * 100)
+        sound_files[sound_name] = sound_path
+    
+    yield sound_files
+    
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 @pytest.fixture
 def mock_config():
     """Mock configuration values for testing."""
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Action Batch Benchmark
+
+Runs a form-filling action plan through AutomationModule.execute_action_sequence
+per action (previous behaviour) and compiled into batched cliclick invocations,
+against fake cliclick and pbcopy shims that record every invocation.
+
+The shims are put first on PATH. They log their arguments and start/end times,
+honour cliclick w: waits and spend --event-ms per posted event, so the reported
+wall time is process start-up plus the waits each mode asked for.
+
+Usage:
+    python tests/run_action_batch_benchmark.py
+    python tests/run_action_batch_benchmark.py --fields 10 --runs 5 --event-ms 20
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import List, Dict, Any
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.automation import AutomationModule
+
+SHIM = '''#!{python}
+import json, os, sys, time
+start = time.time()
+for arg in sys.argv[1:]:
+    if arg.startswith("w:"):
+        time.sleep(int(arg[2:]) / 1000)
+    else:
+        time.sleep({event_ms} / 1000)
+if os.path.basename(sys.argv[0]) == "pbcopy":
+    sys.stdin.read()
+with open(os.environ["ACTION_SHIM_LOG"], "a") as log:
+    log.write(json.dumps({{"argv": sys.argv, "start": start, "end": time.time()}}) + "\\n")
+'''
+
+
+def install_shims(directory: str, event_ms: float) -> str:
+    """Write fake cliclick/pbcopy executables and return the invocation log path."""
+    for name in ("cliclick", "pbcopy"):
+        path = os.path.join(directory, name)
+        with open(path, "w") as shim:
+            shim.write(SHIM.format(python=sys.executable, event_ms=event_ms))
+        os.chmod(path, 0o755)
+    return os.path.join(directory, "invocations.jsonl")
+
+
+def form_plan(fields: int) -> List[Dict[str, Any]]:
+    """Click each field and type a value; the last field gets multi-line text."""
+    plan = []
+    for i in range(fields):
+        plan.append({"action": "click", "coordinates": [400, 200 + 50 * i]})
+        text = f"Value {i}" if i < fields - 1 else "First line\nSecond line"
+        plan.append({"action": "type", "text": text})
+    return plan
+
+
+def run_plan(automation: AutomationModule, plan, log_path: str, batched: bool) -> Dict[str, Any]:
+    if os.path.exists(log_path):
+        os.remove(log_path)
+    with patch('modules.automation.AUTOMATION_BATCH_ENABLED', batched):
+        start = time.perf_counter()
+        results = automation.execute_action_sequence(plan)
+        elapsed = time.perf_counter() - start
+    with open(log_path) as log:
+        invocations = [json.loads(line) for line in log]
+    return {
+        'elapsed': elapsed,
+        'invocations': len(invocations),
+        'successful': results['successful_actions'],
+        'batched': results['batched_actions']
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched cliclick execution of an action plan")
+    parser.add_argument("--fields", type=int, default=3, help="Form fields in the plan (2 actions each)")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per mode")
+    parser.add_argument("--event-ms", type=float, default=20.0, help="Simulated time per posted event (cliclick -w default)")
+    args = parser.parse_args()
+
+    plan = form_plan(args.fields)
+    with tempfile.TemporaryDirectory() as shim_dir:
+        log_path = install_shims(shim_dir, args.event_ms)
+        os.environ["ACTION_SHIM_LOG"] = log_path
+        os.environ["PATH"] = shim_dir + os.pathsep + os.environ.get("PATH", "")
+
+        automation = AutomationModule()
+        automation.is_macos = True
+        automation.has_cliclick = True
+
+        print(f"⚡ {len(plan)}-step form plan, {args.runs} runs per mode, {args.event_ms}ms per event")
+        for name, batched in (("per-action", False), ("batched", True)):
+            runs = [run_plan(automation, plan, log_path, batched) for _ in range(args.runs)]
+            print(f"  {name:<10} median {statistics.median(r['elapsed'] for r in runs) * 1000:7.1f}ms  "
+                  f"processes {runs[0]['invocations']:3d}  "
+                  f"succeeded {runs[0]['successful']}/{len(plan)} ({runs[0]['batched']} batched)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Clipboard Capture Benchmark
+
+Measures selected-text capture latency (call to text returned) on the
+in-memory fake pasteboard, with the frontmost application's copy simulated
+by a timer that writes the selection --copy-ms after Cmd+C. Writing the
+original contents back costs --restore-ms.
+
+Strategies:
+- fixed_sleep: the pyperclip path - save, clear, Cmd+C, fixed sleep, read,
+  restore before returning. Each pyperclip call costs --process-ms
+  (pbcopy/pbpaste process start-up).
+- polled: changeCount polling with a deadline, restore before returning
+- polled_lazy: changeCount polling, restore in the background
+
+Usage:
+    python tests/run_clipboard_capture_benchmark.py
+    python tests/run_clipboard_capture_benchmark.py --copy-ms 15 --runs 50 --rich
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.clipboard_capture import ClipboardCapture, MemoryPasteboardBackend, PasteboardSnapshot, TEXT_TYPE
+
+SELECTION = "The quick brown fox jumps over the lazy dog. " * 20
+
+
+class SlowRestorePasteboard(MemoryPasteboardBackend):
+    """Fake pasteboard where writing back a snapshot takes --restore-ms."""
+
+    def __init__(self, restore_delay: float):
+        super().__init__()
+        self.restore_delay = restore_delay
+
+    def restore(self, snapshot):
+        time.sleep(self.restore_delay)
+        return super().restore(snapshot)
+
+
+def simulated_copy(pasteboard: MemoryPasteboardBackend, args):
+    """Cmd+C handler: the selection lands on the pasteboard after --copy-ms."""
+    item = {TEXT_TYPE: SELECTION.encode('utf-8')}
+    if args.rich:
+        item["public.html"] = f"<p>{SELECTION}</p>".encode('utf-8')
+        item["public.rtf"] = b"{\\rtf1 " + SELECTION.encode('utf-8') + b"}"
+
+    def send_copy():
+        threading.Timer(args.copy_ms / 1000, pasteboard.write, ([item],)).start()
+        return True
+    return send_copy
+
+
+def fixed_sleep_capture(pasteboard: MemoryPasteboardBackend, send_copy, args):
+    process = args.process_ms / 1000
+    time.sleep(process)
+    original = pasteboard.read_text() or ""
+    time.sleep(process)
+    pasteboard.write_text("")
+    send_copy()
+    time.sleep(args.sleep_ms / 1000)
+    time.sleep(process)
+    text = pasteboard.read_text() or None
+    time.sleep(process)
+    pasteboard.restore(PasteboardSnapshot([{TEXT_TYPE: original.encode('utf-8')}], 0))
+    return text
+
+
+def measure(strategy: str, args) -> dict:
+    pasteboard = SlowRestorePasteboard(args.restore_ms / 1000)
+    pasteboard.write_text("original clipboard contents")
+    send_copy = simulated_copy(pasteboard, args)
+    capture = None
+    if strategy != "fixed_sleep":
+        capture = ClipboardCapture(pasteboard, timeout=args.timeout_ms / 1000,
+                                   lazy_restore=(strategy == "polled_lazy"))
+
+    latencies, misses = [], 0
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        if capture is None:
+            text = fixed_sleep_capture(pasteboard, send_copy, args)
+        else:
+            text = capture.capture(send_copy).text
+        latencies.append(time.perf_counter() - start)
+        if text != SELECTION:
+            misses += 1
+        # Let the copy timer and any background restore finish between runs
+        time.sleep(args.copy_ms / 1000 + args.restore_ms / 1000 + 0.01)
+        if capture is not None:
+            capture.flush_restore()
+
+    restored = pasteboard.read_text() == "original clipboard contents"
+    if capture is not None:
+        capture.shutdown()
+    return {
+        'median': statistics.median(latencies),
+        'p95': sorted(latencies)[int(0.95 * (len(latencies) - 1))],
+        'misses': misses,
+        'restored': restored
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark selected-text capture latency on a fake pasteboard")
+    parser.add_argument("--strategies", default="fixed_sleep,polled,polled_lazy", help="Comma-separated strategies")
+    parser.add_argument("--runs", type=int, default=20, help="Captures per strategy")
+    parser.add_argument("--copy-ms", type=float, default=10.0, help="Simulated application copy latency")
+    parser.add_argument("--sleep-ms", type=float, default=200.0, help="Fixed sleep of the fixed_sleep strategy")
+    parser.add_argument("--process-ms", type=float, default=8.0, help="Simulated pyperclip process cost per call")
+    parser.add_argument("--restore-ms", type=float, default=5.0, help="Simulated cost of writing the original back")
+    parser.add_argument("--timeout-ms", type=float, default=500.0, help="changeCount poll deadline")
+    parser.add_argument("--rich", action="store_true", help="Copy HTML and RTF along with the text")
+    args = parser.parse_args()
+
+    print(f"📋 Clipboard capture latency, {args.runs} runs each, copy lands after {args.copy_ms:.0f}ms")
+    for strategy in args.strategies.split(","):
+        result = measure(strategy, args)
+        print(f"  {strategy:<12} median {result['median'] * 1000:8.2f}ms  p95 {result['p95'] * 1000:8.2f}ms  "
+              f"misses {result['misses']}  original restored {result['restored']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
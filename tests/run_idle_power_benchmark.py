@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Idle Power Benchmark
+
+Replays a long recording through wake word listening and compares:
+
+- legacy: every frame converted to a Python list in the audio callback and
+  passed to the detector, with a 10 ms polling loop (previous
+  AudioModule.listen_for_wake_word)
+- gated: batches of frames through the WakeWordGate energy pre-filter
+
+Reported per mode:
+- idle CPU%: process CPU time per second of replayed audio
+- detector duty cycle: fraction of frames that reached the detector
+- wake word detection latency: detection time minus the labelled end of
+  each wake word, and missed wake words
+
+The detector is Porcupine when --access-key is given. Otherwise a stand-in
+fires when it is fed audio within 0.5s after a labelled wake word end and
+burns a comparable amount of CPU per frame.
+
+Recording format: 16-bit mono 16 kHz WAV with a sidecar JSON file of the
+same name listing labelled wake word intervals in seconds:
+    {"wake_words": [[61.2, 61.8], [305.0, 305.7]]}
+
+Usage:
+    python tests/run_idle_power_benchmark.py --recording path/to/long.wav
+    python tests/run_idle_power_benchmark.py --minutes 5 --speed 4
+"""
+
+import argparse
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import wave
+from typing import List, Tuple, Optional, Dict, Any
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import WAKE_WORD, WAKE_WORD_FRAME_BATCH
+from modules.wake_word_gate import WakeWordGate
+
+SAMPLE_RATE = 16000
+FRAME_LENGTH = 512
+DETECTION_WINDOW = 0.5
+
+
+def load_recording(path: str) -> Tuple[np.ndarray, List[Tuple[float, float]]]:
+    """Load a 16 kHz 16-bit mono WAV file and its wake word labels."""
+    with wave.open(path, "rb") as wav_file:
+        if wav_file.getsampwidth() != 2 or wav_file.getframerate() != SAMPLE_RATE:
+            raise ValueError(f"{path} is not 16-bit {SAMPLE_RATE}Hz")
+        frames = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=np.int16)
+        if wav_file.getnchannels() > 1:
+            frames = frames.reshape(-1, wav_file.getnchannels())[:, 0]
+    label_path = os.path.splitext(path)[0] + ".json"
+    wake_words = []
+    if os.path.exists(label_path):
+        with open(label_path) as label_file:
+            wake_words = [tuple(interval) for interval in json.load(label_file)["wake_words"]]
+    return frames.astype(np.float32) / 32768.0, wake_words
+
+
+def synthetic_recording(minutes: float) -> Tuple[np.ndarray, List[Tuple[float, float]]]:
+    """Mostly quiet room with occasional talking, typing and a wake word every ~90s."""
+    rng = np.random.default_rng(7)
+    total = int(minutes * 60 * SAMPLE_RATE)
+    audio = 0.002 * rng.standard_normal(total)
+    audio += np.convolve(rng.standard_normal(total), np.ones(16) / 16, mode="same") * 0.004
+
+    def voice(seconds: float) -> np.ndarray:
+        t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+        pitch = rng.uniform(100, 220)
+        signal = sum(np.sin(2 * np.pi * k * pitch * t) / k for k in range(1, 8))
+        return signal * (0.2 + 0.8 * np.abs(np.sin(2 * np.pi * 3 * t))) * rng.uniform(0.03, 0.1)
+
+    # Background conversation bursts
+    for start in rng.uniform(0, minutes * 60 - 5, int(minutes * 3)):
+        burst = voice(rng.uniform(1.0, 4.0))
+        index = int(start * SAMPLE_RATE)
+        audio[index:index + burst.size] += burst[:total - index]
+
+    wake_words = []
+    for start in np.arange(30.0, minutes * 60 - 5, 90.0):
+        burst = voice(0.7)
+        index = int(start * SAMPLE_RATE)
+        audio[index:index + burst.size] += burst
+        wake_words.append((float(start), float(start + 0.7)))
+    return audio.astype(np.float32), wake_words
+
+
+class StandInDetector:
+    """Fires on audio right after a labelled wake word; costs CPU like a small neural network."""
+
+    def __init__(self, wake_words: List[Tuple[float, float]]):
+        self.wake_words = wake_words
+        self.position = 0.0
+        self._weights = np.random.default_rng(1).standard_normal((FRAME_LENGTH, 64)).astype(np.float32)
+
+    def process(self, frame: np.ndarray) -> int:
+        np.tanh(frame.astype(np.float32) @ self._weights)
+        end = self.position
+        return 0 if any(0 <= end - stop < DETECTION_WINDOW for _, stop in self.wake_words) else -1
+
+
+def create_detector(access_key: Optional[str], wake_words):
+    if access_key:
+        import pvporcupine
+        porcupine = pvporcupine.create(access_key=access_key, keywords=[WAKE_WORD])
+        return porcupine, porcupine.process
+    detector = StandInDetector(wake_words)
+    return detector, detector.process
+
+
+def replay(audio: np.ndarray, block_size: int, speed: float, blocks: "queue.Queue") -> None:
+    """Deliver blocks at (scaled) real-time pace, like a PortAudio callback thread."""
+    start = time.perf_counter()
+    for offset in range(0, audio.size - block_size + 1, block_size):
+        due = start + (offset + block_size) / SAMPLE_RATE / speed
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        blocks.put((offset + block_size, audio[offset:offset + block_size]))
+    blocks.put(None)
+
+
+def run_legacy(audio, wake_words, speed, access_key) -> Dict[str, Any]:
+    engine, process = create_detector(access_key, wake_words)
+    blocks = queue.Queue()
+    audio_buffer, detections, processed = [], [], 0
+    position = 0
+    cpu_start = time.process_time()
+    threading.Thread(target=replay, args=(audio, FRAME_LENGTH, speed, blocks), daemon=True).start()
+    finished = False
+    while not finished:
+        # The legacy callback converted each block to a Python list
+        while True:
+            try:
+                item = blocks.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                finished = True
+                break
+            audio_buffer.extend((item[1] * 32767).astype(np.int16))
+        while len(audio_buffer) >= FRAME_LENGTH:
+            frame = audio_buffer[:FRAME_LENGTH]
+            audio_buffer = audio_buffer[FRAME_LENGTH:]
+            position += FRAME_LENGTH
+            if isinstance(engine, StandInDetector):
+                engine.position = position / SAMPLE_RATE
+            processed += 1
+            if process(np.array(frame, dtype=np.int16)) >= 0:
+                detections.append(position / SAMPLE_RATE)
+        time.sleep(0.01)
+    return {'cpu': time.process_time() - cpu_start, 'processed': processed,
+            'frames': position // FRAME_LENGTH, 'detections': detections}
+
+
+def run_gated(audio, wake_words, speed, access_key, batch: int) -> Dict[str, Any]:
+    engine, process = create_detector(access_key, wake_words)
+    frame_end = [0]
+
+    def tracked(frame):
+        if isinstance(engine, StandInDetector):
+            engine.position = frame_end[0] / SAMPLE_RATE
+        return process(frame)
+
+    gate = WakeWordGate(tracked, FRAME_LENGTH, SAMPLE_RATE)
+    blocks = queue.Queue()
+    detections = []
+    cpu_start = time.process_time()
+    threading.Thread(target=replay, args=(audio, FRAME_LENGTH * batch, speed, blocks), daemon=True).start()
+    while True:
+        item = blocks.get()
+        if item is None:
+            break
+        end, samples = item
+        # A batch is only processed once all of it has arrived, so detections
+        # (and the stand-in detector's notion of time) are at the batch end
+        frame_end[0] = end
+        if gate.process(samples) is not None:
+            detections.append(end / SAMPLE_RATE)
+            gate.reset()
+    stats = gate.get_stats()
+    return {'cpu': time.process_time() - cpu_start, 'processed': stats['frames_processed'],
+            'frames': stats['frames_total'], 'detections': detections}
+
+
+def report(name: str, result: Dict[str, Any], wake_words, audio_seconds: float) -> None:
+    latencies, missed = [], 0
+    for _, stop in wake_words:
+        hits = [d - stop for d in result['detections'] if 0 <= d - stop < DETECTION_WINDOW + 0.5]
+        if hits:
+            latencies.append(min(hits))
+        else:
+            missed += 1
+    latency_text = (f"median {np.median(latencies) * 1000:.0f}ms, max {max(latencies) * 1000:.0f}ms"
+                    if latencies else "n/a")
+    print(f"  {name:<7} CPU {result['cpu'] / audio_seconds * 100:5.2f}%  "
+          f"detector duty cycle {result['processed'] / max(result['frames'], 1):.1%}  "
+          f"wake word latency {latency_text}  missed {missed}/{len(wake_words)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark idle CPU and wake word latency")
+    parser.add_argument("--recording", help="Long 16 kHz WAV with wake word labels (synthetic if omitted)")
+    parser.add_argument("--minutes", type=float, default=3.0, help="Length of the synthetic recording")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed (1.0 = real time)")
+    parser.add_argument("--batch", type=int, default=WAKE_WORD_FRAME_BATCH, help="Frames per gated batch")
+    parser.add_argument("--access-key", help="Picovoice access key to benchmark real Porcupine")
+    args = parser.parse_args()
+
+    audio, wake_words = load_recording(args.recording) if args.recording else synthetic_recording(args.minutes)
+    audio_seconds = audio.size / SAMPLE_RATE
+    print(f"🔋 {audio_seconds:.0f}s recording, {len(wake_words)} wake words, "
+          f"replayed at {args.speed}x, {'Porcupine' if args.access_key else 'stand-in detector'}")
+    print("  CPU% is process CPU time per second of audio (real-time equivalent)")
+
+    report("legacy", run_legacy(audio, wake_words, args.speed, args.access_key), wake_words, audio_seconds)
+    report("gated", run_gated(audio, wake_words, args.speed, args.access_key, args.batch), wake_words, audio_seconds)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Input Backend Benchmark
+
+Measures per-action latency of each input injection backend (call to
+return) for clicks, key presses, typing and pasting.
+
+Backends:
+- recording: no input posted (lower bound of the backend interface)
+- cliclick: one cliclick/pbcopy process per action. With --shim, fake
+  executables from run_action_batch_benchmark are used, so this runs on
+  machines without cliclick (process start-up only).
+- quartz: in-process CGEvents (macOS with pyobjc-framework-Quartz)
+
+WARNING: without --shim the cliclick and quartz backends post real input.
+Clicks go to --x/--y and typed or pasted text goes to the focused window,
+so point them at an empty text editor.
+
+Usage:
+    python tests/run_input_backend_benchmark.py --shim
+    python tests/run_input_backend_benchmark.py --backends quartz,cliclick --actions click,key --x 600 --y 400
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.input_backends import INPUT_BACKENDS, QUARTZ_AVAILABLE
+
+ACTIONS = {
+    'click': lambda backend, args: backend.click(args.x, args.y),
+    'double_click': lambda backend, args: backend.double_click(args.x, args.y),
+    'key': lambda backend, args: backend.key('esc'),
+    'hotkey': lambda backend, args: backend.hotkey(['cmd', 'shift', 'z']),
+    'type': lambda backend, args: backend.type_text("aura"),
+    'paste': lambda backend, args: backend.paste_text("aura\n"),
+}
+
+
+def measure(backend, action: str, args) -> dict:
+    latencies, failures = [], 0
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        if not ACTIONS[action](backend, args):
+            failures += 1
+        latencies.append(time.perf_counter() - start)
+    return {
+        'median': statistics.median(latencies),
+        'p95': sorted(latencies)[int(0.95 * (len(latencies) - 1))],
+        'failures': failures
+    }
+
+
+def main():
+    default_backends = "recording,cliclick" + (",quartz" if QUARTZ_AVAILABLE else "")
+    parser = argparse.ArgumentParser(description="Benchmark per-action latency of input backends")
+    parser.add_argument("--backends", default=default_backends, help="Comma-separated backend names")
+    parser.add_argument("--actions", default="click,key,hotkey", help=f"Comma-separated from {', '.join(ACTIONS)}")
+    parser.add_argument("--runs", type=int, default=20, help="Repetitions per action")
+    parser.add_argument("--x", type=int, default=600, help="Click X coordinate")
+    parser.add_argument("--y", type=int, default=400, help="Click Y coordinate")
+    parser.add_argument("--shim", action="store_true", help="Use fake cliclick/pbcopy executables")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as shim_dir:
+        if args.shim:
+            from tests.run_action_batch_benchmark import install_shims
+            os.environ["ACTION_SHIM_LOG"] = install_shims(shim_dir, event_ms=0)
+            os.environ["PATH"] = shim_dir + os.pathsep + os.environ.get("PATH", "")
+
+        print(f"🖱️  Per-action latency, {args.runs} runs each{' (cliclick shim)' if args.shim else ''}")
+        for name in args.backends.split(","):
+            try:
+                backend = INPUT_BACKENDS[name]()
+            except Exception as e:
+                print(f"  {name:<10} unavailable: {e}")
+                continue
+            for action in args.actions.split(","):
+                result = measure(backend, action, args)
+                print(f"  {name:<10} {action:<13} median {result['median'] * 1000:8.3f}ms  "
+                      f"p95 {result['p95'] * 1000:8.3f}ms  failures {result['failures']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Screenshot Encoding Profile Calibration
+
+Runs a fixed set of local screenshots through a vision endpoint at different
+encoding settings (resolution, JPEG quality, grayscale), records accuracy
+relative to the full-fidelity result together with latency, and writes the
+observations to SCREENSHOT_PROFILE_CALIBRATION_FILE so VisionModule picks the
+tuned profiles up on the next start.
+
+Usage:
+    python tests/run_screenshot_calibration.py --images path/to/screenshots
+    python tests/run_screenshot_calibration.py --mock
+"""
+
+import argparse
+import glob
+import io
+import os
+import sys
+import time
+from typing import Dict, Any, List
+
+import numpy as np
+import requests
+from PIL import Image, ImageDraw
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import (
+    VISION_API_BASE,
+    VISION_API_TIMEOUT,
+    VISION_PROMPT_SIMPLE,
+    VISION_PROMPT_DETAILED,
+    VISION_PROMPT_CLICKABLE,
+    FORM_VISION_PROMPT,
+    get_current_model_name
+)
+from modules.screenshot_profiles import (
+    ScreenshotProfileManager,
+    calibrate_profiles,
+    element_overlap_score
+)
+
+PROMPTS = {
+    "simple": VISION_PROMPT_SIMPLE,
+    "detailed": VISION_PROMPT_DETAILED,
+    "clickable": VISION_PROMPT_CLICKABLE,
+    "form": FORM_VISION_PROMPT
+}
+
+
+def load_images(image_dir: str) -> List[Image.Image]:
+    """Load PNG/JPEG screenshots from a directory."""
+    paths = []
+    for pattern in ("*.png", "*.jpg", "*.jpeg"):
+        paths.extend(glob.glob(os.path.join(image_dir, pattern)))
+    return [Image.open(path).convert("RGB") for path in sorted(paths)]
+
+
+def synthetic_images(count: int = 3) -> List[Image.Image]:
+    """Render simple UI-like screenshots when no local corpus is given."""
+    images = []
+    for index in range(count):
+        img = Image.new("RGB", (2560, 1600), (236, 236, 236))
+        draw = ImageDraw.Draw(img)
+        draw.rectangle((0, 0, 2560, 80), fill=(60, 60, 70))
+        for row in range(8):
+            top = 200 + row * 150
+            draw.rectangle((200, top, 900, top + 90), outline=(120, 120, 120), width=3, fill=(255, 255, 255))
+            draw.text((220, top + 30), f"Field {index}-{row}", fill=(20, 20, 20))
+            draw.rectangle((1000, top, 1300, top + 90), fill=(40, 110, 220))
+            draw.text((1040, top + 30), f"Button {row}", fill=(255, 255, 255))
+        images.append(img)
+    return images
+
+
+def mock_analyze(screenshot_b64: str, analysis_type: str) -> Dict[str, Any]:
+    """
+    Mock vision endpoint.
+
+    Latency grows with payload size; the number of legible elements shrinks
+    as resolution and quality drop, approximating a real model's behavior.
+    """
+    import base64
+    data = base64.b64decode(screenshot_b64)
+    img = Image.open(io.BytesIO(data))
+    time.sleep(len(data) / 40_000_000)
+
+    pixels = np.asarray(img.convert("L"), dtype=np.float32)
+    sharpness = float(np.abs(np.diff(pixels, axis=1)).mean())
+    legible = max(0, min(16, int(img.width / 120 * min(1.0, sharpness / 4.0))))
+    return {"elements": [{"text": f"element {i}"} for i in range(legible)]}
+
+
+def endpoint_analyze(screenshot_b64: str, analysis_type: str) -> Dict[str, Any]:
+    """Send a screenshot to the configured LM Studio vision endpoint."""
+    import json
+    payload = {
+        "model": get_current_model_name(),
+        "messages": [{
+            "role": "user",
+            "content": [
+                {"type": "text", "text": PROMPTS[analysis_type]},
+                {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{screenshot_b64}"}}
+            ]
+        }],
+        "max_tokens": 3000,
+        "temperature": 0.1
+    }
+    response = requests.post(f"{VISION_API_BASE}/chat/completions", json=payload, timeout=VISION_API_TIMEOUT)
+    response.raise_for_status()
+    content = response.json()["choices"][0]["message"]["content"]
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        return {"elements": [{"text": line} for line in content.splitlines() if line.strip()]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate screenshot encoding profiles")
+    parser.add_argument("--images", help="Directory of local screenshots (synthetic UI screenshots if omitted)")
+    parser.add_argument("--mock", action="store_true", help="Use a mock vision endpoint instead of LM Studio")
+    parser.add_argument("--types", default="simple,detailed,clickable,form", help="Comma separated analysis types")
+    parser.add_argument("--output", help="Calibration file to write (defaults to config)")
+    args = parser.parse_args()
+
+    images = load_images(args.images) if args.images else synthetic_images()
+    if not images:
+        print("❌ No screenshots found")
+        return 1
+
+    analysis_types = [t.strip() for t in args.types.split(",") if t.strip()]
+    manager = ScreenshotProfileManager(autotune=False)
+    analyze = mock_analyze if args.mock else endpoint_analyze
+
+    print(f"📸 Calibrating {len(analysis_types)} analysis types on {len(images)} screenshots "
+          f"({'mock' if args.mock else VISION_API_BASE})")
+    tuned = calibrate_profiles(images, analysis_types, analyze, element_overlap_score, manager)
+
+    for analysis_type in analysis_types:
+        profile = tuned.get(analysis_type)
+        print(f"  {analysis_type:10s} -> {profile.key if profile else 'no profile met the accuracy target'}")
+
+    path = manager.save_calibration(args.output)
+    print(f"✅ Calibration written to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
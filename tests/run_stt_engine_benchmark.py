@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Speech-to-Text Engine Benchmark
+
+Measures the real-time factor (inference seconds / audio seconds, lower is
+faster) of each STT engine on a local audio corpus, in-process and through
+the STT worker process (which adds shared memory transfer and IPC).
+
+Engines that are not installed are skipped.
+
+Usage:
+    python tests/run_stt_engine_benchmark.py --corpus path/to/wavs
+    python tests/run_stt_engine_benchmark.py --engines faster-whisper --model base
+    python tests/run_stt_engine_benchmark.py --no-worker
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.speech_preprocessing import prepare_whisper_input, WHISPER_SAMPLE_RATE
+from modules.stt_engines import create_stt_engine
+from modules.stt_worker import SpeechWorkerClient
+from tests.run_stt_latency_benchmark import load_corpus, synthetic_corpus
+
+
+def _rtf_summary(label: str, factors: List[float], texts: List[str]) -> None:
+    factors = sorted(factors)
+    p90 = factors[min(len(factors) - 1, int(len(factors) * 0.9))]
+    print(f"  {label:<28} RTF median {statistics.median(factors):.3f}, p90 {p90:.3f}  "
+          f"({1 / statistics.median(factors):.1f}x real time)")
+    for text in texts[:3]:
+        print(f"      '{text.strip()[:60]}'")
+
+
+def benchmark_engine(name: str, model: str, utterances: List[Tuple[str, np.ndarray, int]],
+                     repeat: int, use_worker: bool) -> None:
+    """Time one engine in-process and (optionally) through the worker process."""
+    inputs = [prepare_whisper_input(audio.copy(), rate) for _, audio, rate in utterances]
+    options = {'language': "en", 'temperature': 0.0}
+
+    try:
+        engine = create_stt_engine(name, model)
+        start = time.perf_counter()
+        engine.load()
+        load_time = time.perf_counter() - start
+    except ImportError as e:
+        print(f"  {name:<28} skipped (not installed: {e.name})")
+        return
+    print(f"  {name} '{model}' loaded in {load_time:.1f}s {engine.describe()}")
+
+    engine.transcribe(inputs[0][:WHISPER_SAMPLE_RATE], **options)  # warm-up
+    factors, texts = [], []
+    for samples in inputs:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = engine.transcribe(samples, **options)
+            factors.append((time.perf_counter() - start) / (samples.size / WHISPER_SAMPLE_RATE))
+        texts.append(result['text'])
+    _rtf_summary(f"{name} (in-process)", factors, texts)
+    del engine
+
+    if not use_worker:
+        return
+
+    worker = SpeechWorkerClient(name, model)
+    try:
+        info = worker.start()
+        print(f"  worker ready (load {info['load_time']:.1f}s, warm-up {info['warmup_time']:.2f}s)")
+        factors, texts = [], []
+        for samples in inputs:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = worker.transcribe(samples, **options)
+                factors.append((time.perf_counter() - start) / (samples.size / WHISPER_SAMPLE_RATE))
+            texts.append(result['text'])
+        _rtf_summary(f"{name} (worker process)", factors, texts)
+    finally:
+        worker.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark STT engines by real-time factor")
+    parser.add_argument("--corpus", help="Directory of 16-bit WAV utterances (synthetic signals if omitted)")
+    parser.add_argument("--engines", default="whisper,faster-whisper", help="Comma-separated engine names")
+    parser.add_argument("--model", default="small", help="Model size or path")
+    parser.add_argument("--repeat", type=int, default=2, help="Runs per utterance")
+    parser.add_argument("--no-worker", action="store_true", help="Skip the worker process measurements")
+    args = parser.parse_args()
+
+    utterances = load_corpus(args.corpus) if args.corpus else synthetic_corpus()
+    if not utterances:
+        print("❌ No utterances found")
+        return 1
+
+    total = sum(audio.size / rate for _, audio, rate in utterances)
+    print(f"🎙️  {len(utterances)} utterances ({total:.1f}s of audio) x {args.repeat} runs")
+    for name in args.engines.split(","):
+        benchmark_engine(name.strip(), args.model, utterances, args.repeat, not args.no_worker)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+End-of-Speech to Text Latency Benchmark
+
+Measures the time from a finished recording (int16 numpy buffer, as returned
+by AudioModule._record_audio) to transcribed text for:
+
+- legacy: pydub normalize + high-pass -> temp WAV + debug_audio.wav export ->
+  librosa reload (if installed) -> Whisper given the file path
+- in-memory: prepare_whisper_input -> Whisper given the float32 array
+
+Usage:
+    python tests/run_stt_latency_benchmark.py --corpus path/to/wavs
+    python tests/run_stt_latency_benchmark.py --model tiny
+    python tests/run_stt_latency_benchmark.py --no-whisper   # preprocessing only
+"""
+
+import argparse
+import glob
+import os
+import statistics
+import sys
+import tempfile
+import time
+import wave
+from typing import List, Tuple
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.speech_preprocessing import prepare_whisper_input, WHISPER_SAMPLE_RATE
+
+
+def load_corpus(corpus_dir: str) -> List[Tuple[str, np.ndarray, int]]:
+    """Load 16-bit mono WAV files as int16 arrays."""
+    utterances = []
+    for path in sorted(glob.glob(os.path.join(corpus_dir, "*.wav"))):
+        with wave.open(path, "rb") as wav_file:
+            if wav_file.getsampwidth() != 2:
+                print(f"  skipping {path}: not 16-bit")
+                continue
+            frames = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=np.int16)
+            if wav_file.getnchannels() > 1:
+                frames = frames.reshape(-1, wav_file.getnchannels())[:, 0].copy()
+            utterances.append((os.path.basename(path), frames, wav_file.getframerate()))
+    return utterances
+
+
+def synthetic_corpus(count: int = 5) -> List[Tuple[str, np.ndarray, int]]:
+    """Generate voice-like test signals (harmonics with syllable envelopes) at 16 kHz."""
+    rng = np.random.default_rng(1)
+    utterances = []
+    for index in range(count):
+        seconds = 1.5 + index * 0.75
+        t = np.arange(int(seconds * WHISPER_SAMPLE_RATE)) / WHISPER_SAMPLE_RATE
+        pitch = 110 + 20 * index
+        voice = sum(np.sin(2 * np.pi * pitch * k * t) / k for k in range(1, 8))
+        envelope = np.clip(np.sin(2 * np.pi * 3.0 * t), 0, None)
+        signal = 0.05 * voice * envelope + 0.002 * rng.standard_normal(t.size) + 0.02 * np.sin(2 * np.pi * 50 * t)
+        utterances.append((f"synthetic_{index}", (signal * 32767).astype(np.int16), WHISPER_SAMPLE_RATE))
+    return utterances
+
+
+def legacy_prepare(audio: np.ndarray, sample_rate: int) -> str:
+    """Previous AudioModule.speech_to_text preprocessing; returns the temp path."""
+    from pydub import AudioSegment
+
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
+        temp_path = temp_file.name
+    segment = AudioSegment(audio.tobytes(), frame_rate=sample_rate, sample_width=audio.dtype.itemsize, channels=1)
+    segment = segment.normalize()
+    if len(segment) > 1000:
+        segment = segment.high_pass_filter(80)
+    segment.export(temp_path, format="wav")
+    segment.export(os.path.join(tempfile.gettempdir(), "debug_audio.wav"), format="wav")
+    try:
+        import librosa
+        librosa.load(temp_path, sr=16000)
+    except ImportError:
+        pass
+    return temp_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark end-of-speech to text latency")
+    parser.add_argument("--corpus", help="Directory of 16-bit WAV utterances (synthetic signals if omitted)")
+    parser.add_argument("--model", default="small", help="Whisper model name")
+    parser.add_argument("--no-whisper", action="store_true", help="Only time preprocessing")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per utterance")
+    args = parser.parse_args()
+
+    utterances = load_corpus(args.corpus) if args.corpus else synthetic_corpus()
+    if not utterances:
+        print("❌ No utterances found")
+        return 1
+
+    model = None
+    if not args.no_whisper:
+        import whisper
+        print(f"Loading Whisper model '{args.model}'...")
+        model = whisper.load_model(args.model)
+
+    legacy_times, memory_times = [], []
+    for name, audio, sample_rate in utterances:
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            temp_path = legacy_prepare(audio, sample_rate)
+            try:
+                legacy_text = model.transcribe(temp_path, language="en", temperature=0.0, fp16=False)["text"] if model else ""
+            finally:
+                os.unlink(temp_path)
+            legacy_times.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            whisper_input = prepare_whisper_input(audio.copy(), sample_rate)
+            memory_text = model.transcribe(whisper_input, language="en", temperature=0.0, fp16=False)["text"] if model else ""
+            memory_times.append((time.perf_counter() - start) * 1000)
+
+        if model:
+            print(f"  {name}: legacy='{legacy_text.strip()}' in-memory='{memory_text.strip()}'")
+
+    scope = "end-of-speech to text" if model else "preprocessing only"
+    print(f"🎙️  {len(utterances)} utterances x {args.repeat} runs ({scope})")
+    print(f"  Legacy (temp WAV):  median {statistics.median(legacy_times):.1f}ms, max {max(legacy_times):.1f}ms")
+    print(f"  In-memory:          median {statistics.median(memory_times):.1f}ms, max {max(memory_times):.1f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
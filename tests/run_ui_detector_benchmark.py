@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Local UI Element Detector Benchmark
+
+Renders synthetic UI screenshots (text fields, filled and outlined buttons,
+labels, toolbars) at typical screenshot sizes and measures detection latency
+and recall of the OpenCV detector against the rendered ground truth.
+
+Usage:
+    python tests/run_ui_detector_benchmark.py
+    python tests/run_ui_detector_benchmark.py --screens 50 --width 1920 --height 1200
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from typing import List, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.ui_element_detector import UIElementDetector, bbox_iou
+
+LABELS = ["OK", "Cancel", "Submit", "Save", "Open", "Sign in", "Next", "Back", "Search", "Apply"]
+
+
+def render_screen(rng: random.Random, width: int, height: int) -> Tuple[np.ndarray, List[Tuple[Tuple[int, int, int, int], str]]]:
+    """Render one synthetic UI screen and return it with ground-truth controls."""
+    background = rng.choice([(236, 236, 236), (246, 246, 246), (225, 228, 232)])
+    img = Image.new("RGB", (width, height), background)
+    draw = ImageDraw.Draw(img)
+    truth = []
+
+    # Toolbar with title text (not a control)
+    draw.rectangle((0, 0, width, 52), fill=(60, 60, 70))
+    draw.text((20, 18), "Window Title", fill=(240, 240, 240))
+
+    top = 100
+    while top + 60 < height:
+        left = rng.randint(40, 120)
+        while left + 160 < width:
+            kind = rng.choice(["field", "button", "outlined", "label"])
+            h = rng.randint(28, 44)
+            if kind == "field":
+                w = rng.randint(260, 520)
+                draw.rounded_rectangle((left, top, left + w, top + h), radius=4, outline=(150, 150, 150), fill=(255, 255, 255))
+                draw.text((left + 10, top + h // 2 - 6), rng.choice(["Email", "Name", "Password", ""]), fill=(130, 130, 130))
+                truth.append(((left, top, w + 1, h + 1), "field"))
+            elif kind in ("button", "outlined"):
+                label = rng.choice(LABELS)
+                w = rng.randint(90, 180)
+                if kind == "button":
+                    draw.rounded_rectangle((left, top, left + w, top + h), radius=6, fill=rng.choice([(40, 110, 220), (52, 168, 83)]))
+                    color = (255, 255, 255)
+                else:
+                    draw.rounded_rectangle((left, top, left + w, top + h), radius=6, outline=(140, 140, 140), fill=(250, 250, 250))
+                    color = (0, 0, 0)
+                draw.text((left + w // 2 - 3 * len(label), top + h // 2 - 6), label, fill=color)
+                truth.append(((left, top, w + 1, h + 1), "button"))
+            else:
+                w = rng.randint(80, 200)
+                draw.text((left, top + 10), "Label text here", fill=(40, 40, 40))
+            left += w + rng.randint(40, 120)
+        top += rng.randint(70, 120)
+
+    return np.asarray(img)[:, :, ::-1].copy(), truth
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the local UI element detector")
+    parser.add_argument("--screens", type=int, default=20, help="Number of synthetic screens")
+    parser.add_argument("--width", type=int, default=1280, help="Screenshot width (encoded screenshot size)")
+    parser.add_argument("--height", type=int, default=800, help="Screenshot height")
+    parser.add_argument("--iou", type=float, default=0.5, help="IoU needed to count a control as found")
+    parser.add_argument("--max-candidates", type=int, help="Override UI_DETECTOR_MAX_CANDIDATES")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    detector = UIElementDetector(max_candidates=args.max_candidates) if args.max_candidates else UIElementDetector()
+    latencies = []
+    found = total = kind_correct = candidates_total = 0
+
+    for _ in range(args.screens):
+        image, truth = render_screen(rng, args.width, args.height)
+        start = time.perf_counter()
+        candidates = detector.detect(image)
+        latencies.append((time.perf_counter() - start) * 1000)
+        candidates_total += len(candidates)
+
+        for bbox, kind in truth:
+            total += 1
+            best = max(candidates, key=lambda c: bbox_iou(c.bbox, bbox), default=None)
+            if best is not None and bbox_iou(best.bbox, bbox) >= args.iou:
+                found += 1
+                kind_correct += best.kind == kind
+
+    latencies.sort()
+    print(f"🔍 Local UI detector on {args.screens} synthetic {args.width}x{args.height} screens")
+    print(f"  Latency: median {statistics.median(latencies):.1f}ms, "
+          f"p95 {latencies[int(len(latencies) * 0.95) - 1]:.1f}ms, max {latencies[-1]:.1f}ms")
+    print(f"  Recall (IoU >= {args.iou}): {found}/{total} = {found / max(total, 1):.1%}")
+    print(f"  Kind accuracy on found controls: {kind_correct / max(found, 1):.1%}")
+    print(f"  Candidates per screen: {candidates_total / args.screens:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
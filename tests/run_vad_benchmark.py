@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Voice Activity Detection Benchmark
+
+Compares end-of-utterance detection on labelled recordings:
+
+- legacy: per-chunk RMS against a threshold from a 0.5s baseline
+  (previous AudioModule._record_audio_with_silence_detection)
+- features: Endpointer with FeatureVAD (energy + zero-crossing + flatness)
+- webrtc: Endpointer with the WebRTC model (if webrtcvad is installed)
+
+Reported per detector:
+- frame precision / recall of speech decisions against the labels
+- endpoint latency: time from the labelled end of speech to the stop decision
+- early stops (decision before the labelled end) and missed endpoints
+
+Corpus format: 16-bit mono WAV files, each with a sidecar JSON file of the
+same name listing labelled speech intervals in seconds:
+    {"speech": [[0.42, 1.95], [2.30, 3.10]]}
+
+Usage:
+    python tests/run_vad_benchmark.py --corpus path/to/labelled_wavs
+    python tests/run_vad_benchmark.py --endpoint-silence 0.5
+"""
+
+import argparse
+import glob
+import json
+import os
+import statistics
+import sys
+import time
+import wave
+from typing import List, Tuple, Dict, Any
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.voice_activity import Endpointer, FeatureVAD, WebRTCVAD, WEBRTC_VAD_AVAILABLE
+
+SAMPLE_RATE = 16000
+CHUNK_SECONDS = 0.1
+
+
+def load_corpus(corpus_dir: str) -> List[Tuple[str, np.ndarray, List[Tuple[float, float]]]]:
+    """Load labelled 16 kHz 16-bit mono WAV files."""
+    recordings = []
+    for path in sorted(glob.glob(os.path.join(corpus_dir, "*.wav"))):
+        label_path = os.path.splitext(path)[0] + ".json"
+        if not os.path.exists(label_path):
+            print(f"  skipping {path}: no labels")
+            continue
+        with wave.open(path, "rb") as wav_file:
+            if wav_file.getsampwidth() != 2 or wav_file.getframerate() != SAMPLE_RATE:
+                print(f"  skipping {path}: not 16-bit {SAMPLE_RATE}Hz")
+                continue
+            frames = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=np.int16)
+            if wav_file.getnchannels() > 1:
+                frames = frames.reshape(-1, wav_file.getnchannels())[:, 0]
+        with open(label_path) as label_file:
+            speech = [tuple(interval) for interval in json.load(label_file)["speech"]]
+        recordings.append((os.path.basename(path), frames.astype(np.float32) / 32768.0, speech))
+    return recordings
+
+
+def _voice(seconds: float, pitch: float, rng) -> np.ndarray:
+    """Voiced speech: harmonics with vibrato and a syllable-rate envelope, plus fricatives."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    phase = 2 * np.pi * np.cumsum(pitch * (1 + 0.05 * np.sin(2 * np.pi * 5 * t))) / SAMPLE_RATE
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 12))
+    envelope = 0.15 + 0.85 * np.abs(np.sin(2 * np.pi * 2.5 * t + rng.uniform(0, np.pi)))
+    signal = voiced * envelope / 3
+    # A fricative at the start of each syllable
+    for start in np.arange(0, seconds, 0.4):
+        index = int(start * SAMPLE_RATE)
+        length = min(int(0.06 * SAMPLE_RATE), len(signal) - index)
+        hiss = rng.standard_normal(length)
+        signal[index:index + length] += 0.4 * np.diff(hiss, prepend=0)
+    return signal
+
+
+def synthetic_corpus(count: int = 8) -> List[Tuple[str, np.ndarray, List[Tuple[float, float]]]]:
+    """Generate labelled utterances in several background conditions."""
+    rng = np.random.default_rng(3)
+    conditions = ["quiet", "fan", "hum", "keyboard"]
+    recordings = []
+    for index in range(count):
+        condition = conditions[index % len(conditions)]
+        lead = rng.uniform(0.2, 0.8)
+        parts, speech, position = [np.zeros(int(lead * SAMPLE_RATE))], [], lead
+        for _ in range(rng.integers(1, 4)):
+            seconds = rng.uniform(0.6, 1.6)
+            parts.append(_voice(seconds, rng.uniform(95, 220), rng) * rng.uniform(0.03, 0.15))
+            speech.append((position, position + seconds))
+            position += seconds
+            pause = rng.uniform(0.15, 0.45)
+            parts.append(np.zeros(int(pause * SAMPLE_RATE)))
+            position += pause
+        parts.append(np.zeros(int(3.0 * SAMPLE_RATE)))
+        audio = np.concatenate(parts)
+
+        t = np.arange(audio.size) / SAMPLE_RATE
+        audio += 0.001 * rng.standard_normal(audio.size)
+        if condition == "fan":
+            audio += np.convolve(rng.standard_normal(audio.size), np.ones(8) / 8, mode="same") * 0.02
+        elif condition == "hum":
+            audio += 0.03 * np.sin(2 * np.pi * 50 * t) + 0.01 * np.sin(2 * np.pi * 100 * t)
+        elif condition == "keyboard":
+            for click in rng.uniform(0, audio.size / SAMPLE_RATE, 25):
+                offset = int(click * SAMPLE_RATE)
+                length = min(int(0.01 * SAMPLE_RATE), audio.size - offset)
+                audio[offset:offset + length] += 0.2 * rng.standard_normal(length) * np.exp(-np.arange(length) / 40)
+        recordings.append((f"synthetic_{index}_{condition}", audio.astype(np.float32), speech))
+    return recordings
+
+
+def _labels(speech: List[Tuple[float, float]], frame_count: int, frame_seconds: float) -> np.ndarray:
+    centers = (np.arange(frame_count) + 0.5) * frame_seconds
+    labels = np.zeros(frame_count, dtype=bool)
+    for start, end in speech:
+        labels |= (centers >= start) & (centers < end)
+    return labels
+
+
+def run_legacy(audio: np.ndarray, max_duration: float = 15.0) -> Tuple[float, np.ndarray]:
+    """Previous RMS baseline detector; returns (stop time, per-chunk speech decisions)."""
+    chunk = int(CHUNK_SECONDS * SAMPLE_RATE)
+    required_silence = int(1.0 / CHUNK_SECONDS)
+    min_chunks = int(0.5 / CHUNK_SECONDS)
+    baseline_chunks = 5
+    threshold, baseline, silence, speech_detected = 0.05, [], 0, False
+    decisions = []
+    for count in range(1, min(int(max_duration / CHUNK_SECONDS), audio.size // chunk) + 1):
+        rms = float(np.sqrt(np.mean(audio[(count - 1) * chunk:count * chunk] ** 2)))
+        if count <= baseline_chunks:
+            baseline.append(rms)
+            decisions.append(False)
+            if count == baseline_chunks:
+                threshold = min(max(np.mean(baseline) * 2.0, 0.05), 0.15)
+            continue
+        decisions.append(rms >= threshold)
+        speech_detected |= rms > threshold * 1.2
+        silence = silence + 1 if rms < threshold else 0
+        if count >= min_chunks and silence >= required_silence and speech_detected:
+            return count * CHUNK_SECONDS, np.array(decisions)
+    return None, np.array(decisions)
+
+
+def run_endpointer(audio: np.ndarray, vad, endpoint_silence: float) -> Tuple[float, np.ndarray, float]:
+    """Endpointer over 100 ms chunks; returns (stop time, per-frame decisions, seconds spent)."""
+    endpointer = Endpointer(vad=vad, endpoint_silence=endpoint_silence)
+    chunk = int(CHUNK_SECONDS * SAMPLE_RATE)
+    decisions = []
+    original = vad.is_speech
+
+    def recording_is_speech(frames):
+        result = original(frames)
+        decisions.extend(result.tolist())
+        return result
+
+    vad.is_speech = recording_is_speech
+    stop_time = None
+    start = time.perf_counter()
+    for offset in range(0, audio.size, chunk):
+        if endpointer.process(audio[offset:offset + chunk]):
+            stop_time = (offset + chunk) / SAMPLE_RATE
+            break
+    elapsed = time.perf_counter() - start
+    return stop_time, np.array(decisions, dtype=bool), elapsed
+
+
+def score(name: str, results: List[Dict[str, Any]]) -> None:
+    """Print aggregate precision, recall and endpoint latency."""
+    true_positive = sum(r['tp'] for r in results)
+    predicted = sum(r['predicted'] for r in results)
+    actual = sum(r['actual'] for r in results)
+    latencies = [r['latency'] for r in results if r['latency'] is not None and r['latency'] >= 0]
+    early = sum(1 for r in results if r['latency'] is not None and r['latency'] < 0)
+    missed = sum(1 for r in results if r['latency'] is None)
+    precision = true_positive / predicted if predicted else 0.0
+    recall = true_positive / actual if actual else 0.0
+    latency_text = (f"median {statistics.median(latencies) * 1000:.0f}ms, max {max(latencies) * 1000:.0f}ms"
+                    if latencies else "n/a")
+    print(f"  {name:<9} precision {precision:.2f}  recall {recall:.2f}  "
+          f"endpoint latency {latency_text}  early stops {early}  missed {missed}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark voice activity detection and endpointing")
+    parser.add_argument("--corpus", help="Directory of labelled WAV files (synthetic recordings if omitted)")
+    parser.add_argument("--endpoint-silence", type=float, default=0.7, help="Hangover in seconds")
+    args = parser.parse_args()
+
+    recordings = load_corpus(args.corpus) if args.corpus else synthetic_corpus()
+    if not recordings:
+        print("❌ No labelled recordings found")
+        return 1
+
+    detectors = {'features': lambda: FeatureVAD()}
+    if WEBRTC_VAD_AVAILABLE:
+        detectors['webrtc'] = lambda: WebRTCVAD()
+
+    results = {'legacy': []}
+    results.update({name: [] for name in detectors})
+    processing = {name: 0.0 for name in detectors}
+    total_audio = 0.0
+
+    for name, audio, speech in recordings:
+        speech_end = speech[-1][1]
+        total_audio += audio.size / SAMPLE_RATE
+
+        stop_time, decisions = run_legacy(audio)
+        labels = _labels(speech, len(decisions), CHUNK_SECONDS)
+        results['legacy'].append({
+            'tp': int(np.count_nonzero(decisions & labels)), 'predicted': int(np.count_nonzero(decisions)),
+            'actual': int(np.count_nonzero(labels)), 'latency': None if stop_time is None else stop_time - speech_end
+        })
+
+        for detector_name, factory in detectors.items():
+            vad = factory()
+            stop_time, decisions, elapsed = run_endpointer(audio, vad, args.endpoint_silence)
+            processing[detector_name] += elapsed
+            labels = _labels(speech, len(decisions), 0.02)
+            results[detector_name].append({
+                'tp': int(np.count_nonzero(decisions & labels)), 'predicted': int(np.count_nonzero(decisions)),
+                'actual': int(np.count_nonzero(labels)), 'latency': None if stop_time is None else stop_time - speech_end
+            })
+
+    print(f"🎙️  {len(recordings)} labelled recordings ({total_audio:.1f}s of audio), "
+          f"endpoint silence {args.endpoint_silence}s")
+    print("  Note: frame scores are only counted up to each detector's stop decision")
+    for detector_name, detector_results in results.items():
+        score(detector_name, detector_results)
+    for detector_name, seconds in processing.items():
+        print(f"  {detector_name} processing: {seconds / max(total_audio, 1e-9) * 1000:.2f}ms per second of audio")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+# tests/test_action_compiler.py
+"""
+Unit tests for the action compiler and batched action sequence execution.
+"""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from modules.action_compiler import ActionCompiler, hotkey_commands, can_type_directly
+from modules.automation import AutomationModule
+
+
+def form_plan():
+    return [
+        {"action": "click", "coordinates": [100, 200]},
+        {"action": "type", "text": "Jane Doe"},
+        {"action": "click", "coordinates": [100, 260]},
+        {"action": "type", "text": "jane@example.com"},
+        {"action": "click", "coordinates": [100, 320]},
+        {"action": "type", "text": "Line one\nLine two"},
+    ]
+
+
+class TestActionCompiler:
+    """Test cases for ActionCompiler class."""
+
+    def test_form_plan_compiles_to_one_batch(self):
+        """Clicks and short typing with one paste become a single invocation."""
+        segments = ActionCompiler(action_pause_ms=100, focus_pause_ms=150).compile(form_plan())
+
+        assert len(segments) == 1
+        assert segments[0].action_indices == list(range(6))
+        assert segments[0].command_line == [
+            'cliclick', 'c:100,200', 'w:150', 't:Jane Doe', 'w:100',
+            'c:100,260', 'w:150', 't:jane@example.com', 'w:100',
+            'c:100,320', 'w:150', 'kd:cmd', 't:v', 'ku:cmd'
+        ]
+        assert segments[0].clipboard_text == "Line one\nLine two"
+
+    def test_second_paste_starts_new_batch(self):
+        """Only one clipboard paste fits in a batch."""
+        plan = [{"action": "type", "text": "first\nparagraph"},
+                {"action": "type", "text": "second\nparagraph"}]
+
+        segments = ActionCompiler().compile(plan)
+
+        assert [s.action_indices for s in segments] == [[0], [1]]
+        assert all(s.batched for s in segments)
+        assert [s.clipboard_text for s in segments] == ["first\nparagraph", "second\nparagraph"]
+
+    def test_feedback_actions_split_the_plan(self):
+        """Scrolls and clicks with fallbacks run on their own."""
+        plan = [
+            {"action": "click", "coordinates": [10, 10]},
+            {"action": "scroll", "direction": "down", "amount": 3},
+            {"action": "click", "coordinates": [20, 20], "fallback_coordinates": [[25, 25]]},
+            {"action": "double_click", "coordinates": [30, 30]},
+        ]
+
+        segments = ActionCompiler().compile(plan)
+
+        assert [(s.action_indices, s.batched) for s in segments] == [
+            ([0], True), ([1], False), ([2], False), ([3], True)
+        ]
+        assert segments[3].commands == ['dc:30,30']
+
+    def test_zero_pause_adds_no_waits(self):
+        """Waits can be disabled entirely."""
+        plan = [{"action": "click", "coordinates": [1, 1]}, {"action": "click", "coordinates": [2, 2]}]
+
+        segments = ActionCompiler(action_pause_ms=0, focus_pause_ms=0).compile(plan)
+
+        assert segments[0].commands == ['c:1,1', 'c:2,2']
+
+    def test_hotkey_commands(self):
+        """Modifiers are held around the main key and released in reverse order."""
+        assert hotkey_commands(['command', 'shift', 'z']) == ['kd:cmd', 'kd:shift', 'kp:z', 'ku:shift', 'ku:cmd']
+        assert hotkey_commands(['enter']) == ['kp:return']
+
+    def test_can_type_directly(self):
+        """Only short single-line ASCII is typed keystroke by keystroke."""
+        assert can_type_directly("hello, world!")
+        assert not can_type_directly("two\nlines")
+        assert not can_type_directly("café")
+        assert not can_type_directly("x" * 500)
+
+
+@pytest.fixture
+def mac_automation():
+    """AutomationModule set up as on macOS with cliclick installed."""
+    with patch('modules.automation.pyautogui.size', return_value=(1920, 1080)):
+        automation = AutomationModule(max_retries=0)
+    automation.is_macos = True
+    automation.has_cliclick = True
+    return automation
+
+
+class TestBatchedSequenceExecution:
+    """Test execute_action_sequence with batching."""
+
+    def test_form_plan_runs_in_two_processes(self, mac_automation):
+        """One pbcopy and one cliclick instead of one process per action."""
+        with patch('modules.automation.subprocess.run',
+                   return_value=subprocess.CompletedProcess([], 0, '', '')) as run:
+            results = mac_automation.execute_action_sequence(form_plan())
+
+        assert results['successful_actions'] == 6
+        assert results['batched_actions'] == 6
+        assert [call.args[0][0] for call in run.call_args_list] == ['pbcopy', 'cliclick']
+        assert run.call_args_list[0].kwargs['input'] == "Line one\nLine two"
+        assert all(record.get('batched') for record in mac_automation.action_history)
+
+    def test_failed_batch_falls_back_to_per_action(self, mac_automation):
+        """A batch cliclick rejected runs again one action at a time."""
+        plan = [{"action": "click", "coordinates": [10, 10]}, {"action": "click", "coordinates": [20, 20]}]
+        responses = [subprocess.CompletedProcess([], 1, '', 'bad command'),
+                     subprocess.CompletedProcess([], 0, '', ''),
+                     subprocess.CompletedProcess([], 0, '', '')]
+
+        with patch('modules.automation.subprocess.run', side_effect=responses) as run:
+            results = mac_automation.execute_action_sequence(plan)
+
+        assert results['successful_actions'] == 2
+        assert results['batched_actions'] == 0
+        assert [call.args[0] for call in run.call_args_list[1:]] == [['cliclick', 'c:10,10'], ['cliclick', 'c:20,20']]
+
+    def test_timed_out_batch_not_repeated(self, mac_automation):
+        """A batch that may have partially run is reported failed, not replayed."""
+        plan = [{"action": "click", "coordinates": [10, 10]}, {"action": "type", "text": "hi"}]
+
+        with patch('modules.automation.subprocess.run',
+                   side_effect=subprocess.TimeoutExpired('cliclick', 10)) as run:
+            results = mac_automation.execute_action_sequence(plan)
+
+        assert results['failed_actions'] == 2
+        assert run.call_count == 1
+
+    def test_invalid_plan_not_batched(self, mac_automation):
+        """Plans with an invalid action keep per-action validation and errors."""
+        plan = [{"action": "click", "coordinates": [10, 10]}, {"action": "click", "coordinates": [5000, 10]}]
+
+        with patch('modules.automation.subprocess.run',
+                   return_value=subprocess.CompletedProcess([], 0, '', '')) as run:
+            results = mac_automation.execute_action_sequence(plan)
+
+        assert results['successful_actions'] == 1
+        assert results['failed_actions'] == 1
+        assert results['batched_actions'] == 0
+        assert run.call_args_list[0].args[0] == ['cliclick', 'c:10,10']
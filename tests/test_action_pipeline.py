@@ -0,0 +1,240 @@
+# tests/test_action_pipeline.py
+"""
+Unit tests for pipelined action plan execution.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from modules.action_pipeline import PipelinedActionExecutor
+from modules.automation import AutomationModule
+
+
+class FakeAutomation:
+    """Validates coordinates are present for clicks and records the thread."""
+
+    def __init__(self, validate_delay: float = 0.0):
+        self.validate_delay = validate_delay
+        self.validated_on = []
+        self.listeners = []
+
+    def add_ui_change_listener(self, callback):
+        self.listeners.append(callback)
+
+    def remove_ui_change_listener(self, callback):
+        self.listeners.remove(callback)
+
+    def notify_ui_changed(self, action_type):
+        for callback in list(self.listeners):
+            callback(action_type)
+
+    def validate_action_format(self, action):
+        time.sleep(self.validate_delay)
+        self.validated_on.append(threading.current_thread().name)
+        if action["action"] == "click" and not action.get("coordinates"):
+            return False, "Click action requires coordinates"
+        return True, ""
+
+
+@pytest.fixture
+def executor():
+    executor = PipelinedActionExecutor(enabled=True)
+    yield executor
+    executor.shutdown()
+
+
+def click(x, y):
+    return {"action": "click", "coordinates": [x, y]}
+
+
+class TestPipelinedActionExecutor:
+    """Test cases for PipelinedActionExecutor."""
+
+    def test_next_step_resolved_while_current_executes(self, executor):
+        automation = FakeAutomation(validate_delay=0.03)
+        executed = []
+
+        def execute_step(action):
+            time.sleep(0.05)
+            executed.append(action["coordinates"])
+
+        results = executor.execute([click(1, 1), click(2, 2), click(3, 3)], execute_step,
+                                   automation_module=automation)
+
+        assert executed == [[1, 1], [2, 2], [3, 3]]
+        assert results["successful_actions"] == 3
+        assert results["pipeline"]["prefetched_steps"] == 2
+        assert results["pipeline"]["saved_time"] > 0.04
+        assert automation.validated_on[1].startswith("ActionPrefetch")
+        assert not results["action_details"][0]["pipeline"]["prefetched"]
+        assert results["action_details"][2]["pipeline"]["overlap_time"] > 0.02
+
+    def test_invalid_step_fails_without_executing(self, executor):
+        execute_step = MagicMock(return_value=None)
+
+        results = executor.execute([click(1, 1), {"action": "click"}, {"action": "type", "text": "a"}],
+                                   execute_step, automation_module=FakeAutomation())
+
+        assert execute_step.call_count == 2
+        assert results["failed_actions"] == 1
+        assert results["errors"] == ["Action 2 failed: Invalid action format: Click action requires coordinates"]
+
+    def test_should_stop_ends_execution(self, executor):
+        execute_step = MagicMock(side_effect=[RuntimeError("permission denied"), None])
+
+        results = executor.execute([click(1, 1), click(2, 2)], execute_step,
+                                   automation_module=FakeAutomation(),
+                                   should_stop=lambda action, error: "permission" in str(error))
+
+        assert execute_step.call_count == 1
+        assert len(results["action_details"]) == 1
+
+    def test_handled_failure_message(self, executor):
+        results = executor.execute([{"action": "scroll", "direction": "down"}],
+                                   lambda action: "Enhanced scroll execution failed",
+                                   automation_module=FakeAutomation())
+
+        assert results["errors"] == ["Enhanced scroll execution failed"]
+
+    def test_target_element_lookup(self, executor):
+        accessibility = MagicMock()
+        accessibility.find_element.return_value = {"center_point": [40, 50]}
+        executed = []
+
+        executor.execute([{"action": "click", "target": {"role": "AXButton", "label": "OK"}}],
+                         executed.append, automation_module=FakeAutomation(),
+                         accessibility_module=accessibility)
+
+        accessibility.find_element.assert_called_once_with("AXButton", "OK", None)
+        assert executed == [{"action": "click", "target": {"role": "AXButton", "label": "OK"},
+                             "coordinates": [40, 50]}]
+
+    def test_target_position_replaces_plan_coordinates(self, executor):
+        accessibility = MagicMock()
+        accessibility.find_element.return_value = {"center_point": [41.6, 50.2]}
+        executed = []
+        action = {"action": "click", "coordinates": [38, 47], "target": {"role": "AXButton", "label": "OK"}}
+
+        executor.execute([action], executed.append, automation_module=FakeAutomation(),
+                         accessibility_module=accessibility)
+
+        assert executed[0]["coordinates"] == [41, 50]
+
+    def test_missing_target_keeps_plan_coordinates(self, executor):
+        accessibility = MagicMock()
+        accessibility.find_element.return_value = None
+        executed = []
+        action = {"action": "click", "coordinates": [38, 47], "target": {"role": "AXButton", "label": "OK"}}
+
+        results = executor.execute([action], executed.append, automation_module=FakeAutomation(),
+                                   accessibility_module=accessibility)
+
+        assert executed[0]["coordinates"] == [38, 47]
+        assert results["successful_actions"] == 1
+
+    def test_ui_lookup_redone_after_ui_change(self, executor):
+        """A prefetched element lookup is stale once the automation module reports a UI change."""
+        automation = FakeAutomation()
+        looked_up = threading.Event()
+        positions = iter([[1, 1], [9, 9]])
+
+        def find_element(role, label, app_name):
+            looked_up.set()
+            return {"center_point": next(positions)}
+
+        accessibility = MagicMock()
+        accessibility.find_element.side_effect = find_element
+        accessibility.element_at_point.return_value = None
+        executed = []
+
+        def execute_step(action):
+            executed.append(action)
+            if looked_up.wait(1.0):
+                automation.notify_ui_changed(action["action"])
+
+        targeted = {"action": "click", "target": {"role": "AXButton", "label": "Next"}}
+        results = executor.execute([click(5, 5), targeted], execute_step,
+                                   automation_module=automation, accessibility_module=accessibility)
+
+        assert executed[1]["coordinates"] == [9, 9]
+        assert results["pipeline"]["invalidated_steps"] == 1
+        assert results["action_details"][1]["pipeline"]["invalidated"]
+        assert automation.listeners == []
+
+    def test_lookup_kept_without_ui_change(self, executor):
+        """A step that doesn't report a UI change (e.g. speak) leaves the prefetched lookup valid."""
+        accessibility = MagicMock()
+        accessibility.find_element.return_value = {"center_point": [1, 1]}
+        targeted = {"action": "click", "target": {"role": "AXButton", "label": "Send"}}
+
+        results = executor.execute([{"action": "speak", "message": "Sending"}, targeted], MagicMock(return_value=None),
+                                   automation_module=FakeAutomation(), accessibility_module=accessibility)
+
+        assert accessibility.find_element.call_count == 1
+        assert results["pipeline"]["prefetched_steps"] == 1
+        assert results["pipeline"]["invalidated_steps"] == 0
+
+    def test_disabled_executes_actions_as_given(self):
+        executor = PipelinedActionExecutor(enabled=False)
+        automation = FakeAutomation()
+        executed = []
+
+        results = executor.execute([click(1, 1), {"action": "click"}], executed.append,
+                                   automation_module=automation)
+
+        assert executed == [click(1, 1), {"action": "click"}]
+        assert automation.validated_on == []
+        assert results["pipeline"]["prefetched_steps"] == 0
+        executor.shutdown()
+
+
+class TestPipelineWithAutomation:
+    """Prefetched lookups across AutomationModule.execute_action, which reports every action as a UI change."""
+
+    OK_BUTTON = {"coordinates": [30, 40, 20, 20], "center_point": [40, 50], "role": "AXButton", "title": "OK"}
+
+    @pytest.fixture
+    def automation(self):
+        automation = AutomationModule(max_retries=0)
+        with patch.object(automation, '_validate_coordinates', return_value=True), \
+                patch.object(automation, '_attempt_click', return_value=True):
+            yield automation
+
+    def run_plan(self, executor, automation, accessibility):
+        looked_up = threading.Event()
+        accessibility.find_element.side_effect = lambda *args: looked_up.set() or dict(self.OK_BUTTON)
+
+        def execute_step(action):
+            # Let the prefetched lookup finish before this step changes the UI
+            looked_up.wait(1.0)
+            automation.execute_action(action)
+
+        targeted = {"action": "click", "target": {"role": "AXButton", "label": "OK"}}
+        return executor.execute([click(5, 5), targeted], execute_step,
+                                automation_module=automation, accessibility_module=accessibility)
+
+    def test_lookup_kept_when_element_still_under_point(self, executor, automation):
+        accessibility = MagicMock()
+        accessibility.element_at_point.return_value = dict(self.OK_BUTTON)
+
+        results = self.run_plan(executor, automation, accessibility)
+
+        assert results["successful_actions"] == 2
+        assert accessibility.find_element.call_count == 1
+        accessibility.element_at_point.assert_called_once_with(40, 50)
+        assert results["pipeline"]["rechecked_steps"] == 1
+        assert results["pipeline"]["invalidated_steps"] == 0
+        assert results["action_details"][1]["pipeline"]["prefetched"]
+
+    def test_lookup_redone_when_element_moved(self, executor, automation):
+        accessibility = MagicMock()
+        accessibility.element_at_point.return_value = {"coordinates": [0, 30, 200, 60], "title": "Toolbar"}
+
+        results = self.run_plan(executor, automation, accessibility)
+
+        assert results["successful_actions"] == 2
+        assert accessibility.find_element.call_count == 2
+        assert results["pipeline"]["invalidated_steps"] == 1
@@ -156,42 +156,29 @@ class TestAudioModule:
         with pytest.raises(Exception, match="Recording failed"):
             audio_module._record_audio(duration=1.0, silence_threshold=0.01)
     
-    @patch('modules.audio.AudioSegment')
-    @patch('modules.audio.tempfile.NamedTemporaryFile')
-    @patch('modules.audio.os.unlink')
-    def test_speech_to_text_success(self, mock_unlink, mock_temp_file, mock_audio_segment, audio_module):
+    def test_speech_to_text_success(self, audio_module):
         """Test successful speech-to-text conversion."""
-        # Mock temporary file
-        mock_temp = Mock()
-        mock_temp.name = "/tmp/test_audio.wav"
-        mock_temp_file.return_value.__enter__.return_value = mock_temp
-        
-        # Mock audio segment
-        mock_segment = Mock()
-        mock_audio_segment.return_value = mock_segment
-        
         # Mock Whisper transcription
         audio_module.whisper_model.transcribe.return_value = {
             "text": "Hello, this is a test transcription."
         }
         
-        # Mock audio recording
-        mock_audio_data = np.array([0.1, 0.2, 0.3], dtype=np.int16)
+        # Mock audio recording (1 second of int16 audio)
+        t = np.arange(16000) / 16000
+        mock_audio_data = (np.sin(2 * np.pi * 440 * t) * 8000).astype(np.int16)
         with patch.object(audio_module, '_record_audio', return_value=mock_audio_data):
             result = audio_module.speech_to_text(duration=3.0)
         
         # Verify result
         assert result == "Hello, this is a test transcription."
         
-        # Verify Whisper was called
-        audio_module.whisper_model.transcribe.assert_called_once_with("/tmp/test_audio.wav")
-        
-        # Verify audio segment creation and export
-        mock_audio_segment.assert_called_once()
-        mock_segment.export.assert_called_once_with("/tmp/test_audio.wav", format="wav")
-        
-        # Verify cleanup
-        mock_unlink.assert_called_once_with("/tmp/test_audio.wav")
+        # Verify Whisper received the normalized in-memory array, not a file path
+        audio_module.whisper_model.transcribe.assert_called_once()
+        whisper_input = audio_module.whisper_model.transcribe.call_args.args[0]
+        assert isinstance(whisper_input, np.ndarray)
+        assert whisper_input.dtype == np.float32
+        assert len(whisper_input) == 16000
+        assert 0.98 < np.max(np.abs(whisper_input)) <= 1.0
     
     def test_speech_to_text_no_audio(self, audio_module):
         """Test speech-to-text with no audio data."""
@@ -205,22 +192,14 @@ class TestAudioModule:
             result = audio_module.speech_to_text(duration=1.0)
             assert result == ""
     
-    @patch('modules.audio.tempfile.NamedTemporaryFile')
-    def test_speech_to_text_whisper_failure(self, mock_temp_file, audio_module):
+    def test_speech_to_text_whisper_failure(self, audio_module):
         """Test speech-to-text with Whisper failure."""
-        # Mock temporary file
-        mock_temp = Mock()
-        mock_temp.name = "/tmp/test_audio.wav"
-        mock_temp_file.return_value.__enter__.return_value = mock_temp
-        
         # Mock Whisper failure
         audio_module.whisper_model.transcribe.side_effect = Exception("Whisper failed")
         
         # Mock audio recording
-        mock_audio_data = np.array([0.1, 0.2], dtype=np.int16)
-        with patch.object(audio_module, '_record_audio', return_value=mock_audio_data), \
-             patch('modules.audio.AudioSegment'), \
-             patch('modules.audio.os.unlink'):
+        mock_audio_data = np.full(16000, 1000, dtype=np.int16)
+        with patch.object(audio_module, '_record_audio', return_value=mock_audio_data):
             
             with pytest.raises(RuntimeError, match="Speech recognition failed"):
                 audio_module.speech_to_text(duration=1.0)
@@ -0,0 +1,263 @@
+"""
+Unit tests for shared audio capture
+
+Tests the lock-free ring buffer, noise floor tracking and the shared
+capture service, and replays a wake word followed by a command through a
+fake callback stream to validate pre-roll command capture.
+"""
+
+import threading
+import time
+import pytest
+import numpy as np
+from unittest.mock import patch
+
+from modules.audio_capture import AudioRingBuffer, NoiseFloorTracker, AudioCaptureService
+
+SAMPLE_RATE = 16000
+BLOCK = 512
+
+
+def _burst(seconds, frequency, amplitude=0.3):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def _noise(seconds, rng, level=0.002):
+    return (level * rng.standard_normal(int(seconds * SAMPLE_RATE))).astype(np.float32)
+
+
+class FakeCallbackStream:
+    """sd.InputStream replacement that drives the callback at 10x real time."""
+
+    source = np.zeros(0, dtype=np.float32)
+
+    def __init__(self, samplerate, channels, dtype, blocksize, callback):
+        self.blocksize = blocksize
+        self.callback = callback
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        position = 0
+        while self._running:
+            block = np.zeros(self.blocksize, dtype=np.float32)
+            available = self.source[position:position + self.blocksize]
+            block[:len(available)] = available
+            position += self.blocksize
+            self.callback(block.reshape(-1, 1), self.blocksize, None, None)
+            time.sleep(self.blocksize / SAMPLE_RATE / 10)
+
+    def stop(self):
+        self._running = False
+        if self._thread:
+            self._thread.join(1.0)
+
+    def close(self):
+        pass
+
+
+class FakePorcupine:
+    """Detects the 'wake word' on the first quiet frame after a loud burst."""
+
+    sample_rate = SAMPLE_RATE
+    frame_length = BLOCK
+
+    def __init__(self):
+        self.loud_frames = 0
+
+    def process(self, pcm):
+        rms = np.sqrt(np.mean((np.asarray(pcm, dtype=np.float32) / 32767) ** 2))
+        if rms > 0.1:
+            self.loud_frames += 1
+            return -1
+        detected = self.loud_frames >= 5
+        self.loud_frames = 0
+        return 0 if detected else -1
+
+
+class TestAudioRingBuffer:
+    """Test cases for AudioRingBuffer class."""
+
+    def test_read_across_wrap(self):
+        """Reads return samples in order across the end of the buffer."""
+        ring = AudioRingBuffer(10)
+        ring.write(np.arange(7, dtype=np.float32))
+        ring.write(np.arange(7, 12, dtype=np.float32))
+
+        samples, position = ring.read(4, 8)
+
+        assert list(samples) == [4, 5, 6, 7, 8, 9, 10, 11]
+        assert position == 12
+
+    def test_readers_are_independent(self):
+        """Each reader advances its own cursor."""
+        ring = AudioRingBuffer(16)
+        ring.write(np.arange(8, dtype=np.float32))
+
+        first, _ = ring.read(0, 4)
+        second, _ = ring.read(2, 4)
+
+        assert list(first) == [0, 1, 2, 3]
+        assert list(second) == [2, 3, 4, 5]
+
+    def test_overrun_resumes_at_oldest(self):
+        """A reader that fell behind skips to the oldest retained sample."""
+        ring = AudioRingBuffer(10)
+        ring.write(np.arange(25, dtype=np.float32))
+
+        samples, position = ring.read(0, 4)
+
+        assert list(samples) == [15, 16, 17, 18]
+        assert position == 19
+        assert ring.overruns == 1
+
+    def test_read_ahead_of_writer(self):
+        """Reading past the write position returns nothing."""
+        ring = AudioRingBuffer(10)
+        ring.write(np.ones(3, dtype=np.float32))
+
+        samples, position = ring.read(3, 4)
+
+        assert samples.size == 0
+        assert position == 3
+
+
+class TestNoiseFloorTracker:
+    """Test cases for NoiseFloorTracker class."""
+
+    def test_speech_barely_moves_floor(self):
+        """Short loud passages hardly raise the estimate; quiet ones lower it fast."""
+        tracker = NoiseFloorTracker()
+        for _ in range(50):
+            tracker.update(0.01)
+        for _ in range(10):
+            tracker.update(0.3)
+        assert tracker.level < 0.05
+
+        for _ in range(10):
+            tracker.update(0.005)
+        assert tracker.level == pytest.approx(0.005, abs=0.001)
+
+
+class TestAudioCaptureService:
+    """Test cases for AudioCaptureService class."""
+
+    def test_stream_is_shared_and_readable(self):
+        """One stream is opened however often start() is called."""
+        FakeCallbackStream.source = _burst(1.0, 440)
+        with patch('modules.audio_capture.sd.InputStream', side_effect=FakeCallbackStream) as mock_stream:
+            service = AudioCaptureService(buffer_seconds=5.0, block_size=BLOCK)
+            service.start()
+            service.start()
+            try:
+                samples, position = service.read(0, 4096, timeout=2.0)
+            finally:
+                service.stop()
+
+        assert mock_stream.call_count == 1
+        assert samples.size == 4096
+        assert np.allclose(samples, FakeCallbackStream.source[:4096])
+        assert position == 4096
+        assert not service.is_running
+
+    def test_partial_read_consumes_nothing(self):
+        """Exact-frame reads leave the cursor alone until a full frame exists."""
+        service = AudioCaptureService(buffer_seconds=1.0, block_size=BLOCK)
+        service._callback(np.ones((100, 1), dtype=np.float32), 100, None, None)
+
+        samples, position = service.read(0, BLOCK, timeout=0.0, partial=False)
+
+        assert samples.size == 0
+        assert position == 0
+
+    def test_stalled_stream_is_unhealthy(self):
+        """A stream without callbacks is reported unhealthy."""
+        with patch('modules.audio_capture.sd.InputStream'):
+            service = AudioCaptureService(buffer_seconds=1.0, block_size=BLOCK)
+            service.start()
+        assert service.is_healthy()
+
+        service._last_callback -= 1.0
+        assert not service.is_healthy()
+
+    def test_stall_timeout_scales_with_read_timeout(self):
+        """Idle-mode readers with long read timeouts tolerate longer gaps."""
+        with patch('modules.audio_capture.sd.InputStream'):
+            service = AudioCaptureService(buffer_seconds=1.0, block_size=BLOCK)
+            service.start()
+        service._last_callback -= 0.7
+
+        assert not service.is_healthy()
+        assert service.is_healthy(read_timeout=0.2)
+
+    def test_silence_threshold_follows_noise_floor(self):
+        """Thresholds track the noise floor within the configured bounds."""
+        service = AudioCaptureService(buffer_seconds=1.0, block_size=BLOCK)
+        service.noise_floor.level = 0.04
+        assert service.silence_threshold(minimum=0.05) == pytest.approx(0.08)
+
+        service.noise_floor.level = 0.001
+        assert service.silence_threshold(minimum=0.05) == 0.05
+
+
+class TestSharedCaptureRecording:
+    """Replay a wake word and a command through the shared stream."""
+
+    @pytest.fixture
+    def audio_module(self):
+        """Create an AudioModule with a fake Porcupine engine."""
+        from modules.audio import AudioModule
+
+        with patch('modules.audio.whisper.load_model'), \
+             patch('modules.audio.pyttsx3.init') as mock_tts, \
+             patch('modules.audio.pvporcupine.create'):
+            mock_tts.return_value.getProperty.return_value = []
+            module = AudioModule()
+        module.porcupine = FakePorcupine()
+        yield module
+        module.capture_service.stop()
+
+    def test_command_right_after_wake_word_is_kept(self, audio_module):
+        """Speech starting during the wake-to-record gap is captured via pre-roll."""
+        rng = np.random.default_rng(0)
+        words = [_burst(0.3, 300 + 100 * index) for index in range(3)]
+        FakeCallbackStream.source = np.concatenate(
+            [_noise(1.0, rng), _burst(0.4, 1000), _noise(0.05, rng)] +
+            [part for word in words for part in (word, _noise(0.15, rng))] +
+            [_noise(3.0, rng)]
+        )
+
+        with patch('modules.audio_capture.sd.InputStream', side_effect=FakeCallbackStream), \
+             patch('modules.audio.AUDIO_CAPTURE_PREROLL', 1.0):
+            assert audio_module.listen_for_wake_word(timeout=5.0, provide_feedback=False)
+            # The command is already being spoken when recording starts
+            time.sleep(0.05)
+            recording = audio_module._record_audio_with_silence_detection(8.0)
+
+        assert recording is not None
+        loud = np.abs(recording) > 0.5 * np.abs(recording).max()
+        onset = np.argmax(loud) / SAMPLE_RATE
+        assert onset < 0.1
+
+        frame = int(0.05 * SAMPLE_RATE)
+        active = [loud[i:i + frame].any() for i in range(0, len(loud), frame)]
+        bursts = sum(1 for prev, cur in zip([False] + active, active) if cur and not prev)
+        assert bursts == len(words)
+
+    def test_stalled_shared_stream_falls_back(self, audio_module):
+        """Recording uses a dedicated stream when the shared one is not delivering."""
+        with patch('modules.audio_capture.sd.InputStream'):
+            audio_module.capture_service.start()
+        audio_module.capture_service._last_callback -= 1.0
+
+        with patch.object(audio_module, '_record_from_shared_capture') as mock_shared, \
+             patch('modules.audio.sd.InputStream', side_effect=Exception("no device")):
+            assert audio_module._record_audio_with_silence_detection(1.0) is None
+
+        mock_shared.assert_not_called()
@@ -0,0 +1,101 @@
+# tests/test_automation_telemetry.py
+"""
+Unit tests for bounded automation telemetry.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from modules.automation import AutomationModule
+from modules.automation_telemetry import AutomationTelemetry, ActionHistory, LatencyHistogram
+
+
+def perf(action, path_type, execution_time, success=True, app_name="Safari"):
+    return {'action': action, 'path_type': path_type, 'execution_time': execution_time,
+            'success': success, 'app_name': app_name}
+
+
+class TestAutomationTelemetry:
+    """Test cases for AutomationTelemetry and ActionHistory."""
+
+    def test_records_bounded_aggregates_cumulative(self):
+        telemetry = AutomationTelemetry(history_size=3)
+
+        for i in range(10):
+            telemetry.record(perf('click', 'fast', 0.01, success=i % 2 == 0))
+
+        assert len(telemetry.records) == 3
+        aggregate = telemetry.aggregates()[('click', 'fast', 'Safari')]
+        assert aggregate.count == 10
+        assert aggregate.success_rate == 50.0
+
+    def test_breakdown_per_action_path_and_app(self):
+        telemetry = AutomationTelemetry()
+        telemetry.record(perf('click', 'fast', 0.02))
+        telemetry.record(perf('click', 'fast', 0.03, app_name="Mail"))
+        telemetry.record(perf('type', 'slow', 0.4, success=False))
+
+        breakdown = {(b['action'], b['path_type'], b['app_name']): b for b in telemetry.get_breakdown()}
+
+        assert set(breakdown) == {('click', 'fast', 'Safari'), ('click', 'fast', 'Mail'), ('type', 'slow', 'Safari')}
+        assert breakdown[('type', 'slow', 'Safari')]['success_rate'] == 0.0
+        assert breakdown[('click', 'fast', 'Mail')]['latency']['p95'] == 0.05
+
+    def test_histogram_percentiles(self):
+        histogram = LatencyHistogram()
+        for seconds in [0.003] * 90 + [0.3] * 10:
+            histogram.add(seconds)
+
+        assert histogram.percentile(50) == 0.005
+        assert histogram.percentile(95) == 0.5
+        assert histogram.mean == pytest.approx(0.0327)
+
+    def test_failure_rate_follows_status_changes_and_eviction(self):
+        history = ActionHistory(maxlen=2)
+        first = history.append({"status": "attempting"})
+        history.set_status(first, "failed")
+        assert history.failure_rate() == 100.0
+
+        history.append({"status": "success"})
+        history.append({"status": "success"})
+
+        assert len(history) == 2
+        assert history.failure_rate() == 0.0
+        assert history.recent(1) == [{"status": "success"}]
+
+
+class TestAutomationModuleTelemetry:
+    """AutomationModule metrics backed by telemetry."""
+
+    @pytest.fixture
+    def automation(self):
+        with patch('modules.automation.pyautogui.size', return_value=(1920, 1080)):
+            return AutomationModule(max_retries=0)
+
+    def test_performance_metrics_from_aggregates(self, automation):
+        automation._log_click_performance(0.02, fast_path=True, success=True)
+        automation._log_click_performance(0.2, fast_path=False, success=False)
+        automation.telemetry.record(perf('type', 'fast', 0.04))
+
+        metrics = automation.get_performance_metrics()
+
+        assert metrics['total_operations'] == 3
+        assert metrics['fast_path_avg_time'] == pytest.approx(0.03)
+        assert metrics['slow_path_success_rate'] == 0.0
+        assert metrics['speedup_factor'] == pytest.approx(0.2 / 0.03)
+        assert metrics['action_breakdown']['click']['count'] == 2
+
+        assert automation.get_performance_metrics(limit=1)['total_operations'] == 1
+        assert automation.get_performance_metrics(path_type='slow')['total_operations'] == 1
+
+    def test_action_history_bounded(self, automation):
+        automation._action_history = ActionHistory(maxlen=5)
+
+        with patch.object(automation, '_execute_click'):
+            for i in range(8):
+                automation.execute_action({"action": "click", "coordinates": [10 + i, 10]})
+
+        assert len(automation.get_action_history()) == 5
+        assert automation.get_action_history(limit=2)[-1]["action"]["coordinates"] == [17, 10]
+        assert automation.get_failure_rate() == 0.0
@@ -138,9 +138,9 @@ class TestBackwardCompatibilityGUICommands(unittest.TestCase):
                 # Should succeed (either fast path or vision fallback)
                 self.assertIn(result["status"], ["success", "error"])
                 
-                # If successful, should have called automation
+                # If successful, should have typed through automation
                 if result["status"] == "success":
-                    self.mock_automation.execute_fast_path_action.assert_called()
+                    self.mock_automation.execute_action.assert_called()
     
     def test_scroll_commands_backward_compatibility(self):
         """Test that all scroll command variations work as before."""
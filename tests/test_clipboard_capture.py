@@ -0,0 +1,123 @@
+# tests/test_clipboard_capture.py
+"""
+Unit tests for pasteboard-aware clipboard capture.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from modules.automation import AutomationModule
+from modules.clipboard_capture import (
+    ClipboardCapture,
+    MemoryPasteboardBackend,
+    TEXT_TYPE,
+    create_pasteboard_backend
+)
+from modules.input_backends import RecordingInputBackend
+
+
+def copier(pasteboard, items, delay=0.0):
+    """send_copy that writes items to the pasteboard after a delay."""
+    def send_copy():
+        threading.Timer(delay, pasteboard.write, ([items],)).start()
+        return True
+    return send_copy
+
+
+@pytest.fixture
+def pasteboard():
+    pasteboard = MemoryPasteboardBackend()
+    pasteboard.write([{TEXT_TYPE: b"original", "public.html": b"<b>original</b>"}])
+    return pasteboard
+
+
+@pytest.fixture
+def capture(pasteboard):
+    capture = ClipboardCapture(pasteboard, timeout=0.5, lazy_restore=True)
+    yield capture
+    capture.shutdown()
+
+
+class TestClipboardCapture:
+    """Test cases for ClipboardCapture."""
+
+    def test_text_captured_when_copy_lands(self, pasteboard, capture):
+        result = capture.capture(copier(pasteboard, {TEXT_TYPE: "héllo".encode('utf-8')}, delay=0.02))
+
+        assert result.changed
+        assert result.text == "héllo"
+        assert 0.02 <= result.latency < 0.2
+
+    def test_original_contents_restored_in_background(self, pasteboard, capture):
+        capture.capture(copier(pasteboard, {TEXT_TYPE: b"selection"}))
+        capture.flush_restore()
+
+        assert pasteboard.read_text() == "original"
+        assert pasteboard.read_data("public.html") == b"<b>original</b>"
+        assert capture.get_stats()['restored'] == 1
+
+    def test_non_text_types_captured(self, pasteboard, capture):
+        result = capture.capture(copier(pasteboard, {"public.png": b"\x89PNG", "public.file-url": b"file:///a"}))
+
+        assert result.text is None
+        assert result.data == {"public.png": b"\x89PNG", "public.file-url": b"file:///a"}
+
+    def test_timeout_without_copy(self, pasteboard):
+        capture = ClipboardCapture(pasteboard, timeout=0.05)
+
+        result = capture.capture(lambda: True)
+
+        assert not result.changed and result.text is None
+        assert pasteboard.change_count() == 1
+        assert capture.get_stats()['timed_out'] == 1
+        capture.shutdown()
+
+    def test_restore_skipped_after_later_copy(self, pasteboard):
+        capture = ClipboardCapture(pasteboard, timeout=0.5, lazy_restore=True)
+        gate = threading.Event()
+        # Hold the restore worker so the user's own copy lands first
+        capture._restorer.submit(gate.wait)
+
+        capture.capture(copier(pasteboard, {TEXT_TYPE: b"selection"}))
+        pasteboard.write_text("copied by the user")
+        gate.set()
+        capture.flush_restore()
+
+        assert pasteboard.read_text() == "copied by the user"
+        assert capture.get_stats()['restore_skipped'] == 1
+        capture.shutdown()
+
+    def test_next_capture_waits_for_pending_restore(self, pasteboard, capture):
+        capture.capture(copier(pasteboard, {TEXT_TYPE: b"first"}))
+        result = capture.capture(copier(pasteboard, {TEXT_TYPE: b"second"}))
+        capture.flush_restore()
+
+        assert result.text == "second"
+        assert pasteboard.read_text() == "original"
+
+    def test_backend_factory(self):
+        assert create_pasteboard_backend("none") is None
+        assert create_pasteboard_backend("memory").name == "memory"
+        with pytest.raises(ValueError):
+            create_pasteboard_backend("x11")
+
+
+class TestAutomationPasteboardCapture:
+    """get_selected_text_via_clipboard with a pasteboard backend."""
+
+    def test_selected_text_via_pasteboard(self, pasteboard):
+        with patch('modules.automation.pyautogui.size', return_value=(1920, 1080)):
+            automation = AutomationModule(max_retries=0)
+        automation.input_backend = RecordingInputBackend()
+        automation.clipboard_capture = ClipboardCapture(pasteboard, timeout=0.5)
+        automation.input_backend.hotkey = lambda keys: pasteboard.write_text("selected") or True
+
+        with patch('modules.automation.pyperclip') as pyperclip:
+            text = automation.get_selected_text_via_clipboard()
+
+        assert text == "selected"
+        pyperclip.paste.assert_not_called()
+        assert automation.text_capture_performance[-1]['method'] == 'pasteboard'
+        automation.clipboard_capture.shutdown()
@@ -0,0 +1,209 @@
+# tests/test_command_router.py
+"""
+Unit tests for the pre-intent fast command router.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from handlers.gui_handler import GUIHandler
+from modules.command_router import FastCommandRouter, RoutedCommand
+from orchestrator import Orchestrator
+
+
+def llm_label(intent="gui_interaction", action_type="type", target=None):
+    parameters = {"action_type": action_type}
+    if target is not None:
+        parameters["target"] = target
+    return {"intent": intent, "confidence": 0.9, "parameters": parameters,
+            "reasoning": "test", "source": "llm"}
+
+
+@pytest.fixture
+def router():
+    return FastCommandRouter(mode="auto", min_precision=0.9, min_samples=3, stats_file=None)
+
+
+class TestFastCommandRouter:
+    """Test cases for FastCommandRouter."""
+
+    @pytest.mark.parametrize("command, grammar, parameters", [
+        ("type hello world", "type", {"text": "hello world"}),
+        ("type salt and pepper", "type", {"text": "salt and pepper"}),
+        ('Type "Dear Sam,"', "type", {"text": "Dear Sam,"}),
+        ("press enter", "key", {"keys": ["return"]}),
+        ("hit cmd+shift+t", "key", {"keys": ["cmd", "shift", "t"]}),
+        ("press the down arrow key", "key", {"keys": ["down"]}),
+        ("scroll up by 300", "scroll", {"direction": "up", "amount": 300}),
+        ("click on the Save button", "click", {"action": "click", "label": "Save", "role": "button"}),
+        ("double-click Downloads", "click", {"action": "double_click", "label": "Downloads"}),
+    ])
+    def test_unambiguous_commands_matched(self, router, command, grammar, parameters):
+        routed = router.match(command)
+
+        assert routed.grammar == grammar
+        assert routed.parameters == parameters
+
+    @pytest.mark.parametrize("command", [
+        "type hello into the search field",
+        "type a python function that sorts a list",
+        "press submit",
+        "scroll to the bottom",
+        "click it",
+        "click the first link and then the second",
+        "type hello and press enter",
+        "type hello world then click send",
+        "type my email address",
+        "type the current date",
+        "what's on my screen",
+    ])
+    def test_ambiguous_commands_left_to_llm(self, router, command):
+        assert router.match(command) is None
+
+    def test_enforced_after_shadow_precision_reached(self, router):
+        routed = router.match("type hello")
+        assert not router.should_enforce(routed)
+
+        for _ in range(3):
+            router.record_llm_label("type hello", routed, llm_label(target="hello"))
+
+        assert router.should_enforce(routed)
+        assert not router.should_enforce(router.match("scroll down"))
+
+    def test_disagreement_keeps_grammar_shadowed(self, router):
+        routed = router.match("click Submit")
+        router.record_llm_label("click Submit", routed, llm_label(action_type="click", target="Submit"))
+        router.record_llm_label("click Submit", routed, llm_label(action_type="click", target="Submit"))
+        assert not router.record_llm_label("click Submit", routed, llm_label(intent="question_answering"))
+
+        stats = router.get_stats()["grammars"]["click"]
+        assert stats["shadowed"] == 3 and stats["precision"] == pytest.approx(2 / 3)
+        assert not stats["enforcing"]
+        assert stats["recent_disagreements"][0]["intent"] == "question_answering"
+
+    @pytest.mark.parametrize("command, target, agreed", [
+        ("type hello world", "hello world", True),
+        ("type hello world", '"Hello world."', True),
+        ("type hello world", "hello world and press enter", False),
+        ("click Save", "Save button", True),
+        ("click Save", "Cancel button", False),
+        ("press enter", "enter key", True),
+        ("hit cmd+shift+t", "cmd+shift+t", True),
+        ("press enter", "tab", False),
+        ("scroll up by 300", "up 300", True),
+        ("scroll down", "page down", True),
+        ("scroll down", "up", False),
+        ("scroll up by 300", "up", False),
+    ])
+    def test_extracted_parameters_compared_with_llm_target(self, router, command, target, agreed):
+        routed = router.match(command)
+        label = llm_label(action_type=routed.grammar, target=target)
+
+        assert router.record_llm_label(command, routed, label) is agreed
+
+    @pytest.mark.parametrize("command, label", [
+        ("press enter", llm_label(action_type="type")),
+        ("press enter", llm_label(action_type="type", target="the key the user asked for")),
+        ("type hello", llm_label(action_type="unknown", target="hello")),
+        ("scroll down", llm_label(action_type="scroll", target="the page")),
+    ])
+    def test_uncomparable_labels_skipped(self, router, command, label):
+        routed = router.match(command)
+
+        assert router.record_llm_label(command, routed, label) is None
+
+        stats = router.get_stats()["grammars"][routed.grammar]
+        assert stats["shadowed"] == 0 and stats["skipped"] == 1
+        assert not router.should_enforce(routed)
+
+    def test_parameter_disagreement_recorded(self, router):
+        routed = router.match("type hello world")
+
+        router.record_llm_label("type hello world", routed, llm_label(target="hello"))
+
+        disagreement = router.get_stats()["grammars"]["type"]["recent_disagreements"][0]
+        assert disagreement["target"] == "hello"
+        assert disagreement["routed"] == {"text": "hello world"}
+
+    def test_shadow_mode_never_enforces(self):
+        router = FastCommandRouter(mode="shadow", min_samples=1, stats_file=None)
+        routed = router.match("press enter")
+        router.record_llm_label("press enter", routed, llm_label(action_type="click", target="enter"))
+
+        assert not router.should_enforce(routed)
+
+    def test_stats_persist_across_sessions(self, tmp_path):
+        path = str(tmp_path / "router_stats.json")
+        router = FastCommandRouter(mode="auto", min_samples=2, min_precision=0.9, stats_file=path)
+        routed = router.match("scroll down")
+        router.record_llm_label("scroll down", routed, llm_label(action_type="scroll", target="down"))
+        router.record_llm_label("scroll down", routed, llm_label(action_type="scroll", target="down"))
+        router.flush()
+
+        reloaded = FastCommandRouter(mode="auto", min_samples=2, min_precision=0.9, stats_file=path)
+
+        assert reloaded.should_enforce(reloaded.match("scroll down"))
+
+
+class TestGUIHandlerRoutedCommands:
+    """GUIHandler execution of routed commands."""
+
+    @pytest.fixture
+    def handler(self):
+        orchestrator = Mock(spec=['automation_module', 'accessibility_module', 'vision_module'])
+        orchestrator.automation_module = Mock()
+        orchestrator.automation_module.press_keys.return_value = True
+        return GUIHandler(orchestrator)
+
+    def context(self, command):
+        routed = FastCommandRouter(mode="enforce", stats_file=None).match(command)
+        return {'intent': routed.to_intent(), 'execution_id': 'cmd_1'}
+
+    def test_type_goes_straight_to_automation(self, handler):
+        result = handler.handle("type hello world", self.context("type hello world"))
+
+        assert result['status'] == 'success' and result['method'] == 'direct_typing'
+        handler.orchestrator.automation_module.execute_action.assert_called_once_with(
+            {'action': 'type', 'text': 'hello world'})
+        handler.orchestrator.accessibility_module.find_element_enhanced.assert_not_called()
+
+    def test_key_press(self, handler):
+        result = handler.handle("press cmd+s", self.context("press cmd+s"))
+
+        assert result['status'] == 'success'
+        handler.orchestrator.automation_module.press_keys.assert_called_once_with(['cmd', 's'])
+
+    def test_click_uses_routed_label(self, handler):
+        routed = RoutedCommand("click", {"action": "click", "label": "Save", "role": "button"}, 0.9)
+
+        elements = handler._gui_elements_from_route(routed.to_dict())
+
+        assert elements == {'action': 'click', 'label': 'Save', 'role': 'button', 'app_name': None}
+
+
+class TestOrchestratorRouting:
+    """Orchestrator intent routing through the fast command router."""
+
+    def orchestrator(self, router):
+        orchestrator = Mock(command_router=router)
+        orchestrator._recognize_intent.return_value = llm_label(target="hello")
+        return orchestrator
+
+    def test_shadowed_command_uses_llm_label(self, router):
+        orchestrator = self.orchestrator(router)
+
+        intent = Orchestrator._route_or_recognize_intent(orchestrator, "cmd_1", "type hello")
+
+        assert intent["source"] == "llm"
+        assert router.get_stats()["grammars"]["type"]["shadowed"] == 1
+
+    def test_enforced_command_skips_llm(self):
+        router = FastCommandRouter(mode="enforce", stats_file=None)
+        orchestrator = self.orchestrator(router)
+
+        intent = Orchestrator._route_or_recognize_intent(orchestrator, "cmd_1", "type hello")
+
+        assert intent["source"] == "fast_router"
+        assert intent["fast_route"]["parameters"] == {"text": "hello"}
+        orchestrator._recognize_intent.assert_not_called()
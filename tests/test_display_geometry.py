@@ -0,0 +1,179 @@
+# tests/test_display_geometry.py
+"""
+Unit tests for the shared display geometry service.
+"""
+
+import base64
+import io
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from modules.automation import AutomationModule
+from modules.display_geometry import (
+    Display,
+    DisplayGeometryService,
+    StaticDisplayProvider,
+    create_display_provider
+)
+from modules.vision import VisionModule
+
+
+def screenshot_b64(width, height):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height)).save(buffer, format="JPEG")
+    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+
+
+def retina_main():
+    return Display(1, 0, 0, 1440, 900, 2880, 1800, is_main=True)
+
+
+def left_external():
+    return Display(2, -1920, -180, 1920, 1080)
+
+
+@pytest.fixture
+def provider():
+    return StaticDisplayProvider([retina_main(), left_external()])
+
+
+@pytest.fixture
+def service(provider):
+    return DisplayGeometryService(provider, max_age=0)
+
+
+class TestDisplayGeometryService:
+    """Test cases for DisplayGeometryService and DisplayLayout."""
+
+    def test_layout_read_once_and_cached(self, provider, service):
+        first = service.layout()
+        second = service.layout()
+
+        assert first is second
+        assert provider.reads == 1
+        assert service.get_stats()['watching']
+
+    def test_reconfiguration_rereads_and_notifies(self, provider, service):
+        changes = []
+        service.add_listener(changes.append)
+        service.layout()
+
+        provider.reconfigure([Display(1, 0, 0, 1728, 1117, 3456, 2234, is_main=True)])
+
+        assert provider.reads == 2
+        assert len(changes) == 1 and changes[0].main.width == 1728
+        assert service.layout() is changes[0]
+        assert service.get_stats()['reconfigurations'] == 1
+
+    def test_stale_layout_reread_after_max_age(self, provider):
+        service = DisplayGeometryService(provider, max_age=30.0)
+        service.layout()
+
+        with patch('modules.display_geometry.time.monotonic', return_value=1e9):
+            service.layout()
+
+        assert provider.reads == 2
+
+    def test_retina_scale(self, service):
+        main = service.layout().main
+
+        assert main.scale == 2.0
+        assert main.to_dict()['pixel_size'] == [2880, 1800]
+
+    def test_multi_monitor_bounds(self, service):
+        layout = service.layout()
+
+        assert layout.bounds == (-1920, -180, 3360, 1080)
+        assert layout.contains(-500, 400) and layout.display_at(-500, 400).display_id == 2
+        assert not layout.contains(-500, 950)
+        assert layout.intersects(-10, 10, 50, 20)
+        assert not layout.intersects(2000, 10, 50, 20)
+        assert layout.display(0).is_main and layout.display(1).display_id == 2
+
+    def test_image_to_points(self, service):
+        layout = service.layout()
+
+        # Downscaled screenshot of the main display, and a screenshot of the external one
+        assert layout.image_to_points(640, 400, 1280, 800) == (720, 450)
+        assert layout.image_to_points(960, 540, 1920, 1080, layout.display(1)) == (-960, 360)
+
+    def test_read_failure_not_retried_every_call(self, provider, service):
+        with patch.object(provider, 'read', side_effect=RuntimeError("no displays")) as read:
+            assert service.layout() is None
+            assert service.layout() is None
+
+        assert read.call_count == 1
+        service.invalidate()
+        assert service.layout() is not None
+
+    def test_provider_factory(self):
+        assert create_display_provider("none") is None
+        assert create_display_provider("static").name == "static"
+        with pytest.raises(ValueError):
+            create_display_provider("x11")
+
+
+class TestAutomationDisplayGeometry:
+    """AutomationModule coordinates from the shared display geometry."""
+
+    @pytest.fixture
+    def automation(self, service):
+        with patch('modules.automation.display_geometry', service):
+            with patch('modules.automation.pyautogui.size', side_effect=AssertionError("size probed")):
+                yield AutomationModule(max_retries=0)
+
+    def test_screen_size_from_main_display(self, automation):
+        assert automation.get_screen_size() == (1440, 900)
+
+    def test_secondary_display_coordinates_valid(self, automation):
+        assert automation._validate_coordinates(-1000, 300)
+        assert automation._validate_coordinates(1440, 900)
+        assert not automation._validate_coordinates(-1000, 950)
+        assert not automation._validate_coordinates(1500, 100)
+
+    def test_screen_size_follows_reconfiguration(self, provider, automation):
+        provider.reconfigure([Display(1, 0, 0, 1728, 1117, 3456, 2234, is_main=True)])
+
+        assert automation.get_screen_size() == (1728, 1117)
+
+
+class TestVisionDisplayGeometry:
+    """Vision coordinates mapped from screenshot pixels to global points."""
+
+    @pytest.fixture
+    def vision(self, service):
+        with patch('modules.vision.display_geometry', service):
+            with patch('modules.vision.mss.mss'):
+                yield VisionModule()
+
+    def test_retina_screenshot_coordinates_to_points(self, vision):
+        analysis = {
+            "forms": [{"coordinates": [200, 100, 1000, 600],
+                       "fields": [{"label": "Email", "coordinates": [400, 300, 800, 360]}]}],
+            "submit_buttons": [{"text": "Send", "coordinates": [2000, 1600]}],
+            "metadata": {}
+        }
+
+        vision._map_coordinates_to_points(analysis, screenshot_b64(2880, 1800))
+
+        assert analysis["forms"][0]["coordinates"] == [100, 50, 500, 300]
+        assert analysis["forms"][0]["fields"][0]["coordinates"] == [200, 150, 400, 180]
+        assert analysis["submit_buttons"][0]["coordinates"] == [1000, 800]
+        assert analysis["metadata"]["image_size"] == [2880, 1800]
+
+    def test_downscaled_screenshot_coordinates_to_points(self, vision):
+        analysis = {"elements": [{"text": "OK", "coordinates": [960, 600]}, "plain text"]}
+
+        vision._map_coordinates_to_points(analysis, screenshot_b64(1920, 1200))
+
+        assert analysis["elements"][0]["coordinates"] == [720, 450]
+        assert analysis["elements"][1] == "plain text"
+
+    def test_unreadable_screenshot_keeps_coordinates(self, vision):
+        analysis = {"elements": [{"coordinates": [10, 20]}]}
+
+        vision._map_coordinates_to_points(analysis, "not an image")
+
+        assert analysis["elements"][0]["coordinates"] == [10, 20]
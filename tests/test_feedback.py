@@ -7,8 +7,6 @@ Tests the sound effect system and TTS integration functionality.
 
 import pytest
 import unittest.mock as mock
-import tempfile
-import os
 from pathlib import Path
 import time
 import queue
@@ -41,27 +39,6 @@ def mock_audio_module():
     return mock_audio
 
 
-@pytest.fixture
-def temp_sound_files():
-    """Create temporary sound files for testing."""
-    temp_dir = tempfile.mkdtemp()
-    sound_files = {}
-    
-    # Create dummy sound files
-    for sound_name in ['success', 'failure', 'thinking']:
-        sound_path = os.path.join(temp_dir, f"{sound_name}.wav")
-        with open(sound_path, 'wb') as f:
-            # Write minimal WAV header (44 bytes) + some data
-            f.write(b'RIFF' + b'\x00' * 40 + b'data' + b'\x00' * 100)
-        sound_files[sound_name] = sound_path
-    
-    yield sound_files
-    
-    # Cleanup
-    import shutil
-    shutil.rmtree(temp_dir, ignore_errors=True)
-
-
 @pytest.fixture
 def feedback_module(mock_pygame, mock_audio_module, temp_sound_files):
     """Create FeedbackModule instance for testing."""
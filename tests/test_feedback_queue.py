@@ -0,0 +1,166 @@
+"""
+Unit tests for the feedback queue
+
+Covers deadlines, coalescing, channel separation, latency metrics and
+preemption of lower-priority speech in FeedbackModule.
+"""
+
+import threading
+import time
+
+import pytest
+import unittest.mock as mock
+
+from modules.feedback import FeedbackModule, FeedbackPriority, FeedbackType
+from modules.feedback_queue import FeedbackQueue, FeedbackChannel
+
+
+class TestFeedbackQueue:
+    """Test cases for FeedbackQueue class."""
+
+    def test_priority_then_enqueue_order(self):
+        """Higher priorities are taken first, equal priorities in order."""
+        feedback_queue = FeedbackQueue()
+        feedback_queue.put({'id': 'low'}, 1)
+        feedback_queue.put({'id': 'high-1'}, 3)
+        feedback_queue.put({'id': 'high-2'}, 3)
+
+        taken = [feedback_queue.get(FeedbackChannel.SPEECH, timeout=0.1).item['id'] for _ in range(3)]
+
+        assert taken == ['high-1', 'high-2', 'low']
+
+    def test_stale_items_dropped(self):
+        """Items past their deadline are dropped instead of returned."""
+        feedback_queue = FeedbackQueue()
+        feedback_queue.put({'id': 'stale'}, 2, timeout=0.01)
+        feedback_queue.put({'id': 'fresh'}, 1)
+        time.sleep(0.03)
+
+        entry = feedback_queue.get(FeedbackChannel.SPEECH, timeout=0.1)
+        feedback_queue.task_done(entry)
+
+        assert entry.item['id'] == 'fresh'
+        assert feedback_queue.get_metrics()['expired'] == 1
+        assert feedback_queue.join(timeout=0.1)
+
+    def test_coalescing_replaces_pending_item(self):
+        """A newer item with the same key replaces the pending one and keeps its priority."""
+        feedback_queue = FeedbackQueue()
+        feedback_queue.put({'id': 'old'}, 3, coalesce_key='status')
+        feedback_queue.put({'id': 'new'}, 1, coalesce_key='status')
+
+        entry = feedback_queue.get(FeedbackChannel.SPEECH, timeout=0.1)
+
+        assert feedback_queue.qsize() == 0
+        assert entry.item['id'] == 'new'
+        assert entry.priority == 3
+        assert feedback_queue.get_metrics()['coalesced'] == 1
+
+    def test_channels_are_independent(self):
+        """Effects are available while speech items are pending."""
+        feedback_queue = FeedbackQueue()
+        feedback_queue.put({'id': 'speech'}, 4)
+        feedback_queue.put({'id': 'sound'}, 1, channel=FeedbackChannel.EFFECTS)
+
+        assert feedback_queue.get(FeedbackChannel.EFFECTS, timeout=0.1).item['id'] == 'sound'
+        assert feedback_queue.qsize() == 1
+
+    def test_latency_metrics(self):
+        """Enqueue-to-playback latency is recorded per channel."""
+        feedback_queue = FeedbackQueue()
+        feedback_queue.put({'id': 'sound'}, 2, channel=FeedbackChannel.EFFECTS)
+        time.sleep(0.02)
+        feedback_queue.task_done(feedback_queue.get(FeedbackChannel.EFFECTS, timeout=0.1))
+
+        latency = feedback_queue.get_metrics()['latency']
+
+        assert latency['effects']['count'] == 1
+        assert latency['effects']['max'] >= 0.02
+        assert latency['speech']['count'] == 0
+
+    def test_clear_below_priority(self):
+        """Clearing with a threshold keeps higher-priority items."""
+        feedback_queue = FeedbackQueue()
+        feedback_queue.put({'id': 'low'}, 1)
+        feedback_queue.put({'id': 'high'}, 3, channel=FeedbackChannel.EFFECTS)
+
+        assert feedback_queue.clear(below_priority=2) == 1
+        assert feedback_queue.qsize() == 1
+
+
+@pytest.fixture
+def slow_audio_module():
+    """AudioModule whose speech takes a while and can be interrupted."""
+    audio = mock.Mock(spec=['text_to_speech', 'stop_speaking'])
+    interrupted = threading.Event()
+
+    def speak(text):
+        interrupted.wait(0.3)
+
+    def stop():
+        interrupted.set()
+        return True
+
+    audio.text_to_speech.side_effect = speak
+    audio.stop_speaking.side_effect = stop
+    return audio
+
+
+@pytest.fixture
+def feedback(mock_pygame, slow_audio_module, temp_sound_files):
+    """FeedbackModule with slow, interruptible speech."""
+    with mock.patch('modules.feedback.SOUNDS', temp_sound_files):
+        feedback = FeedbackModule(audio_module=slow_audio_module)
+        yield feedback
+        feedback.cleanup()
+
+
+class TestFeedbackModuleQueueing:
+    """Test queue behaviour as seen through FeedbackModule."""
+
+    def test_sound_not_delayed_by_speech(self, feedback, mock_pygame):
+        """Sound effects play while speech is still in progress."""
+        feedback.speak("A long answer that takes a while to speak")
+        time.sleep(0.05)
+        feedback.play('success')
+        time.sleep(0.05)
+
+        assert mock_pygame.Sound.return_value.play.called
+        assert feedback.get_queue_metrics()['latency']['effects']['max'] < 0.1
+
+    def test_duplicate_thinking_sounds_coalesced(self, feedback):
+        """Repeated identical sounds queued together play once."""
+        feedback.is_processing = False
+        feedback.effects_thread.join(timeout=2.0)
+
+        for _ in range(3):
+            feedback.play('thinking')
+
+        assert feedback.get_queue_size() == 1
+        assert feedback.get_queue_metrics()['coalesced'] == 2
+
+    def test_high_priority_preempts_low_priority_speech(self, feedback, slow_audio_module):
+        """HIGH priority speech interrupts LOW priority speech in progress."""
+        feedback.speak("Low priority status update", FeedbackPriority.LOW)
+        time.sleep(0.05)
+        feedback.speak("Task failed", FeedbackPriority.HIGH)
+
+        assert feedback.wait_for_completion(timeout=1.0)
+        slow_audio_module.stop_speaking.assert_called_once()
+        assert feedback.get_queue_metrics()['preempted'] == 1
+
+    def test_stale_speech_dropped(self, feedback, slow_audio_module):
+        """Queued NORMAL speech whose deadline passes is never spoken."""
+        feedback.speak("First message")
+        feedback.speak("Stale message", deadline=0.05)
+
+        assert feedback.wait_for_completion(timeout=1.0)
+        spoken = [call.args[0] for call in slow_audio_module.text_to_speech.call_args_list]
+        assert spoken == ["First message"]
+        assert feedback.get_queue_metrics()['expired'] == 1
+
+    def test_channel_assignment(self, feedback):
+        """Sound-only items use the effects channel."""
+        assert feedback._get_channel({'type': FeedbackType.SOUND}) == FeedbackChannel.EFFECTS
+        assert feedback._get_channel({'type': FeedbackType.HYBRID_SLOW, 'message': None}) == FeedbackChannel.EFFECTS
+        assert feedback._get_channel({'type': FeedbackType.COMBINED, 'message': "Done"}) == FeedbackChannel.SPEECH
@@ -0,0 +1,148 @@
+# tests/test_form_filler.py
+"""
+Unit tests for batched form filling.
+"""
+
+import subprocess
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from modules.automation import AutomationModule
+from modules.form_filler import FormFillEngine, match_field_value
+from modules.input_backends import RecordingInputBackend
+
+
+def form_data():
+    """Sign-up form as returned by vision analysis, fields out of Tab order."""
+    return {
+        "forms": [{
+            "form_id": "signup",
+            "fields": [
+                {"type": "email", "label": "Email", "coordinates": [100, 160, 400, 190]},
+                {"type": "text_input", "label": "Name", "coordinates": [100, 100, 400, 130]},
+                {"type": "checkbox", "label": "Subscribe", "coordinates": [100, 220, 120, 240]},
+                {"type": "text_input", "label": "Company", "coordinates": [100, 280, 400, 310]}
+            ],
+            "submit_buttons": [{"text": "Sign up", "coordinates": [100, 340, 200, 370]}]
+        }]
+    }
+
+
+def ax_element(role, x, y, width, height, value=None):
+    return {"element": object(), "role": role, "title": "", "value": value,
+            "coordinates": [x, y, width, height], "center_point": [x + width // 2, y + height // 2]}
+
+
+@pytest.fixture
+def accessibility():
+    """Accessibility snapshot of the form: Name, Email, Subscribe, a link, Company."""
+    module = MagicMock()
+    module.get_focusable_elements.return_value = [
+        ax_element("AXTextField", 100, 100, 300, 30),
+        ax_element("AXTextField", 100, 160, 300, 30),
+        ax_element("AXCheckBox", 100, 220, 20, 20, value=0),
+        ax_element("AXLink", 150, 220, 100, 20),
+        ax_element("AXTextField", 100, 280, 300, 30)
+    ]
+    module.read_element_values.side_effect = lambda elements: ["Ada", "ada@example.com", 1, "Analytical Engines"]
+    return module
+
+
+@pytest.fixture
+def automation():
+    with patch('modules.automation.pyautogui.size', return_value=(1920, 1080)):
+        automation = AutomationModule(max_retries=0)
+    automation.input_backend = RecordingInputBackend()
+    return automation
+
+
+VALUES = {"Name": "Ada", "Email": "ada@example.com", "Subscribe": "yes", "Company": "Analytical Engines"}
+
+
+class TestFormFillEngine:
+    """Test cases for FormFillEngine."""
+
+    def test_fields_filled_in_tab_order_with_tab_moves(self, automation, accessibility):
+        with patch('modules.form_filler.wait_for'):
+            result = automation.fill_form(form_data(), VALUES, accessibility_module=accessibility)
+
+        events = automation.input_backend.events
+        assert [(e['type'], e.get('key') or e.get('text') or e.get('x')) for e in events] == [
+            ('click', 250), ('hotkey', None), ('type', 'Ada'),
+            ('key', 'tab'), ('hotkey', None), ('type', 'ada@example.com'),
+            ('click', 110),
+            # The link sits between the checkbox and Company, so Company is clicked
+            ('click', 250), ('hotkey', None), ('type', 'Analytical Engines')
+        ]
+        assert result["filled_fields"] == 4
+        assert result["batch"]["resolved_fields"] == 4
+        assert result["batch"]["tab_moves"] == 1
+        accessibility.get_focusable_elements.assert_called_once()
+        accessibility.read_element_values.assert_called_once()
+        assert result["batch"]["validation"] == {"available": True, "checked": 4, "mismatched": []}
+
+    def test_checked_checkbox_not_clicked(self, automation, accessibility):
+        accessibility.get_focusable_elements.return_value[2]["value"] = 1
+
+        with patch('modules.form_filler.wait_for'):
+            automation.fill_form(form_data(), {"Subscribe": "yes"}, accessibility_module=accessibility)
+
+        assert automation.input_backend.events == []
+
+    def test_mismatch_reported_as_warning(self, automation, accessibility):
+        accessibility.read_element_values.side_effect = lambda elements: ["Ad", "ada@example.com", 1, "Analytical Engines"]
+
+        with patch('modules.form_filler.wait_for'):
+            result = automation.fill_form(form_data(), VALUES, accessibility_module=accessibility)
+
+        assert result["batch"]["validation"]["mismatched"] == [{"field": "Name", "expected": "Ada", "actual": "Ad"}]
+        assert any("Name" in warning for warning in result["warnings"])
+
+    def test_reading_order_without_accessibility(self, automation):
+        with patch('modules.form_filler.wait_for'):
+            result = automation.fill_form(form_data(), {"Name": "Ada", "Email": "a@b.c"})
+
+        clicks = [e['y'] for e in automation.input_backend.events if e['type'] == 'click']
+        assert clicks == [115, 175]
+        assert result["batch"]["tab_moves"] == 0
+        assert not result["batch"]["validation"]["available"]
+
+    def test_cliclick_stream_is_one_invocation(self, automation, accessibility):
+        automation.input_backend = None
+        automation.is_macos = True
+        automation.has_cliclick = True
+
+        with patch('modules.automation.subprocess.run',
+                   return_value=subprocess.CompletedProcess([], 0, '', '')) as run:
+            automation.fill_form(form_data(), {"Name": "Ada", "Email": "ada@example.com"},
+                                 accessibility_module=accessibility)
+
+        argvs = [call.args[0] for call in run.call_args_list]
+        assert len(argvs) == 1
+        assert argvs[0][:4] == ['cliclick', 'c:250,115', 'w:100', 'kd:cmd']
+        assert 'kp:tab' in argvs[0]
+        assert 't:ada@example.com' in argvs[0]
+
+    def test_select_fields_filled_separately(self, automation):
+        data = {"forms": [{"fields": [
+            {"type": "select", "label": "Country", "coordinates": [0, 0, 100, 20], "options": ["France"]}
+        ]}]}
+        engine = FormFillEngine(automation)
+
+        with patch.object(automation, '_fill_select_field',
+                          return_value={"status": "filled", "field": "Country", "value": "France"}) as fill_select:
+            results, summary = engine.fill(data["forms"], {"Country": "france"})
+
+        fill_select.assert_called_once_with(50, 10, "france", "Country", ["France"])
+        assert summary["separate_fields"] == 1
+        assert results[0]["status"] == "filled"
+
+    def test_per_field_path_without_batching(self, automation):
+        automation.input_backend = None
+
+        assert not FormFillEngine(automation).can_batch()
+
+    def test_match_field_value(self):
+        assert match_field_value("Email Address", {"email": "a@b.c"}) == "a@b.c"
+        assert match_field_value("Phone", {"email": "a@b.c"}) is None
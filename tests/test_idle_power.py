@@ -0,0 +1,144 @@
+"""
+Unit tests for idle power mode
+
+Covers the wake word energy gate (which frames reach the detector) and the
+idle state that suspends background workers.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from modules.idle_power import IdlePowerState
+from modules.wake_word_gate import WakeWordGate
+
+SAMPLE_RATE = 16000
+FRAME = 512
+
+
+def quiet(frames, rng):
+    return (0.001 * rng.standard_normal(frames * FRAME)).astype(np.float32)
+
+
+def loud(frames):
+    t = np.arange(frames * FRAME) / SAMPLE_RATE
+    return (0.1 * np.sin(2 * np.pi * 200 * t)).astype(np.float32)
+
+
+class RecordingDetector:
+    """Records the int16 frames it is fed; fires on a frame reaching the given peak level."""
+
+    def __init__(self, fire_on_level=None):
+        self.frames = []
+        self.fire_on_level = fire_on_level
+
+    def __call__(self, frame):
+        self.frames.append(frame)
+        if self.fire_on_level is not None and np.abs(frame).max() >= self.fire_on_level:
+            return 0
+        return -1
+
+
+class TestWakeWordGate:
+    """Test cases for WakeWordGate class."""
+
+    def test_silence_never_reaches_detector(self):
+        """Quiet batches cost no detector calls."""
+        rng = np.random.default_rng(0)
+        detector = RecordingDetector()
+        gate = WakeWordGate(detector, FRAME, SAMPLE_RATE)
+
+        for _ in range(50):
+            assert gate.process(quiet(4, rng)) is None
+
+        assert detector.frames == []
+        assert gate.get_stats()['duty_cycle'] == 0.0
+
+    def test_loud_audio_opens_gate_with_preroll(self):
+        """The frames before the gate opened are passed to the detector first."""
+        rng = np.random.default_rng(1)
+        detector = RecordingDetector()
+        gate = WakeWordGate(detector, FRAME, SAMPLE_RATE, preroll=0.1, hangover=0.2)
+
+        for _ in range(10):
+            gate.process(quiet(4, rng))
+        gate.process(loud(4))
+
+        preroll_frames = round(0.1 / (FRAME / SAMPLE_RATE))
+        assert len(detector.frames) == preroll_frames + 4
+        assert gate.is_open
+        assert gate.gate_openings == 1
+
+    def test_gate_closes_after_hangover(self):
+        """Quiet audio after speech stops reaching the detector once the hangover ends."""
+        rng = np.random.default_rng(2)
+        detector = RecordingDetector()
+        gate = WakeWordGate(detector, FRAME, SAMPLE_RATE, preroll=0.0, hangover=0.1)
+        hangover_frames = round(0.1 / (FRAME / SAMPLE_RATE))
+
+        gate.process(loud(1))
+        gate.process(quiet(8, rng))
+
+        assert len(detector.frames) == 1 + hangover_frames - 1
+        assert not gate.is_open
+
+    def test_detection_index_within_batch(self):
+        """The index of the frame that triggered the detector is returned."""
+        detector = RecordingDetector(fire_on_level=16384)
+        gate = WakeWordGate(detector, FRAME, SAMPLE_RATE, preroll=0.0)
+        batch = loud(4)
+        batch[2 * FRAME:3 * FRAME] *= 8
+
+        assert gate.process(batch) == 2
+
+    def test_disabled_gate_passes_every_frame(self):
+        """With the gate disabled Porcupine sees all audio, as before."""
+        rng = np.random.default_rng(3)
+        detector = RecordingDetector()
+        gate = WakeWordGate(detector, FRAME, SAMPLE_RATE, enabled=False)
+
+        gate.process(quiet(4, rng))
+
+        assert len(detector.frames) == 4
+        assert detector.frames[0].dtype == np.int16
+
+
+class TestIdlePowerState:
+    """Test cases for IdlePowerState class."""
+
+    def test_workers_wait_while_idle(self):
+        """wait_until_active blocks until the wake word ends the idle period."""
+        state = IdlePowerState()
+        state.enter_idle()
+        resumed = threading.Event()
+
+        def worker():
+            if state.wait_until_active(poll_interval=0.05):
+                resumed.set()
+
+        threading.Thread(target=worker, daemon=True).start()
+        time.sleep(0.1)
+        assert not resumed.is_set()
+
+        state.exit_idle()
+
+        assert resumed.wait(1.0)
+        assert state.get_stats()['total_idle_time'] >= 0.1
+
+    def test_stop_condition_ends_wait(self):
+        """Shutdown is not held up by an idle period."""
+        state = IdlePowerState()
+        state.enter_idle()
+        stop = threading.Event()
+        stop.set()
+
+        assert state.wait_until_active(stop.is_set, poll_interval=0.01) is False
+
+    def test_active_state_does_not_block(self):
+        """Workers run normally when AURA isn't idle."""
+        state = IdlePowerState()
+
+        start = time.perf_counter()
+        assert state.wait_until_active(poll_interval=1.0)
+        assert time.perf_counter() - start < 0.1
@@ -0,0 +1,132 @@
+# tests/test_input_backends.py
+"""
+Unit tests for input injection backends and their use by AutomationModule.
+"""
+
+import subprocess
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from modules import input_backends
+from modules.automation import AutomationModule
+from modules.input_backends import (
+    CliclickInputBackend,
+    RecordingInputBackend,
+    create_input_backend
+)
+
+
+@pytest.fixture
+def recorded_automation():
+    """AutomationModule driving a recording backend."""
+    with patch('modules.automation.pyautogui.size', return_value=(1920, 1080)):
+        automation = AutomationModule(max_retries=0)
+    automation.input_backend = RecordingInputBackend()
+    return automation
+
+
+class TestBackendSelection:
+    """Test create_input_backend."""
+
+    def test_auto_prefers_quartz_on_macos(self):
+        with patch.object(input_backends, 'QUARTZ_AVAILABLE', True), \
+                patch.object(input_backends, 'Quartz', MagicMock(), create=True):
+            backend = create_input_backend("auto", is_macos=True, has_cliclick=True)
+        assert backend.name == "quartz"
+        assert backend.in_process
+
+    def test_auto_falls_back_to_cliclick(self):
+        with patch.object(input_backends, 'QUARTZ_AVAILABLE', False):
+            backend = create_input_backend("auto", is_macos=True, has_cliclick=True)
+        assert backend.name == "cliclick"
+        assert not backend.in_process
+
+    def test_auto_uses_builtin_methods_elsewhere(self):
+        assert create_input_backend("auto", is_macos=False, has_cliclick=False) is None
+        assert create_input_backend("none", is_macos=True, has_cliclick=True) is None
+
+    def test_unavailable_quartz_returns_none(self):
+        with patch.object(input_backends, 'QUARTZ_AVAILABLE', False):
+            assert create_input_backend("quartz", is_macos=True, has_cliclick=False) is None
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            create_input_backend("xdotool", is_macos=False, has_cliclick=False)
+
+
+class TestAutomationWithRecordingBackend:
+    """Test actions routed through an in-process backend."""
+
+    def test_actions_are_posted_in_process(self, recorded_automation):
+        """Every action type goes to the backend and nothing is spawned."""
+        with patch('modules.automation.subprocess.run') as run, \
+                patch('modules.automation.pyautogui') as mock_pyautogui:
+            recorded_automation.execute_action({"action": "click", "coordinates": [10, 20]})
+            recorded_automation.execute_action({"action": "double_click", "coordinates": [30, 40]})
+            recorded_automation.execute_action({"action": "type", "text": "hello"})
+            recorded_automation.execute_action({"action": "type", "text": "two\nlines"})
+            recorded_automation.execute_action({"action": "scroll", "direction": "left", "amount": 50})
+
+        events = recorded_automation.input_backend.events
+        assert [event['type'] for event in events] == ['click', 'double_click', 'type', 'paste', 'scroll']
+        assert events[3]['text'] == "two\nlines"
+        run.assert_not_called()
+        mock_pyautogui.click.assert_not_called()
+
+    def test_fast_path_actions_use_backend(self, recorded_automation):
+        with patch('modules.automation.time.sleep'):
+            result = recorded_automation.execute_fast_path_action('type', [100, 200], text="abc")
+
+        assert result['success']
+        assert [event['type'] for event in recorded_automation.input_backend.events] == ['click', 'type']
+
+    def test_hotkeys_use_backend(self, recorded_automation):
+        assert recorded_automation._macos_hotkey(['cmd', 'a'])
+        assert recorded_automation.input_backend.events[-1]['keys'] == ['cmd', 'a']
+
+    def test_backend_failure_falls_back(self, recorded_automation):
+        """An exception in the backend falls back to the built-in methods."""
+        recorded_automation.input_backend.click = MagicMock(side_effect=RuntimeError("no access"))
+
+        with patch('modules.automation.pyautogui') as mock_pyautogui:
+            recorded_automation.execute_action({"action": "click", "coordinates": [10, 20]})
+
+        mock_pyautogui.click.assert_called_once()
+
+    def test_in_process_backend_disables_batching(self, recorded_automation):
+        recorded_automation.is_macos = True
+        recorded_automation.has_cliclick = True
+
+        segments = recorded_automation._compile_action_sequence([
+            {"action": "click", "coordinates": [10, 20]},
+            {"action": "type", "text": "hi"}
+        ])
+
+        assert not any(segment.batched for segment in segments)
+
+
+class TestCliclickInputBackend:
+    """Test the cliclick backend command lines."""
+
+    def test_commands(self):
+        backend = CliclickInputBackend()
+        with patch('modules.input_backends.subprocess.run',
+                   return_value=subprocess.CompletedProcess([], 0, '', '')) as run:
+            assert backend.click(5, 6)
+            assert backend.hotkey(['cmd', 'shift', 'z'])
+            assert backend.paste_text("x\ny")
+            assert not backend.scroll("down", 3)
+
+        argvs = [call.args[0] for call in run.call_args_list]
+        assert argvs == [
+            ['cliclick', 'c:5,6'],
+            ['cliclick', 'kd:cmd', 'kd:shift', 'kp:z', 'ku:shift', 'ku:cmd'],
+            ['pbcopy'],
+            ['cliclick', 'kd:cmd', 't:v', 'ku:cmd']
+        ]
+
+    def test_failure_returns_false(self):
+        backend = CliclickInputBackend()
+        with patch('modules.input_backends.subprocess.run', side_effect=FileNotFoundError("cliclick")):
+            assert not backend.click(1, 1)
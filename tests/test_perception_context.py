@@ -0,0 +1,159 @@
+"""
+Unit tests for the per-command PerceptionContext
+
+Tests memoization of vision/accessibility lookups and invalidation when the
+automation module reports UI-mutating actions.
+"""
+
+import threading
+import pytest
+from unittest.mock import Mock
+
+from modules.perception_context import PerceptionContext
+from modules.vision_scheduler import VisionRequestPriority
+from modules.automation import AutomationModule
+
+
+class TestPerceptionContext:
+    """Test cases for PerceptionContext class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.vision_module = Mock()
+        self.vision_module.capture_screen_as_base64.return_value = "screenshot_b64"
+        self.vision_module.describe_screen.return_value = {"elements": [], "description": "screen"}
+
+        self.accessibility_module = Mock()
+        self.accessibility_module.get_active_application.return_value = {"name": "Safari"}
+
+        self.context = PerceptionContext(
+            "cmd_1",
+            vision_module=self.vision_module,
+            accessibility_module=self.accessibility_module
+        )
+
+    def test_describe_screen_is_memoized_per_analysis_type(self):
+        """Repeated descriptions reuse the cached result."""
+        first = self.context.describe_screen("simple")
+        second = self.context.describe_screen("simple")
+
+        assert first is second
+        self.vision_module.describe_screen.assert_called_once_with(
+            analysis_type="simple", screenshot_b64="screenshot_b64",
+            priority=VisionRequestPriority.INTERACTIVE
+        )
+
+    def test_analysis_types_share_one_screenshot_per_profile(self):
+        """Analysis types with the same encoding profile capture the screen once."""
+        self.context.describe_screen("detailed")
+        self.context.describe_screen("clickable")
+
+        assert self.vision_module.describe_screen.call_count == 2
+        self.vision_module.capture_screen_as_base64.assert_called_once()
+
+    def test_cheaper_profile_gets_its_own_screenshot(self):
+        """A type with a different encoding profile is captured separately."""
+        self.context.describe_screen("simple")
+        self.context.describe_screen("detailed")
+
+        assert self.vision_module.capture_screen_as_base64.call_count == 2
+        self.vision_module.capture_screen_as_base64.assert_any_call(analysis_type="simple")
+
+    def test_invalidate_clears_cache(self):
+        """Invalidation forces a fresh capture."""
+        self.context.describe_screen("simple")
+        self.context.invalidate("test")
+        self.context.describe_screen("simple")
+
+        assert self.vision_module.describe_screen.call_count == 2
+        assert self.vision_module.capture_screen_as_base64.call_count == 2
+        assert self.context.generation == 1
+        assert self.context.get_stats()['last_invalidation_reason'] == "test"
+
+    def test_value_computed_across_invalidation_is_not_cached(self):
+        """A result captured while the UI changed is returned but not stored."""
+        def producer():
+            self.context.invalidate("mid-capture")
+            return "stale"
+
+        assert self.context.get_accessibility_snapshot("tree", producer) == "stale"
+
+        fresh = Mock(return_value="fresh")
+        assert self.context.get_accessibility_snapshot("tree", fresh) == "fresh"
+        fresh.assert_called_once()
+
+    def test_expired_entries_are_refreshed(self):
+        """Entries older than max_age are recomputed."""
+        context = PerceptionContext("cmd_2", accessibility_module=self.accessibility_module, max_age=0)
+        context.get_active_application()
+        context.get_active_application()
+
+        assert self.accessibility_module.get_active_application.call_count >= 1
+        assert context.get_stats()['misses'] >= 1
+
+    def test_missing_modules(self):
+        """Lookups degrade gracefully when modules are not available."""
+        context = PerceptionContext("cmd_3")
+
+        assert context.get_screenshot() is None
+        assert context.get_active_application() is None
+        assert context.get_application_info() is None
+        with pytest.raises(RuntimeError):
+            context.describe_screen()
+
+    def test_stats(self):
+        """Stats report hits and misses."""
+        self.context.get_active_application()
+        self.context.get_active_application()
+
+        stats = self.context.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate_percent'] == 50.0
+        assert stats['cached_entries'] == 1
+
+
+class TestPerceptionContextAutomationIntegration:
+    """Test invalidation driven by AutomationModule notifications."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.automation_module = AutomationModule.__new__(AutomationModule)
+        self.automation_module._ui_change_listeners = []
+        self.automation_module._ui_listener_lock = threading.Lock()
+
+        self.accessibility_module = Mock()
+        self.accessibility_module.get_active_application.return_value = {"name": "Finder"}
+        self.context = PerceptionContext("cmd_4", accessibility_module=self.accessibility_module)
+
+    def test_ui_change_invalidates_attached_context(self):
+        """Automation actions invalidate the attached context."""
+        self.context.attach(self.automation_module)
+        self.context.get_active_application()
+
+        self.automation_module._notify_ui_changed("click")
+
+        assert self.context.generation == 1
+        assert self.context.get_stats()['last_invalidation_reason'] == "automation:click"
+        assert self.context.get_stats()['cached_entries'] == 0
+
+    def test_detach_stops_notifications(self):
+        """Detached contexts no longer receive notifications."""
+        self.context.attach(self.automation_module)
+        self.context.detach()
+
+        self.automation_module._notify_ui_changed("type")
+
+        assert self.context.generation == 0
+        assert self.automation_module._ui_change_listeners == []
+
+    def test_listener_errors_are_swallowed(self):
+        """A failing listener does not break automation."""
+        failing = Mock(side_effect=Exception("boom"))
+        self.automation_module.add_ui_change_listener(failing)
+        self.context.attach(self.automation_module)
+
+        self.automation_module._notify_ui_changed("scroll")
+
+        failing.assert_called_once_with("scroll")
+        assert self.context.generation == 1
@@ -0,0 +1,147 @@
+"""
+Unit tests for screenshot encoding profiles
+
+Tests per-analysis-type profile selection, encoding and auto-tuning from
+recorded accuracy/latency observations.
+"""
+
+import base64
+import io
+import os
+import tempfile
+from PIL import Image
+
+from modules.screenshot_profiles import (
+    ScreenshotProfile,
+    ScreenshotProfileManager,
+    calibrate_profiles,
+    element_overlap_score
+)
+
+
+class TestScreenshotProfile:
+    """Test cases for ScreenshotProfile."""
+
+    def test_encode_resizes_and_converts(self):
+        """Encoding respects max size and grayscale settings."""
+        img = Image.new("RGB", (2000, 1000), (200, 10, 10))
+        profile = ScreenshotProfile(max_size=500, quality=50, grayscale=True)
+
+        decoded = Image.open(io.BytesIO(base64.b64decode(profile.encode(img))))
+
+        assert decoded.size == (500, 250)
+        assert decoded.mode == "L"
+
+    def test_smaller_profile_gives_smaller_payload(self):
+        """Cheaper profiles produce smaller payloads."""
+        img = Image.effect_noise((1920, 1080), 40).convert("RGB")
+        full = ScreenshotProfile(max_size=1920, quality=85)
+        cheap = ScreenshotProfile(max_size=1024, quality=55)
+
+        assert len(cheap.encode(img)) < len(full.encode(img))
+
+    def test_key_and_round_trip(self):
+        """Profiles serialize and keep a stable key."""
+        profile = ScreenshotProfile(max_size=1280, quality=60, grayscale=True)
+
+        assert profile.key == "1280px_q60_gray"
+        assert ScreenshotProfile.from_dict(profile.to_dict()) == profile
+
+
+class TestScreenshotProfileManager:
+    """Test cases for ScreenshotProfileManager."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.manager = ScreenshotProfileManager(
+            profiles={"simple": {"max_size": 1280, "quality": 60}},
+            calibration_file=None,
+            min_accuracy=0.9
+        )
+
+    def test_get_profile(self):
+        """Configured profiles are returned per type, default otherwise."""
+        assert self.manager.get_profile("simple").max_size == 1280
+        assert self.manager.get_profile("unknown") == self.manager.default_profile
+        assert self.manager.get_profile(None) == self.manager.default_profile
+
+    def test_tune_picks_fastest_accurate_profile(self):
+        """Tuning selects the lowest latency profile meeting the accuracy target."""
+        fast_inaccurate = ScreenshotProfile(max_size=768, quality=50, grayscale=True)
+        fast_accurate = ScreenshotProfile(max_size=1024, quality=55)
+        slow_accurate = ScreenshotProfile(max_size=1920, quality=85)
+
+        self.manager.record_observation("simple", fast_inaccurate, accuracy=0.6, latency=1.0)
+        self.manager.record_observation("simple", fast_accurate, accuracy=0.95, latency=2.0)
+        self.manager.record_observation("simple", slow_accurate, accuracy=1.0, latency=4.0)
+
+        tuned = self.manager.tune()
+
+        assert tuned["simple"] == fast_accurate
+        assert self.manager.get_profile("simple") == fast_accurate
+
+    def test_tune_keeps_base_profile_when_nothing_is_accurate(self):
+        """No tuned profile is applied if every candidate is too inaccurate."""
+        self.manager.record_observation("simple", ScreenshotProfile(768, 50, True), accuracy=0.2, latency=1.0)
+
+        assert self.manager.tune() == {}
+        assert self.manager.get_profile("simple").max_size == 1280
+
+    def test_coordinate_types_keep_full_size(self):
+        """Analysis types returning coordinates are never downscaled."""
+        manager = ScreenshotProfileManager(
+            profiles={"form": {"max_size": 1600, "quality": 75}},
+            calibration_file=None,
+            min_accuracy=0.9,
+            coordinate_types=["form"]
+        )
+        assert manager.get_profile("form") == ScreenshotProfile(max_size=1920, quality=75)
+
+        full_size_q70 = ScreenshotProfile(max_size=1920, quality=70)
+        manager.record_observation("form", ScreenshotProfile(max_size=1024, quality=55), accuracy=1.0, latency=1.0)
+        manager.record_observation("form", full_size_q70, accuracy=0.95, latency=2.0)
+
+        assert manager.tune()["form"] == full_size_q70
+
+    def test_calibration_file_round_trip(self):
+        """Saved calibrations are loaded and applied by a new manager."""
+        profile = ScreenshotProfile(max_size=1024, quality=55)
+        self.manager.record_observation("simple", profile, accuracy=0.97, latency=1.5)
+        self.manager.tune()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "calibration.json")
+            self.manager.save_calibration(path)
+
+            loaded = ScreenshotProfileManager(calibration_file=path, min_accuracy=0.9)
+
+        assert loaded.get_profile("simple") == profile
+        assert loaded.get_stats()["observations"] == 1
+
+
+class TestCalibration:
+    """Test cases for the calibration helpers."""
+
+    def test_element_overlap_score(self):
+        """Scores are Jaccard similarity of element labels."""
+        reference = {"elements": [{"text": "OK"}, {"text": "Cancel"}]}
+
+        assert element_overlap_score(reference, reference) == 1.0
+        assert element_overlap_score(reference, {"elements": [{"text": "ok"}]}) == 0.5
+        assert element_overlap_score({}, {}) == 1.0
+
+    def test_calibrate_profiles_records_every_candidate(self):
+        """Each candidate is scored against the full-fidelity reference."""
+        manager = ScreenshotProfileManager(calibration_file=None, min_accuracy=0.9)
+        candidates = [ScreenshotProfile(640, 40, True), ScreenshotProfile(1920, 85)]
+
+        def analyze(screenshot_b64, analysis_type):
+            img = Image.open(io.BytesIO(base64.b64decode(screenshot_b64)))
+            labels = ["title", "button"] if img.width >= 1000 else ["title"]
+            return {"elements": [{"text": label} for label in labels]}
+
+        images = [Image.new("RGB", (1920, 1080), (255, 255, 255))]
+        tuned = calibrate_profiles(images, ["simple"], analyze, element_overlap_score, manager, candidates)
+
+        assert manager.get_stats()["observations"] == 2
+        assert tuned["simple"] == candidates[1]
@@ -0,0 +1,137 @@
+# tests/test_selection_capture.py
+"""
+Unit tests for hedged selected-text capture.
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from modules.accessibility import AccessibilityModule, AccessibilityPermissionError
+from modules.selection_capture import HedgedSelectionCapture, ACCESSIBILITY_METHOD, CLIPBOARD_METHOD
+
+
+def slow(value, delay, calls=None):
+    """Capture method returning value after delay."""
+    def read():
+        if calls is not None:
+            calls.append(time.perf_counter())
+        time.sleep(delay)
+        if isinstance(value, Exception):
+            raise value
+        return value
+    return read
+
+
+@pytest.fixture
+def hedged():
+    capture = HedgedSelectionCapture(initial_delay=0.05, min_delay=0.01, max_delay=0.3)
+    yield capture
+    capture.shutdown()
+
+
+class TestHedgedSelectionCapture:
+    """Test cases for HedgedSelectionCapture."""
+
+    def test_fast_accessibility_wins_without_clipboard(self, hedged):
+        clipboard = Mock(return_value="clipboard")
+
+        outcome = hedged.capture(slow("ax", 0.005), clipboard, "com.apple.TextEdit")
+
+        assert outcome.text == "ax" and outcome.method == ACCESSIBILITY_METHOD
+        assert not outcome.clipboard_started
+        clipboard.assert_not_called()
+
+    def test_clipboard_started_after_hedge_delay(self, hedged):
+        outcome = hedged.capture(slow("ax", 0.3), slow("clipboard", 0.02), "com.tinyspeck.slackmacgap")
+
+        assert outcome.method == CLIPBOARD_METHOD
+        assert outcome.clipboard_started
+        assert 0.05 <= outcome.elapsed < 0.2
+
+    def test_empty_accessibility_read_starts_clipboard_at_once(self, hedged):
+        started = []
+
+        start = time.perf_counter()
+        outcome = hedged.capture(slow(None, 0.0), slow("clipboard", 0.0, started), "app")
+
+        assert outcome.text == "clipboard"
+        assert started[0] - start < 0.04
+
+    def test_delay_learned_per_app(self, hedged):
+        for _ in range(5):
+            hedged.capture(slow(None, 0.0), slow("clipboard", 0.0), "electron")
+            hedged.capture(slow("ax", 0.03), slow("clipboard", 0.0), "native")
+        time.sleep(0.01)
+
+        assert hedged.hedge_delay("electron") == 0.0
+        assert 0.05 < hedged.hedge_delay("native") < 0.1
+        assert hedged.hedge_delay("new app") == 0.05
+        stats = hedged.get_stats()
+        assert stats["electron"]["wins"] == {ACCESSIBILITY_METHOD: 0, CLIPBOARD_METHOD: 5}
+
+    def test_loser_accessibility_read_still_learned(self, hedged):
+        hedged.capture(slow("ax", 0.15), slow("clipboard", 0.0), "app")
+        time.sleep(0.2)
+
+        profile = hedged.get_stats()["app"]
+        assert profile["accessibility_latency"] >= 0.15
+        assert profile["wins"][CLIPBOARD_METHOD] == 1
+
+    def test_no_selection_reports_both_results(self, hedged):
+        outcome = hedged.capture(slow(AccessibilityPermissionError("denied"), 0.0), slow(None, 0.0), "app")
+
+        assert outcome.method is None
+        assert isinstance(outcome.accessibility.error, AccessibilityPermissionError)
+        assert outcome.clipboard.error is None and outcome.clipboard.text is None
+
+
+class TestAccessibilityHedgedCapture:
+    """AccessibilityModule.get_selected_text with hedged capture."""
+
+    @pytest.fixture
+    def accessibility_module(self):
+        with patch('modules.accessibility.ACCESSIBILITY_AVAILABLE', True):
+            with patch('modules.accessibility.AXUIElementCreateSystemWide', create=True):
+                with patch('modules.accessibility.NSWorkspace', create=True):
+                    module = AccessibilityModule()
+                    module.accessibility_enabled = True
+                    module.degraded_mode = False
+        module.selection_capture = HedgedSelectionCapture(initial_delay=0.05)
+        module.workspace = Mock()
+        module.workspace.frontmostApplication.return_value.bundleIdentifier.return_value = "com.microsoft.VSCode"
+        yield module
+        module.selection_capture.shutdown()
+
+    def test_slow_accessibility_read_raced_by_clipboard(self, accessibility_module):
+        automation = Mock()
+        automation.get_selected_text_via_clipboard.return_value = "clipboard text"
+        accessibility_module._automation_module = automation
+        release = threading.Event()
+
+        with patch.object(accessibility_module, 'get_selected_text_via_accessibility', side_effect=release.wait):
+            with patch.object(accessibility_module, '_log_performance_metrics') as log:
+                start = time.perf_counter()
+                result = accessibility_module.get_selected_text()
+                elapsed = time.perf_counter() - start
+        release.set()
+
+        assert result == "clipboard text"
+        assert elapsed < 0.5
+        assert accessibility_module.last_text_capture_method == CLIPBOARD_METHOD
+        metrics = log.call_args[0][3]
+        assert metrics['method_used'] == CLIPBOARD_METHOD
+        assert metrics['app'] == "com.microsoft.VSCode"
+
+    def test_both_failed_raises_clipboard_error(self, accessibility_module):
+        automation = Mock()
+        automation.get_selected_text_via_clipboard.side_effect = Exception("pasteboard locked")
+        accessibility_module._automation_module = automation
+
+        with patch.object(accessibility_module, 'get_selected_text_via_accessibility',
+                          side_effect=RuntimeError("AX error -25204")):
+            with patch.object(accessibility_module, '_log_performance_metrics'):
+                with pytest.raises(Exception, match="Cannot access clipboard"):
+                    accessibility_module.get_selected_text()
@@ -0,0 +1,194 @@
+"""
+Unit tests for speculative screen perception
+
+Tests background analysis started on wake word, reuse by describe_screen,
+and discarding on screen changes, expiry and non-vision intents.
+"""
+
+import base64
+import io
+import threading
+import time
+from unittest.mock import Mock, patch
+from PIL import Image
+
+from modules.speculative_perception import (
+    SpeculativePerception,
+    screen_fingerprint,
+    screens_match
+)
+from modules.vision import VisionModule
+from modules.vision_scheduler import VisionRequestPriority, VisionRequestScheduler
+
+
+def _screenshot(color=(255, 255, 255), box_color=None):
+    """Create a base64 JPEG screenshot."""
+    img = Image.new("RGB", (640, 400), color)
+    if box_color:
+        img.paste(box_color, (0, 0, 640, 200))
+    buffer = io.BytesIO()
+    img.save(buffer, format="JPEG", quality=80)
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+class TestScreenFingerprint:
+    """Test cases for screen fingerprint helpers."""
+
+    def test_same_screen_matches(self):
+        """Identical screenshots match."""
+        screenshot = _screenshot()
+        assert screens_match(screen_fingerprint(screenshot), screen_fingerprint(screenshot))
+
+    def test_changed_screen_does_not_match(self):
+        """A large visual change is detected."""
+        before = screen_fingerprint(_screenshot())
+        after = screen_fingerprint(_screenshot(box_color=(0, 0, 0)))
+        assert not screens_match(before, after)
+
+    def test_invalid_screenshot(self):
+        """Undecodable screenshots never match."""
+        assert screen_fingerprint("not-an-image") is None
+        assert not screens_match(None, None)
+
+
+class TestSpeculativePerception:
+    """Test cases for SpeculativePerception class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.screenshot = _screenshot()
+        self.vision_module = Mock()
+        self.vision_module.capture_screen_as_base64.return_value = self.screenshot
+        self.vision_module.describe_screen.return_value = {"elements": [{"text": "OK"}]}
+        self.speculative = SpeculativePerception(analysis_types=["simple"], ttl=20.0, wait_timeout=2.0)
+
+    def test_start_runs_background_analysis(self):
+        """Analysis runs at background priority without recursing into itself."""
+        assert self.speculative.start(self.vision_module)
+
+        result = self.speculative.lookup("simple", self.screenshot)
+
+        assert result == {"elements": [{"text": "OK"}]}
+        self.vision_module.describe_screen.assert_called_once_with(
+            analysis_type="simple",
+            screenshot_b64=self.screenshot,
+            priority=VisionRequestPriority.BACKGROUND,
+            use_speculative=False
+        )
+        assert self.speculative.get_stats()['hits'] == 1
+
+    def test_lookup_waits_for_in_flight_analysis(self):
+        """A lookup during analysis waits for the result."""
+        release = threading.Event()
+
+        def slow_describe(**kwargs):
+            release.wait(2.0)
+            return {"elements": []}
+
+        self.vision_module.describe_screen.side_effect = slow_describe
+        self.speculative.start(self.vision_module)
+        threading.Timer(0.05, release.set).start()
+
+        assert self.speculative.lookup("simple", self.screenshot) == {"elements": []}
+
+    def test_changed_screen_is_discarded(self):
+        """Results for an outdated screen are dropped."""
+        self.speculative.start(self.vision_module)
+
+        assert self.speculative.lookup("simple", _screenshot(box_color=(0, 0, 0))) is None
+        assert self.speculative.get_stats()['discarded_changed'] == 1
+        assert self.speculative.lookup("simple", self.screenshot) is None
+
+    def test_expired_results_are_discarded(self):
+        """Results older than the TTL are not reused."""
+        speculative = SpeculativePerception(analysis_types=["simple"], ttl=-1.0, wait_timeout=2.0)
+        speculative.start(self.vision_module)
+
+        assert speculative.lookup("simple", self.screenshot) is None
+        assert speculative.get_stats()['expired'] == 1
+
+    def test_discard_for_non_vision_intent(self):
+        """Discarding drops results and counts intent discards."""
+        self.speculative.start(self.vision_module)
+        self.speculative.discard("intent:conversational_chat")
+
+        assert self.speculative.lookup("simple", self.screenshot) is None
+        assert self.speculative.get_stats()['discarded_intent'] == 1
+
+    def test_discard_cancels_in_flight_request(self):
+        """A discarded analysis is dropped and frees the vision scheduler's only slot when its call returns."""
+        scheduler = VisionRequestScheduler(max_concurrent=1, queue_wait_timeout=5.0)
+        started = threading.Event()
+        release = threading.Event()
+
+        def background_describe(**kwargs):
+            return scheduler.run(lambda: started.set() or release.wait(5.0), priority=kwargs['priority'])
+
+        self.vision_module.describe_screen.side_effect = background_describe
+        with patch('modules.speculative_perception.vision_scheduler', scheduler):
+            self.speculative.start(self.vision_module)
+            assert started.wait(2.0)
+            self.speculative.discard("intent:conversational_chat")
+
+        interactive = []
+        waiter = threading.Thread(target=lambda: interactive.append(scheduler.run(lambda: "interactive")))
+        waiter.start()
+        release.set()
+        waiter.join(2.0)
+        for thread in threading.enumerate():
+            if thread.name == "SpeculativePerception":
+                thread.join(2.0)
+
+        assert interactive == ["interactive"]
+        assert scheduler.get_metrics()['cancelled'] == 1
+        assert self.speculative.get_stats()['failed'] == 0
+
+    def test_discarded_request_is_not_rerun(self):
+        """describe_screen doesn't retry an analysis cancelled by discard."""
+        scheduler = VisionRequestScheduler(max_concurrent=1, queue_wait_timeout=5.0)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def analyze(analysis_type, screenshot_b64, hints=None):
+            calls.append(time.time())
+            started.set()
+            release.wait(5.0)
+            return {"elements": []}
+
+        with patch('modules.vision.mss.mss'):
+            vision_module = VisionModule()
+        vision_module._scheduler = scheduler
+        with patch.object(vision_module, 'capture_screen_as_base64', return_value=self.screenshot), \
+                patch.object(vision_module, '_request_screen_analysis', side_effect=analyze), \
+                patch('modules.speculative_perception.vision_scheduler', scheduler):
+            self.speculative.start(vision_module)
+            assert started.wait(2.0)
+            self.speculative.discard("intent:conversational_chat")
+            release.set()
+            for thread in threading.enumerate():
+                if thread.name == "SpeculativePerception":
+                    thread.join(5.0)
+                    assert not thread.is_alive()
+
+        assert len(calls) == 1
+        assert scheduler.get_metrics()['running'] == 0
+
+    def test_unrequested_type_is_not_served(self):
+        """Only precomputed analysis types are served."""
+        self.speculative.start(self.vision_module)
+        assert self.speculative.lookup("detailed", self.screenshot) is None
+
+    def test_failed_analysis_is_a_miss(self):
+        """A failing background analysis falls through to a normal request."""
+        self.vision_module.describe_screen.side_effect = Exception("vision down")
+        self.speculative.start(self.vision_module)
+
+        assert self.speculative.lookup("simple", self.screenshot) is None
+        stats = self.speculative.get_stats()
+        assert stats['failed'] == 1
+        assert stats['misses'] == 1
+
+    def test_start_without_vision_module(self):
+        """Nothing starts without a vision module."""
+        assert not self.speculative.start(None)
@@ -0,0 +1,107 @@
+"""
+Unit tests for in-memory speech preprocessing
+
+Tests conversion, filtering and normalization of recorded buffers into
+Whisper input arrays, and the opt-in debug audio ring buffer.
+"""
+
+import tempfile
+import wave
+import pytest
+import numpy as np
+
+from modules.speech_preprocessing import (
+    DebugAudioRing,
+    audio_stats,
+    high_pass_filter,
+    normalize_peak,
+    prepare_whisper_input,
+    to_float32
+)
+
+
+def _tone(frequency, seconds=2.0, sample_rate=16000, amplitude=0.2):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+class TestSpeechPreprocessing:
+    """Test cases for the Whisper input pipeline."""
+
+    def test_int16_is_converted_to_float32(self):
+        """int16 recordings are scaled to [-1, 1] floats."""
+        samples = to_float32(np.array([0, 16384, -32768], dtype=np.int16))
+
+        assert samples.dtype == np.float32
+        assert np.allclose(samples, [0.0, 0.5, -1.0])
+
+    def test_float32_is_not_copied(self):
+        """float32 recordings are processed in place."""
+        audio = _tone(440)
+        assert np.shares_memory(to_float32(audio), audio)
+
+    def test_high_pass_removes_low_frequencies(self):
+        """Content below the cutoff is attenuated, speech band is kept."""
+        low = high_pass_filter(_tone(20), 80.0, 16000)
+        speech = high_pass_filter(_tone(1000), 80.0, 16000)
+
+        assert np.abs(low[8000:]).max() < 0.1
+        assert np.abs(speech[8000:]).max() > 0.19
+
+    def test_normalize_peak(self):
+        """Peaks are scaled to full scale minus headroom; silence is untouched."""
+        normalized = normalize_peak(_tone(440, amplitude=0.05), 0.1)
+        assert np.abs(normalized).max() == pytest.approx(10 ** (-0.1 / 20), rel=1e-4)
+
+        silence = np.zeros(100, dtype=np.float32)
+        assert not normalize_peak(silence, 0.1).any()
+
+    def test_prepare_whisper_input(self):
+        """Recorded int16 audio becomes a normalized float32 16 kHz array."""
+        recording = (_tone(440) * 32767).astype(np.int16)
+
+        whisper_input = prepare_whisper_input(recording, 16000)
+
+        assert whisper_input.dtype == np.float32
+        assert whisper_input.shape == (32000,)
+        assert np.abs(whisper_input).max() == pytest.approx(10 ** (-0.1 / 20), rel=1e-4)
+
+    def test_prepare_resamples_to_16k(self):
+        """Recordings at other rates are resampled for Whisper."""
+        whisper_input = prepare_whisper_input(_tone(440, sample_rate=48000), 48000)
+        assert whisper_input.shape == (32000,)
+
+    def test_audio_stats(self):
+        """Stats report duration, RMS and peak."""
+        stats = audio_stats(_tone(440, seconds=1.0, amplitude=0.5))
+
+        assert stats['duration'] == 1.0
+        assert stats['peak'] == pytest.approx(0.5, rel=1e-3)
+        assert stats['rms'] == pytest.approx(0.5 / np.sqrt(2), rel=1e-3)
+
+
+class TestDebugAudioRing:
+    """Test cases for DebugAudioRing class."""
+
+    def test_ring_is_bounded(self):
+        """Only the most recent utterances are kept."""
+        ring = DebugAudioRing(capacity=2)
+        for index in range(3):
+            ring.add(_tone(440, seconds=0.1), metadata={'index': index})
+
+        assert [entry['metadata']['index'] for entry in ring.get_recent()] == [1, 2]
+
+    def test_dump_writes_wav_files(self):
+        """Dumping writes 16-bit mono WAV files."""
+        ring = DebugAudioRing(capacity=2)
+        ring.add(_tone(440, seconds=0.5))
+        ring.annotate_latest(text="hello")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = ring.dump(tmp)
+            with wave.open(paths[0], "rb") as wav_file:
+                assert wav_file.getnchannels() == 1
+                assert wav_file.getsampwidth() == 2
+                assert wav_file.getnframes() == 8000
+
+        assert ring.get_recent()[0]['metadata'] == {'text': 'hello'}
@@ -0,0 +1,259 @@
+"""
+Unit tests for streaming LLM-to-speech
+
+Feeds fake token streams (optionally with per-token latency) through the
+sentence chunker, SpeechStream and the handler streaming paths, with a
+recording speaker in place of text-to-speech.
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+
+from modules.speech_stream import SpeechStream
+from modules.tts_pipeline import SentenceChunker, PipelinedSpeaker
+from tests.test_tts_pipeline import FakeBackend
+
+ANSWER = ("Paris is the capital of France. It has been the capital since the tenth century. "
+          "It is also the largest city in the country. About two million people live there.")
+
+
+def tokens(text, delay=0.0, fail_after=None):
+    """Yield text in small word-sized deltas, like an LLM stream."""
+    for index, word in enumerate(text.split(" ")):
+        if fail_after is not None and index == fail_after:
+            raise ConnectionError("stream interrupted")
+        if delay:
+            time.sleep(delay)
+        yield word if index == 0 else " " + word
+
+
+class RecordingAudioModule:
+    """Speaks sentences by recording them."""
+
+    def __init__(self):
+        self.spoken = []
+        self.done = threading.Event()
+
+    def speak_sentences(self, sentences):
+        for sentence in sentences:
+            self.spoken.append(sentence)
+        self.done.set()
+
+
+class TestSentenceChunker:
+    """Test cases for SentenceChunker class."""
+
+    def test_sentences_returned_when_next_one_starts(self):
+        """A sentence is complete once the next sentence begins."""
+        chunker = SentenceChunker()
+
+        assert chunker.feed("Hello there. How") == ["Hello there."]
+        assert chunker.feed(" are you?") == []
+        assert chunker.flush() == ["How are you?"]
+
+    def test_list_items_and_lines(self):
+        """Line breaks end sentences and list markers stay with their item."""
+        chunker = SentenceChunker()
+        sentences = []
+        for delta in tokens("Steps:\n1. Open the menu\n2. Click save, e.g. with the mouse"):
+            sentences.extend(chunker.feed(delta))
+        sentences.extend(chunker.flush())
+
+        assert sentences == ["Steps:", "1. Open the menu", "2. Click save, e.g. with the mouse"]
+
+    def test_long_text_without_boundary_is_split(self):
+        """Text is not held back indefinitely when no sentence end arrives."""
+        chunker = SentenceChunker(max_chars=40)
+
+        sentences = chunker.feed("first clause goes here, second clause follows, third one is longer")
+
+        assert sentences and all(len(sentence) <= 40 for sentence in sentences)
+
+
+class TestSpeechStream:
+    """Test cases for SpeechStream class."""
+
+    def test_first_sentence_independent_of_length(self):
+        """The first sentence is ready after its own tokens, not the whole answer."""
+        long_answer = " ".join([ANSWER] * 5)
+        stream = SpeechStream()
+        feeder = threading.Thread(target=stream.feed, args=(tokens(long_answer, delay=0.005),))
+        feeder.start()
+
+        assert stream.wait_for_first_sentence(2.0)
+        assert not stream.finished
+        feeder.join(5.0)
+
+        assert stream.time_to_first_sentence < 0.25  # the whole answer takes ~0.75s
+        assert list(stream) == stream.sentences
+        assert stream.text == long_answer
+
+    def test_transform_applied_per_sentence(self):
+        """Post-processing runs on each sentence as it completes."""
+        stream = SpeechStream(transform=str.upper)
+
+        stream.feed(tokens(ANSWER))
+
+        assert stream.sentences[0] == "PARIS IS THE CAPITAL OF FRANCE."
+        assert len(stream.sentences) == 4
+
+    def test_budget_stops_reading_the_stream(self):
+        """Once the length budget is reached the LLM stream is closed."""
+        closed = []
+
+        def generator():
+            try:
+                yield from tokens(ANSWER)
+            finally:
+                closed.append(True)
+
+        stream = SpeechStream(max_chars=60)
+        stream.feed(generator())
+
+        assert stream.truncated
+        assert stream.sentences == ["Paris is the capital of France."]
+        assert closed == [True]
+
+    def test_error_before_first_sentence_is_raised(self):
+        """The caller can fall back when nothing has been emitted."""
+        stream = SpeechStream()
+
+        with pytest.raises(ConnectionError):
+            stream.feed(tokens(ANSWER, fail_after=3))
+
+        assert not stream.wait_for_first_sentence(0.1)
+        assert list(stream) == []
+
+    def test_error_after_first_sentence_keeps_spoken_text(self):
+        """A stream that fails mid-answer ends after the sentences already emitted."""
+        stream = SpeechStream()
+
+        text = stream.feed(tokens(ANSWER, fail_after=8))
+
+        assert text == "Paris is the capital of France."
+        assert "stream interrupted" in stream.error
+
+    def test_sentences_piped_into_pipelined_speaker(self):
+        """The speaker starts synthesizing before the stream has finished."""
+        backend = FakeBackend(synth_latency=0.01, play_duration=0.01)
+        speaker = PipelinedSpeaker(backend)
+        stream = SpeechStream()
+        feeder = threading.Thread(target=stream.feed, args=(tokens(ANSWER, delay=0.01),))
+        feeder.start()
+
+        result = speaker.speak_sentences(stream)
+        feeder.join(2.0)
+
+        assert result.spoken == result.sentences == 4
+        assert backend.times('synth_start')[0] < backend.times('synth_start')[-1] - 0.05
+
+
+class TestStreamQuery:
+    """Test streamed responses from ReasoningModule."""
+
+    def test_role_prefix_removed_across_chunks(self):
+        """A role prefix split over several chunks is not spoken."""
+        from modules.reasoning import ReasoningModule
+
+        module = ReasoningModule.__new__(ReasoningModule)
+        module.api_base = "http://localhost:11434"
+        module.api_key = "key"
+        module.model = "test-model"
+        module.ollama_client = Mock()
+        module.ollama_client.chat.return_value = iter(
+            {'message': {'content': piece}} for piece in ["AU", "RA: ", "Hello", " there."]
+        )
+
+        with patch.object(ReasoningModule, '_build_conversational_prompt', return_value="prompt"), \
+             patch.object(ReasoningModule, '_get_prompt_template', return_value="template"):
+            deltas = list(module.stream_query("hi", prompt_template='CONVERSATIONAL_PROMPT'))
+
+        assert "".join(deltas) == "Hello there."
+        assert module.ollama_client.chat.call_args.kwargs['stream'] is True
+
+
+class TestHandlerStreaming:
+    """Test the streaming paths of the response handlers."""
+
+    def _orchestrator(self, stream_query):
+        orchestrator = Mock()
+        orchestrator.feedback_module = None
+        orchestrator.audio_module = RecordingAudioModule()
+        orchestrator.reasoning_module = Mock()
+        orchestrator.reasoning_module.stream_query.side_effect = stream_query
+        return orchestrator
+
+    def test_conversation_spoken_while_generated(self):
+        """The conversation response is spoken from the stream, not after process_query."""
+        from handlers.conversation_handler import ConversationHandler
+
+        orchestrator = self._orchestrator(lambda **kwargs: tokens(ANSWER, delay=0.002))
+        handler = ConversationHandler(orchestrator)
+
+        result = handler.handle("Tell me about Paris", {'execution_id': 'test'})
+
+        assert result['status'] == 'success'
+        assert result['response'] == ANSWER
+        assert orchestrator.audio_module.done.wait(2.0)
+        assert orchestrator.audio_module.spoken[0] == "Paris is the capital of France."
+        orchestrator.reasoning_module.process_query.assert_not_called()
+
+    def test_conversation_falls_back_when_stream_fails(self):
+        """A stream that fails before the first sentence uses the normal path."""
+        from handlers.conversation_handler import ConversationHandler
+
+        orchestrator = self._orchestrator(lambda **kwargs: tokens(ANSWER, fail_after=0))
+        orchestrator.reasoning_module.process_query.return_value = "Hello there."
+        orchestrator.audio_module.text_to_speech = Mock()
+        handler = ConversationHandler(orchestrator)
+
+        result = handler.handle("Hello", {'execution_id': 'test'})
+
+        assert result['response'] == "Hello there."
+        orchestrator.audio_module.text_to_speech.assert_called_once_with("Hello there.")
+        assert orchestrator.audio_module.spoken == []
+
+    def test_explanation_sentences_cleaned_for_speech(self):
+        """Wrapper text and markdown are removed from streamed explanation sentences."""
+        from handlers.explain_selection_handler import ExplainSelectionHandler
+
+        response = "Here's an explanation: **Recursion** means a function calls itself. It stops at a base case."
+        orchestrator = self._orchestrator(lambda **kwargs: tokens(response))
+        handler = ExplainSelectionHandler(orchestrator)
+
+        with patch('modules.performance_monitor.get_performance_monitor', return_value=None):
+            explanation = handler._stream_explanation("def f(n): return f(n - 1)", "explain this")
+
+        assert orchestrator.audio_module.done.wait(2.0)
+        assert orchestrator.audio_module.spoken == [
+            "Recursion means a function calls itself.", "It stops at a base case."
+        ]
+        assert explanation == "Recursion means a function calls itself. It stops at a base case."
+
+    def test_summary_streaming_times_out_without_speaking(self):
+        """A summary whose first sentence doesn't arrive in time is not spoken."""
+        from handlers.question_answering_handler import QuestionAnsweringHandler
+
+        def slow_tokens(**kwargs):
+            time.sleep(0.3)
+            yield from tokens(ANSWER)
+
+        handler = QuestionAnsweringHandler(Mock())
+        handler._reasoning_module = Mock()
+        handler._reasoning_module.stream_query.side_effect = slow_tokens
+        handler._audio_module = RecordingAudioModule()
+
+        stream_llm_to_speech = handler._stream_llm_to_speech
+
+        def short_timeout(tokens, **kwargs):
+            return stream_llm_to_speech(tokens, **{**kwargs, 'first_sentence_timeout': 0.1})
+
+        with patch.object(handler, '_stream_llm_to_speech', side_effect=short_timeout):
+            assert handler._stream_summary(ANSWER * 3, "what is this page about") is None
+
+        time.sleep(0.5)
+        assert handler._audio_module.spoken == []
+        assert not handler._result_spoken
@@ -0,0 +1,232 @@
+"""
+Unit tests for streaming transcription
+
+Tests incremental passes, segment commits and finalization of the
+StreamingTranscriber, and replays recorded WAV files through a fake
+sd.InputStream to validate streaming speech_to_text end to end.
+"""
+
+import os
+import tempfile
+import threading
+import time
+import wave
+import pytest
+import numpy as np
+from unittest.mock import patch
+
+from modules.streaming_transcriber import StreamingTranscriber, PartialTranscript
+
+SAMPLE_RATE = 16000
+
+
+def _render_utterance(word_count=5, word_seconds=0.4, gap_seconds=0.25):
+    """Render 'speech': one tone burst per word, each at its own frequency."""
+    rng = np.random.default_rng(0)
+    parts = [0.002 * rng.standard_normal(int(0.5 * SAMPLE_RATE))]
+    for index in range(word_count):
+        t = np.arange(int(word_seconds * SAMPLE_RATE)) / SAMPLE_RATE
+        parts.append(0.3 * np.sin(2 * np.pi * (300 + 100 * index) * t))
+        parts.append(0.002 * rng.standard_normal(int(gap_seconds * SAMPLE_RATE)))
+    parts.append(0.002 * rng.standard_normal(int(1.5 * SAMPLE_RATE)))
+    return np.concatenate(parts).astype(np.float32)
+
+
+def _write_wav(path, samples):
+    with wave.open(path, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(SAMPLE_RATE)
+        wav_file.writeframes((samples * 32767).astype(np.int16).tobytes())
+
+
+def _read_wav(path):
+    with wave.open(path, "rb") as wav_file:
+        frames = wav_file.readframes(wav_file.getnframes())
+    return np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+class FakeWhisperModel:
+    """Names each tone burst 'word<k>' from its frequency, one segment per word."""
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def transcribe(self, audio, **kwargs):
+        with self.lock:
+            self.calls.append(len(audio))
+        frame = int(0.05 * SAMPLE_RATE)
+        frames = len(audio) // frame
+        active = [np.sqrt(np.mean(audio[i * frame:(i + 1) * frame] ** 2)) > 0.05 for i in range(frames)]
+
+        segments, index = [], 0
+        while index < frames:
+            if not active[index]:
+                index += 1
+                continue
+            start = index
+            while index < frames and active[index]:
+                index += 1
+            burst = audio[start * frame:index * frame]
+            spectrum = np.abs(np.fft.rfft(burst))
+            frequency = np.argmax(spectrum) * SAMPLE_RATE / len(burst)
+            word = f"word{int(round((frequency - 300) / 100))}"
+            segments.append({"text": f" {word}", "start": start * 0.05, "end": index * 0.05 + 0.1})
+
+        return {"text": "".join(s["text"] for s in segments), "segments": segments}
+
+
+class FakeInputStream:
+    """sd.InputStream replacement that replays samples at 10x real time."""
+
+    source = np.zeros(0, dtype=np.float32)
+
+    def __init__(self, samplerate, channels, dtype, blocksize):
+        self.position = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def read(self, frames):
+        time.sleep(frames / SAMPLE_RATE / 10)
+        chunk = np.zeros(frames, dtype=np.float32)
+        available = self.source[self.position:self.position + frames]
+        chunk[:len(available)] = available
+        self.position += frames
+        return chunk.reshape(-1, 1), False
+
+
+class TestStreamingTranscriber:
+    """Test cases for StreamingTranscriber class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.model = FakeWhisperModel()
+        self.partials = []
+        self.audio = _render_utterance()
+        self.transcriber = StreamingTranscriber(
+            lambda samples, prompt: self.model.transcribe(samples),
+            sample_rate=SAMPLE_RATE,
+            step_seconds=0.5,
+            min_audio_seconds=0.5,
+            on_partial=self.partials.append
+        )
+
+    def _feed_paced(self, audio):
+        chunk = int(0.1 * SAMPLE_RATE)
+        for start in range(0, len(audio), chunk):
+            self.transcriber.feed(audio[start:start + chunk])
+            time.sleep(0.01)
+
+    def test_streaming_commits_and_finalizes_tail(self):
+        """Agreed segments are committed and the final pass only sees the tail."""
+        self._feed_paced(self.audio)
+
+        text = self.transcriber.finalize(timeout=5.0)
+
+        assert text == "word0 word1 word2 word3 word4"
+        stats = self.transcriber.get_stats()
+        assert stats['passes'] > 0
+        assert stats['committed_seconds'] > 0
+        assert self.model.calls[-1] < len(self.audio)
+
+    def test_partials_grow_and_end_final(self):
+        """Partial transcripts are published during feeding, then a final one."""
+        self._feed_paced(self.audio)
+        self.transcriber.finalize(timeout=5.0)
+
+        assert any(not p.is_final and p.stable_text for p in self.partials)
+        assert self.partials[-1].is_final
+        assert self.transcriber.get_partial().text == "word0 word1 word2 word3 word4"
+
+    def test_finalize_without_passes(self):
+        """Short recordings are transcribed in a single final pass."""
+        self.transcriber.feed(self.audio[:int(0.3 * SAMPLE_RATE)])
+
+        assert self.transcriber.finalize(timeout=5.0) == ""
+        assert self.transcriber.get_stats()['passes'] == 0
+
+    def test_cancel_stops_feeding(self):
+        """Cancelled transcribers ignore further audio."""
+        self.transcriber.cancel()
+        self.transcriber.feed(self.audio)
+        assert self.transcriber.samples_received == 0
+
+    def test_partial_text(self):
+        """Partial text joins stable and unstable parts."""
+        assert PartialTranscript("open the", "browser").text == "open the browser"
+
+
+class TestStreamingSpeechToText:
+    """Replay recorded WAV files through a fake sd.InputStream."""
+
+    @pytest.fixture
+    def audio_module(self):
+        """Create an AudioModule with a fake Whisper model."""
+        from modules.audio import AudioModule
+
+        with patch('modules.audio.whisper.load_model'), \
+             patch('modules.audio.pyttsx3.init') as mock_tts, \
+             patch('modules.audio.pvporcupine.create'):
+            mock_tts.return_value.getProperty.return_value = []
+            module = AudioModule()
+        module.whisper_model = FakeWhisperModel()
+        return module
+
+    def test_wav_replay(self, audio_module):
+        """A replayed utterance is transcribed with streaming partials."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "utterance.wav")
+            _write_wav(path, _render_utterance())
+            FakeInputStream.source = _read_wav(path)
+
+        partials = []
+        audio_module.add_partial_transcript_listener(partials.append)
+
+        with patch('modules.audio.sd.InputStream', FakeInputStream), \
+             patch('modules.audio.sd.query_devices', return_value={'name': 'fake'}), \
+             patch('modules.audio.STREAMING_STT_ENABLED', True):
+            text = audio_module.speech_to_text(duration=8.0)
+
+        assert text == "word0 word1 word2 word3 word4"
+        assert partials and partials[-1].is_final
+        assert any(not p.is_final for p in partials)
+        assert audio_module.whisper_model.calls[-1] < len(FakeInputStream.source)
+
+    def test_shared_capture_fallback_restarts_streaming(self, audio_module):
+        """Audio from a failed shared-capture attempt isn't streamed twice."""
+        FakeInputStream.source = _render_utterance()
+
+        def failed_shared_capture(max_duration, on_chunk=None):
+            on_chunk(_render_utterance(word_count=2))
+            return None
+
+        with patch('modules.audio.sd.InputStream', FakeInputStream), \
+             patch('modules.audio.sd.query_devices', return_value={'name': 'fake'}), \
+             patch('modules.audio.STREAMING_STT_ENABLED', True), \
+             patch('modules.audio.AUDIO_CAPTURE_SHARED_STREAM', True), \
+             patch.object(audio_module.capture_service, 'is_healthy', return_value=True), \
+             patch.object(audio_module, '_record_from_shared_capture', side_effect=failed_shared_capture):
+            text = audio_module.speech_to_text(duration=8.0)
+
+        assert text == "word0 word1 word2 word3 word4"
+
+    def test_fixed_duration_fallback_transcribes_returned_audio(self, audio_module):
+        """Streamed text from a failed attempt is not returned for another recording."""
+        def failed_recording(max_duration, on_chunk=None, on_fallback=None):
+            on_chunk(_render_utterance(word_count=2))
+            return None
+
+        recording = audio_module._process_recorded_audio(_render_utterance())
+
+        with patch('modules.audio.sd.query_devices', return_value={'name': 'fake'}), \
+             patch('modules.audio.STREAMING_STT_ENABLED', True), \
+             patch.object(audio_module, '_record_audio_with_silence_detection', side_effect=failed_recording), \
+             patch.object(audio_module, '_record_audio_fixed_duration', return_value=recording):
+            text = audio_module.speech_to_text(duration=8.0)
+
+        assert text == "word0 word1 word2 word3 word4"
@@ -0,0 +1,153 @@
+"""
+Unit tests for the STT worker process and engine interface
+
+Runs a lightweight engine in a real worker process to test shared memory
+transfer, error handling and restarts, and tests engine creation and the
+AudioModule fallback to an in-process model.
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import patch
+
+from modules.stt_engines import STTEngine, create_stt_engine, register_stt_engine, STT_ENGINES
+from modules.stt_worker import SpeechWorkerClient
+
+ENGINE_PATH = "tests.test_stt_worker:SummaryEngine"
+
+
+class SummaryEngine(STTEngine):
+    """Describes the received audio instead of transcribing it."""
+
+    name = "summary"
+
+    def load(self) -> None:
+        pass
+
+    def transcribe(self, audio, **options):
+        if audio.size == 0:
+            raise ValueError("empty audio")
+        text = f"{audio.size} {float(audio.sum()):.3f} {options.get('initial_prompt')}"
+        return {'text': text, 'segments': [{'id': 0, 'start': 0.0, 'end': audio.size / 16000, 'text': text,
+                                            'avg_logprob': np.float32(-0.1), 'tokens': [1, 2]}],
+                'language': 'en'}
+
+
+class BrokenEngine(SummaryEngine):
+    """Engine whose model never loads."""
+
+    def load(self) -> None:
+        raise OSError("model file missing")
+
+
+@pytest.fixture(scope="module")
+def worker():
+    """Start one worker process for the module."""
+    client = SpeechWorkerClient(ENGINE_PATH, "tiny", request_timeout=10.0)
+    client.start(timeout=60.0)
+    yield client
+    client.stop()
+
+
+class TestSpeechWorkerClient:
+    """Test cases for SpeechWorkerClient class."""
+
+    def test_transcribe_through_shared_memory(self, worker):
+        """Samples reach the worker intact and results come back as plain types."""
+        audio = np.linspace(-0.5, 0.5, 16000 * 3, dtype=np.float32) ** 3
+
+        result = worker.transcribe(audio, language="en", initial_prompt="open")
+
+        assert result['text'] == f"{audio.size} {float(audio.sum()):.3f} open"
+        assert result['segments'][0]['avg_logprob'] == pytest.approx(-0.1)
+        assert 'tokens' not in result['segments'][0]
+        assert worker.engine_info['engine'] == "summary"
+
+    def test_engine_error_keeps_worker(self, worker):
+        """Engine errors are raised in the client without killing the worker."""
+        with pytest.raises(RuntimeError, match="empty audio"):
+            worker.transcribe(np.zeros(0, dtype=np.float32))
+
+        assert worker.is_alive
+        assert worker.transcribe(np.ones(10, dtype=np.float32))['text'].startswith("10 ")
+
+    def test_dead_worker_is_restarted(self, worker):
+        """A worker that died is replaced on the next request."""
+        worker._process.kill()
+        worker._process.join(5.0)
+
+        assert worker.transcribe(np.ones(5, dtype=np.float32))['text'].startswith("5 ")
+        assert worker.get_stats()['restarts'] >= 1
+
+    def test_stats_report_real_time_factor(self, worker):
+        """Inference time is reported relative to audio duration."""
+        worker.transcribe(np.ones(16000, dtype=np.float32))
+        stats = worker.get_stats()
+
+        assert stats['audio_seconds'] >= 1.0
+        assert stats['real_time_factor'] is not None
+
+    def test_failed_model_load(self):
+        """Startup errors from the worker are raised and resources released."""
+        client = SpeechWorkerClient("tests.test_stt_worker:BrokenEngine", "tiny")
+
+        with pytest.raises(RuntimeError, match="model file missing"):
+            client.start(timeout=60.0)
+        assert not client.is_alive
+
+
+class TestSTTEngines:
+    """Test cases for engine creation."""
+
+    def test_create_from_import_path(self):
+        """Engines can be given as module:Class paths."""
+        engine = create_stt_engine(ENGINE_PATH, "base", beam_size=2)
+
+        assert isinstance(engine, SummaryEngine)
+        assert engine.describe() == {'engine': 'summary', 'model': 'base', 'beam_size': 2}
+
+    def test_register_engine(self):
+        """Registered engines are created by name."""
+        register_stt_engine("summary", SummaryEngine)
+        try:
+            assert isinstance(create_stt_engine("summary"), SummaryEngine)
+        finally:
+            STT_ENGINES.pop("summary")
+
+    def test_unknown_engine(self):
+        """Unknown engine names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown STT engine"):
+            create_stt_engine("does-not-exist")
+
+
+class TestAudioModuleWorker:
+    """Test STT worker selection in AudioModule."""
+
+    def test_falls_back_to_in_process_model(self):
+        """If the worker can't start, the model is loaded in-process."""
+        from modules.audio import AudioModule
+
+        with patch('modules.audio.SpeechWorkerClient') as mock_client, \
+             patch('modules.audio.whisper.load_model') as mock_load, \
+             patch('modules.audio.pyttsx3.init') as mock_tts, \
+             patch('modules.audio.pvporcupine.create'):
+            mock_client.return_value.start.side_effect = RuntimeError("no worker")
+            mock_tts.return_value.getProperty.return_value = []
+            module = AudioModule(use_stt_worker=True)
+
+        assert module.stt_worker is None
+        assert module.whisper_model is mock_load.return_value
+
+    def test_worker_client_replaces_model(self):
+        """A started worker is used as the transcription model."""
+        from modules.audio import AudioModule
+
+        with patch('modules.audio.SpeechWorkerClient') as mock_client, \
+             patch('modules.audio.whisper.load_model') as mock_load, \
+             patch('modules.audio.pyttsx3.init') as mock_tts, \
+             patch('modules.audio.pvporcupine.create'):
+            mock_tts.return_value.getProperty.return_value = []
+            module = AudioModule(use_stt_worker=True)
+
+        assert module.whisper_model is mock_client.return_value
+        mock_load.assert_not_called()
@@ -0,0 +1,217 @@
+"""
+Unit tests for the TTS phrase audio cache
+
+Renders phrases with a fake renderer (short WAV tones) and plays them
+through a real pygame mixer on SDL's dummy audio driver.
+"""
+
+import os
+import threading
+import time
+import wave
+
+import numpy as np
+import pygame
+import pytest
+from unittest.mock import Mock, patch
+
+from modules.tts_phrase_cache import PhraseAudioCache
+
+TEMPLATE = r"The deferred action has timed out after \d+ seconds\."
+
+
+class ToneRenderer:
+    """Writes a tone (50 ms by default) per utterance and records what was rendered."""
+
+    def __init__(self, samples: int = 1102):
+        self.rendered = []
+        self.samples = samples
+
+    def __call__(self, text: str, path: str) -> None:
+        self.rendered.append(text)
+        tone = (np.sin(np.arange(self.samples) * 0.2) * 8000).astype(np.int16)
+        with wave.open(path, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(22050)
+            wav_file.writeframes(tone.tobytes())
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mixer():
+    """Initialize the pygame mixer without an audio device."""
+    previous = os.environ.get("SDL_AUDIODRIVER")
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+    yield
+    pygame.mixer.quit()
+    if previous is None:
+        os.environ.pop("SDL_AUDIODRIVER", None)
+    else:
+        os.environ["SDL_AUDIODRIVER"] = previous
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestPhraseAudioCache:
+    """Test cases for PhraseAudioCache class."""
+
+    def test_prerendered_phrase_plays_from_memory(self, tmp_path):
+        """Configured phrases are rendered once and played without the renderer."""
+        renderer = ToneRenderer()
+        cache = PhraseAudioCache(renderer, str(tmp_path))
+
+        assert cache.prerender(["Yes?"]) == 1
+        assert cache.play("Yes?")
+        assert cache.play("Yes?", wait=False)
+
+        assert renderer.rendered == ["Yes?"]
+        assert cache.get_stats()['hits'] == 2
+
+    def test_rendered_files_survive_restart(self, tmp_path):
+        """A new cache with the same voice and rate reuses the files on disk."""
+        PhraseAudioCache(ToneRenderer(), str(tmp_path)).prerender(["Yes?"])
+
+        renderer = ToneRenderer()
+        cache = PhraseAudioCache(renderer, str(tmp_path))
+        cache.prerender(["Yes?"])
+
+        assert renderer.rendered == []
+        assert cache.play("Yes?")
+
+    def test_key_includes_voice_and_rate(self, tmp_path):
+        """Changing the voice or rate selects different files."""
+        paths = {
+            PhraseAudioCache(ToneRenderer(), str(tmp_path), voice=voice, rate=rate).cache_path("Yes?")
+            for voice in ("alex", "samantha") for rate in (180, 200)
+        }
+
+        assert len(paths) == 4
+
+    def test_template_rendered_on_first_use(self, tmp_path):
+        """Templated utterances are spoken live once, then played from the cache."""
+        renderer = ToneRenderer()
+        cache = PhraseAudioCache(renderer, str(tmp_path), templates=[TEMPLATE])
+        message = "The deferred action has timed out after 300 seconds."
+
+        assert not cache.play(message)
+        assert _wait_for(lambda: cache.cache_path(message).exists())
+        assert _wait_for(lambda: cache.play(message, wait=False))
+        assert renderer.rendered == [message]
+
+    def test_other_utterances_not_cached(self, tmp_path):
+        """Utterances that aren't configured or templated are left to live TTS."""
+        renderer = ToneRenderer()
+        cache = PhraseAudioCache(renderer, str(tmp_path), templates=[TEMPLATE], max_chars=40)
+        cache.prerender(["Yes?"])
+
+        assert not cache.play("Here is what I found on the screen.")
+        assert not cache.is_cacheable("The deferred action has timed out after 300 seconds.")
+        time.sleep(0.05)
+        assert renderer.rendered == ["Yes?"]
+
+    def test_render_failure_falls_back(self, tmp_path):
+        """Renderer errors leave no files and the phrase is spoken live."""
+        def failing_renderer(text, path):
+            with open(path, "wb") as partial:
+                partial.write(b"RIFF")
+            raise RuntimeError("say exited with status 1")
+
+        cache = PhraseAudioCache(failing_renderer, str(tmp_path))
+
+        assert cache.prerender(["Yes?"]) == 0
+        assert not cache.play("Yes?")
+        assert _wait_for(lambda: cache.get_stats()['render_failures'] >= 2)
+        assert _wait_for(lambda: not any(tmp_path.iterdir()))
+
+    def test_memory_is_bounded(self, tmp_path):
+        """Only the most recently used sounds stay decoded in memory."""
+        cache = PhraseAudioCache(ToneRenderer(), str(tmp_path), max_loaded=2)
+        cache.prerender(["one", "two", "three"])
+
+        assert cache.get_stats()['loaded'] == 2
+        assert cache.play("one", wait=False)
+
+
+    def test_stop_interrupts_playing_phrase(self, tmp_path):
+        """stop() cuts a playing phrase short and ends a blocking play()."""
+        cache = PhraseAudioCache(ToneRenderer(samples=22050 * 3), str(tmp_path))
+        cache.prerender(["Yes?"])
+        assert not cache.stop()
+
+        started = time.monotonic()
+        threading.Timer(0.1, cache.stop).start()
+
+        assert cache.play("Yes?")
+        assert time.monotonic() - started < 2.0
+        assert not cache.stop()
+
+
+class TestAudioModulePhraseCache:
+    """Test phrase cache use in AudioModule."""
+
+    def _audio_module(self):
+        from modules.audio import AudioModule
+
+        module = AudioModule.__new__(AudioModule)
+        module.tts_engine = 'macos_say'
+        module.tts_method = 'system'
+        return module
+
+    def test_cached_phrase_skips_say(self):
+        """A cached phrase is played without starting a 'say' process."""
+        module = self._audio_module()
+        module.phrase_cache = Mock()
+        module.phrase_cache.play.return_value = True
+
+        with patch('subprocess.run') as mock_run:
+            module._speak_text_internal("Yes?")
+
+        module.phrase_cache.play.assert_called_once_with("Yes?")
+        mock_run.assert_not_called()
+
+    def test_uncached_phrase_uses_say(self):
+        """Phrases the cache doesn't play are synthesized live."""
+        module = self._audio_module()
+        module.phrase_cache = Mock()
+        module.phrase_cache.play.return_value = False
+
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value.returncode = 0
+            module._speak_text_internal("Opening Safari")
+
+        assert mock_run.call_args[0][0][0] == 'say'
+
+    def test_stop_speaking_stops_cached_phrase(self):
+        """Barge-in stops a cached phrase as well as pipelined speech."""
+        module = self._audio_module()
+        module.speech_pipeline = None
+        module.phrase_cache = Mock()
+        module.phrase_cache.stop.return_value = True
+
+        assert module.stop_speaking()
+        module.phrase_cache.stop.assert_called_once_with()
+
+    def test_enable_phrase_cache_prerenders_in_background(self, tmp_path):
+        """Enabling the cache renders the configured phrases without blocking."""
+        module = self._audio_module()
+        module.phrase_cache = None
+        started = threading.Event()
+
+        def render(text, path):
+            started.set()
+            ToneRenderer()(text, path)
+
+        with patch('modules.audio.TTS_PHRASE_CACHE_DIR', str(tmp_path)), \
+             patch('modules.audio.TTS_PHRASE_CACHE_PHRASES', ["Yes?"]), \
+             patch.object(module, '_render_speech_to_file', side_effect=render):
+            cache = module.enable_phrase_cache()
+            assert started.wait(5.0)
+            assert _wait_for(lambda: cache.play("Yes?", wait=False))
+
+        assert module.enable_phrase_cache() is cache
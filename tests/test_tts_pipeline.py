@@ -0,0 +1,189 @@
+"""
+Unit tests for sentence-pipelined text-to-speech
+
+Uses a fake backend with configurable synthesis latency and playback
+duration that records when each sentence was synthesized and played.
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+
+from modules.tts_pipeline import PipelinedSpeaker, SpeechBackend, split_sentences
+
+RESPONSE = ("The capital of France is Paris. It has been the capital since the tenth century. "
+            "Paris is also the largest city in France. Its population is about two million.")
+
+
+class FakeBackend(SpeechBackend):
+    """Synthesizes and plays sentences with fixed latencies."""
+
+    def __init__(self, synth_latency=0.05, play_duration=0.08, fail_on=None):
+        self.synth_latency = synth_latency
+        self.play_duration = play_duration
+        self.fail_on = fail_on
+        self.events = []
+        self.stopped = 0
+        self._lock = threading.Lock()
+
+    def _record(self, kind, text):
+        with self._lock:
+            self.events.append((kind, text, time.perf_counter()))
+
+    def synthesize(self, text):
+        self._record('synth_start', text)
+        if self.fail_on and self.fail_on in text:
+            raise RuntimeError("voice unavailable")
+        time.sleep(self.synth_latency)
+        self._record('synth_end', text)
+        return text
+
+    def play(self, clip, cancel_event):
+        self._record('play_start', clip)
+        cancel_event.wait(self.play_duration)
+        self._record('play_end', clip)
+
+    def stop(self):
+        self.stopped += 1
+
+    def times(self, kind):
+        return [moment for event, _, moment in self.events if event == kind]
+
+    def texts(self, kind):
+        return [text for event, text, _ in self.events if event == kind]
+
+
+class TestSplitSentences:
+    """Test cases for sentence splitting."""
+
+    def test_splits_on_sentence_ends(self):
+        """Sentences end at terminal punctuation followed by a new sentence."""
+        assert split_sentences("Hello there! How are you? I'm fine. Version 3.5 is out.") == [
+            "Hello there!", "How are you?", "I'm fine.", "Version 3.5 is out."
+        ]
+
+    def test_splits_lines_and_keeps_abbreviations_lowercase(self):
+        """Lines are separate pieces; a period before a lowercase word doesn't split."""
+        assert split_sentences("Steps:\n1. Open the menu\n2. Click save, e.g. with the mouse") == [
+            "Steps:", "1. Open the menu", "2. Click save, e.g. with the mouse"
+        ]
+
+    def test_long_sentence_split_at_clauses(self):
+        """Sentences over the limit are split at commas, then words."""
+        sentence = "First clause here, second clause follows, and a third one ends it."
+        pieces = split_sentences(sentence, max_chars=30)
+
+        assert pieces == ["First clause here,", "second clause follows,", "and a third one ends it."]
+        assert all(len(piece) <= 30 for piece in split_sentences("word " * 40, max_chars=30))
+
+
+class TestPipelinedSpeaker:
+    """Test cases for PipelinedSpeaker class."""
+
+    def test_next_sentence_synthesized_during_playback(self):
+        """Synthesis of sentence N+1 overlaps playback of sentence N."""
+        backend = FakeBackend(synth_latency=0.05, play_duration=0.1)
+        speaker = PipelinedSpeaker(backend, lookahead=1)
+
+        result = speaker.speak(RESPONSE)
+
+        assert result.spoken == result.sentences == 4
+        assert backend.texts('play_start') == split_sentences(RESPONSE)
+        assert backend.times('synth_end')[1] < backend.times('play_end')[0]
+
+    def test_time_to_first_audio_is_one_sentence(self):
+        """Audio starts after the first sentence, not the whole response."""
+        backend = FakeBackend(synth_latency=0.1, play_duration=0.05)
+        speaker = PipelinedSpeaker(backend)
+
+        result = speaker.speak(RESPONSE)
+
+        assert result.time_to_first_audio == pytest.approx(0.1, abs=0.08)
+        assert result.time_to_first_audio < 0.4  # synthesizing all four would take 0.4s
+        assert speaker.get_stats()['median_time_to_first_audio'] == result.time_to_first_audio
+
+    def test_barge_in_cancels_playback_and_synthesis(self):
+        """cancel() stops the sentence playing and no further sentences are synthesized."""
+        backend = FakeBackend(synth_latency=0.02, play_duration=2.0)
+        speaker = PipelinedSpeaker(backend, lookahead=1)
+        results = []
+        thread = threading.Thread(target=lambda: results.append(speaker.speak(RESPONSE)))
+        thread.start()
+
+        deadline = time.monotonic() + 2.0
+        while not backend.texts('play_start') and time.monotonic() < deadline:
+            time.sleep(0.01)
+        start = time.perf_counter()
+        assert speaker.cancel()
+        thread.join(2.0)
+
+        assert time.perf_counter() - start < 0.3
+        assert results[0].cancelled and results[0].spoken == 0
+        assert backend.stopped == 1
+        assert len(backend.texts('synth_start')) <= 3
+        assert not speaker.is_speaking
+        assert not speaker.cancel()
+
+    def test_synthesis_error_reports_remaining_sentences(self):
+        """A failed sentence ends the pipeline and reports what wasn't spoken."""
+        backend = FakeBackend(synth_latency=0.01, play_duration=0.01, fail_on="largest")
+        speaker = PipelinedSpeaker(backend)
+
+        result = speaker.speak(RESPONSE)
+
+        assert "voice unavailable" in result.error
+        assert result.spoken == 2
+        assert result.remaining == split_sentences(RESPONSE)[2:]
+
+    def test_single_sentence_not_pipelined(self):
+        """Short text is left to the direct TTS path."""
+        speaker = PipelinedSpeaker(FakeBackend())
+
+        assert not speaker.should_pipeline("Opening Safari.")
+        assert speaker.should_pipeline(RESPONSE)
+
+
+class TestAudioModulePipeline:
+    """Test speech pipeline use in AudioModule."""
+
+    def _audio_module(self, backend):
+        from modules.audio import AudioModule
+
+        module = AudioModule.__new__(AudioModule)
+        module.tts_engine = 'macos_say'
+        module.tts_method = 'system'
+        module.phrase_cache = None
+        module.speech_pipeline = PipelinedSpeaker(backend)
+        return module
+
+    def test_long_text_uses_pipeline(self):
+        """Multi-sentence text is spoken through the pipeline, not one 'say' call."""
+        backend = FakeBackend(synth_latency=0.01, play_duration=0.01)
+        module = self._audio_module(backend)
+
+        with patch('subprocess.run') as mock_run:
+            module._speak_text_internal(RESPONSE)
+
+        assert len(backend.texts('play_start')) == 4
+        mock_run.assert_not_called()
+
+    def test_pipeline_failure_speaks_rest_directly(self):
+        """Sentences left after a synthesis failure are spoken with 'say'."""
+        backend = FakeBackend(synth_latency=0.01, play_duration=0.01, fail_on="population")
+        module = self._audio_module(backend)
+
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value.returncode = 0
+            module._speak_text_internal(RESPONSE)
+
+        assert mock_run.call_args[0][0][-1].endswith("Its population is about two million.'")
+
+    def test_stop_speaking(self):
+        """stop_speaking() interrupts speech in progress."""
+        module = self._audio_module(FakeBackend())
+        module.speech_pipeline = Mock()
+        module.speech_pipeline.cancel.return_value = True
+
+        assert module.stop_speaking()
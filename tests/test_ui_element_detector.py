@@ -0,0 +1,201 @@
+"""
+Unit tests for the local UI element detector
+
+Tests detection of buttons and fields in rendered UI screenshots, matching
+candidates against accessibility elements, and vision hint generation.
+"""
+
+import base64
+import io
+import numpy as np
+from unittest.mock import Mock
+from PIL import Image, ImageDraw
+
+from modules.ui_element_detector import (
+    DetectedElement,
+    UIElementDetector,
+    bbox_iou,
+    build_vision_hints,
+    format_vision_hints,
+    hints_signature,
+    match_known_elements
+)
+from handlers.gui_handler import GUIHandler
+
+
+def _render_form():
+    """Render a small form: one text field and two buttons per row."""
+    img = Image.new("RGB", (1200, 600), (236, 236, 236))
+    draw = ImageDraw.Draw(img)
+    truth = []
+    for row in range(3):
+        top = 100 + row * 150
+        draw.rounded_rectangle((80, top, 560, top + 36), radius=5, outline=(150, 150, 150), fill=(255, 255, 255))
+        draw.text((92, top + 12), f"Email {row}", fill=(120, 120, 120))
+        truth.append(((80, top, 481, 37), "field"))
+        draw.rounded_rectangle((640, top, 800, top + 36), radius=6, fill=(40, 110, 220))
+        draw.text((690, top + 12), "Submit", fill=(255, 255, 255))
+        truth.append(((640, top, 161, 37), "button"))
+        draw.rounded_rectangle((860, top, 1000, top + 36), radius=6, outline=(140, 140, 140), fill=(250, 250, 250))
+        draw.text((910, top + 12), "Cancel", fill=(0, 0, 0))
+        truth.append(((860, top, 141, 37), "button"))
+    return np.asarray(img)[:, :, ::-1].copy(), truth
+
+
+class TestUIElementDetector:
+    """Test cases for UIElementDetector class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.detector = UIElementDetector()
+        self.image, self.truth = _render_form()
+
+    def test_detects_buttons_and_fields(self):
+        """Every rendered control is found with the right kind."""
+        candidates = self.detector.detect(self.image)
+
+        for bbox, kind in self.truth:
+            best = max(candidates, key=lambda c: bbox_iou(c.bbox, bbox))
+            assert bbox_iou(best.bbox, bbox) >= 0.5
+            assert best.kind == kind
+
+    def test_blank_screen_has_no_controls(self):
+        """A flat screen yields no candidates."""
+        blank = np.full((400, 600, 3), 240, dtype=np.uint8)
+        assert self.detector.detect(blank) == []
+
+    def test_candidate_limit(self):
+        """Candidates are capped at max_candidates."""
+        detector = UIElementDetector(max_candidates=2)
+        assert len(detector.detect(self.image)) == 2
+
+    def test_decode_screenshot(self):
+        """Base64 screenshots decode, invalid data returns None."""
+        buffer = io.BytesIO()
+        Image.fromarray(self.image[:, :, ::-1]).save(buffer, format="JPEG")
+        encoded = base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+        assert self.detector.decode_screenshot(encoded).shape[:2] == (600, 1200)
+        assert self.detector.decode_screenshot("not-an-image") is None
+
+
+class TestMatching:
+    """Test cases for matching candidates against accessibility elements."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.candidates = [
+            DetectedElement((640, 100, 160, 36), "button", 0.85, has_text=True),
+            DetectedElement((860, 100, 140, 36), "button", 0.85, has_text=True)
+        ]
+
+    def test_matches_label_and_frame(self):
+        """A known element with a similar label and overlapping frame is matched."""
+        known = [
+            {"title": "Submit", "coordinates": [642, 101, 158, 34]},
+            {"title": "Cancel", "coordinates": [862, 101, 138, 34]}
+        ]
+
+        match = match_known_elements(self.candidates, known, "submit button")
+
+        assert match is not None
+        assert match["candidate"].center == (720, 118)
+        assert match["element"]["title"] == "Submit"
+
+    def test_no_match_without_overlap(self):
+        """A label match elsewhere on screen is not confirmed."""
+        known = [{"title": "Submit", "coordinates": [10, 500, 80, 30]}]
+        assert match_known_elements(self.candidates, known, "submit") is None
+
+    def test_no_match_for_different_label(self):
+        """A dissimilar label is not matched even with perfect overlap."""
+        known = [{"title": "Delete account", "position": [640, 100], "size": [160, 36]}]
+        assert match_known_elements(self.candidates, known, "save") is None
+
+
+class TestVisionHints:
+    """Test cases for vision hint helpers."""
+
+    def test_hints_keep_pixels_and_crop(self):
+        """Hints stay in screenshot pixels and the best candidates get crops."""
+        image, _ = _render_form()
+        candidates = UIElementDetector().detect(image)
+
+        hints = build_vision_hints(image, candidates, max_crops=1)
+
+        assert hints[0]["bbox"] == list(candidates[0].bbox)
+        assert "crop_b64" in hints[0]
+        assert all("crop_b64" not in hint for hint in hints[1:])
+
+    def test_format_and_signature(self):
+        """Prompt text lists every hint and signatures ignore crops."""
+        hints = [{"bbox": [1, 2, 3, 4], "kind": "button", "crop_b64": "abc"},
+                 {"bbox": [5, 6, 7, 8], "kind": "field"}]
+
+        text = format_vision_hints(hints)
+
+        assert "pixels of the attached screenshot" in text
+        assert "1. button at (1, 2, 3, 4) - shown in cropped image 1" in text
+        assert "2. field at (5, 6, 7, 8)" in text
+        assert hints_signature(hints) == (((1, 2, 3, 4), "button"), ((5, 6, 7, 8), "field"))
+
+
+class TestGUIHandlerLocalDetection:
+    """Test cases for the local detection step of the GUI vision fallback."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        image, _ = _render_form()
+        buffer = io.BytesIO()
+        Image.fromarray(image[:, :, ::-1]).save(buffer, format="PNG")
+
+        self.vision_module = Mock()
+        self.vision_module.capture_screen_as_base64.return_value = base64.b64encode(buffer.getvalue()).decode("utf-8")
+        self.vision_module.get_screen_resolution.return_value = (2400, 1200)
+        self.automation_module = Mock()
+        self.automation_module.execute_fast_path_action.return_value = {"success": True}
+
+        orchestrator = Mock()
+        orchestrator._get_active_perception_context.return_value = None
+        self.handler = GUIHandler(orchestrator)
+
+    def test_confident_match_clicks_without_vision(self):
+        """A detected button confirmed by accessibility is clicked directly."""
+        fast_path_result = {
+            "gui_elements": {"action": "click", "label": "cancel"},
+            "fuzzy_matches": [{"title": "Cancel", "coordinates": [1720, 200, 282, 74]}]
+        }
+
+        result = self.handler._attempt_local_detection(
+            "click cancel", {}, self.vision_module, self.automation_module, fast_path_result
+        )
+
+        assert result["success"]
+        assert result["method"] == "local_detection"
+        coordinates = self.automation_module.execute_fast_path_action.call_args.kwargs["coordinates"]
+        assert abs(coordinates[0] - 1860) <= 6 and abs(coordinates[1] - 236) <= 6
+
+    def test_no_match_returns_hints(self):
+        """Without a confirmed match, candidates are returned as vision hints."""
+        result = self.handler._attempt_local_detection(
+            "click cancel", {}, self.vision_module, self.automation_module, {}
+        )
+
+        assert not result["success"]
+        assert len(result["hints"]) >= 9
+        assert result["screenshot_b64"] == self.vision_module.capture_screen_as_base64.return_value
+        # Boxes are in the 1200x600 screenshot, not the 2400x1200 screen
+        assert all(hint["bbox"][0] + hint["bbox"][2] <= 1200 for hint in result["hints"])
+        self.automation_module.execute_fast_path_action.assert_not_called()
+
+    def test_hints_sent_with_detected_screenshot(self):
+        """Hints go to a coordinate analysis of the screenshot they were detected in."""
+        hints = [{"bbox": [640, 100, 161, 37], "kind": "button"}]
+        self.vision_module.describe_screen.return_value = {"description": "form"}
+
+        self.handler._perform_screen_perception(self.vision_module, {}, hints=hints, screenshot_b64="shot")
+
+        kwargs = self.vision_module.describe_screen.call_args.kwargs
+        assert kwargs["analysis_type"] == "clickable"
+        assert kwargs["screenshot_b64"] == "shot"
+        assert kwargs["hints"] == hints
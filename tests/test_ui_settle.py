@@ -0,0 +1,97 @@
+# tests/test_ui_settle.py
+"""
+Unit tests for condition-based UI settle waits.
+"""
+
+import time
+from unittest.mock import patch
+
+from modules.ui_settle import (
+    AnyOf,
+    Predicate,
+    SettleCondition,
+    PasteboardChanged,
+    wait_for
+)
+
+
+class Countdown(SettleCondition):
+    """Holds after a number of checks; records pauses."""
+
+    name = "countdown"
+
+    def __init__(self, checks: int, available: bool = True):
+        super().__init__()
+        self.remaining = checks
+        self.available = available
+        self.pauses = []
+        self.closed = False
+
+    def check(self) -> bool:
+        self.remaining -= 1
+        return self.remaining < 0
+
+    def pause(self, seconds: float) -> None:
+        self.pauses.append(seconds)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestWaitFor:
+    """Test cases for wait_for."""
+
+    def test_returns_as_soon_as_condition_holds(self):
+        """A condition that already holds costs no waiting."""
+        start = time.perf_counter()
+        assert wait_for(Predicate(lambda: True), timeout=1.0)
+        assert time.perf_counter() - start < 0.05
+
+    def test_exponential_backoff_is_capped(self):
+        condition = Countdown(checks=8)
+
+        assert wait_for(condition, timeout=10.0, initial_interval=0.002, max_interval=0.05)
+
+        assert condition.pauses[:5] == [0.002, 0.004, 0.008, 0.016, 0.032]
+        assert max(condition.pauses) == 0.05
+        assert condition.closed
+
+    def test_deadline(self):
+        """A condition that never holds returns False at the deadline."""
+        start = time.perf_counter()
+        assert not wait_for(Predicate(lambda: False), timeout=0.05)
+        assert 0.05 <= time.perf_counter() - start < 0.2
+
+    def test_unavailable_condition_uses_fallback_delay(self):
+        """Without a way to check, the previous fixed delay is used."""
+        condition = Countdown(checks=0, available=False)
+
+        with patch('modules.ui_settle.time.sleep') as sleep:
+            assert not wait_for(condition, timeout=1.0, fallback=0.1)
+
+        sleep.assert_called_once_with(0.1)
+        assert condition.remaining == 0
+
+    def test_no_condition_sleeps_timeout(self):
+        with patch('modules.ui_settle.time.sleep') as sleep:
+            wait_for(None, timeout=0.2)
+        sleep.assert_called_once_with(0.2)
+
+
+class TestConditions:
+    """Test condition composition and availability."""
+
+    def test_any_of_skips_unavailable_conditions(self):
+        unavailable = Countdown(checks=0, available=False)
+        condition = AnyOf(unavailable, Countdown(checks=2))
+
+        assert condition.available
+        assert wait_for(condition, timeout=1.0)
+        assert unavailable.remaining == 0
+
+    def test_any_of_unavailable_when_all_are(self):
+        assert not AnyOf(Countdown(0, available=False)).available
+
+    def test_pasteboard_unavailable_without_appkit(self):
+        with patch('modules.ui_settle.PASTEBOARD_AVAILABLE', False):
+            assert not PasteboardChanged().available
@@ -6,12 +6,16 @@ Tests screen capture functionality and API communication.
 
 import base64
 import json
+import threading
+import time
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from PIL import Image
 import io
 
 from modules.vision import VisionModule
+from modules.screenshot_profiles import screenshot_profiles
+from modules.vision_scheduler import VisionRequestScheduler, VisionRequestCancelledError
 
 
 class TestVisionModule:
@@ -75,12 +79,13 @@ class TestVisionModule:
         
         vision_module = VisionModule()
         
-        with patch('modules.vision.MAX_SCREENSHOT_SIZE', 1920):
-            result = vision_module.capture_screen_as_base64()
+        result = vision_module.capture_screen_as_base64()
             
-        # Should still return valid base64
+        # Should still return valid base64, downscaled to the profile's max size
         assert isinstance(result, str)
         assert len(result) > 0
+        image = Image.open(io.BytesIO(base64.b64decode(result)))
+        assert max(image.size) <= screenshot_profiles.get_profile(None).max_size
     
     @patch('modules.vision.mss.mss')
     def test_capture_screen_failure(self, mock_mss):
@@ -256,5 +261,66 @@ class TestVisionModule:
             self.vision_module.describe_screen()
 
 
+
+class TestVisionRequestCancellation:
+    """Cancelled and superseded requests through describe_screen."""
+
+    def setup_method(self):
+        """Set up a vision module with its own single-slot scheduler."""
+        with patch('modules.vision.mss.mss'):
+            self.vision_module = VisionModule()
+        self.vision_module._scheduler = VisionRequestScheduler(max_concurrent=1, queue_wait_timeout=5.0)
+        self.analyzed = []
+        self.release = threading.Event()
+
+    def _analyze(self, analysis_type, screenshot_b64, hints=None):
+        self.analyzed.append(screenshot_b64)
+        if screenshot_b64 == "blocker":
+            self.release.wait(5.0)
+        return {"elements": [], "metadata": {}}
+
+    def _describe(self, screenshot_b64, outcomes):
+        try:
+            outcomes[screenshot_b64] = self.vision_module.describe_screen(
+                screenshot_b64=screenshot_b64, use_speculative=False)
+        except Exception as e:
+            outcomes[screenshot_b64] = e
+
+    def test_superseded_request_is_not_reissued(self):
+        """A superseded request whose successor is cancelled fails at once instead of retrying its stale screenshot."""
+        scheduler = self.vision_module._scheduler
+        outcomes = {}
+        with patch.object(self.vision_module, '_request_screen_analysis', side_effect=self._analyze):
+            threads = [threading.Thread(target=self._describe, args=("blocker", outcomes))]
+            threads[0].start()
+            assert _wait_until(lambda: self.analyzed == ["blocker"])
+            for submitted, screenshot in enumerate(("old", "new"), start=2):
+                threads.append(threading.Thread(target=self._describe, args=(screenshot, outcomes)))
+                threads[-1].start()
+                assert _wait_until(lambda: scheduler.get_metrics()['submitted'] == submitted)
+            assert scheduler.get_metrics()['superseded'] == 1
+
+            start = time.time()
+            assert scheduler.cancel_pending() == 1
+            self.release.set()
+            for thread in threads:
+                thread.join(5.0)
+
+        assert time.time() - start < 2.0
+        assert isinstance(outcomes["old"], VisionRequestCancelledError)
+        assert isinstance(outcomes["new"], VisionRequestCancelledError)
+        assert self.analyzed == ["blocker"]
+
+
+def _wait_until(condition, timeout=2.0):
+    """Poll until condition() is true."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
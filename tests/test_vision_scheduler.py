@@ -0,0 +1,243 @@
+"""
+Unit tests for the Vision Request Scheduler
+
+Tests priority ordering, deduplication, supersession, cancellation,
+concurrency limits and metrics.
+"""
+
+import threading
+import time
+import pytest
+
+from modules.vision_scheduler import (
+    VisionRequestScheduler,
+    VisionRequestPriority,
+    VisionRequestCancelledError
+)
+
+
+def _wait_for(condition, timeout=2.0):
+    """Poll until condition() is true."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class TestVisionRequestPriority:
+    """Test cases for VisionRequestPriority."""
+
+    def test_coerce(self):
+        """Names, members and None are accepted."""
+        assert VisionRequestPriority.coerce("background") == VisionRequestPriority.BACKGROUND
+        assert VisionRequestPriority.coerce(VisionRequestPriority.FALLBACK) == VisionRequestPriority.FALLBACK
+        assert VisionRequestPriority.coerce(None) == VisionRequestPriority.INTERACTIVE
+
+    def test_coerce_invalid(self):
+        """Unknown names raise ValueError."""
+        with pytest.raises(ValueError):
+            VisionRequestPriority.coerce("urgent")
+
+
+class TestVisionRequestScheduler:
+    """Test cases for VisionRequestScheduler class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.scheduler = VisionRequestScheduler(max_concurrent=1, queue_wait_timeout=5.0)
+        self.release = threading.Event()
+        self.blocker_started = threading.Event()
+
+    def _blocking_call(self):
+        self.blocker_started.set()
+        self.release.wait(5.0)
+        return "blocker"
+
+    def _start(self, target, *args, **kwargs):
+        thread = threading.Thread(target=target, args=args, kwargs=kwargs, daemon=True)
+        thread.start()
+        return thread
+
+    def test_run_returns_result(self):
+        """A single request executes immediately."""
+        assert self.scheduler.run(lambda: 42) == 42
+        metrics = self.scheduler.get_metrics()
+        assert metrics['executed'] == 1
+        assert metrics['queue_depth'] == 0
+
+    def test_errors_propagate(self):
+        """Exceptions raised by the vision call reach the caller."""
+        def failing():
+            raise RuntimeError("api down")
+
+        with pytest.raises(RuntimeError):
+            self.scheduler.run(failing)
+        assert self.scheduler.get_metrics()['failed'] == 1
+
+    def test_interactive_runs_before_background(self):
+        """Queued interactive requests overtake queued background requests."""
+        order = []
+        self._start(self.scheduler.run, self._blocking_call, priority="background")
+        assert self.blocker_started.wait(2.0)
+
+        background = self._start(self.scheduler.run, lambda: order.append("background"),
+                                 priority=VisionRequestPriority.BACKGROUND)
+        assert _wait_for(lambda: self.scheduler.get_queue_depth() == 1)
+        interactive = self._start(self.scheduler.run, lambda: order.append("interactive"),
+                                  priority=VisionRequestPriority.INTERACTIVE)
+        assert _wait_for(lambda: self.scheduler.get_queue_depth() == 2)
+
+        self.release.set()
+        background.join(2.0)
+        interactive.join(2.0)
+
+        assert order == ["interactive", "background"]
+
+    def test_identical_requests_are_deduplicated(self):
+        """Callers with the same key share one execution."""
+        calls = []
+        results = []
+
+        def analyze():
+            calls.append(1)
+            return {"elements": []}
+
+        self._start(self.scheduler.run, self._blocking_call)
+        assert self.blocker_started.wait(2.0)
+
+        threads = [
+            self._start(lambda: results.append(self.scheduler.run(analyze, key=("simple", "abc"))))
+            for _ in range(3)
+        ]
+        assert _wait_for(lambda: self.scheduler.get_metrics()['deduplicated'] == 2)
+
+        self.release.set()
+        for thread in threads:
+            thread.join(2.0)
+
+        assert len(calls) == 1
+        assert results == [{"elements": []}] * 3
+
+    def test_newer_screen_state_supersedes_pending_request(self):
+        """Pending requests for an old screen state follow the newer request."""
+        executed = []
+        results = []
+
+        self._start(self.scheduler.run, self._blocking_call)
+        assert self.blocker_started.wait(2.0)
+
+        old = self._start(lambda: results.append(self.scheduler.run(
+            lambda: executed.append("old") or "old", group="simple", screen_state="state_1")))
+        assert _wait_for(lambda: self.scheduler.get_queue_depth() == 1)
+        new = self._start(lambda: results.append(self.scheduler.run(
+            lambda: executed.append("new") or "new", group="simple", screen_state="state_2")))
+        assert _wait_for(lambda: self.scheduler.get_metrics()['superseded'] == 1)
+
+        self.release.set()
+        old.join(2.0)
+        new.join(2.0)
+
+        assert executed == ["new"]
+        assert results == ["new", "new"]
+
+    def test_cancel_pending(self):
+        """Cancelled requests raise VisionRequestCancelledError to their callers."""
+        errors = []
+
+        def background_caller():
+            try:
+                self.scheduler.run(lambda: "never", priority="background")
+            except VisionRequestCancelledError as e:
+                errors.append(e)
+
+        self._start(self.scheduler.run, self._blocking_call)
+        assert self.blocker_started.wait(2.0)
+        waiter = self._start(background_caller)
+        assert _wait_for(lambda: self.scheduler.get_queue_depth() == 1)
+
+        assert self.scheduler.cancel_pending(VisionRequestPriority.BACKGROUND) == 1
+        waiter.join(2.0)
+        self.release.set()
+
+        assert len(errors) == 1
+        assert self.scheduler.get_metrics()['cancelled'] == 1
+
+    def test_cancel_running_keeps_slot_until_call_returns(self):
+        """An abandoned running request holds its slot until its call returns, then its result is dropped."""
+        errors = []
+        interactive = []
+
+        def background_caller():
+            try:
+                self.scheduler.run(self._blocking_call, priority="background")
+            except VisionRequestCancelledError as e:
+                errors.append(e)
+
+        background = self._start(background_caller)
+        assert self.blocker_started.wait(2.0)
+
+        assert self.scheduler.cancel_pending(VisionRequestPriority.BACKGROUND, include_running=True) == 1
+        waiter = self._start(lambda: interactive.append(self.scheduler.run(lambda: "interactive")))
+        assert _wait_for(lambda: self.scheduler.get_queue_depth() == 1)
+        time.sleep(0.05)
+        assert interactive == []
+        assert self.scheduler.get_metrics()['running'] == 1
+
+        self.release.set()
+        background.join(2.0)
+        waiter.join(2.0)
+        assert len(errors) == 1
+        assert interactive == ["interactive"]
+        assert self.scheduler.get_metrics()['running'] == 0
+
+    def test_concurrency_limit(self):
+        """No more than max_concurrent requests run at once."""
+        scheduler = VisionRequestScheduler(max_concurrent=2, queue_wait_timeout=5.0)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def analyze():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+
+        threads = [self._start(scheduler.run, analyze) for _ in range(6)]
+        for thread in threads:
+            thread.join(5.0)
+
+        assert max(peak) <= 2
+        assert scheduler.get_metrics()['executed'] == 6
+
+    def test_queue_wait_timeout(self):
+        """Requests that cannot get a slot in time fail with TimeoutError."""
+        scheduler = VisionRequestScheduler(max_concurrent=1, queue_wait_timeout=0.1)
+        self._start(scheduler.run, self._blocking_call)
+        assert self.blocker_started.wait(2.0)
+
+        with pytest.raises(TimeoutError):
+            scheduler.run(lambda: "late")
+        self.release.set()
+
+    def test_metrics(self):
+        """Metrics include queue depth by priority and wait times."""
+        self._start(self.scheduler.run, self._blocking_call)
+        assert self.blocker_started.wait(2.0)
+        waiter = self._start(self.scheduler.run, lambda: None, priority="fallback")
+        assert _wait_for(lambda: self.scheduler.get_queue_depth() == 1)
+
+        metrics = self.scheduler.get_metrics()
+        assert metrics['running'] == 1
+        assert metrics['pending_by_priority']['fallback'] == 1
+        assert metrics['max_queue_depth'] == 1
+
+        self.release.set()
+        waiter.join(2.0)
+        metrics = self.scheduler.get_metrics()
+        assert metrics['max_wait_time'] > 0
+        assert metrics['avg_wait_time'] > 0
@@ -0,0 +1,136 @@
+"""
+Unit tests for voice activity detection and endpointing
+
+Tests frame features, the feature-based detector on speech-like and
+noise signals, and the Endpointer's minimum-speech and hangover logic.
+"""
+
+import pytest
+import numpy as np
+
+from modules.voice_activity import Endpointer, FeatureVAD, frame_features, create_vad
+
+SAMPLE_RATE = 16000
+
+
+def _voice(seconds, pitch=120.0, amplitude=0.1):
+    """Harmonic 'voiced speech' with a syllable-rate envelope."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    voice = sum(np.sin(2 * np.pi * pitch * k * t) / k for k in range(1, 10))
+    envelope = 0.6 + 0.4 * np.abs(np.sin(2 * np.pi * 2.0 * t))
+    return (amplitude * voice * envelope / 2).astype(np.float32)
+
+
+def _noise(seconds, level=0.002, seed=0):
+    rng = np.random.default_rng(seed)
+    return (level * rng.standard_normal(int(seconds * SAMPLE_RATE))).astype(np.float32)
+
+
+def _frames(samples, frame=320):
+    count = len(samples) // frame
+    return samples[:count * frame].reshape(count, frame)
+
+
+def _feed(endpointer, audio, chunk=1600):
+    """Feed audio in chunks; return the time at which the endpoint fired."""
+    for start in range(0, len(audio), chunk):
+        if endpointer.process(audio[start:start + chunk]):
+            return (start + chunk) / SAMPLE_RATE
+    return None
+
+
+class TestFrameFeatures:
+    """Test cases for vectorized frame features."""
+
+    def test_tonal_and_noise_flatness(self):
+        """Voiced frames are tonal, white noise is flat."""
+        voiced = frame_features(_frames(_voice(0.5)))
+        noise = frame_features(_frames(_noise(0.5, level=0.1)))
+
+        assert np.median(voiced['flatness']) < 0.2
+        assert np.median(noise['flatness']) > 0.5
+
+    def test_zero_crossing_rate(self):
+        """Zero-crossing rate reflects frequency content."""
+        t = np.arange(3200) / SAMPLE_RATE
+        low = frame_features(_frames(np.sin(2 * np.pi * 200 * t).astype(np.float32)))
+        high = frame_features(_frames(np.sin(2 * np.pi * 4000 * t).astype(np.float32)))
+
+        assert np.median(low['zcr']) < 0.05
+        assert np.median(high['zcr']) > 0.4
+
+
+class TestFeatureVAD:
+    """Test cases for FeatureVAD class."""
+
+    def test_speech_over_noise(self):
+        """Voiced speech is detected above background noise."""
+        vad = FeatureVAD(noise_floor=0.002)
+        assert vad.is_speech(_frames(_voice(0.5))).mean() > 0.9
+        assert vad.is_speech(_frames(_noise(0.5))).mean() < 0.1
+
+    def test_hum_is_not_speech(self):
+        """Loud mains hum is rejected by spectral flatness."""
+        t = np.arange(SAMPLE_RATE // 2) / SAMPLE_RATE
+        hum = (0.05 * np.sin(2 * np.pi * 50 * t)).astype(np.float32)
+
+        assert FeatureVAD(noise_floor=0.002).is_speech(_frames(hum)).mean() < 0.1
+
+    def test_noise_floor_adapts(self):
+        """The noise floor follows the background level of non-speech frames."""
+        vad = FeatureVAD(noise_floor=0.002)
+        background = _frames(_noise(0.1, level=0.02))
+        level = np.median(frame_features(background)['energy'])
+        for _ in range(60):
+            vad.is_speech(background)
+        assert vad.noise_floor == pytest.approx(level, rel=0.3)
+
+        for _ in range(5):
+            vad.is_speech(_frames(_noise(0.1, level=0.001)))
+        assert vad.noise_floor < level / 2
+
+    def test_default_engine(self):
+        """The feature detector is the default engine."""
+        assert isinstance(create_vad("features"), FeatureVAD)
+
+
+class TestEndpointer:
+    """Test cases for Endpointer class."""
+
+    def test_endpoint_after_hangover(self):
+        """The utterance ends one hangover after the speech."""
+        endpointer = Endpointer(endpoint_silence=0.5, noise_floor=0.002)
+        audio = np.concatenate([_noise(0.5), _voice(1.0), _noise(2.0, seed=1)])
+
+        ended_at = _feed(endpointer, audio)
+
+        summary = endpointer.get_summary()
+        assert summary['speech_start'] == pytest.approx(0.5, abs=0.05)
+        assert summary['speech_end'] == pytest.approx(1.5, abs=0.05)
+        assert ended_at == pytest.approx(2.0, abs=0.11)
+
+    def test_short_pause_does_not_end(self):
+        """Pauses shorter than the hangover keep the utterance open."""
+        endpointer = Endpointer(endpoint_silence=0.5, noise_floor=0.002)
+        audio = np.concatenate([_voice(0.6), _noise(0.3), _voice(0.6), _noise(1.0, seed=1)])
+
+        ended_at = _feed(endpointer, audio)
+
+        assert endpointer.get_summary()['speech_end'] == pytest.approx(1.5, abs=0.05)
+        assert ended_at > 1.5
+
+    def test_clicks_do_not_start_utterance(self):
+        """Bursts shorter than the minimum speech duration are ignored."""
+        endpointer = Endpointer(endpoint_silence=0.3, min_speech=0.15, noise_floor=0.002)
+        audio = np.concatenate([_noise(0.3), _voice(0.04), _noise(1.0, seed=1)])
+
+        assert _feed(endpointer, audio) is None
+        assert not endpointer.speech_started
+
+    def test_odd_chunk_sizes(self):
+        """Samples that don't fill a frame are carried into the next chunk."""
+        endpointer = Endpointer(endpoint_silence=0.3, noise_floor=0.002)
+        audio = np.concatenate([_voice(0.5), _noise(1.0, seed=1)])
+
+        assert _feed(endpointer, audio, chunk=777) is not None
+        assert endpointer.processed_seconds <= len(audio) / SAMPLE_RATE